@@ -4,6 +4,7 @@ Main application to launch OneSoul.
 """
 import sys
 import os
+import multiprocessing
 import threading
 import json
 
@@ -381,4 +382,6 @@ def main():
 
 
 if __name__ == '__main__':
+    # Frozen builds re-launch this exe for yt-dlp pool workers
+    multiprocessing.freeze_support()
     main()
@@ -107,6 +107,19 @@ UPLOAD_CONFIG = {
     # Optional explicit ffmpeg path (for image conversion)
     # If empty, auto-detection will be used
     "ffmpeg_path": os.getenv("FFMPEG_PATH", ""),
+
+    # Profiles kept open at the same time (default: 1 = one after another)
+    # Above 1, navigation/typing/upload waits overlap across profiles while
+    # mouse clicks and file dialogs still run one profile at a time
+    "parallel_profiles": int(os.getenv("IX_PARALLEL_PROFILES", "1")),
+
+    # Files of the current folder prepared ahead (validated, converted,
+    # fingerprinted) while the current one uploads
+    "prep_lookahead": 2,
+
+    # Also skip videos that look identical to an uploaded one (decodes a few
+    # frames per new file; exact-content duplicates are always skipped)
+    "perceptual_dedupe": False,
 }
 
 
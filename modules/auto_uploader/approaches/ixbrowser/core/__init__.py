@@ -5,14 +5,32 @@ This package contains:
 - state_manager: Bot state persistence and recovery
 - network_monitor: Network health monitoring and reconnection
 - folder_queue: Folder queue management and infinite loop
+- upload_progress_monitor: Event-driven upload completion (page events, no DOM polling)
+- input_lease: Foreground input lease shared by parallel profiles
+- parallel_runner: Keeps several profiles open and processes them in parallel
+- upload_prep: Look-ahead preparation of the next files to upload
+- fingerprint_index: Cached content fingerprints for duplicate-upload protection
 """
 
 from .state_manager import StateManager
 from .network_monitor import NetworkMonitor
 from .folder_queue import FolderQueueManager
+from .upload_progress_monitor import UploadProgressMonitor
+from .input_lease import InputLease, get_input_lease
+from .parallel_runner import ParallelProfileRunner
+from .upload_prep import PreparedUpload, UploadPrepPipeline
+from .fingerprint_index import FingerprintIndex, get_fingerprint_index
 
 __all__ = [
     'StateManager',
     'NetworkMonitor',
     'FolderQueueManager',
+    'UploadProgressMonitor',
+    'InputLease',
+    'get_input_lease',
+    'ParallelProfileRunner',
+    'PreparedUpload',
+    'UploadPrepPipeline',
+    'FingerprintIndex',
+    'get_fingerprint_index',
 ]
@@ -0,0 +1,220 @@
+"""
+Fingerprint Index for ixBrowser Approach
+
+Content fingerprints for duplicate-upload protection across folders:
+- Fingerprint = file size + SHA-1 of three sampled chunks (start, middle,
+  end); streamed, never reads a whole multi-GB file
+- Optional perceptual hash: dHash of a few decoded frames (OpenCV), so a
+  re-encoded copy of the same clip is recognized too
+- Computed once per file, cached by (path, size, mtime) in
+  data/fingerprint_cache.json
+- A renamed or re-downloaded clip gets the same fingerprint as the
+  uploaded original
+
+Usage:
+    index = get_fingerprint_index()
+    fingerprint = index.fingerprint(video_path)
+    phash = index.perceptual_hash(video_path)   # None unless enabled
+    index.save()
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bytes hashed at each sample point (start, middle, end) of a file
+FINGERPRINT_SAMPLE_BYTES = 64 * 1024
+# Frames decoded for the perceptual hash (positions in the clip)
+PERCEPTUAL_FRAME_POSITIONS = (0.25, 0.5, 0.75)
+# Max differing bits (of 64 per frame) for two clips to count as the same
+PERCEPTUAL_MAX_DISTANCE = 10
+
+
+def sampled_fingerprint(file_path: str, sample_bytes: int = FINGERPRINT_SAMPLE_BYTES) -> str:
+    """
+    Cheap content fingerprint: file size + hash of three sampled chunks.
+
+    Reads at most 3 * sample_bytes, whatever the file size.
+    """
+    size = os.path.getsize(file_path)
+    digest = hashlib.sha1(str(size).encode("ascii"))
+    with open(file_path, "rb") as handle:
+        for offset in sorted({0, max(0, size // 2 - sample_bytes // 2), max(0, size - sample_bytes)}):
+            handle.seek(offset)
+            digest.update(handle.read(sample_bytes))
+    return f"{size}:{digest.hexdigest()}"
+
+
+def perceptual_hash(file_path: str) -> Optional[str]:
+    """
+    dHash (64 bit) of a few decoded frames, hex-joined with '-'.
+
+    Returns None if OpenCV is missing or the file cannot be decoded.
+    """
+    try:
+        import cv2
+    except ImportError:
+        return None
+
+    capture = cv2.VideoCapture(file_path)
+    try:
+        frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+        hashes = []
+        for position in PERCEPTUAL_FRAME_POSITIONS:
+            if frame_count > 0:
+                capture.set(cv2.CAP_PROP_POS_FRAMES, int(frame_count * position))
+            ok, frame = capture.read()
+            if not ok or frame is None:
+                continue
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+            small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+            bits = (small[:, 1:] > small[:, :-1]).flatten()
+            hashes.append("%016x" % int("".join("1" if bit else "0" for bit in bits), 2))
+        return "-".join(hashes) if hashes else None
+    finally:
+        capture.release()
+
+
+def perceptual_distance(first: str, second: str) -> Optional[int]:
+    """Largest per-frame Hamming distance of two perceptual hashes (None if not comparable)."""
+    if not first or not second:
+        return None
+    first_parts, second_parts = first.split("-"), second.split("-")
+    if len(first_parts) != len(second_parts):
+        return None
+    return max(bin(int(a, 16) ^ int(b, 16)).count("1") for a, b in zip(first_parts, second_parts))
+
+
+class FingerprintIndex:
+    """Caches content fingerprints by (path, size, mtime)."""
+
+    def __init__(self, cache_file: str = None, perceptual: bool = False):
+        """
+        Initialize Fingerprint Index.
+
+        Args:
+            cache_file: JSON cache (default: ixbrowser/data/fingerprint_cache.json)
+            perceptual: Also compute perceptual hashes of decoded frames
+        """
+        if cache_file is None:
+            cache_file = Path(__file__).parent.parent / "data" / "fingerprint_cache.json"
+
+        self.cache_file = Path(cache_file)
+        self.perceptual = perceptual
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        self._dirty = False
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning("[Fingerprint] Cache unreadable, starting fresh: %s", str(e))
+            return {}
+
+    def _entry(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Cached entry for the file as it is now (computed on a miss)."""
+        key = os.path.normcase(os.path.normpath(str(file_path)))
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry.get("size") == stat.st_size and entry.get("mtime") == stat.st_mtime_ns:
+                self.hits += 1
+                return entry
+
+        self.misses += 1
+        entry = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "fingerprint": sampled_fingerprint(file_path),
+        }
+        with self._lock:
+            self._entries[key] = entry
+            self._dirty = True
+        return entry
+
+    def fingerprint(self, file_path: str) -> Optional[str]:
+        """Content fingerprint of a file (None if it cannot be read)."""
+        try:
+            entry = self._entry(file_path)
+        except OSError as e:
+            logger.debug("[Fingerprint] Cannot fingerprint %s: %s", file_path, str(e))
+            return None
+        return entry["fingerprint"] if entry else None
+
+    def perceptual_hash(self, file_path: str) -> Optional[str]:
+        """Perceptual hash of a video (None unless enabled and decodable)."""
+        if not self.perceptual:
+            return None
+        try:
+            entry = self._entry(file_path)
+        except OSError:
+            return None
+        if not entry:
+            return None
+
+        if "phash" not in entry:
+            phash = perceptual_hash(file_path)
+            with self._lock:
+                entry["phash"] = phash
+                self._dirty = True
+        return entry.get("phash")
+
+    def save(self) -> None:
+        """Write the cache if it changed (entries of vanished files are dropped)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = dict(self._entries)
+            self._dirty = False
+
+        entries = {key: value for key, value in entries.items() if os.path.exists(key)}
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+            with open(temp_file, "w", encoding="utf-8") as handle:
+                json.dump(entries, handle, separators=(",", ":"))
+            os.replace(temp_file, self.cache_file)
+            with self._lock:
+                for key in set(self._entries) - set(entries):
+                    self._entries.pop(key, None)
+        except Exception as e:
+            logger.error("[Fingerprint] Failed to save cache: %s", str(e))
+
+
+_fingerprint_index = None
+_fingerprint_index_lock = threading.Lock()
+
+
+def get_fingerprint_index() -> FingerprintIndex:
+    """Get global fingerprint index instance"""
+    global _fingerprint_index
+
+    with _fingerprint_index_lock:
+        if _fingerprint_index is None:
+            try:
+                from ..config.upload_config import UPLOAD_CONFIG
+                perceptual = bool(UPLOAD_CONFIG.get("perceptual_dedupe", False))
+            except ImportError:
+                perceptual = False
+            _fingerprint_index = FingerprintIndex(perceptual=perceptual)
+
+    return _fingerprint_index
@@ -7,6 +7,7 @@ Handles folder queue management and infinite loop:
 - Manages folder completion
 - Implements infinite loop (cycle back to folder #1)
 - Tracks cycle count
+- Skips files whose content was already uploaded (fingerprint index)
 
 Usage:
     queue_mgr = FolderQueueManager(base_path="/path/to/creator_data")
@@ -28,16 +29,19 @@ logger = logging.getLogger(__name__)
 class FolderQueueManager:
     """Manages folder queue and infinite loop logic."""
 
-    def __init__(self, base_path: str, state_manager=None):
+    def __init__(self, base_path: str, state_manager=None, fingerprint_index=None):
         """
         Initialize Folder Queue Manager.
 
         Args:
             base_path: Path to creator_data directory
             state_manager: StateManager instance for persistence
+            fingerprint_index: FingerprintIndex for content dedupe
+                (default: global index when a state manager is given)
         """
         self.base_path = Path(base_path)
         self.state_manager = state_manager
+        self.fingerprint_index = fingerprint_index
 
         # Video file extensions (comprehensive list)
         self.video_extensions = [
@@ -140,6 +144,69 @@ class FolderQueueManager:
                     os.path.basename(current), index)
         return current
 
+    def _filter_history(self, paths: List[str]) -> List[str]:
+        """
+        Drop files already recorded in history (uploaded or failed).
+
+        Uses the state manager's bulk index lookup when available.
+        """
+        if hasattr(self.state_manager, "filter_unprocessed"):
+            try:
+                return self.state_manager.filter_unprocessed(paths)
+            except Exception as exc:
+                logger.debug("[FolderQueue] Bulk history check failed: %s", exc)
+
+        def is_in_history(path_value: str) -> bool:
+            try:
+                if hasattr(self.state_manager, "is_video_uploaded"):
+                    if self.state_manager.is_video_uploaded(path_value):
+                        return True
+                if hasattr(self.state_manager, "is_video_failed"):
+                    if self.state_manager.is_video_failed(path_value):
+                        return True
+            except Exception as exc:
+                logger.debug("[FolderQueue] History check failed for %s: %s", path_value, exc)
+            return False
+
+        return [p for p in paths if not is_in_history(p)]
+
+    def _filter_duplicates(self, paths: List[str], visual: bool = True) -> List[str]:
+        """
+        Drop files whose content was already uploaded under another name/path.
+
+        Fingerprints are cached by (path, size, mtime), so a folder is only
+        hashed once (and only sampled chunks of each file are read).
+        """
+        if not paths or not hasattr(self.state_manager, "is_fingerprint_uploaded"):
+            return paths
+
+        index = self.fingerprint_index
+        if index is None:
+            try:
+                from .fingerprint_index import get_fingerprint_index
+                index = self.fingerprint_index = get_fingerprint_index()
+            except Exception as exc:
+                logger.debug("[FolderQueue] Fingerprint index unavailable: %s", exc)
+                return paths
+
+        kept = []
+        for path_value in paths:
+            try:
+                if self.state_manager.is_fingerprint_uploaded(index.fingerprint(path_value)):
+                    logger.info("[FolderQueue] Skipping duplicate content: %s", os.path.basename(path_value))
+                    continue
+                phash = index.perceptual_hash(path_value) if visual else None
+                if phash and self.state_manager.is_similar_uploaded(phash):
+                    logger.info("[FolderQueue] Skipping visually identical video: %s",
+                               os.path.basename(path_value))
+                    continue
+            except Exception as exc:
+                logger.debug("[FolderQueue] Duplicate check failed for %s: %s", path_value, exc)
+            kept.append(path_value)
+
+        index.save()
+        return kept
+
     def get_videos_in_folder(self, folder_path: str, exclude_uploaded: bool = True) -> List[str]:
         """
         Get all video files in folder.
@@ -205,20 +272,7 @@ class FolderQueueManager:
             # Filter out videos already recorded in history (uploaded or failed)
             if self.state_manager:
                 videos_before = len(videos)
-
-                def is_in_history(path_value: str) -> bool:
-                    try:
-                        if hasattr(self.state_manager, "is_video_uploaded"):
-                            if self.state_manager.is_video_uploaded(path_value):
-                                return True
-                        if hasattr(self.state_manager, "is_video_failed"):
-                            if self.state_manager.is_video_failed(path_value):
-                                return True
-                    except Exception as exc:
-                        logger.debug("[FolderQueue] History check failed for %s: %s", path_value, exc)
-                    return False
-
-                videos = [v for v in videos if not is_in_history(v)]
+                videos = self._filter_duplicates(self._filter_history(videos))
                 filtered_history = videos_before - len(videos)
                 if filtered_history > 0:
                     logger.info("[FolderQueue] Filtered out %d video(s) already in history",
@@ -293,20 +347,7 @@ class FolderQueueManager:
 
             if self.state_manager:
                 images_before = len(images)
-
-                def is_in_history(path_value: str) -> bool:
-                    try:
-                        if hasattr(self.state_manager, "is_video_uploaded"):
-                            if self.state_manager.is_video_uploaded(path_value):
-                                return True
-                        if hasattr(self.state_manager, "is_video_failed"):
-                            if self.state_manager.is_video_failed(path_value):
-                                return True
-                    except Exception as exc:
-                        logger.debug("[FolderQueue] History check failed for %s: %s", path_value, exc)
-                    return False
-
-                images = [img for img in images if not is_in_history(img)]
+                images = self._filter_duplicates(self._filter_history(images), visual=False)
                 filtered_history = images_before - len(images)
                 if filtered_history > 0:
                     logger.info("[FolderQueue] Filtered out %d image(s) already in history",
@@ -0,0 +1,172 @@
+"""
+Input Lease for ixBrowser Approach
+
+One foreground "input lease" shared by every open profile:
+- Only steps that need the real desktop take it: OS file dialogs, pyautogui
+  mouse/keyboard, screen image matching, clipboard paste
+- Everything else (navigation, DOM typing, waiting for the upload, verify)
+  runs in the other profiles while one of them holds the lease
+- First come, first served (no profile starves behind a busy one)
+- Re-entrant per thread; the focus callback runs when a thread newly takes
+  the lease, so its browser window is brought to the front first
+
+Usage:
+    lease = get_input_lease()
+
+    with lease.hold("publish click", focus=lambda: bring_browser_to_front(driver)):
+        pyautogui.click(x, y)
+
+    if lease.try_acquire("idle mouse"):
+        try:
+            ...
+        finally:
+            lease.release()
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class InputLease:
+    """FIFO, re-entrant lease on the desktop's mouse/keyboard/foreground."""
+
+    def __init__(self):
+        """Initialize Input Lease."""
+        self._cond = threading.Condition()
+        self._owner: Optional[int] = None
+        self._depth = 0
+        self._reason = ""
+        self._queue = deque()
+
+        # Stats
+        self.acquisitions = 0
+        self.total_wait = 0.0
+
+    @property
+    def holder(self) -> Optional[str]:
+        """Reason given by the current holder (None when free)."""
+        with self._cond:
+            return self._reason if self._owner is not None else None
+
+    def held_by_me(self) -> bool:
+        """True if the calling thread holds the lease."""
+        with self._cond:
+            return self._owner == threading.get_ident()
+
+    def _take(self, me: int, reason: str) -> None:
+        self._owner = me
+        self._depth = 1
+        self._reason = reason
+        self.acquisitions += 1
+
+    def acquire(self, reason: str = "", focus: Optional[Callable[[], object]] = None,
+                timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the lease (first come, first served).
+
+        Args:
+            reason: What the lease is needed for (logged)
+            focus: Called after the lease is newly taken (bring window to front)
+            timeout: Seconds to wait at most (None = forever)
+
+        Returns:
+            True if the lease is held, False on timeout
+        """
+        me = threading.get_ident()
+        started = time.monotonic()
+        with self._cond:
+            if self._owner == me:
+                self._depth += 1
+                return True
+
+            ticket = object()
+            self._queue.append(ticket)
+            try:
+                while self._owner is not None or self._queue[0] is not ticket:
+                    remaining = None if timeout is None else timeout - (time.monotonic() - started)
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+            finally:
+                self._queue.remove(ticket)
+                self._cond.notify_all()
+
+            self._take(me, reason)
+            waited = time.monotonic() - started
+            self.total_wait += waited
+
+        if waited > 1:
+            logger.debug("[InputLease] '%s' waited %.1fs for the foreground", reason, waited)
+        if focus:
+            try:
+                focus()
+            except Exception as e:
+                logger.debug("[InputLease] Focus callback failed: %s", str(e))
+        return True
+
+    def try_acquire(self, reason: str = "", focus: Optional[Callable[[], object]] = None) -> bool:
+        """Take the lease only if it is free right now (or already ours)."""
+        me = threading.get_ident()
+        with self._cond:
+            if self._owner == me:
+                self._depth += 1
+                return True
+            if self._owner is not None or self._queue:
+                return False
+            self._take(me, reason)
+
+        if focus:
+            try:
+                focus()
+            except Exception as e:
+                logger.debug("[InputLease] Focus callback failed: %s", str(e))
+        return True
+
+    def release(self) -> None:
+        """Release one level of the lease held by the calling thread."""
+        with self._cond:
+            if self._owner != threading.get_ident():
+                return
+            self._depth -= 1
+            if self._depth <= 0:
+                self._owner = None
+                self._depth = 0
+                self._reason = ""
+                self._cond.notify_all()
+
+    def release_all(self) -> None:
+        """Drop the lease completely if the calling thread holds it."""
+        with self._cond:
+            if self._owner == threading.get_ident():
+                self._depth = 1
+        self.release()
+
+    @contextmanager
+    def hold(self, reason: str = "", focus: Optional[Callable[[], object]] = None):
+        """Context manager around acquire()/release()."""
+        self.acquire(reason, focus=focus)
+        try:
+            yield self
+        finally:
+            self.release()
+
+
+_input_lease = None
+_input_lease_lock = threading.Lock()
+
+
+def get_input_lease() -> InputLease:
+    """Get global input lease instance"""
+    global _input_lease
+
+    with _input_lease_lock:
+        if _input_lease is None:
+            _input_lease = InputLease()
+
+    return _input_lease
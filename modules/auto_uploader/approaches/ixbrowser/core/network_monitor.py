@@ -7,6 +7,7 @@ Handles network health monitoring and reconnection:
 - Detects network drops
 - Waits for reconnection
 - Provides callbacks for network events
+- Shared by parallel profiles (start/stop are reference counted)
 
 Usage:
     monitor = NetworkMonitor()
@@ -41,6 +42,8 @@ class NetworkMonitor:
         self.check_interval = check_interval
         self.is_monitoring = False
         self.monitor_thread = None
+        self._users = 0
+        self._users_lock = threading.Lock()
         self.current_status = "unknown"  # stable, unstable, disconnected, unknown
 
         # Callbacks
@@ -208,23 +211,30 @@ class NetworkMonitor:
         return False
 
     def start_monitoring(self):
-        """Start background network monitoring thread."""
-        if self.is_monitoring:
-            logger.warning("[NetworkMonitor] Already monitoring")
-            return
-
-        self.is_monitoring = True
-        self.monitor_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
-        self.monitor_thread.start()
+        """Start background network monitoring thread (first user starts it)."""
+        with self._users_lock:
+            self._users += 1
+            if self.is_monitoring:
+                logger.debug("[NetworkMonitor] Already monitoring (%d users)", self._users)
+                return
+
+            self.is_monitoring = True
+            self.monitor_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
+            self.monitor_thread.start()
         logger.info("[NetworkMonitor] ✓ Background monitoring started")
 
     def stop_monitoring(self):
-        """Stop background network monitoring."""
-        if not self.is_monitoring:
-            logger.debug("[NetworkMonitor] Not monitoring")
-            return
-
-        self.is_monitoring = False
+        """Stop background network monitoring (last user stops it)."""
+        with self._users_lock:
+            self._users = max(0, self._users - 1)
+            if not self.is_monitoring:
+                logger.debug("[NetworkMonitor] Not monitoring")
+                return
+            if self._users > 0:
+                logger.debug("[NetworkMonitor] Still used by %d profile(s)", self._users)
+                return
+
+            self.is_monitoring = False
 
         if self.monitor_thread and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=5)
@@ -0,0 +1,241 @@
+"""
+Parallel Profile Runner for ixBrowser Approach
+
+Keeps up to K ixBrowser profiles open at once instead of one at a time:
+- K worker threads each claim the next profile, process it, close it and
+  claim the next one (ProfileManager.claim_next_profile)
+- Desktop-bound steps are serialized by the shared InputLease; navigation,
+  DOM typing and waiting for uploads overlap across the open profiles
+- ProfileScopedState gives every profile its own folder-queue position and
+  current upload, and makes the basic daily limit count uploads still in
+  flight in the other profiles (no overshoot when K profiles check the
+  limit together)
+- LaunchFailureStreak stops the run after N profile launches in a row fail,
+  like the sequential loop does
+
+Usage:
+    runner = ParallelProfileRunner(max_open=3, process_profile=process)
+    results = runner.run(profile_manager, should_continue=lambda: not limit_reached())
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DailyLimitBook:
+    """Upload slots reserved by profiles that passed the daily limit check."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self._reserved: Dict[Any, int] = {}
+
+    def reserved_by_others(self, owner: Any) -> int:
+        with self.lock:
+            return sum(count for key, count in self._reserved.items() if key != owner)
+
+    def reserve(self, owner: Any) -> None:
+        with self.lock:
+            self._reserved[owner] = 1
+
+    def clear(self, owner: Any) -> None:
+        with self.lock:
+            self._reserved.pop(owner, None)
+
+
+class LaunchFailureStreak:
+    """Consecutive profile launch failures, counted in finishing order."""
+
+    def __init__(self, limit: int):
+        self.limit = max(1, int(limit))
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def record(self, launched: bool) -> bool:
+        """Record one finished profile. Returns True once the limit is hit."""
+        with self._lock:
+            self._count = 0 if launched else self._count + 1
+            return self._count >= self.limit
+
+
+class ProfileScopedState:
+    """
+    StateManager view for one profile of a parallel run.
+
+    Queue position and current upload live in memory per profile (each
+    profile resets its queue on open anyway, and K profiles would overwrite
+    each other's single current_upload slot); everything else goes to the
+    shared StateManager.
+    """
+
+    def __init__(self, state_manager, owner: Any, limit_book: DailyLimitBook):
+        self._state_manager = state_manager
+        self._owner = owner
+        self._limit_book = limit_book
+        self._queue: Dict[str, Any] = {}
+        self._current_upload: Dict[str, Any] = {}
+
+    def __getattr__(self, name: str):
+        return getattr(self._state_manager, name)
+
+    def update_queue_position(self, folder_index: int = None, folder_path: str = None,
+                              total_folders: int = None, cycle: int = None):
+        """Update this profile's folder queue position."""
+        if folder_index is not None:
+            self._queue['current_folder_index'] = folder_index
+        if folder_path is not None:
+            self._queue['current_folder_path'] = folder_path
+        if total_folders is not None:
+            self._queue['total_folders'] = total_folders
+        if cycle is not None:
+            self._queue['current_cycle'] = cycle
+
+    def update_current_upload(self, video_file: str = None, video_name: str = None,
+                              bookmark: str = None, status: str = None,
+                              progress: int = None, attempt: int = None):
+        """Update this profile's current upload (same fields as StateManager)."""
+        upload = self._current_upload
+        if video_file is not None:
+            upload['video_file'] = video_file
+        if video_name is not None:
+            upload['video_name'] = video_name
+        if bookmark is not None:
+            upload['bookmark'] = bookmark
+        if status is not None:
+            upload['status'] = status
+        if progress is not None:
+            upload['progress_last_seen'] = progress
+            upload['last_progress_update'] = time.strftime("%Y-%m-%d %H:%M:%S")
+        if attempt is not None:
+            upload['attempt'] = attempt
+        if status == 'uploading' and not upload.get('started_at'):
+            upload['started_at'] = time.strftime("%Y-%m-%d %H:%M:%S")
+
+    def clear_current_upload(self):
+        """Clear this profile's current upload."""
+        self._current_upload = {}
+
+    def get_current_position(self) -> Dict[str, Any]:
+        """Shared position info with this profile's queue position and upload."""
+        position = self._state_manager.get_current_position()
+        position.update(
+            folder_index=self._queue.get('current_folder_index', 0),
+            folder_path=self._queue.get('current_folder_path'),
+            cycle=self._queue.get('current_cycle', 1),
+            current_upload=dict(self._current_upload),
+        )
+        return position
+
+    def check_daily_limit(self, user_type: str = "basic", limit: int = 200) -> Dict[str, Any]:
+        """
+        Daily limit check that counts the other profiles' in-flight uploads.
+
+        Passing the check reserves one upload slot for this profile until
+        increment_daily_bookmarks() (or the profile finishes).
+        """
+        if user_type.lower() == "pro":
+            return self._state_manager.check_daily_limit(user_type=user_type, limit=limit)
+
+        with self._limit_book.lock:
+            result = self._state_manager.check_daily_limit(user_type=user_type, limit=limit)
+            in_flight = self._limit_book.reserved_by_others(self._owner)
+            if in_flight:
+                current_count = result['current_count'] + in_flight
+                result['limit_reached'] = current_count >= limit
+                result['remaining'] = max(0, limit - current_count)
+                result['message'] = (
+                    f"{result['message']} ({in_flight} upload(s) in progress in other profiles)")
+            if not result['limit_reached']:
+                self._limit_book.reserve(self._owner)
+            return result
+
+    def increment_daily_bookmarks(self, count: int = 1, bookmark_name: str = None):
+        """Count the upload and give back this profile's reserved slot."""
+        with self._limit_book.lock:
+            self._state_manager.increment_daily_bookmarks(count=count, bookmark_name=bookmark_name)
+            self._limit_book.clear(self._owner)
+
+    def release(self) -> None:
+        """Give back any reserved upload slot (profile finished)."""
+        self._limit_book.clear(self._owner)
+
+
+class ParallelProfileRunner:
+    """Processes profiles with up to max_open of them open at the same time."""
+
+    def __init__(self, max_open: int, process_profile: Callable[[Dict[str, Any], int], Any]):
+        """
+        Initialize Parallel Profile Runner.
+
+        Args:
+            max_open: How many profiles may be open at once (K)
+            process_profile: Called as process_profile(profile, index) in a
+                worker thread; opens, processes and closes the profile
+        """
+        self.max_open = max(1, int(max_open))
+        self.process_profile = process_profile
+        self.limit_book = DailyLimitBook()
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        """Let running profiles finish but claim no new ones."""
+        self._stop.set()
+
+    def scoped_state(self, state_manager, owner: Any) -> ProfileScopedState:
+        """StateManager view for one profile of this run."""
+        return ProfileScopedState(state_manager, owner, self.limit_book)
+
+    def run(self, profile_manager,
+            should_continue: Optional[Callable[[], bool]] = None) -> List[Dict[str, Any]]:
+        """
+        Run until every profile is processed (or should_continue() is False).
+
+        Returns:
+            One dict per processed profile, in profile order:
+            {'index', 'profile', 'result', 'error'}
+        """
+        results: List[Dict[str, Any]] = []
+        results_lock = threading.Lock()
+
+        def worker(slot: int) -> None:
+            while not self._stop.is_set():
+                if should_continue is not None and not should_continue():
+                    self._stop.set()
+                    break
+
+                claimed = profile_manager.claim_next_profile()
+                if claimed is None:
+                    break
+                index, profile = claimed
+
+                entry = {'index': index, 'profile': profile, 'result': None, 'error': None}
+                logger.info("[ParallelRunner] Slot %d: processing profile %s",
+                            slot, profile.get('name', 'Unknown'))
+                try:
+                    entry['result'] = self.process_profile(profile, index)
+                except Exception as e:
+                    logger.error("[ParallelRunner] Slot %d: profile %s failed: %s",
+                                 slot, profile.get('name', 'Unknown'), str(e))
+                    entry['error'] = str(e)
+                finally:
+                    self.limit_book.clear(profile.get('profile_id', index))
+                    profile_manager.finish_profile(index)
+
+                with results_lock:
+                    results.append(entry)
+
+        threads = [
+            threading.Thread(target=worker, args=(slot,), name=f"ix-profile-{slot}", daemon=True)
+            for slot in range(1, self.max_open + 1)
+        ]
+        logger.info("[ParallelRunner] Running with %d profile slot(s)", len(threads))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        results.sort(key=lambda item: item['index'])
+        return results
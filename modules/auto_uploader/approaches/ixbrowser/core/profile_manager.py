@@ -5,6 +5,7 @@ Handles multi-profile workflow:
 - Fetch profiles from ixBrowser API
 - Track current profile index
 - Open/close profiles sequentially
+- Hand out profiles to parallel workers (claim_next_profile/finish_profile)
 - Check profile completion
 - Resume from crash/interruption
 
@@ -19,8 +20,9 @@ Usage:
 """
 
 import logging
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -48,6 +50,11 @@ class ProfileManager:
         self.current_launcher = None
         self.current_driver = None
 
+        # Parallel mode: next unclaimed index + claimed, unfinished indexes
+        self._claim_lock = threading.Lock()
+        self._next_claim: Optional[int] = None
+        self._in_flight = set()
+
         logger.info("[ProfileManager] Initialized")
 
     def fetch_profiles(self, limit: int = 9999) -> List[Dict[str, Any]]:
@@ -174,12 +181,33 @@ class ProfileManager:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            profile = self.get_current_profile()
-            if not profile:
-                logger.error("[ProfileManager] No current profile to open")
-                return False
+        profile = self.get_current_profile()
+        if not profile:
+            logger.error("[ProfileManager] No current profile to open")
+            return False
+
+        driver = self.open_profile_for(profile, launcher, self.current_profile_index)
+        if not driver:
+            return False
+
+        # Store launcher and driver
+        self.current_launcher = launcher
+        self.current_driver = driver
+        return True
+
+    def open_profile_for(self, profile: Dict[str, Any], launcher, index: int = None) -> Optional[Any]:
+        """
+        Open a given profile using provided launcher (parallel-safe).
 
+        Args:
+            profile: Profile dictionary
+            launcher: BrowserLauncher instance (one per open profile)
+            index: Position of the profile (for logging)
+
+        Returns:
+            Selenium driver of the opened profile, or None
+        """
+        try:
             profile_id = profile.get('profile_id')
             profile_name = profile.get('name', 'Unknown')
 
@@ -187,34 +215,30 @@ class ProfileManager:
             logger.info("[ProfileManager] Opening Profile")
             logger.info("[ProfileManager] ═══════════════════════════════════════════")
             logger.info("[ProfileManager] Profile: %s (ID: %s)", profile_name, profile_id)
-            logger.info("[ProfileManager] Position: %d/%d",
-                       self.current_profile_index + 1, len(self.profiles))
+            if index is not None:
+                logger.info("[ProfileManager] Position: %d/%d", index + 1, len(self.profiles))
 
             # Launch profile with no custom args (clean opening)
             if not launcher.launch_profile(profile_id, startup_args=[]):
                 logger.error("[ProfileManager] ✗ Failed to launch profile")
-                return False
+                return None
 
             # Attach Selenium
             if not launcher.attach_selenium():
                 logger.error("[ProfileManager] ✗ Failed to attach Selenium")
-                return False
+                return None
 
             driver = launcher.get_driver()
             if not driver:
                 logger.error("[ProfileManager] ✗ Driver not available")
-                return False
-
-            # Store launcher and driver
-            self.current_launcher = launcher
-            self.current_driver = driver
+                return None
 
             logger.info("[ProfileManager] ✓ Profile opened successfully!")
-            return True
+            return driver
 
         except Exception as e:
             logger.error("[ProfileManager] Failed to open profile: %s", str(e))
-            return False
+            return None
 
     def close_profile(self) -> bool:
         """
@@ -223,12 +247,30 @@ class ProfileManager:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            profile = self.get_current_profile()
-            if not profile:
-                logger.debug("[ProfileManager] No current profile to close")
-                return True
+        profile = self.get_current_profile()
+        if not profile:
+            logger.debug("[ProfileManager] No current profile to close")
+            return True
+
+        closed = self.close_profile_for(profile, self.current_launcher)
+
+        # Clear references
+        self.current_launcher = None
+        self.current_driver = None
+        return closed
 
+    def close_profile_for(self, profile: Dict[str, Any], launcher) -> bool:
+        """
+        Close a given profile (parallel-safe).
+
+        Args:
+            profile: Profile dictionary
+            launcher: BrowserLauncher the profile was opened with
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
             profile_name = profile.get('name', 'Unknown')
             profile_id = profile.get('profile_id')
 
@@ -238,9 +280,9 @@ class ProfileManager:
             logger.info("[ProfileManager] Profile: %s (ID: %s)", profile_name, profile_id)
 
             # Close using launcher if available
-            if self.current_launcher:
+            if launcher:
                 try:
-                    self.current_launcher.close_profile()
+                    launcher.close_profile()
                     logger.info("[ProfileManager] ✓ Launcher closed profile")
                 except Exception as e:
                     logger.warning("[ProfileManager] Launcher close failed: %s", str(e))
@@ -254,10 +296,6 @@ class ProfileManager:
             except Exception as e:
                 logger.warning("[ProfileManager] API close failed: %s", str(e))
 
-            # Clear references
-            self.current_launcher = None
-            self.current_driver = None
-
             # Brief wait for cleanup
             time.sleep(2)
 
@@ -300,6 +338,37 @@ class ProfileManager:
 
         return True
 
+    def claim_next_profile(self) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """
+        Hand the next unprocessed profile to a parallel worker.
+
+        Returns:
+            (index, profile) or None when every profile has been claimed
+        """
+        with self._claim_lock:
+            if self._next_claim is None:
+                self._next_claim = self.current_profile_index
+
+            if self._next_claim >= len(self.profiles):
+                return None
+
+            index = self._next_claim
+            self._next_claim += 1
+            self._in_flight.add(index)
+            self._save_claim_state()
+            return index, self.profiles[index]
+
+    def finish_profile(self, index: int) -> None:
+        """Mark a claimed profile as processed (parallel mode)."""
+        with self._claim_lock:
+            self._in_flight.discard(index)
+            self._save_claim_state()
+
+    def _save_claim_state(self) -> None:
+        # Resume from the oldest profile that is not finished yet
+        self.current_profile_index = min(self._in_flight | {self._next_claim})
+        self.save_state()
+
     def all_profiles_complete(self) -> bool:
         """
         Check if all profiles have been processed.
@@ -312,7 +381,10 @@ class ProfileManager:
     def reset_to_first_profile(self):
         """Reset to first profile (for new day or manual restart)."""
         logger.info("[ProfileManager] Resetting to first profile")
-        self.current_profile_index = 0
+        with self._claim_lock:
+            self.current_profile_index = 0
+            self._next_claim = None
+            self._in_flight.clear()
         self.save_state()
 
     def get_driver(self):
@@ -5,9 +5,12 @@ Handles bot state persistence and recovery:
 - Saves/loads bot_state.json (current runtime state)
 - Saves/loads folder_progress.json (folder tracking)
 - Saves/loads uploaded_videos.json (upload history)
+- Keeps an in-memory index of the upload history (reloaded when the file changes)
+- Journals every change as a small append and compacts it back into the
+  JSON files periodically (see JsonJournal)
 - Provides thread-safe operations
 - Atomic file writes (prevents corruption)
-- Auto-backup functionality
+- Auto-backup functionality (on compaction)
 
 Usage:
     state_mgr = StateManager()
@@ -15,21 +18,294 @@ Usage:
     state = state_mgr.load_state()
 """
 
+import copy
 import logging
 import os
 import json
 import time
+import functools
 import threading
 import platform
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable, Callable
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+
+def _serialized(method):
+    """Run a load-modify-save StateManager method under the state lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._state_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 # Detect platform for Windows-specific workarounds
 IS_WINDOWS = platform.system() == "Windows"
 
 
+def history_key(file_path: str) -> str:
+    """Normalized path used to look up upload history records."""
+    return os.path.normcase(os.path.normpath(str(file_path)))
+
+
+def _index_record(index: Dict[str, Any], list_key: str, record: Dict[str, Any]) -> None:
+    """Add one 'videos' / 'failed_videos' record to a history index."""
+    file_path = record.get('file_path')
+    if list_key == 'failed_videos':
+        if file_path:
+            index['failed'].add(history_key(file_path))
+        return
+
+    if file_path:
+        key = history_key(file_path)
+        index['uploaded'].add(key)
+        index['by_bookmark'].setdefault(record.get('bookmark') or '', set()).add(key)
+    if record.get('fingerprint'):
+        index['fingerprints'].add(record['fingerprint'])
+    if record.get('phash'):
+        index['phashes'].append(record['phash'])
+
+
+def _build_history_index(videos_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Hash indexes over uploaded_videos.json records."""
+    index: Dict[str, Any] = {
+        'uploaded': set(),
+        'failed': set(),
+        'fingerprints': set(),
+        'phashes': [],
+        'by_bookmark': {},
+    }
+    for list_key in ('videos', 'failed_videos'):
+        for record in videos_data.get(list_key, []) or []:
+            _index_record(index, list_key, record)
+    return index
+
+
+# ═══════════════════════════════════════════════════════════
+# Append-only journal
+#
+# Each state file is kept as the JSON file itself (the compacted base, in
+# its usual layout) plus <name>.journal next to it: one JSON record per
+# line, appended and fsync'd for every change since the last compaction.
+# The materialized view (base + replayed journal) stays in memory, so a
+# mutation costs one short append instead of backup + full rewrite.
+# Compaction writes the view back into the JSON file once the journal
+# grows past a record count or size, then truncates the journal.
+#
+# Records carry a sequence number and the base stores the last one it
+# contains, so replay after a crash skips records already compacted; a
+# torn last line is ignored.
+# ═══════════════════════════════════════════════════════════
+
+JOURNAL_SEQ_KEY = "_journal_seq"
+
+# Compact once the journal holds this many records or bytes
+JOURNAL_COMPACT_RECORDS = 200
+JOURNAL_COMPACT_BYTES = 1024 * 1024
+
+
+class JsonJournal:
+    """Materialized JSON state backed by a base file plus an append journal."""
+
+    def __init__(
+        self,
+        file_path: Path,
+        load_base: Callable[[Path], Dict[str, Any]],
+        save_base: Callable[[Path, Dict[str, Any]], None],
+        compact_records: int = JOURNAL_COMPACT_RECORDS,
+        compact_bytes: int = JOURNAL_COMPACT_BYTES,
+        fsync: bool = True,
+    ):
+        """
+        Args:
+            file_path: The JSON state file
+            load_base: Reads the JSON file (returns {} when missing/corrupt)
+            save_base: Atomically writes the JSON file
+            compact_records: Journal record count that triggers compaction
+            compact_bytes: Journal size that triggers compaction
+            fsync: fsync each append (durable across power loss)
+        """
+        self.file_path = Path(file_path)
+        self.journal_path = self.file_path.with_name(self.file_path.name + ".journal")
+        self._load_base = load_base
+        self._save_base = save_base
+        self.compact_records = compact_records
+        self.compact_bytes = compact_bytes
+        self.fsync = fsync
+
+        self.lock = threading.RLock()
+        self._view: Optional[Dict[str, Any]] = None
+        self._seq = 0
+        self._records = 0
+        self._signature = None
+
+    # ── Loading ─────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _stat(path: Path):
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def signature(self):
+        """Changes whenever the base file or the journal changes on disk."""
+        return (self._stat(self.file_path), self._stat(self.journal_path))
+
+    def _load(self) -> None:
+        base = self._load_base(self.file_path)
+        if not isinstance(base, dict):
+            base = {}
+        base_seq = int(base.pop(JOURNAL_SEQ_KEY, 0) or 0)
+        seq, records = base_seq, 0
+
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn write from a crash: nothing after it was acknowledged
+                        logger.warning("[StateManager] Ignoring damaged tail of %s", self.journal_path.name)
+                        break
+                    records += 1
+                    if int(record.get("seq", 0)) <= base_seq:
+                        continue   # already compacted into the base
+                    self._apply(base, record)
+                    seq = max(seq, int(record.get("seq", 0)))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error("[StateManager] Error replaying %s: %s", self.journal_path.name, str(e))
+
+        self._view = base
+        self._seq = seq
+        self._records = records
+        self._signature = self.signature()
+
+    def _ensure_fresh(self) -> None:
+        # Reload when another StateManager / process touched the files
+        if self._view is None or self._signature != self.signature():
+            self._load()
+
+    # ── Records ─────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _apply(view: Dict[str, Any], record: Dict[str, Any]) -> None:
+        op = record.get("op")
+        if op == "append":
+            items = view.get(record["key"])
+            if not isinstance(items, list):
+                items = view[record["key"]] = []
+            items.append(record.get("item"))
+        elif op == "set" and record.get("delete"):
+            for key in record["delete"]:
+                view.pop(key, None)
+        view.update(record.get("set") or {})
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._seq += 1
+        record["seq"] = self._seq
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        self._apply(self._view, record)
+        self._records += 1
+        self._signature = self.signature()
+        self._maybe_compact()
+
+    # ── Public API ──────────────────────────────────────────────────────────
+
+    def read(self) -> Dict[str, Any]:
+        """Current state (a copy the caller may modify)."""
+        with self.lock:
+            self._ensure_fresh()
+            return copy.deepcopy(self._view)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """One top-level value (a copy)."""
+        with self.lock:
+            self._ensure_fresh()
+            return copy.deepcopy(self._view.get(key, default))
+
+    def replace(self, data: Dict[str, Any]) -> None:
+        """Make data the new state; only changed top-level keys are journaled."""
+        with self.lock:
+            self._ensure_fresh()
+            data = {k: v for k, v in data.items() if k != JOURNAL_SEQ_KEY}
+            changed = {k: v for k, v in data.items() if self._view.get(k) != v or k not in self._view}
+            removed = [k for k in self._view if k not in data]
+            if not changed and not removed:
+                return
+            record = {"op": "set", "set": copy.deepcopy(changed)}
+            if removed:
+                record["delete"] = removed
+            self._write(record)
+
+    def append(
+        self,
+        key: str,
+        item: Any,
+        count_key: Optional[str] = None,
+        updates: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Append item to the list at key.
+
+        Args:
+            key: Top-level list key
+            item: Item to append
+            count_key: Top-level key kept equal to the list length
+            updates: Other top-level values to set alongside
+        """
+        with self.lock:
+            self._ensure_fresh()
+            values = dict(updates or {})
+            if count_key:
+                items = self._view.get(key)
+                values[count_key] = (len(items) if isinstance(items, list) else 0) + 1
+            self._write({"op": "append", "key": key, "item": copy.deepcopy(item), "set": values})
+
+    def compact(self) -> None:
+        """Write the view into the JSON file and empty the journal."""
+        with self.lock:
+            self._ensure_fresh()
+            if self._records == 0 and self.file_path.exists():
+                return
+            data = dict(self._view)
+            data[JOURNAL_SEQ_KEY] = self._seq
+            # Base first: a crash before truncation only leaves records the
+            # base already covers (skipped by seq on replay)
+            self._save_base(self.file_path, data)
+            try:
+                with open(self.journal_path, "w", encoding="utf-8"):
+                    pass
+            except Exception as e:
+                logger.debug("[StateManager] Journal truncate failed (non-critical): %s", str(e))
+                return
+            self._records = 0
+            self._signature = self.signature()
+            logger.debug("[StateManager] Compacted %s (seq %d)", self.file_path.name, self._seq)
+
+    def _maybe_compact(self) -> None:
+        size = (self._signature[1] or (0, 0))[1]
+        if self._records >= self.compact_records or size >= self.compact_bytes:
+            try:
+                self.compact()
+            except Exception as e:
+                # The journal still holds everything; retry on the next write
+                logger.warning("[StateManager] Compaction of %s failed: %s", self.file_path.name, str(e))
+
+
 class StateManager:
     """Manages all bot state persistence and recovery."""
 
@@ -56,6 +332,18 @@ class StateManager:
         # Thread lock for thread-safe operations
         self.lock = threading.Lock()
 
+        # Serializes load-modify-save of bot_state.json (parallel profiles)
+        self._state_lock = threading.RLock()
+
+        # Journaled views of the state files (created on first use)
+        self._journals: Dict[Path, JsonJournal] = {}
+        self._journals_lock = threading.Lock()
+
+        # Upload history index, valid while uploaded_videos.json is unchanged
+        self._history_lock = threading.Lock()
+        self._history_index: Optional[Dict[str, Any]] = None
+        self._history_signature = None
+
         logger.info("[StateManager] Initialized with data_dir: %s", self.data_dir)
 
     def _load_json_file(self, file_path: Path) -> Dict[str, Any]:
@@ -161,6 +449,23 @@ class StateManager:
                     time.sleep(retry_delay)
                     retry_delay *= 2  # Exponential backoff
 
+    def _journal(self, file_path: Path) -> JsonJournal:
+        """Journal for one state file."""
+        with self._journals_lock:
+            journal = self._journals.get(file_path)
+            if journal is None:
+                journal = JsonJournal(file_path, self._load_json_file, self._save_json_file)
+                self._journals[file_path] = journal
+            return journal
+
+    def compact(self):
+        """Fold all journals back into their JSON files (e.g. on shutdown)."""
+        for file_path in (self.bot_state_file, self.folder_progress_file, self.uploaded_videos_file):
+            try:
+                self._journal(file_path).compact()
+            except Exception as e:
+                logger.error("[StateManager] Compaction of %s failed: %s", file_path.name, str(e))
+
     def load_state(self) -> Dict[str, Any]:
         """
         Load complete bot state.
@@ -168,7 +473,7 @@ class StateManager:
         Returns:
             Dict with bot state data
         """
-        return self._load_json_file(self.bot_state_file)
+        return self._journal(self.bot_state_file).read()
 
     def save_state(self, state: Dict[str, Any]):
         """
@@ -179,7 +484,7 @@ class StateManager:
         """
         # Update timestamp
         state['last_updated'] = time.strftime("%Y-%m-%d %H:%M:%S")
-        self._save_json_file(self.bot_state_file, state)
+        self._journal(self.bot_state_file).replace(state)
 
     def load_folder_progress(self) -> Dict[str, Any]:
         """
@@ -188,7 +493,7 @@ class StateManager:
         Returns:
             Dict with folder progress
         """
-        return self._load_json_file(self.folder_progress_file)
+        return self._journal(self.folder_progress_file).read()
 
     def save_folder_progress(self, progress: Dict[str, Any]):
         """
@@ -197,7 +502,7 @@ class StateManager:
         Args:
             progress: Folder progress data
         """
-        self._save_json_file(self.folder_progress_file, progress)
+        self._journal(self.folder_progress_file).replace(progress)
 
     def load_uploaded_videos(self) -> Dict[str, Any]:
         """
@@ -206,7 +511,7 @@ class StateManager:
         Returns:
             Dict with uploaded videos list
         """
-        return self._load_json_file(self.uploaded_videos_file)
+        return self._journal(self.uploaded_videos_file).read()
 
     def save_uploaded_videos(self, videos_data: Dict[str, Any]):
         """
@@ -215,8 +520,52 @@ class StateManager:
         Args:
             videos_data: Uploaded videos data
         """
-        self._save_json_file(self.uploaded_videos_file, videos_data)
+        journal = self._journal(self.uploaded_videos_file)
+        journal.replace(videos_data)
+        index = _build_history_index(videos_data)
+        with self._history_lock:
+            self._history_index = index
+            self._history_signature = journal.signature()
+
+    def _append_history(self, list_key: str, record: Dict[str, Any], count_key: str,
+                        stamp_key: str):
+        """
+        Journal one history record and keep the in-memory index current.
 
+        Args:
+            list_key: 'videos' or 'failed_videos'
+            record: Record to append
+            count_key: Counter kept equal to the list length
+            stamp_key: Timestamp key set to now
+        """
+        journal = self._journal(self.uploaded_videos_file)
+        with journal.lock:
+            signature_before = journal.signature()
+            journal.append(list_key, record, count_key=count_key,
+                           updates={stamp_key: time.strftime("%Y-%m-%d %H:%M:%S")})
+            with self._history_lock:
+                index = self._history_index
+                if index is not None and self._history_signature == signature_before:
+                    _index_record(index, list_key, record)
+                    self._history_signature = journal.signature()
+
+    def _get_history_index(self) -> Dict[str, Any]:
+        """
+        Upload history index, re-read only when uploaded_videos.json (or its
+        journal) changed behind our back (another StateManager / process).
+        """
+        signature = self._journal(self.uploaded_videos_file).signature()
+        with self._history_lock:
+            if self._history_index is not None and self._history_signature == signature:
+                return self._history_index
+
+        index = _build_history_index(self.load_uploaded_videos())
+        with self._history_lock:
+            self._history_index = index
+            self._history_signature = signature
+        return index
+
+    @_serialized
     def update_current_upload(self, video_file: str = None, video_name: str = None,
                              bookmark: str = None, status: str = None,
                              progress: int = None, attempt: int = None):
@@ -259,6 +608,7 @@ class StateManager:
         logger.debug("[StateManager] Updated current upload: %s @ %d%%",
                     video_name or 'unknown', progress or 0)
 
+    @_serialized
     def clear_current_upload(self):
         """Clear current upload information (after completion or failure)."""
         state = self.load_state()
@@ -277,6 +627,7 @@ class StateManager:
         self.save_state(state)
         logger.debug("[StateManager] Cleared current upload")
 
+    @_serialized
     def update_queue_position(self, folder_index: int = None, folder_path: str = None,
                              total_folders: int = None, cycle: int = None):
         """
@@ -306,6 +657,7 @@ class StateManager:
         logger.debug("[StateManager] Updated queue: folder #%d, cycle #%d",
                     folder_index or 0, cycle or 1)
 
+    @_serialized
     def mark_folder_completed(self, folder_path: str):
         """
         Mark a folder as completed.
@@ -348,7 +700,7 @@ class StateManager:
         return folder_info.get('status') == 'completed'
 
     def mark_video_uploaded(self, video_file: str, bookmark: str, session_id: str = None,
-                           moved_to: str = None):
+                           moved_to: str = None, fingerprint: str = None, phash: str = None):
         """
         Add video to uploaded history.
 
@@ -357,12 +709,9 @@ class StateManager:
             bookmark: Bookmark name
             session_id: Session ID
             moved_to: New location after moving
+            fingerprint: Content fingerprint of the file (optional)
+            phash: Perceptual hash of the video (optional)
         """
-        videos_data = self.load_uploaded_videos()
-
-        if 'videos' not in videos_data:
-            videos_data['videos'] = []
-
         upload_record = {
             "file_path": video_file,
             "uploaded_at": time.strftime("%Y-%m-%d %H:%M:%S"),
@@ -370,12 +719,12 @@ class StateManager:
             "session_id": session_id,
             "moved_to": moved_to
         }
+        if fingerprint:
+            upload_record["fingerprint"] = fingerprint
+        if phash:
+            upload_record["phash"] = phash
 
-        videos_data['videos'].append(upload_record)
-        videos_data['total_uploads'] = len(videos_data['videos'])
-        videos_data['last_upload'] = time.strftime("%Y-%m-%d %H:%M:%S")
-
-        self.save_uploaded_videos(videos_data)
+        self._append_history('videos', upload_record, 'total_uploads', 'last_upload')
         logger.info("[StateManager] ✓ Recorded uploaded video: %s", os.path.basename(video_file))
 
     def mark_video_failed(
@@ -394,11 +743,6 @@ class StateManager:
             reason: Failure reason
             moved_to: New location after moving (failed uploads folder)
         """
-        videos_data = self.load_uploaded_videos()
-
-        if 'failed_videos' not in videos_data:
-            videos_data['failed_videos'] = []
-
         record = {
             "file_path": video_file,
             "failed_at": time.strftime("%Y-%m-%d %H:%M:%S"),
@@ -409,11 +753,7 @@ class StateManager:
         if moved_to:
             record["moved_to"] = moved_to
 
-        videos_data['failed_videos'].append(record)
-        videos_data['failed_count'] = len(videos_data['failed_videos'])
-        videos_data['last_failed'] = time.strftime("%Y-%m-%d %H:%M:%S")
-
-        self.save_uploaded_videos(videos_data)
+        self._append_history('failed_videos', record, 'failed_count', 'last_failed')
         logger.info("[StateManager] Recorded failed video: %s", os.path.basename(video_file))
 
     def is_video_uploaded(self, video_file: str) -> bool:
@@ -426,17 +766,7 @@ class StateManager:
         Returns:
             True if already uploaded, False otherwise
         """
-        videos_data = self.load_uploaded_videos()
-
-        if 'videos' not in videos_data:
-            return False
-
-        # Check if video file path exists in upload history
-        for record in videos_data['videos']:
-            if record.get('file_path') == video_file:
-                return True
-
-        return False
+        return history_key(video_file) in self._get_history_index()['uploaded']
 
     def is_video_failed(self, video_file: str) -> bool:
         """
@@ -448,13 +778,66 @@ class StateManager:
         Returns:
             True if marked failed, False otherwise
         """
-        videos_data = self.load_uploaded_videos()
-        failed_list = videos_data.get('failed_videos', [])
-        for record in failed_list:
-            if record.get('file_path') == video_file:
+        return history_key(video_file) in self._get_history_index()['failed']
+
+    def is_video_uploaded_to(self, video_file: str, bookmark: str) -> bool:
+        """
+        Check if video has been uploaded to a specific bookmark.
+
+        Args:
+            video_file: Video file path
+            bookmark: Bookmark name
+
+        Returns:
+            True if uploaded to that bookmark, False otherwise
+        """
+        by_bookmark = self._get_history_index()['by_bookmark']
+        return history_key(video_file) in by_bookmark.get(bookmark or '', ())
+
+    def is_fingerprint_uploaded(self, fingerprint: str) -> bool:
+        """
+        Check if a file with this content fingerprint has been uploaded.
+
+        Only records that carry a 'fingerprint' field take part.
+        """
+        return bool(fingerprint) and fingerprint in self._get_history_index()['fingerprints']
+
+    def is_similar_uploaded(self, phash: str, max_distance: int = 10) -> bool:
+        """
+        Check if an uploaded video looks like this one (perceptual hash).
+
+        Only records that carry a 'phash' field take part.
+        """
+        if not phash:
+            return False
+
+        from .fingerprint_index import perceptual_distance
+
+        for known in self._get_history_index()['phashes']:
+            distance = perceptual_distance(phash, known)
+            if distance is not None and distance <= max_distance:
                 return True
         return False
 
+    def filter_unprocessed(self, file_paths: Iterable[str]) -> List[str]:
+        """
+        Drop files already recorded as uploaded or failed (one index lookup each).
+
+        Args:
+            file_paths: Candidate file paths
+
+        Returns:
+            The remaining paths, in their original order
+        """
+        index = self._get_history_index()
+        uploaded, failed = index['uploaded'], index['failed']
+        remaining = []
+        for file_path in file_paths:
+            key = history_key(file_path)
+            if key not in uploaded and key not in failed:
+                remaining.append(file_path)
+        return remaining
+
     def get_current_position(self) -> Dict[str, Any]:
         """
         Get current bot position (folder, video, upload state).
@@ -473,6 +856,7 @@ class StateManager:
             'last_updated': state.get('last_updated')
         }
 
+    @_serialized
     def update_network_status(self, status: str, consecutive_failures: int = None):
         """
         Update network status in state.
@@ -501,6 +885,7 @@ class StateManager:
     # Daily Limit Tracking (Basic vs Pro users)
     # ═══════════════════════════════════════════════════════════
 
+    @_serialized
     def get_daily_stats(self) -> Dict[str, Any]:
         """
         Get today's upload statistics.
@@ -557,6 +942,7 @@ class StateManager:
 
         return daily_stats
 
+    @_serialized
     def increment_daily_bookmarks(self, count: int = 1, bookmark_name: str = None):
         """
         Increment daily bookmark counter with per-bookmark tracking.
@@ -758,6 +1144,7 @@ class StateManager:
             logger.error("[StateManager] Failed to load profile state: %s", str(e))
             return {}
 
+    @_serialized
     def save_profile_state(self, profile_state: Dict[str, Any]):
         """
         Save multi-profile state.
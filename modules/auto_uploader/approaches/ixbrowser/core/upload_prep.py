@@ -0,0 +1,211 @@
+"""
+Upload Preparation Pipeline for ixBrowser Approach
+
+Look-ahead preparation of the next files of a creator folder:
+- A background thread scans the folder once and prepares the next files
+  while the current one is uploading (producer/consumer)
+- Each job is validated (exists, not empty), titled and fingerprinted;
+  images are also converted (ffmpeg) and captioned
+- Bounded queue: at most `lookahead` jobs are prepared ahead
+- The upload loop only pops ready jobs; a retry gets the same job back
+  until its file is uploaded, moved or failed
+
+Usage:
+    prep = UploadPrepPipeline(list_files=list_videos, prepare=prepare_video,
+                              is_done=state_manager.is_video_uploaded)
+    job = prep.next_job(folder_path)
+    if job:
+        upload(job.file_path, title=job.title)
+    prep.close()
+"""
+
+import logging
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+_END = object()
+
+
+@dataclass
+class PreparedUpload:
+    """A file of a creator folder, ready to be handed to the page."""
+
+    file_path: str
+    folder_path: str
+    title: str
+    size: int = 0
+    fingerprint: Optional[str] = None
+    phash: Optional[str] = None           # perceptual hash (videos, if enabled)
+    upload_path: Optional[str] = None     # file to inject (converted image)
+    temp_path: Optional[str] = None       # converted copy, removed when retired
+    caption: Optional[str] = None
+    error: Optional[str] = None
+
+
+class _FolderFeed:
+    """Producer thread preparing one folder's files into a bounded queue."""
+
+    def __init__(self, pipeline: "UploadPrepPipeline", folder_path: str):
+        self.folder_path = folder_path
+        self.jobs: "queue.Queue[Any]" = queue.Queue(maxsize=pipeline.lookahead)
+        self.stop = threading.Event()
+        self.valid_jobs = 0
+        self._pipeline = pipeline
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name=f"upload-prep-{os.path.basename(folder_path)}")
+        self._thread.start()
+
+    def _put(self, item: Any) -> bool:
+        while not self.stop.is_set():
+            try:
+                self.jobs.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self) -> None:
+        pipeline = self._pipeline
+        try:
+            files = sorted(pipeline.list_files(self.folder_path))
+            folder_data = pipeline.load_folder(self.folder_path) if pipeline.load_folder else None
+
+            for file_path in files:
+                if self.stop.is_set():
+                    return
+                if file_path in pipeline.skipped:
+                    continue
+                try:
+                    job = pipeline.prepare(file_path, self.folder_path, folder_data)
+                except Exception as e:
+                    job = PreparedUpload(file_path=file_path, folder_path=self.folder_path,
+                                         title=os.path.splitext(os.path.basename(file_path))[0],
+                                         error=str(e))
+                if not self._put(job):
+                    pipeline.retire(job)
+                    return
+        except Exception as e:
+            logger.error("[UploadPrep] Preparing %s failed: %s", self.folder_path, str(e))
+        finally:
+            self._put(_END)
+
+    def close(self) -> None:
+        """Stop producing and drop (retire) jobs nobody took."""
+        self.stop.set()
+        while True:
+            try:
+                item = self.jobs.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _END:
+                self._pipeline.retire(item)
+
+
+class UploadPrepPipeline:
+    """Keeps the next uploads of the current folder prepared ahead of time."""
+
+    def __init__(self, list_files: Callable[[str], List[str]],
+                 prepare: Callable[[str, str, Any], PreparedUpload],
+                 is_done: Optional[Callable[[str], bool]] = None,
+                 load_folder: Optional[Callable[[str], Any]] = None,
+                 lookahead: int = 2):
+        """
+        Initialize Upload Prep Pipeline.
+
+        Args:
+            list_files: Returns the not yet processed files of a folder
+            prepare: Builds a PreparedUpload as prepare(file_path, folder_path, folder_data)
+            is_done: True if a file was already handled (uploaded/failed)
+            load_folder: Per-folder data for prepare (e.g. caption map), loaded once
+            lookahead: How many jobs may be prepared ahead
+        """
+        self.list_files = list_files
+        self.prepare = prepare
+        self.is_done = is_done
+        self.load_folder = load_folder
+        self.lookahead = max(1, int(lookahead))
+
+        # Files whose preparation failed (not offered again)
+        self.skipped: Set[str] = set()
+
+        self._lock = threading.Lock()
+        self._feed: Optional[_FolderFeed] = None
+        self._current: Optional[PreparedUpload] = None
+
+    def _is_pending(self, job: PreparedUpload) -> bool:
+        if not os.path.exists(job.file_path):
+            return False
+        return not (self.is_done and self.is_done(job.file_path))
+
+    def retire(self, job: Optional[PreparedUpload]) -> None:
+        """Remove a job's converted temp file."""
+        if job and job.temp_path and os.path.exists(job.temp_path):
+            try:
+                os.remove(job.temp_path)
+            except OSError as e:
+                logger.debug("[UploadPrep] Could not remove %s: %s", job.temp_path, str(e))
+
+    def next_job(self, folder_path: str) -> Optional[PreparedUpload]:
+        """
+        Job to upload next from a folder (blocks only if none is ready yet).
+
+        Returns the current job again while its file is still pending
+        (retries), otherwise the next prepared one; None when the folder has
+        nothing left.
+        """
+        with self._lock:
+            current = self._current
+            if current and current.folder_path == folder_path and self._is_pending(current):
+                return current
+            self._current = None
+            self.retire(current)
+
+            if self._feed is None or self._feed.folder_path != folder_path:
+                self._start(folder_path)
+
+            while True:
+                item = self._feed.jobs.get()
+
+                if item is _END:
+                    # Snapshot used up: rescan once for files added meanwhile
+                    if self._feed.valid_jobs == 0:
+                        return None
+                    self._start(folder_path)
+                    continue
+
+                if item.error:
+                    logger.warning("[UploadPrep] Skipping %s: %s",
+                                   os.path.basename(item.file_path), item.error)
+                    self.skipped.add(item.file_path)
+                    self.retire(item)
+                    continue
+
+                if not self._is_pending(item):
+                    self.retire(item)
+                    continue
+
+                self._feed.valid_jobs += 1
+                self._current = item
+                logger.info("[UploadPrep] Ready: %s (%.2f MB, %d more prepared)",
+                            os.path.basename(item.file_path), item.size / (1024 * 1024),
+                            self._feed.jobs.qsize())
+                return item
+
+    def _start(self, folder_path: str) -> None:
+        if self._feed:
+            self._feed.close()
+        self._feed = _FolderFeed(self, folder_path)
+
+    def close(self) -> None:
+        """Stop preparing and remove converted files that were not used."""
+        with self._lock:
+            if self._feed:
+                self._feed.close()
+                self._feed = None
+            self.retire(self._current)
+            self._current = None
@@ -0,0 +1,377 @@
+"""
+Upload Progress Monitor for ixBrowser Approach
+
+Event-driven replacement for polling the upload progress bar:
+- One page script, registered through CDP (Page.addScriptToEvaluateOnNewDocument)
+  so it is already in place when Facebook starts the upload requests
+- Network side: wraps XMLHttpRequest/fetch and counts the request bodies of
+  the video upload POSTs (upload progress events + completion of each
+  request); thumbnails and other large POSTs are ignored
+- DOM side: a single MutationObserver re-reads [role=progressbar] when the
+  page changes, instead of WebDriver calls per element/attribute
+- Python long-polls with execute_async_script: the call returns the moment
+  the page reports a change, so publish starts right after 100%
+- If the page shows neither upload requests nor a progress bar for a while
+  the wait gives up early and the caller polls the DOM text instead
+
+Usage:
+    monitor = UploadProgressMonitor(driver)
+    monitor.arm(expected_bytes=os.path.getsize(video_file))
+    ... inject file, set title ...
+    completed = monitor.wait_until_complete(timeout=600, on_progress=log)
+    if completed is None:
+        # page script unavailable / no upload seen -> fall back to DOM polling
+        pass
+"""
+
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Request bodies at least this large are treated as upload chunks
+UPLOAD_BODY_MIN_BYTES = 64 * 1024
+# Only these requests count as video upload traffic (by URL or video/* body)
+VIDEO_UPLOAD_URL_PATTERN = r"vupload|fb_video|videos?/upload|upload/video"
+# How long one execute_async_script call waits for a page event
+WAIT_SLICE_SECONDS = 10.0
+# Give up on page events when no upload request / progress bar showed up
+QUIET_FALLBACK_SECONDS = 30.0
+
+
+MONITOR_SCRIPT = r"""
+(function () {
+  if (window.__ixUploadMonitor) { return; }
+  var MIN_BODY = %(min_body)d;
+  var VIDEO_URL = new RegExp(%(video_url)s, 'i');
+  var m = window.__ixUploadMonitor = {
+    seq: 0, barProgress: -1, sent: 0, inflight: {}, pending: 0, requests: 0,
+    failed: 0, expected: 0, done: false, reason: '', waiters: [], nextId: 1
+  };
+
+  function notify() {
+    m.seq++;
+    var waiters = m.waiters;
+    m.waiters = [];
+    for (var i = 0; i < waiters.length; i++) { try { waiters[i](); } catch (e) {} }
+  }
+
+  function netBytes() {
+    var total = m.sent;
+    for (var id in m.inflight) { total += m.inflight[id]; }
+    return total;
+  }
+
+  function checkNetworkDone() {
+    if (!m.done && m.expected > 0 && m.pending === 0 && m.sent >= m.expected) {
+      m.done = true;
+      m.reason = 'network';
+    }
+  }
+  m.checkNetworkDone = checkNetworkDone;
+
+  m.snapshot = function () {
+    var net = m.expected > 0 ? Math.min(99, Math.floor(netBytes() * 100 / m.expected)) : -1;
+    return {
+      seq: m.seq, progress: m.done ? 100 : Math.max(m.barProgress, net),
+      bar: m.barProgress, network: net, sent: m.sent, pending: m.pending,
+      requests: m.requests, failed: m.failed, done: m.done, reason: m.reason
+    };
+  };
+
+  function bodySize(body) {
+    if (!body) { return 0; }
+    if (typeof body === 'string') { return body.length; }
+    if (typeof Blob !== 'undefined' && body instanceof Blob) { return body.size; }
+    if (body.byteLength !== undefined) { return body.byteLength; }
+    if (typeof FormData !== 'undefined' && body instanceof FormData) {
+      var size = 0;
+      body.forEach(function (value) { size += bodySize(value); });
+      return size;
+    }
+    return 0;
+  }
+
+  function isVideoBody(body) {
+    if (!body) { return false; }
+    if (typeof Blob !== 'undefined' && body instanceof Blob) {
+      return /^video\//i.test(body.type || '');
+    }
+    if (typeof FormData !== 'undefined' && body instanceof FormData) {
+      var found = false;
+      body.forEach(function (value) { found = found || isVideoBody(value); });
+      return found;
+    }
+    return false;
+  }
+
+  function isVideoUpload(url, body) {
+    return bodySize(body) >= MIN_BODY && (isVideoBody(body) || VIDEO_URL.test(String(url || '')));
+  }
+
+  function begin() {
+    var id = m.nextId++;
+    m.inflight[id] = 0;
+    m.pending++;
+    m.requests++;
+    notify();
+    return id;
+  }
+
+  function end(id, size, ok) {
+    if (!(id in m.inflight)) { return; }
+    delete m.inflight[id];
+    m.pending--;
+    if (ok) { m.sent += size; } else { m.failed++; }
+    checkNetworkDone();
+    notify();
+  }
+
+  var xhrOpen = XMLHttpRequest.prototype.open;
+  XMLHttpRequest.prototype.open = function (method, url) {
+    this.__ixUploadUrl = url;
+    return xhrOpen.apply(this, arguments);
+  };
+
+  var xhrSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function (body) {
+    var size = bodySize(body);
+    if (isVideoUpload(this.__ixUploadUrl, body)) {
+      var xhr = this, id = begin(), lastPct = -1;
+      try {
+        xhr.upload.addEventListener('progress', function (e) {
+          if (!(id in m.inflight)) { return; }
+          m.inflight[id] = e.loaded;
+          var pct = m.expected > 0 ? Math.floor(netBytes() * 100 / m.expected) : -1;
+          if (pct !== lastPct) { lastPct = pct; notify(); }
+        });
+      } catch (e) {}
+      xhr.addEventListener('loadend', function () {
+        end(id, size, xhr.status >= 200 && xhr.status < 300);
+      });
+    }
+    return xhrSend.apply(this, arguments);
+  };
+
+  if (window.fetch) {
+    var origFetch = window.fetch;
+    window.fetch = function (input, init) {
+      var body = init && init.body;
+      var size = bodySize(body);
+      var url = (input && input.url) || input;
+      var promise = origFetch.apply(this, arguments);
+      if (isVideoUpload(url, body)) {
+        var id = begin();
+        promise.then(function (resp) { end(id, size, resp.ok); },
+                     function () { end(id, size, false); });
+      }
+      return promise;
+    };
+  }
+
+  function readBars() {
+    var bars = document.querySelectorAll('[role="progressbar"]');
+    var best = -1;
+    for (var i = 0; i < bars.length; i++) {
+      var bar = bars[i];
+      if (!bar.offsetParent && bar.getClientRects().length === 0) { continue; }
+      var value = parseFloat(bar.getAttribute('aria-valuenow'));
+      if (isNaN(value)) {
+        var match = (bar.textContent || '').match(/(\d{1,3})\s*%%/);
+        value = match ? parseFloat(match[1]) : NaN;
+      }
+      if (!isNaN(value) && value >= 0 && value <= 100) { best = Math.max(best, value); }
+    }
+    if (best > m.barProgress) {
+      m.barProgress = best;
+      if (best >= 100 && !m.done) { m.done = true; m.reason = 'progressbar'; }
+      notify();
+    }
+  }
+
+  var scheduled = false;
+  function schedule() {
+    if (scheduled) { return; }
+    scheduled = true;
+    setTimeout(function () { scheduled = false; readBars(); }, 100);
+  }
+
+  function observe() {
+    new MutationObserver(schedule).observe(document.documentElement, {
+      subtree: true, childList: true, characterData: true,
+      attributes: true, attributeFilter: ['aria-valuenow', 'style', 'class', 'hidden']
+    });
+    readBars();
+  }
+  if (document.documentElement) { observe(); }
+  else { document.addEventListener('DOMContentLoaded', observe); }
+})();
+""" % {"min_body": UPLOAD_BODY_MIN_BYTES, "video_url": json.dumps(VIDEO_UPLOAD_URL_PATTERN)}
+
+
+# arguments: last seen seq, slice ms, expected bytes; resolves on the next page event
+WAIT_SCRIPT = r"""
+var lastSeq = arguments[0], sliceMs = arguments[1], expected = arguments[2];
+var callback = arguments[arguments.length - 1];
+var m = window.__ixUploadMonitor;
+if (!m) { callback(null); return; }
+if (expected > m.expected) { m.expected = expected; m.checkNetworkDone(); }
+if (m.seq !== lastSeq || m.done) { callback(m.snapshot()); return; }
+var finished = false;
+function finish() {
+  if (finished) { return; }
+  finished = true;
+  clearTimeout(timer);
+  callback(m.snapshot());
+}
+var timer = setTimeout(finish, sliceMs);
+m.waiters.push(finish);
+"""
+
+RESET_SCRIPT = r"""
+var m = window.__ixUploadMonitor;
+if (!m) { return false; }
+m.barProgress = -1; m.sent = 0; m.inflight = {}; m.pending = 0; m.requests = 0;
+m.failed = 0; m.expected = arguments[0] || 0; m.done = false; m.reason = ''; m.seq++;
+return true;
+"""
+
+
+class UploadProgressMonitor:
+    """Waits for upload completion on page events instead of DOM polling."""
+
+    def __init__(self, driver: Any):
+        """
+        Initialize Upload Progress Monitor.
+
+        Args:
+            driver: Selenium WebDriver attached to the ixBrowser profile
+        """
+        self.driver = driver
+        self.expected_bytes = 0
+        self._registered = False
+
+    def _register(self) -> None:
+        """Register the page script for every future document (once per driver)."""
+        if self._registered:
+            return
+        try:
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument",
+                                        {"source": MONITOR_SCRIPT})
+            self._registered = True
+            logger.debug("[UploadMonitor] Page script registered via CDP")
+        except Exception as e:
+            # Not a Chromium driver / CDP blocked: the script is still
+            # injected into the current document by arm()
+            logger.debug("[UploadMonitor] CDP registration unavailable: %s", str(e))
+
+    def arm(self, expected_bytes: int = 0) -> bool:
+        """
+        Install the page script and reset its counters for a new upload.
+
+        Call before the file is handed to the page so the upload requests
+        are seen from the first byte.
+
+        Args:
+            expected_bytes: Size of the video file being uploaded
+
+        Returns:
+            True if the page script is active in the current document
+        """
+        self.expected_bytes = int(expected_bytes or 0)
+        self._register()
+        try:
+            self.driver.execute_script(MONITOR_SCRIPT)
+            armed = bool(self.driver.execute_script(RESET_SCRIPT, self.expected_bytes))
+        except Exception as e:
+            logger.debug("[UploadMonitor] Could not install page script: %s", str(e))
+            return False
+
+        if armed:
+            logger.debug("[UploadMonitor] Armed (expecting %d bytes)", self.expected_bytes)
+        return armed
+
+    def _wait_for_event(self, last_seq: int, slice_seconds: float) -> Optional[Dict[str, Any]]:
+        state = self.driver.execute_async_script(
+            WAIT_SCRIPT, last_seq, int(slice_seconds * 1000), self.expected_bytes)
+        if state is None:
+            # Page navigated since arm(): the script is gone or fresh, re-install
+            self.driver.execute_script(MONITOR_SCRIPT)
+            state = self.driver.execute_async_script(
+                WAIT_SCRIPT, last_seq, int(slice_seconds * 1000), self.expected_bytes)
+        return state
+
+    def wait_until_complete(self, timeout: float,
+                            on_progress: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+                            on_quiet: Optional[Callable[[float], None]] = None,
+                            slice_seconds: float = WAIT_SLICE_SECONDS,
+                            quiet_fallback: float = QUIET_FALLBACK_SECONDS) -> Optional[bool]:
+        """
+        Block until the page reports the upload as complete.
+
+        Args:
+            timeout: Maximum seconds to wait
+            on_progress: Called with (percent, page state) whenever progress changes
+            on_quiet: Called with seconds since the last change when a wait
+                slice passes without any page event
+            slice_seconds: Longest single execute_async_script wait
+            quiet_fallback: Seconds without any upload request or progress
+                bar after which the page events are given up on
+
+        Returns:
+            True when complete, False on timeout, None if the page script is
+            not available or saw no upload (caller should fall back to DOM polling)
+        """
+        started = time.time()
+        deadline = started + timeout
+        last_seq = -1
+        last_progress = -1
+        last_change = time.time()
+
+        try:
+            self.driver.set_script_timeout(slice_seconds + 10)
+        except Exception as e:
+            logger.debug("[UploadMonitor] Could not set script timeout: %s", str(e))
+
+        while time.time() < deadline:
+            wait = max(0.5, min(slice_seconds, deadline - time.time()))
+            try:
+                state = self._wait_for_event(last_seq, wait)
+            except Exception as e:
+                if last_seq < 0:
+                    logger.debug("[UploadMonitor] Page script unavailable: %s", str(e))
+                    return None
+                logger.debug("[UploadMonitor] Wait error (retrying): %s", str(e))
+                time.sleep(1)
+                continue
+
+            if state is None:
+                return None if last_seq < 0 else False
+
+            changed = state.get("seq") != last_seq
+            last_seq = state.get("seq", last_seq)
+            progress = int(state.get("progress", -1))
+
+            if progress != last_progress:
+                last_progress = progress
+                last_change = time.time()
+                if on_progress and progress >= 0:
+                    on_progress(progress, state)
+
+            if state.get("done"):
+                logger.debug("[UploadMonitor] Complete (%s): %s", state.get("reason"), state)
+                return True
+
+            if (not state.get("requests") and state.get("bar", -1) < 0
+                    and time.time() - started >= quiet_fallback):
+                # Upload runs through requests/markup the script does not know
+                logger.debug("[UploadMonitor] No upload activity after %.0fs: %s",
+                             time.time() - started, state)
+                return None
+
+            if not changed and on_quiet:
+                on_quiet(time.time() - last_change)
+
+        return False
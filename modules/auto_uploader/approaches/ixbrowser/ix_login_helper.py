@@ -9,8 +9,8 @@ import time
 from pathlib import Path
 from typing import Optional, Tuple
 import pyautogui
-import cv2
-import numpy as np
+
+from ...browser.screen_matcher import get_screen_matcher
 
 logger = logging.getLogger(__name__)
 
@@ -87,60 +87,18 @@ class IXBrowserLoginHelper:
         logger.info("[IXLogin] Detecting login window...")
         logger.info("[IXLogin]   Confidence threshold: %.0f%%", confidence * 100)
 
-        # Try PyAutoGUI first
         try:
-            location = pyautogui.locateOnScreen(
-                str(self.login_window_img),
-                confidence=confidence
-            )
+            location = get_screen_matcher().find(self.login_window_img, confidence=confidence)
             if location:
-                logger.info("[IXLogin] ✓ Login window detected (PyAutoGUI)")
-                logger.info("[IXLogin]   Location: %s", location)
-                return True
-        except Exception as e:
-            logger.debug("[IXLogin] PyAutoGUI detection failed: %s", str(e))
-
-        # Fallback to OpenCV
-        try:
-            if self._detect_with_opencv(self.login_window_img, confidence):
-                logger.info("[IXLogin] ✓ Login window detected (OpenCV)")
+                logger.info("[IXLogin] ✓ Login window detected (confidence: %.2f)", location.confidence)
+                logger.info("[IXLogin]   Location: %s", tuple(location[:4]))
                 return True
         except Exception as e:
-            logger.debug("[IXLogin] OpenCV detection failed: %s", str(e))
+            logger.debug("[IXLogin] Login window detection failed: %s", str(e))
 
         logger.info("[IXLogin] ✗ Login window not detected")
         return False
 
-    def _detect_with_opencv(self, template_path: Path, confidence: float) -> bool:
-        """
-        Detect image using OpenCV template matching.
-
-        Args:
-            template_path: Path to template image
-            confidence: Minimum confidence threshold
-
-        Returns:
-            True if detected with sufficient confidence
-        """
-        # Take screenshot
-        screenshot = pyautogui.screenshot()
-        screenshot_np = np.array(screenshot)
-        screenshot_gray = cv2.cvtColor(screenshot_np, cv2.COLOR_RGB2GRAY)
-
-        # Load template
-        template = cv2.imread(str(template_path), cv2.IMREAD_GRAYSCALE)
-        if template is None:
-            logger.error("[IXLogin] Failed to load template: %s", template_path)
-            return False
-
-        # Template matching
-        result = cv2.matchTemplate(screenshot_gray, template, cv2.TM_CCOEFF_NORMED)
-        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
-
-        logger.debug("[IXLogin] OpenCV match confidence: %.2f", max_val)
-
-        return max_val >= confidence
-
     def find_and_click_field(self, icon_img: Path, offset_x: int = 5, search_region: Optional[Tuple[int, int, int, int]] = None) -> Tuple[bool, Optional[Tuple[int, int]]]:
         """
         Find icon and click to the right of it.
@@ -158,12 +116,8 @@ class IXBrowserLoginHelper:
             logger.info("[IXLogin]   Search region: left=%d, top=%d, width=%d, height=%d",
                        search_region[0], search_region[1], search_region[2], search_region[3])
 
-        # Try PyAutoGUI first
         try:
-            if search_region:
-                location = pyautogui.locateOnScreen(str(icon_img), confidence=0.7, region=search_region)
-            else:
-                location = pyautogui.locateOnScreen(str(icon_img), confidence=0.7)
+            location = get_screen_matcher().find(icon_img, confidence=0.7, region=search_region)
 
             if location:
                 # Click to the right of the icon
@@ -172,84 +126,21 @@ class IXBrowserLoginHelper:
 
                 icon_center_y = location.top + (location.height // 2)
 
-                logger.info("[IXLogin] ✓ Found icon (PyAutoGUI)")
+                logger.info("[IXLogin] ✓ Found icon (confidence: %.2f)", location.confidence)
                 logger.info("[IXLogin]   Icon location: left=%d, top=%d, width=%d, height=%d",
                            location.left, location.top, location.width, location.height)
                 logger.info("[IXLogin]   Clicking at: (%d, %d)", click_x, click_y)
 
                 pyautogui.click(click_x, click_y)
+                get_screen_matcher().invalidate()
                 time.sleep(0.5)  # Wait for field to activate
                 return True, (location.left, icon_center_y)
         except Exception as e:
-            logger.debug("[IXLogin] PyAutoGUI failed: %s", str(e))
-
-        # Fallback to OpenCV
-        try:
-            location = self._find_with_opencv(icon_img, search_region)
-            if location:
-                x, y, w, h = location
-                click_x = x + w + offset_x
-                click_y = y + (h // 2)
-
-                icon_center_y = y + (h // 2)
-
-                logger.info("[IXLogin] ✓ Found icon (OpenCV)")
-                logger.info("[IXLogin]   Icon location: x=%d, y=%d, w=%d, h=%d", x, y, w, h)
-                logger.info("[IXLogin]   Clicking at: (%d, %d)", click_x, click_y)
-
-                pyautogui.click(click_x, click_y)
-                time.sleep(0.5)
-                return True, (x, icon_center_y)
-        except Exception as e:
-            logger.debug("[IXLogin] OpenCV failed: %s", str(e))
+            logger.debug("[IXLogin] Icon search failed: %s", str(e))
 
         logger.error("[IXLogin] ✗ Could not find: %s", icon_img.name)
         return False, None
 
-    def _find_with_opencv(self, template_path: Path, search_region: Optional[Tuple[int, int, int, int]] = None) -> Optional[Tuple[int, int, int, int]]:
-        """
-        Find image location using OpenCV.
-
-        Args:
-            template_path: Path to template image
-            search_region: Optional (left, top, width, height) to restrict search area
-
-        Returns:
-            Tuple of (x, y, width, height) or None
-        """
-        # Take screenshot
-        screenshot = pyautogui.screenshot()
-        screenshot_np = np.array(screenshot)
-
-        # Crop to search region if specified
-        if search_region:
-            left, top, width, height = search_region
-            screenshot_np = screenshot_np[top:top+height, left:left+width]
-
-        screenshot_gray = cv2.cvtColor(screenshot_np, cv2.COLOR_RGB2GRAY)
-
-        # Load template
-        template = cv2.imread(str(template_path), cv2.IMREAD_GRAYSCALE)
-        if template is None:
-            return None
-
-        # Template matching
-        result = cv2.matchTemplate(screenshot_gray, template, cv2.TM_CCOEFF_NORMED)
-        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
-
-        if max_val >= 0.7:
-            h, w = template.shape
-            x, y = max_loc
-
-            # Adjust coordinates if we searched in a region
-            if search_region:
-                x += search_region[0]
-                y += search_region[1]
-
-            return (x, y, w, h)
-
-        return None
-
     def perform_login(self, retry_count: int = 3) -> bool:
         """
         Perform complete login sequence.
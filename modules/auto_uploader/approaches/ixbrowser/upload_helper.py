@@ -25,7 +25,12 @@ from selenium.webdriver.support import expected_conditions as EC
 
 # Phase 2: Import core modules for robustness
 from .core.state_manager import StateManager
+from ...browser.screen_matcher import get_screen_matcher
 from .core.network_monitor import NetworkMonitor
+from .core.upload_progress_monitor import UploadProgressMonitor
+from .core.input_lease import InputLease, get_input_lease
+from .core.upload_prep import PreparedUpload, UploadPrepPipeline
+from .core.fingerprint_index import get_fingerprint_index
 from .utils.file_handler import FileHandler
 
 # Import settings manager for delete preference
@@ -95,7 +100,8 @@ class VideoUploadHelper:
     """Helper class for uploading videos to Facebook via bookmarks."""
 
     def __init__(self, driver: Any, state_manager: StateManager = None,
-                 network_monitor: NetworkMonitor = None):
+                 network_monitor: NetworkMonitor = None,
+                 input_lease: InputLease = None, focus_callback=None):
         """
         Initialize upload helper.
 
@@ -103,6 +109,9 @@ class VideoUploadHelper:
             driver: Selenium WebDriver instance
             state_manager: Optional StateManager for persistence (Phase 2)
             network_monitor: Optional NetworkMonitor for resilience (Phase 2)
+            input_lease: Foreground lease shared with other open profiles
+            focus_callback: Brings this profile's window to the front
+                whenever the lease is newly taken
         """
         self.driver = driver
         self.upload_timeout = 600  # 10 minutes max per video
@@ -111,6 +120,32 @@ class VideoUploadHelper:
         self.state_manager = state_manager or StateManager()
         self.network_monitor = network_monitor or NetworkMonitor(check_interval=10)
         self.file_handler = FileHandler()
+        self.progress_monitor = UploadProgressMonitor(driver)
+
+        # Desktop input (mouse, OS dialogs, clipboard) is shared by all open profiles
+        self.input_lease = input_lease or get_input_lease()
+        self.focus_callback = focus_callback
+
+        # Content fingerprints (cached by path/size/mtime) for duplicate protection
+        self.fingerprints = get_fingerprint_index()
+
+        # Look-ahead preparation: next files are validated/converted/fingerprinted
+        # in the background while the current one uploads
+        from .config.upload_config import UPLOAD_CONFIG
+        lookahead = UPLOAD_CONFIG.get("prep_lookahead", 2)
+        self.video_prep = UploadPrepPipeline(
+            list_files=self._list_folder_videos,
+            prepare=self._prepare_video,
+            is_done=self._is_media_done,
+            lookahead=lookahead,
+        )
+        self.image_prep = UploadPrepPipeline(
+            list_files=self._list_folder_images,
+            prepare=self._prepare_image,
+            is_done=self._is_media_done,
+            load_folder=self.load_image_text_map,
+            lookahead=lookahead,
+        )
 
         # Load settings for delete preference
         self.settings = SettingsManager()
@@ -128,6 +163,10 @@ class VideoUploadHelper:
 
         logger.info("[Upload] ✓ VideoUploadHelper initialized with Phase 2 robustness")
 
+    def _take_foreground(self, reason: str) -> None:
+        """Wait for the desktop input lease and bring this profile's window up."""
+        self.input_lease.acquire(reason, focus=self.focus_callback)
+
     def close_unwanted_windows(self) -> int:
         """
         Close any unwanted popup windows/dialogs that appear during upload.
@@ -842,10 +881,7 @@ class VideoUploadHelper:
 
                 # Find all matches on screen
                 logger.info("[Upload] Searching for button image...")
-                matches = list(pyautogui.locateAllOnScreen(
-                    ADD_VIDEOS_BUTTON_IMAGE,
-                    confidence=0.8
-                ))
+                matches = get_screen_matcher().find_all(ADD_VIDEOS_BUTTON_IMAGE, confidence=0.8)
 
                 if not matches:
                     logger.warning("[Upload] No button matches found in attempt %d", attempt)
@@ -985,15 +1021,10 @@ class VideoUploadHelper:
                     logger.info("[Upload][Image] Retry %d/%d (image search)...", attempt, retries)
                     self.idle_mouse_activity(duration=2.0, base_radius=85)
 
-                matches = list(pyautogui.locateAllOnScreen(
-                    ADD_PHOTOS_BUTTON_IMAGE,
-                    confidence=0.8
-                ))
+                matcher = get_screen_matcher()
+                matches = matcher.find_all(ADD_PHOTOS_BUTTON_IMAGE, confidence=0.8)
                 if not matches:
-                    matches = list(pyautogui.locateAllOnScreen(
-                        ADD_PHOTOS_VIDEO_BUTTON_IMAGE,
-                        confidence=0.8
-                    ))
+                    matches = matcher.find_all(ADD_PHOTOS_VIDEO_BUTTON_IMAGE, confidence=0.8)
 
                 if matches:
                     logger.info("[Upload][Image] Found %d Add photo match(es)", len(matches))
@@ -1072,10 +1103,7 @@ class VideoUploadHelper:
                     logger.info("[Upload][Image] Retry %d/%d (image search)...", attempt, retries)
                     self.idle_mouse_activity(duration=1.5, base_radius=70)
 
-                matches = list(pyautogui.locateAllOnScreen(
-                    UPLOAD_FROM_DESKTOP_BUTTON_IMAGE,
-                    confidence=0.8
-                ))
+                matches = get_screen_matcher().find_all(UPLOAD_FROM_DESKTOP_BUTTON_IMAGE, confidence=0.8)
 
                 if matches:
                     logger.info("[Upload][Image] Found %d Upload from desktop match(es)", len(matches))
@@ -1153,6 +1181,63 @@ class VideoUploadHelper:
             logger.error("[Upload] Error finding video: %s", str(e))
             return None
 
+    def _folder_queue_for(self, folder_path: str):
+        from .core.folder_queue import FolderQueueManager
+
+        return FolderQueueManager(
+            base_path=os.path.dirname(folder_path),
+            state_manager=self.state_manager,
+        )
+
+    def _list_folder_videos(self, folder_path: str) -> List[str]:
+        return self._folder_queue_for(folder_path).get_videos_in_folder(folder_path, exclude_uploaded=True)
+
+    def _list_folder_images(self, folder_path: str) -> List[str]:
+        return self._folder_queue_for(folder_path).get_images_in_folder(folder_path, exclude_uploaded=True)
+
+    def _is_media_done(self, file_path: str) -> bool:
+        return self.state_manager.is_video_uploaded(file_path) or self.state_manager.is_video_failed(file_path)
+
+    def _prepare_video(self, video_file: str, folder_path: str, folder_data: Any = None) -> PreparedUpload:
+        """Validate, title and fingerprint a video (runs in the prep thread)."""
+        size = os.path.getsize(video_file)
+        if size <= 0:
+            raise ValueError("empty video file")
+
+        return PreparedUpload(
+            file_path=video_file,
+            folder_path=folder_path,
+            title=os.path.splitext(os.path.basename(video_file))[0],
+            size=size,
+            fingerprint=self.fingerprints.fingerprint(video_file),
+            phash=self.fingerprints.perceptual_hash(video_file),
+            upload_path=video_file,
+        )
+
+    def _prepare_image(self, image_file: str, folder_path: str,
+                       caption_map: Optional[Dict[str, str]] = None) -> PreparedUpload:
+        """Validate, convert, caption and fingerprint an image (runs in the prep thread)."""
+        size = os.path.getsize(image_file)
+        if size <= 0:
+            raise ValueError("empty image file")
+
+        upload_path, temp_path = self.convert_image_if_needed(image_file, folder_path)
+        return PreparedUpload(
+            file_path=image_file,
+            folder_path=folder_path,
+            title=Path(image_file).stem or "unknown",
+            size=size,
+            fingerprint=self.fingerprints.fingerprint(image_file),
+            upload_path=upload_path,
+            temp_path=temp_path,
+            caption=self.get_image_caption_for_file(image_file, caption_map or {}),
+        )
+
+    def close(self) -> None:
+        """Stop look-ahead preparation and remove converted files not used."""
+        self.video_prep.close()
+        self.image_prep.close()
+
     def get_first_image_from_folder(self, folder_path: str) -> Optional[str]:
         """
         Get first image file from folder using FolderQueueManager for consistency.
@@ -1345,6 +1430,7 @@ class VideoUploadHelper:
         """
         Paste caption text into the active input area using clipboard.
         """
+        self._take_foreground("caption paste")
         try:
             pyperclip.copy(caption)
             time.sleep(0.2)
@@ -1354,6 +1440,8 @@ class VideoUploadHelper:
         except Exception as e:
             logger.error("[Upload][Image] Caption paste failed: %s", str(e))
             return False
+        finally:
+            self.input_lease.release()
 
     def focus_image_caption_area_dom(self) -> bool:
         """
@@ -1420,7 +1508,7 @@ class VideoUploadHelper:
         Focus caption area using image recognition.
         """
         try:
-            location = pyautogui.locateOnScreen(IMAGE_TEXT_AREA_IMAGE, confidence=0.8)
+            location = get_screen_matcher().find(IMAGE_TEXT_AREA_IMAGE, confidence=0.8)
             if not location:
                 return False
 
@@ -1516,10 +1604,7 @@ class VideoUploadHelper:
 
         while (time.time() - start_time) < timeout:
             try:
-                location = pyautogui.locateOnScreen(
-                    ACTIVE_PUBLISH_BUTTON_IMAGE,
-                    confidence=0.8
-                )
+                location = get_screen_matcher().find(ACTIVE_PUBLISH_BUTTON_IMAGE, confidence=0.8)
                 if location:
                     logger.info("[Upload][Image] Active Publish button detected")
                     self.hover_on_active_publish_button_image(location)
@@ -1902,6 +1987,7 @@ class VideoUploadHelper:
             # Method 2: Fallback to clipboard paste (works for emojis/special characters)
             if not typing_success:
                 logger.info("[Upload] Attempting clipboard paste fallback...")
+                self._take_foreground("clipboard paste")
                 try:
                     # Copy text to clipboard
                     pyperclip.copy(text)
@@ -1928,6 +2014,8 @@ class VideoUploadHelper:
                 except Exception as paste_error:
                     logger.error("[Upload] Clipboard paste failed: %s", str(paste_error))
                     return False
+                finally:
+                    self.input_lease.release()
             else:
                 return True
 
@@ -2172,17 +2260,61 @@ class VideoUploadHelper:
         """
         Monitor upload progress until 100% complete.
 
+        Waits on page events (upload requests + progress bar mutations, see
+        UploadProgressMonitor) and falls back to polling the DOM when the
+        page script is not available or does not see the upload.
+
         Returns:
             True if upload completed successfully
         """
         logger.info("⏳ Monitoring upload progress...")
 
+        def on_progress(progress: int, state: Dict[str, Any]) -> None:
+            logger.info("📊 Upload Progress: %d%%", progress)
+            self.state_manager.update_current_upload(progress=progress)
+
+        def on_quiet(idle_seconds: float) -> None:
+            if idle_seconds >= 50:
+                logger.warning("⚠ No upload progress for %.0f seconds", idle_seconds)
+            # Short star movement between waits (shows bot is active)
+            self.idle_mouse_activity(duration=2.0, base_radius=80)
+
+        start_time = time.time()
+        completed = self.progress_monitor.wait_until_complete(
+            self.upload_timeout, on_progress=on_progress, on_quiet=on_quiet)
+
+        if completed is None:
+            logger.info("[Upload] Page progress events unavailable, polling the DOM instead")
+            return self._poll_upload_progress_dom(
+                timeout=self.upload_timeout - (time.time() - start_time))
+
+        if completed:
+            self.state_manager.update_current_upload(progress=100, status="completed")
+            logger.info("✓✓✓ Upload COMPLETE! (%.1fs)", time.time() - start_time)
+            return True
+
+        logger.error("[Upload] ✗ Upload timeout after %.0f seconds (limit: %d seconds)",
+                    time.time() - start_time, self.upload_timeout)
+        return False
+
+    def _poll_upload_progress_dom(self, timeout: Optional[float] = None) -> bool:
+        """
+        Poll the progress bar / percentage text until 100% complete.
+
+        Args:
+            timeout: Seconds to poll for (default: upload_timeout)
+
+        Returns:
+            True if upload completed successfully
+        """
         start_time = time.time()
         last_progress = 0
         stuck_count = 0
         max_stuck_iterations = 10  # Alert if stuck for 50 seconds (10 * 5s)
+        if timeout is None:
+            timeout = self.upload_timeout
 
-        while (time.time() - start_time) < self.upload_timeout:
+        while (time.time() - start_time) < timeout:
             try:
                 # Method 1: Progress bar with role="progressbar"
                 progress_bars = self.driver.find_elements(By.XPATH, "//*[@role='progressbar']")
@@ -2314,7 +2446,7 @@ class VideoUploadHelper:
         # Timeout reached
         elapsed = time.time() - start_time
         logger.error("[Upload] ✗ Upload timeout after %.0f seconds (limit: %d seconds)",
-                    elapsed, self.upload_timeout)
+                    elapsed, timeout)
         logger.error("[Upload]   Last detected progress: %d%%", last_progress)
         return False
 
@@ -2430,25 +2562,19 @@ class VideoUploadHelper:
                 location = button.location
                 size = button.size
 
-                # Use image recognition to verify enabled state
-                enabled_match = pyautogui.locateOnScreen(
-                    PUBLISH_BUTTON_ENABLED_IMAGE,
+                # Use image recognition to verify enabled state (both
+                # state images checked against one screen capture)
+                state_match = get_screen_matcher().find_any(
+                    [PUBLISH_BUTTON_ENABLED_IMAGE, PUBLISH_BUTTON_DISABLED_IMAGE],
                     confidence=0.75
                 )
 
-                if enabled_match:
+                if state_match and state_match[0] == PUBLISH_BUTTON_ENABLED_IMAGE:
                     logger.info("[Upload] ✓ Button is ENABLED (image match confirmed)")
                     return True
-                else:
-                    # Try matching disabled state
-                    disabled_match = pyautogui.locateOnScreen(
-                        PUBLISH_BUTTON_DISABLED_IMAGE,
-                        confidence=0.75
-                    )
-
-                    if disabled_match:
-                        logger.debug("[Upload] Button is DISABLED (disabled image match)")
-                        return False
+                elif state_match:
+                    logger.debug("[Upload] Button is DISABLED (disabled image match)")
+                    return False
 
             except Exception as img_error:
                 logger.debug("[Upload] Image state check failed: %s", str(img_error))
@@ -2665,16 +2791,13 @@ class VideoUploadHelper:
         Click publish button using image recognition.
         """
         try:
-            enabled_match = pyautogui.locateOnScreen(
-                PUBLISH_BUTTON_ENABLED_IMAGE,
+            state_match = get_screen_matcher().find_any(
+                [PUBLISH_BUTTON_ENABLED_IMAGE, PUBLISH_BUTTON_DISABLED_IMAGE],
                 confidence=0.8
             )
+            enabled_match = state_match[1] if state_match and state_match[0] == PUBLISH_BUTTON_ENABLED_IMAGE else None
             if not enabled_match:
-                disabled_match = pyautogui.locateOnScreen(
-                    PUBLISH_BUTTON_DISABLED_IMAGE,
-                    confidence=0.8
-                )
-                if disabled_match:
+                if state_match:
                     logger.warning("[Upload] Publish button appears disabled (image match)")
                 else:
                     logger.warning("[Upload] Publish button image not found")
@@ -2830,6 +2953,17 @@ class VideoUploadHelper:
             duration: How long to animate (seconds) - patterns adapt to available time
             base_radius: Base size for patterns in pixels (randomized per pattern)
         """
+        # Another profile is using the desktop: just wait instead
+        if not self.input_lease.try_acquire("idle mouse"):
+            time.sleep(duration)
+            return
+
+        try:
+            self._animate_idle_mouse(duration, base_radius)
+        finally:
+            self.input_lease.release()
+
+    def _animate_idle_mouse(self, duration: float, base_radius: int) -> None:
         # SMART FEATURE: Check if user is actively using mouse
         try:
             initial_mouse_pos = pyautogui.position()
@@ -3206,13 +3340,15 @@ class VideoUploadHelper:
     def upload_images_for_folder(self, bookmark: Dict[str, str], folder_path: str, max_retries: int = 3) -> bool:
         """
         Upload all images in a folder, one by one.
+
+        Images come from the look-ahead pipeline: the next ones are already
+        converted and captioned while the current one uploads.
         """
-        caption_map = self.load_image_text_map(folder_path)
         processed_any = False
 
         while True:
-            image_file = self.get_first_image_from_folder(folder_path)
-            if not image_file:
+            job = self.image_prep.next_job(folder_path)
+            if not job:
                 if not processed_any:
                     logger.info("[Upload][Image] No images found for folder: %s", os.path.basename(folder_path))
                 return True
@@ -3221,9 +3357,9 @@ class VideoUploadHelper:
             success = self.upload_image_to_bookmark(
                 bookmark=bookmark,
                 folder_path=folder_path,
-                image_file=image_file,
-                caption_map=caption_map,
+                image_file=job.file_path,
                 max_retries=max_retries,
+                prepared=job,
             )
             if not success:
                 return False
@@ -3235,10 +3371,29 @@ class VideoUploadHelper:
         image_file: str,
         caption_map: Optional[Dict[str, str]] = None,
         max_retries: int = 3,
+        prepared: Optional[PreparedUpload] = None,
     ) -> bool:
         """
         Upload a single image to a bookmark (test mode skips publish click).
+
+        Image uploads go through the OS file dialog and on-screen matching
+        from start to end, so the whole upload holds the input lease.
+        A prepared job supplies the converted file and caption.
         """
+        with self.input_lease.hold("image upload", focus=self.focus_callback):
+            return self._upload_image_to_bookmark(
+                bookmark, folder_path, image_file, caption_map=caption_map,
+                max_retries=max_retries, prepared=prepared)
+
+    def _upload_image_to_bookmark(
+        self,
+        bookmark: Dict[str, str],
+        folder_path: str,
+        image_file: str,
+        caption_map: Optional[Dict[str, str]] = None,
+        max_retries: int = 3,
+        prepared: Optional[PreparedUpload] = None,
+    ) -> bool:
         bookmark_title = bookmark["title"]
         image_name = Path(image_file).stem or "unknown"
         caption_map = caption_map or {}
@@ -3281,8 +3436,11 @@ class VideoUploadHelper:
                 logger.info("[Upload][Image] Step 3: Waiting for page to stabilize...")
                 self.idle_mouse_activity(duration=2.5, base_radius=90)
 
-                # Step 4: Convert if needed
-                upload_path, temp_cleanup_path = self.convert_image_if_needed(image_file, folder_path)
+                # Step 4: Convert if needed (prepared jobs are converted already)
+                if prepared and prepared.upload_path:
+                    upload_path = prepared.upload_path
+                else:
+                    upload_path, temp_cleanup_path = self.convert_image_if_needed(image_file, folder_path)
 
                 # Step 5: Preload file input
                 logger.info("[Upload][Image] Step 4: Pre-loading image file input...")
@@ -3378,7 +3536,10 @@ class VideoUploadHelper:
 
                 # Step 8: Set caption before publish becomes active
                 logger.info("[Upload][Image] Step 7: Setting image caption...")
-                caption = self.get_image_caption_for_file(image_file, caption_map)
+                if prepared and prepared.caption is not None:
+                    caption = prepared.caption
+                else:
+                    caption = self.get_image_caption_for_file(image_file, caption_map)
                 if not self.set_image_caption(caption):
                     logger.warning("[Upload][Image] Caption may not have been set")
 
@@ -3488,6 +3649,10 @@ class VideoUploadHelper:
         """
         Complete upload workflow for single bookmark.
 
+        Only the desktop-bound steps (window queue, "Add Videos" click, file
+        dialog check, publish click) hold the input lease; title typing and
+        waiting for the upload leave the desktop to the other open profiles.
+
         Args:
             bookmark: Bookmark dict with title and URL
             folder_path: Path to creator folder with videos
@@ -3496,9 +3661,17 @@ class VideoUploadHelper:
         Returns:
             True if upload successful
         """
+        try:
+            return self._upload_to_bookmark(bookmark, folder_path, max_retries)
+        finally:
+            self.input_lease.release_all()
+
+    def _upload_to_bookmark(self, bookmark: Dict[str, str], folder_path: str, max_retries: int) -> bool:
         bookmark_title = bookmark['title']
         video_name = "unknown"  # Initialize to prevent error if navigation fails
         video_file = None
+        fingerprint = None
+        phash = None
 
         # Phase 2: Check network before starting
         if not self.network_monitor.is_network_stable():
@@ -3508,6 +3681,8 @@ class VideoUploadHelper:
                 return False
 
         for attempt in range(1, max_retries + 1):
+            # A retry may come from a step that still held the foreground
+            self.input_lease.release_all()
             try:
                 logger.info("[Upload] ═══════════════════════════════════════════")
                 logger.info("[Upload] Attempt %d/%d for: %s", attempt, max_retries, bookmark_title)
@@ -3531,11 +3706,15 @@ class VideoUploadHelper:
                 logger.info("📁 Step 2: Finding video in folder...")
                 logger.info("[TIMESTAMP] Finding video: %s", datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3])
 
-                video_file = self.get_first_video_from_folder(folder_path)
-                if not video_file:
+                # Prepared ahead while the previous video uploaded (same job on retry)
+                job = self.video_prep.next_job(folder_path)
+                if not job:
                     raise Exception("No video found in folder")
 
-                video_name = os.path.splitext(os.path.basename(video_file))[0]
+                video_file = job.file_path
+                video_name = job.title
+                fingerprint = job.fingerprint
+                phash = job.phash
                 logger.info("✓ Video found: %s", video_name)
                 logger.info("[TIMESTAMP] Video found: %s", datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3])
 
@@ -3567,6 +3746,7 @@ class VideoUploadHelper:
                 # This queue will help us identify NEW windows after button click
                 # ═══════════════════════════════════════════════════════════════
                 logger.info("[Upload] 📋 STEP 1: Creating queue of current windows...")
+                self._take_foreground("add videos")
                 existing_window_handles = set()
 
                 import platform
@@ -3589,6 +3769,9 @@ class VideoUploadHelper:
                 else:
                     logger.warning("[Upload] ⚠ Non-Windows system, skipping window queue")
 
+                # Watch upload requests from the first byte (before file injection)
+                self.progress_monitor.arm(expected_bytes=job.size)
+
                 # Step 3a: Find file input element (BEFORE clicking "Add Videos" button)
                 logger.info("📤 Step 4: Pre-loading file (prevents dialog)...")
                 logger.info("[TIMESTAMP] Before file pre-load: %s", datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3])
@@ -3761,6 +3944,9 @@ class VideoUploadHelper:
                             continue
                         raise Exception("File upload failed")
 
+                # Desktop part done: other profiles may click while this one uploads
+                self.input_lease.release_all()
+
                 # Step 6: Set title IMMEDIATELY (while upload is in progress)
                 # Don't wait for 100% - title field appears as soon as upload starts
                 logger.info("✏️  Step 6: Setting video title...")
@@ -3792,7 +3978,9 @@ class VideoUploadHelper:
                 # STEP 6 (USER APPROACH): Detect and click publish button
                 # ═══════════════════════════════════════════════════════════════
                 logger.info("[Upload] 🚀 STEP 6: Detecting publish button...")
+                self._take_foreground("publish")
                 publish_success = self.detect_and_hover_publish_button()
+                self.input_lease.release_all()
 
                 # CRITICAL: Only move/delete video if publish was successful!
                 if not publish_success:
@@ -3849,14 +4037,18 @@ class VideoUploadHelper:
                             self.state_manager.mark_video_uploaded(
                                 video_file=video_file,
                                 bookmark=bookmark_title,
-                                moved_to="DELETED_AFTER_PUBLISH"
+                                moved_to="DELETED_AFTER_PUBLISH",
+                                fingerprint=fingerprint,
+                                phash=phash
                             )
                         else:
                             logger.warning("[Upload] ⚠ Video file not found for deletion")
                             self.state_manager.mark_video_uploaded(
                                 video_file=video_file,
                                 bookmark=bookmark_title,
-                                moved_to="DELETE_MISSING"
+                                moved_to="DELETE_MISSING",
+                                fingerprint=fingerprint,
+                                phash=phash
                             )
                     except Exception as e:
                         logger.error("[Upload] ✗ Error deleting video: %s", str(e))
@@ -3864,7 +4056,9 @@ class VideoUploadHelper:
                         self.state_manager.mark_video_uploaded(
                             video_file=video_file,
                             bookmark=bookmark_title,
-                            moved_to="DELETE_FAILED"
+                            moved_to="DELETE_FAILED",
+                            fingerprint=fingerprint,
+                            phash=phash
                         )
                 else:
                     # Move video to uploaded folder (default behavior)
@@ -3878,7 +4072,9 @@ class VideoUploadHelper:
                         self.state_manager.mark_video_uploaded(
                             video_file=video_file,
                             bookmark=bookmark_title,
-                            moved_to=moved_to
+                            moved_to=moved_to,
+                            fingerprint=fingerprint,
+                            phash=phash
                         )
                     else:
                         logger.warning("[Upload] ⚠ Could not move video (continuing anyway)")
@@ -3886,7 +4082,9 @@ class VideoUploadHelper:
                         self.state_manager.mark_video_uploaded(
                             video_file=video_file,
                             bookmark=bookmark_title,
-                            moved_to="MOVE_FAILED"
+                            moved_to="MOVE_FAILED",
+                            fingerprint=fingerprint,
+                            phash=phash
                         )
                 # Phase 2: Clear current upload state
                 self.state_manager.clear_current_upload()
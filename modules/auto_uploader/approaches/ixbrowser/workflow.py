@@ -11,7 +11,7 @@ import time
 import subprocess
 import platform
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from ..base_approach import (
     ApproachConfig,
@@ -33,10 +33,14 @@ from .core.state_manager import StateManager
 from .core.network_monitor import NetworkMonitor
 from .core.folder_queue import FolderQueueManager
 from .core.profile_manager import ProfileManager
-from .config.upload_config import USER_CONFIG
+from .core.input_lease import get_input_lease
+from .core.parallel_runner import LaunchFailureStreak, ParallelProfileRunner
+from .config.upload_config import UPLOAD_CONFIG, USER_CONFIG
 
 logger = logging.getLogger(__name__)
 
+MAX_CONSECUTIVE_LAUNCH_FAILURES = 3  # Stop after 3 consecutive profile launch failures
+
 
 def bring_browser_to_front(driver) -> bool:
     """
@@ -173,9 +177,9 @@ class IXBrowserApproach(BaseApproach):
         # Phase 2: Initialize robustness components
         self._state_manager = StateManager()
         self._network_monitor = NetworkMonitor(check_interval=10)
-        self._folder_queue: Optional[FolderQueueManager] = None
         self._profile_manager: Optional[ProfileManager] = None
-        self._last_profile_launch_success: bool = False
+        # Whether the last launch of each profile succeeded (by profile_id)
+        self._launch_success: Dict[Any, bool] = {}
 
         logger.info("[IXApproach] ✓ Phase 2 robustness components initialized")
 
@@ -357,6 +361,11 @@ class IXBrowserApproach(BaseApproach):
 
         logger.info("[IXApproach] ═══════════════════════════════════════════")
 
+        parallel_profiles = int(UPLOAD_CONFIG.get("parallel_profiles", 1) or 1)
+        if parallel_profiles > 1:
+            return self._execute_profiles_parallel(
+                result, client, user_type, daily_limit, parallel_profiles)
+
         # ═══════════════════════════════════════════════════════════
         # MAIN PROFILE LOOP - Process all profiles sequentially
         # ═══════════════════════════════════════════════════════════
@@ -364,7 +373,6 @@ class IXBrowserApproach(BaseApproach):
         total_successful_uploads = 0
         profile_results = []
         consecutive_launch_failures = 0
-        MAX_CONSECUTIVE_FAILURES = 3  # Stop after 3 consecutive profile launch failures
 
         try:
             # Loop through all profiles
@@ -414,7 +422,8 @@ class IXBrowserApproach(BaseApproach):
                     profile_name=profile_name,
                     client=client,
                     user_type=user_type,
-                    daily_limit=daily_limit
+                    daily_limit=daily_limit,
+                    profile=current_profile
                 )
 
                 # Track results
@@ -429,17 +438,10 @@ class IXBrowserApproach(BaseApproach):
                 # Detect consecutive launch failures (kernel error, selenium missing, API issues).
                 # Do NOT treat "0 uploads" as a launch failure because profiles can legitimately
                 # have no data/bookmarks to upload.
-                if not self._last_profile_launch_success:
+                if not self._launch_success.get(profile_id):
                     consecutive_launch_failures += 1
-                    if consecutive_launch_failures >= MAX_CONSECUTIVE_FAILURES:
-                        logger.error("[IXApproach] ═══════════════════════════════════════════")
-                        logger.error("[IXApproach] STOPPING: %d consecutive profile failures!", MAX_CONSECUTIVE_FAILURES)
-                        logger.error("[IXApproach] This indicates a systemic issue:")
-                        logger.error("[IXApproach]   - ixBrowser kernel may be corrupted (repair in ixBrowser settings)")
-                        logger.error("[IXApproach]   - Selenium may not be installed")
-                        logger.error("[IXApproach]   - ixBrowser API may be unreachable")
-                        logger.error("[IXApproach] Fix the issue and restart automation.")
-                        logger.error("[IXApproach] ═══════════════════════════════════════════")
+                    if consecutive_launch_failures >= MAX_CONSECUTIVE_LAUNCH_FAILURES:
+                        self._log_launch_failure_abort()
                         break
                 else:
                     consecutive_launch_failures = 0  # Reset when launch was healthy
@@ -532,23 +534,128 @@ class IXBrowserApproach(BaseApproach):
 
         return result
 
+    def _execute_profiles_parallel(self, result: WorkflowResult, client, user_type: str,
+                                   daily_limit: int, max_open: int) -> WorkflowResult:
+        """
+        Process all profiles with up to max_open of them open at once.
+
+        Mouse/file-dialog steps still run one profile at a time (input lease);
+        everything else overlaps. Stops claiming profiles once the global
+        daily limit is reached.
+        """
+        logger.info("[IXApproach] ═══════════════════════════════════════════")
+        logger.info("[IXApproach] PARALLEL MODE: %d profiles open at a time", max_open)
+        logger.info("[IXApproach] ═══════════════════════════════════════════")
+
+        runner = None
+        launch_failures = LaunchFailureStreak(MAX_CONSECUTIVE_LAUNCH_FAILURES)
+
+        def process(profile, index):
+            profile_id = profile.get('profile_id')
+            profile_name = profile.get('name', 'Unknown')
+            logger.info("[IXApproach] PROCESSING PROFILE %d/%d: %s (ID: %s)",
+                       index + 1, len(self._profile_manager.profiles), profile_name, profile_id)
+            try:
+                return self._process_single_profile(
+                    profile_id=profile_id,
+                    profile_name=profile_name,
+                    client=client,
+                    user_type=user_type,
+                    daily_limit=daily_limit,
+                    profile=profile,
+                    state=runner.scoped_state(self._state_manager, profile_id)
+                )
+            finally:
+                # Same systemic-failure stop as the sequential loop; profiles
+                # already open finish, no new ones are claimed
+                if launch_failures.record(bool(self._launch_success.get(profile_id))):
+                    self._log_launch_failure_abort()
+                    runner.stop()
+
+        def limit_not_reached():
+            status = self._state_manager.check_daily_limit(user_type=user_type, limit=daily_limit)
+            if status['limit_reached']:
+                logger.warning("[IXApproach] GLOBAL DAILY LIMIT REACHED - no more profiles will be opened")
+            return not status['limit_reached']
+
+        runner = ParallelProfileRunner(max_open=max_open, process_profile=process)
+
+        try:
+            profile_results = runner.run(self._profile_manager, should_continue=limit_not_reached)
+            total_successful_uploads = sum(entry['result'] or 0 for entry in profile_results)
+
+            logger.info("[IXApproach] ═══════════════════════════════════════════")
+            logger.info("[IXApproach] Multi-Profile Session Summary")
+            logger.info("[IXApproach] ═══════════════════════════════════════════")
+            logger.info("[IXApproach] Total profiles processed: %d", len(profile_results))
+            logger.info("[IXApproach] Total uploads this session: %d", total_successful_uploads)
+
+            final_limit_status = self._state_manager.check_daily_limit(
+                user_type=user_type,
+                limit=daily_limit
+            )
+            logger.info("[IXApproach] Global daily uploads: %d", final_limit_status['current_count'])
+
+            for idx, entry in enumerate(profile_results, 1):
+                logger.info("[IXApproach]   %d. %s: %d upload(s)",
+                           idx, entry['profile'].get('name', 'Unknown'), entry['result'] or 0)
+
+            logger.info("[IXApproach] Foreground lease waits: %.1fs over %d acquisitions",
+                       get_input_lease().total_wait, get_input_lease().acquisitions)
+            logger.info("[IXApproach] ═══════════════════════════════════════════")
+
+            # Round finished (or limit reached): next run starts from the first profile
+            if self._profile_manager.all_profiles_complete():
+                self._profile_manager.reset_to_first_profile()
+                logger.info("[IXApproach] Profile index reset to 0 (ready for next run)")
+
+            result.creators_processed = total_successful_uploads
+            result.success = True
+
+        except Exception as e:
+            logger.error("[IXApproach] Multi-profile workflow error: %s", str(e))
+            result.add_error(str(e))
+
+        return result
+
+    def _log_launch_failure_abort(self):
+        """Explain why the run stops after repeated profile launch failures."""
+        logger.error("[IXApproach] ═══════════════════════════════════════════")
+        logger.error("[IXApproach] STOPPING: %d consecutive profile failures!", MAX_CONSECUTIVE_LAUNCH_FAILURES)
+        logger.error("[IXApproach] This indicates a systemic issue:")
+        logger.error("[IXApproach]   - ixBrowser kernel may be corrupted (repair in ixBrowser settings)")
+        logger.error("[IXApproach]   - Selenium may not be installed")
+        logger.error("[IXApproach]   - ixBrowser API may be unreachable")
+        logger.error("[IXApproach] Fix the issue and restart automation.")
+        logger.error("[IXApproach] ═══════════════════════════════════════════")
+
     def _process_single_profile(self, profile_id: int, profile_name: str,
-                                 client, user_type: str, daily_limit: int) -> int:
+                                 client, user_type: str, daily_limit: int,
+                                 profile: Dict[str, Any] = None, state=None) -> int:
         """
         Process a single profile completely.
 
+        Safe to run for several profiles at once (parallel mode): the driver,
+        launcher and folder queue are local to the call.
+
         Args:
             profile_id: Profile ID to process
             profile_name: Profile name
             client: ixBrowser API client
             user_type: User type (basic/pro)
             daily_limit: Daily upload limit
+            profile: Profile dict (default: ProfileManager's current profile)
+            state: StateManager (view) to use (default: the shared one)
 
         Returns:
             Number of successful uploads for this profile
         """
         upload_count = 0
-        self._last_profile_launch_success = False
+        self._launch_success[profile_id] = False
+        profile = profile or self._profile_manager.get_current_profile()
+        state = state or self._state_manager
+        launcher = None
+        monitoring = False
 
         # Defaults to avoid unbound variables when folder checks fail/skip early.
         facebook_bookmarks = []
@@ -565,22 +672,17 @@ class IXBrowserApproach(BaseApproach):
             logger.info("[IXApproach] ═══════════════════════════════════════════")
 
             # Open profile using ProfileManager
-            if not self._profile_manager.open_profile(launcher):
-                logger.error("[IXApproach] Failed to open profile: %s", profile_name)
-                return 0
-
-            # Get driver from ProfileManager
-            driver = self._profile_manager.get_driver()
+            driver = self._profile_manager.open_profile_for(profile, launcher)
             if not driver:
-                logger.error("[IXApproach] Driver not available")
-                self._profile_manager.close_profile()
+                logger.error("[IXApproach] Failed to open profile: %s", profile_name)
                 return 0
 
             logger.info("[IXApproach] ✓ Profile opened and Selenium attached!")
-            self._last_profile_launch_success = True
+            self._launch_success[profile_id] = True
 
             # IMPORTANT: Bring browser window to FRONT (always visible) - OS-LEVEL
-            bring_browser_to_front(driver)
+            with get_input_lease().hold("bring to front"):
+                bring_browser_to_front(driver)
 
             # Step 3: Enumerate tabs and URLs
             logger.info("[IXApproach] ═══════════════════════════════════════════")
@@ -777,15 +879,15 @@ class IXBrowserApproach(BaseApproach):
                     logger.warning("[IXApproach] No matched folders found, skipping uploads")
                 else:
                     # Phase 2: Initialize folder queue manager
-                    self._folder_queue = FolderQueueManager(
+                    folder_queue = FolderQueueManager(
                         base_path=profile_folder,
-                        state_manager=self._state_manager
+                        state_manager=state
                     )
                     # Force reset for each new profile (fresh start)
-                    self._folder_queue.initialize_queue(force_reset=True)
+                    folder_queue.initialize_queue(force_reset=True)
 
                     # Phase 2: Detect total folders (for tracking/logging only)
-                    all_folders = self._folder_queue.get_all_folders()
+                    all_folders = folder_queue.get_all_folders()
                     total_folders = len(all_folders)
 
                     logger.info("[IXApproach] ═══════════════════════════════════════════")
@@ -808,7 +910,7 @@ class IXBrowserApproach(BaseApproach):
                     logger.info("[IXApproach] Resume Check")
                     logger.info("[IXApproach] ═══════════════════════════════════════════")
 
-                    current_position = self._state_manager.get_current_position()
+                    current_position = state.get_current_position()
                     if current_position.get('current_upload', {}).get('video_file'):
                         logger.info("[IXApproach] ✓ Found incomplete upload:")
                         logger.info("[IXApproach]   Video: %s",
@@ -831,7 +933,7 @@ class IXBrowserApproach(BaseApproach):
                     user_type = USER_CONFIG.get('user_type', 'basic')
                     daily_limit = USER_CONFIG.get('daily_limit_basic', 200)
 
-                    limit_status = self._state_manager.check_daily_limit(
+                    limit_status = state.check_daily_limit(
                         user_type=user_type,
                         limit=daily_limit
                     )
@@ -861,12 +963,14 @@ class IXBrowserApproach(BaseApproach):
                         # Phase 2: Initialize upload helper with Phase 2 components
                         upload_helper = VideoUploadHelper(
                             driver,
-                            state_manager=self._state_manager,
-                            network_monitor=self._network_monitor
+                            state_manager=state,
+                            network_monitor=self._network_monitor,
+                            focus_callback=lambda: bring_browser_to_front(driver)
                         )
 
                         # Phase 2: Start network monitoring
                         self._network_monitor.start_monitoring()
+                        monitoring = True
                         logger.info("[IXApproach] ✓ Network monitoring started")
 
                         upload_results = []
@@ -884,7 +988,7 @@ class IXBrowserApproach(BaseApproach):
                         logger.info("[IXApproach] ")
 
                         # Track if we found any videos in current cycle (to detect empty profile)
-                        starting_cycle = self._folder_queue.get_cycle_count()
+                        starting_cycle = folder_queue.get_cycle_count()
                         folders_checked_in_cycle = 0
                         total_folders = len(all_folders)
 
@@ -892,7 +996,7 @@ class IXBrowserApproach(BaseApproach):
                         # Bot will continue until user stops it or all folders are processed
                         while True:
                             # Get current folder from queue
-                            current_folder = self._folder_queue.get_current_folder()
+                            current_folder = folder_queue.get_current_folder()
                             if not current_folder:
                                 logger.warning("[IXApproach] No folders in queue, stopping")
                                 break
@@ -917,8 +1021,8 @@ class IXBrowserApproach(BaseApproach):
                                     break
 
                             # Get media in folder
-                            videos = self._folder_queue.get_videos_in_folder(current_folder)
-                            images = self._folder_queue.get_images_in_folder(current_folder)
+                            videos = folder_queue.get_videos_in_folder(current_folder)
+                            images = folder_queue.get_images_in_folder(current_folder)
 
                             if not videos and not images:
                                 logger.info("[IXApproach] ----------------------------------------")
@@ -927,8 +1031,8 @@ class IXBrowserApproach(BaseApproach):
                                 logger.info("[IXApproach] ----------------------------------------")
 
                                 # Mark folder complete and move to next
-                                self._folder_queue.mark_current_folder_complete()
-                                self._folder_queue.move_to_next_folder()
+                                folder_queue.mark_current_folder_complete()
+                                folder_queue.move_to_next_folder()
 
                                 # Track empty folders
                                 folders_checked_in_cycle += 1
@@ -954,43 +1058,43 @@ class IXBrowserApproach(BaseApproach):
                                 if not image_bookmark:
                                     logger.warning("[IXApproach] SKIPPED: Folder '%s' - No matching image bookmark found", folder_name)
                                     logger.debug("Available bookmarks: %s", [b['title'] for b in facebook_bookmarks[:5]])
-                                    self._folder_queue.move_to_next_folder()
+                                    folder_queue.move_to_next_folder()
                                     continue
 
                                 logger.info("[IXApproach] Starting image uploads for: %s", folder_name)
                                 images_ok = upload_helper.upload_images_for_folder(image_bookmark, current_folder)
                                 if not images_ok:
                                     logger.warning("[IXApproach] Image upload failed, skipping folder for now")
-                                    self._folder_queue.move_to_next_folder()
+                                    folder_queue.move_to_next_folder()
                                     continue
 
-                                images = self._folder_queue.get_images_in_folder(current_folder)
+                                images = folder_queue.get_images_in_folder(current_folder)
                                 if images:
                                     logger.warning("[IXApproach] Images still remain after processing, skipping videos")
-                                    self._folder_queue.move_to_next_folder()
+                                    folder_queue.move_to_next_folder()
                                     continue
 
                             # Refresh videos after image processing
-                            videos = self._folder_queue.get_videos_in_folder(current_folder)
+                            videos = folder_queue.get_videos_in_folder(current_folder)
                             if not videos:
                                 logger.info("[IXApproach] ----------------------------------------")
                                 logger.info("[IXApproach] Folder: %s", folder_name)
                                 logger.info("[IXApproach] Status: No videos remaining after images")
                                 logger.info("[IXApproach] ----------------------------------------")
 
-                                self._folder_queue.mark_current_folder_complete()
-                                self._folder_queue.move_to_next_folder()
+                                folder_queue.mark_current_folder_complete()
+                                folder_queue.move_to_next_folder()
                                 continue
 
                             if not matching_bookmark:
                                 logger.warning("[IXApproach] SKIPPED: Folder '%s' - No matching video bookmark found", folder_name)
                                 logger.debug("Available bookmarks: %s", [b['title'] for b in facebook_bookmarks[:5]])
-                                self._folder_queue.move_to_next_folder()
+                                folder_queue.move_to_next_folder()
                                 continue
 
                             # Check daily limit BEFORE uploading (for basic users)
                             if user_type.lower() == 'basic':
-                                current_limit_check = self._state_manager.check_daily_limit(
+                                current_limit_check = state.check_daily_limit(
                                     user_type=user_type,
                                     limit=daily_limit
                                 )
@@ -1011,7 +1115,7 @@ class IXBrowserApproach(BaseApproach):
                             logger.info("[IXApproach] ───────────────────────────────────────────────")
                             logger.info("[IXApproach] Processing: %s", folder_name)
                             logger.info("[IXApproach] Videos remaining: %d", len(videos))
-                            logger.info("[IXApproach] Current cycle: #%d", self._folder_queue.get_cycle_count())
+                            logger.info("[IXApproach] Current cycle: #%d", folder_queue.get_cycle_count())
                             if user_type.lower() == 'basic':
                                 logger.info("[IXApproach] Daily usage: %d/%d bookmarks",
                                            current_limit_check['current_count'],
@@ -1033,7 +1137,7 @@ class IXBrowserApproach(BaseApproach):
 
                                 # Increment daily counter after successful upload
                                 # Pass bookmark name for per-bookmark tracking and deduplication
-                                self._state_manager.increment_daily_bookmarks(count=1, bookmark_name=folder_name)
+                                state.increment_daily_bookmarks(count=1, bookmark_name=folder_name)
                                 logger.debug("[IXApproach] Daily bookmark counter updated for '%s'", folder_name)
 
                                 # Brief pause between uploads
@@ -1041,12 +1145,12 @@ class IXBrowserApproach(BaseApproach):
                                 time.sleep(5)
 
                                 # Check if folder has more videos
-                                remaining = self._folder_queue.get_videos_in_folder(current_folder)
+                                remaining = folder_queue.get_videos_in_folder(current_folder)
                                 if not remaining:
                                     # Folder complete - move to next
                                     logger.info("[IXApproach] ✓ Folder '%s' complete (no videos remaining)", folder_name)
-                                    self._folder_queue.mark_current_folder_complete()
-                                    self._folder_queue.move_to_next_folder()
+                                    folder_queue.mark_current_folder_complete()
+                                    folder_queue.move_to_next_folder()
                                 else:
                                     logger.info("[IXApproach] Folder '%s' has %d video(s) remaining", folder_name, len(remaining))
                                     # Continue with same folder (will upload next video)
@@ -1058,6 +1162,8 @@ class IXBrowserApproach(BaseApproach):
 
                         # Phase 2: Stop network monitoring
                         self._network_monitor.stop_monitoring()
+                        monitoring = False
+                        upload_helper.close()
 
                         # Calculate summary statistics
                         successful = sum(1 for r in upload_results if r['success'])
@@ -1071,7 +1177,7 @@ class IXBrowserApproach(BaseApproach):
                         logger.info("[IXApproach] Successful: %d", successful)
                         logger.info("[IXApproach] Failed: %d", failed)
                         logger.info("[IXApproach] Current queue position:")
-                        queue_status = self._folder_queue.get_queue_status()
+                        queue_status = folder_queue.get_queue_status()
                         logger.info("[IXApproach]   Folder: %d/%d", queue_status['current_index'] + 1, queue_status['total_folders'])
                         logger.info("[IXApproach]   Cycle: #%d", queue_status['cycle'])
                         logger.info("[IXApproach] ═══════════════════════════════════════════")
@@ -1082,7 +1188,7 @@ class IXBrowserApproach(BaseApproach):
             except Exception as e:
                 logger.error("[IXApproach] Video upload failed: %s", str(e))
                 # Stop network monitor on error
-                if self._network_monitor:
+                if self._network_monitor and monitoring:
                     self._network_monitor.stop_monitoring()
 
         except Exception as e:
@@ -1095,11 +1201,14 @@ class IXBrowserApproach(BaseApproach):
             logger.info("[IXApproach] ═══════════════════════════════════════════")
 
             try:
-                self._profile_manager.close_profile()
+                self._profile_manager.close_profile_for(profile, launcher)
                 logger.info("[IXApproach] ✓ Profile closed successfully")
             except Exception as e:
                 logger.error("[IXApproach] Failed to close profile: %s", str(e))
 
+            # Fold the state journals back into the JSON files between profiles
+            self._state_manager.compact()
+
         return upload_count
 
     def _run_upload_workflow(
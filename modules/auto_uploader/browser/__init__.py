@@ -15,6 +15,8 @@ Submodules:
 - window_manager: Window operations (cross-platform)
 - session_manager: Session persistence and restoration
 - screen_detector: Image recognition for UI detection (NEW)
+- screen_matcher: Shared screen capture + cached template matching for all image lookups
+- detector_benchmark: Offline latency / hit-rate benchmark of the visual detectors
 - mouse_controller: Human-like mouse movements with bezier curves (NEW)
 - login_manager: Intelligent login/logout with autofill handling (NEW)
 - fullscreen_manager: Fullscreen operations with F11 (NEW)
@@ -0,0 +1,516 @@
+"""
+Detector Benchmark
+==================
+Offline latency / accuracy benchmark for the uploader's visual detectors.
+
+Replays screenshots through ScreenDetector's template path (ScreenMatcher),
+AdvancedScreenAnalyzer, OCRDetector and CoordinatePredictor without a live
+desktop, so threshold or algorithm changes can be judged on a headless box.
+
+Cases come from two sources:
+
+- synthetic renders: every helper_images template pasted onto a generated
+  desktop at several resolutions and DPI scales (ground truth known). Each
+  positive frame has a negative twin where a *different* template sits at
+  the same spot, which is what drives the false-positive rate.
+- recorded captures: full screenshots (helper_images captures, debug
+  screenshots). An ``annotations.json`` next to them maps
+  ``{"file.png": {"element": [x, y, w, h] or null}}``; null marks the element
+  as absent. Unannotated captures still count towards latency.
+
+Per detector and element type the report gives p50/p95/p99 latency, hit rate
+(detected point lands inside the true box), mislocated count and
+false-positive rate (detection on a frame where the element is absent).
+
+Example Usage:
+--------------
+python -m modules.auto_uploader.browser.detector_benchmark \\
+    --resolutions 1366x768,1920x1080 --scales 1,1.25,1.5 --json report.json
+"""
+
+import argparse
+import json
+import logging
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+Box = Tuple[int, int, int, int]
+Point = Tuple[int, int]
+
+DEFAULT_RESOLUTIONS: Tuple[Tuple[int, int], ...] = ((1366, 768), (1920, 1080), (2560, 1440))
+DEFAULT_SCALES: Tuple[float, ...] = (1.0, 1.25, 1.5)
+# Helper images at least this large are full-screen captures, not templates
+CAPTURE_MIN_SIZE = (640, 480)
+# A detected point may miss the true box by this many pixels and still count
+HIT_TOLERANCE = 4
+# ScreenDetector's default matching threshold
+TEMPLATE_CONFIDENCE = 0.8
+ANNOTATIONS_FILE = "annotations.json"
+
+# Text the OCR detector is asked to find for each template (when it has any)
+OCR_LABELS: Dict[str, Tuple[str, ...]] = {
+    "activePublishButton": ("Publish",),
+    "publish_button_after_data": ("Publish",),
+    "publish_button_befor_data": ("Publish",),
+    "add_videos_button": ("Add Videos", "Add videos"),
+    "addphotoVideo_imag": ("Add photo/video", "Photo/video"),
+    "addphoto_imag": ("Add photo",),
+    "all_bookmarks": ("All Bookmarks", "All bookmarks"),
+    "search_bookmarks_bar": ("Search bookmarks", "Search"),
+    "uploadfromdesktop_imag": ("Upload from desktop", "Upload"),
+    "profile_open_button": ("Open",),
+}
+
+
+@dataclass
+class BenchmarkCase:
+    """One frame + the element a detector is asked to find in it."""
+
+    name: str
+    frame: np.ndarray            # RGB, like pyautogui screenshots
+    element: str
+    truth: Optional[Box]         # None = element absent (when labelled)
+    source: str = "synthetic"
+    scale: float = 1.0
+    labelled: bool = True
+
+    @property
+    def resolution(self) -> Tuple[int, int]:
+        return self.frame.shape[1], self.frame.shape[0]
+
+
+@dataclass
+class ElementStats:
+    """Counters + latencies of one detector on one element type."""
+
+    detector: str
+    element: str
+    cases: int = 0
+    positives: int = 0
+    negatives: int = 0
+    hits: int = 0
+    mislocated: int = 0
+    false_positives: int = 0
+    detections: int = 0
+    latencies_ms: List[float] = field(default_factory=list)
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        return self.hits / self.positives if self.positives else None
+
+    @property
+    def fp_rate(self) -> Optional[float]:
+        return self.false_positives / self.negatives if self.negatives else None
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Nearest-rank latency percentile in milliseconds."""
+        if not self.latencies_ms:
+            return None
+        ordered = sorted(self.latencies_ms)
+        rank = max(1, int(np.ceil(pct / 100.0 * len(ordered))))
+        return ordered[rank - 1]
+
+    def summary(self) -> Dict[str, object]:
+        data = asdict(self)
+        data.pop("latencies_ms")
+        data.update(hit_rate=self.hit_rate, fp_rate=self.fp_rate,
+                    p50_ms=self.percentile(50), p95_ms=self.percentile(95),
+                    p99_ms=self.percentile(99))
+        return data
+
+
+# ── Detector adapters ───────────────────────────────────────────────────────
+
+class TemplateDetector:
+    """ScreenDetector's lookup path: ScreenMatcher.find on the given frame."""
+
+    name = "screen_detector"
+
+    def __init__(self, templates: Dict[str, Path], matcher, confidence: float = TEMPLATE_CONFIDENCE):
+        self.templates = templates
+        self.matcher = matcher
+        self.confidence = confidence
+
+    def supports(self, element: str) -> bool:
+        return element in self.templates
+
+    def prepare(self, cases: Sequence[BenchmarkCase]) -> None:
+        self.matcher.preload(self.templates.values())
+
+    def locate(self, case: BenchmarkCase) -> Optional[Point]:
+        match = self.matcher.find(self.templates[case.element], confidence=self.confidence,
+                                  frame=case.frame)
+        return match.center if match else None
+
+
+class AnalyzerDetector:
+    """AdvancedScreenAnalyzer.smart_element_click (shape/colour heuristics)."""
+
+    name = "advanced_analyzer"
+
+    def __init__(self, analyzer, element_types: Optional[Dict[str, str]] = None):
+        self.analyzer = analyzer
+        self.element_types = element_types or {}
+
+    def _element_type(self, element: str) -> Optional[str]:
+        if element in self.element_types:
+            return self.element_types[element]
+        lowered = element.lower()
+        if "input" in lowered or "bar" in lowered or "field" in lowered:
+            return "field"
+        if "button" in lowered:
+            return "button"
+        return None
+
+    def supports(self, element: str) -> bool:
+        return self.analyzer.available and self._element_type(element) is not None
+
+    def prepare(self, cases: Sequence[BenchmarkCase]) -> None:
+        pass
+
+    def locate(self, case: BenchmarkCase) -> Optional[Point]:
+        bgr = cv2.cvtColor(case.frame, cv2.COLOR_RGB2BGR)
+        return self.analyzer.smart_element_click(self._element_type(case.element), bgr)
+
+
+class OCRTextDetector:
+    """OCRDetector.find_any over the element's expected labels."""
+
+    name = "ocr"
+
+    def __init__(self, detector, labels: Optional[Dict[str, Sequence[str]]] = None):
+        self.detector = detector
+        self.labels = labels if labels is not None else OCR_LABELS
+
+    def supports(self, element: str) -> bool:
+        return self.detector.available and element in self.labels
+
+    def prepare(self, cases: Sequence[BenchmarkCase]) -> None:
+        pass
+
+    def locate(self, case: BenchmarkCase) -> Optional[Point]:
+        match = self.detector.find_any(list(self.labels[case.element]), screenshot=case.frame)
+        return match.center if match else None
+
+
+class PredictorDetector:
+    """
+    CoordinatePredictor trained on the scale-1.0 positives, then asked to
+    predict every case (including other resolutions / DPI scales).
+    """
+
+    name = "coordinate_predictor"
+
+    def __init__(self, predictor_cls, to_image):
+        self._predictor_cls = predictor_cls
+        self._to_image = to_image
+        self._tmp = tempfile.TemporaryDirectory(prefix="detector_benchmark_")
+        self.predictor = predictor_cls(Path(self._tmp.name) / "predictor.json",
+                                       min_samples=1, autosave_interval=1_000_000)
+
+    def supports(self, element: str) -> bool:
+        return True
+
+    def prepare(self, cases: Sequence[BenchmarkCase]) -> None:
+        for case in cases:
+            if case.labelled and case.truth is not None and case.scale == 1.0:
+                x, y, w, h = case.truth
+                self.predictor.record_click(case.element, (x + w // 2, y + h // 2),
+                                            self._to_image(case.frame))
+
+    def locate(self, case: BenchmarkCase) -> Optional[Point]:
+        prediction = self.predictor.predict_coords(case.element, self._to_image(case.frame))
+        return prediction.coords if prediction else None
+
+
+def default_detectors(templates: Dict[str, Path], names: Optional[Iterable[str]] = None,
+                      confidence: float = TEMPLATE_CONFIDENCE) -> list:
+    """Build the detector adapters whose dependencies are installed."""
+    wanted = set(names) if names else None
+    detectors = []
+
+    def want(name: str) -> bool:
+        return wanted is None or name in wanted
+
+    if want(TemplateDetector.name):
+        from .screen_matcher import ScreenMatcher
+        # Frames are always passed in, the matcher never captures the screen
+        detectors.append(TemplateDetector(templates, ScreenMatcher(grab=_no_screen), confidence))
+
+    if want(AnalyzerDetector.name):
+        from .advanced_screen_analyzer import AdvancedScreenAnalyzer
+        detectors.append(AnalyzerDetector(AdvancedScreenAnalyzer()))
+
+    if want(OCRTextDetector.name):
+        from .ocr_detector import OCRDetector
+        ocr = OCRDetector()
+        if ocr.available:
+            detectors.append(OCRTextDetector(ocr))
+        else:
+            logger.warning("[Benchmark] pytesseract not installed; skipping OCR detector")
+
+    if want(PredictorDetector.name):
+        from PIL import Image
+        from .ml_coordinate_predictor import CoordinatePredictor
+        detectors.append(PredictorDetector(CoordinatePredictor, Image.fromarray))
+
+    return detectors
+
+
+def _no_screen() -> np.ndarray:
+    raise RuntimeError("detector benchmark never captures the live screen")
+
+
+# ── Cases ───────────────────────────────────────────────────────────────────
+
+def _read_rgb(path: Path) -> Optional[np.ndarray]:
+    # imdecode handles non-ASCII / spaced paths on every platform
+    data = np.fromfile(str(path), dtype=np.uint8)
+    image = cv2.imdecode(data, cv2.IMREAD_COLOR) if data.size else None
+    return cv2.cvtColor(image, cv2.COLOR_BGR2RGB) if image is not None else None
+
+
+def split_helper_images(images_dir: Path) -> Tuple[Dict[str, Path], List[Path]]:
+    """Split a helper_images folder into templates and full-screen captures."""
+    templates: Dict[str, Path] = {}
+    captures: List[Path] = []
+    for path in sorted(Path(images_dir).glob("*.png")):
+        image = cv2.imread(str(path), cv2.IMREAD_UNCHANGED)
+        if image is None:
+            continue
+        height, width = image.shape[:2]
+        if width >= CAPTURE_MIN_SIZE[0] and height >= CAPTURE_MIN_SIZE[1]:
+            captures.append(path)
+        else:
+            templates[path.stem] = path
+    return templates, captures
+
+
+def _desktop(width: int, height: int, rng: np.random.Generator) -> np.ndarray:
+    """Flat light background with panels and text-like bars as clutter."""
+    frame = np.full((height, width, 3), 242, dtype=np.uint8)
+    for _ in range(12):
+        w, h = int(rng.integers(width // 10, width // 3)), int(rng.integers(height // 12, height // 3))
+        x, y = int(rng.integers(0, width - w)), int(rng.integers(0, height - h))
+        frame[y:y + h, x:x + w] = rng.integers(200, 255, size=3, dtype=np.uint8)
+    for _ in range(120):
+        w, h = int(rng.integers(20, 160)), int(rng.integers(6, 12))
+        x, y = int(rng.integers(0, width - w)), int(rng.integers(0, height - h))
+        frame[y:y + h, x:x + w] = int(rng.integers(40, 120))
+    return frame
+
+
+def _paste(frame: np.ndarray, image: np.ndarray, x: int, y: int) -> None:
+    h, w = image.shape[:2]
+    frame[y:y + h, x:x + w] = image
+
+
+def render_synthetic_cases(
+    templates: Dict[str, Path],
+    resolutions: Sequence[Tuple[int, int]] = DEFAULT_RESOLUTIONS,
+    scales: Sequence[float] = DEFAULT_SCALES,
+    seed: int = 0,
+) -> List[BenchmarkCase]:
+    """
+    Positive + negative frame per template, resolution and DPI scale.
+
+    Every template keeps one layout anchor (as a ratio of the screen) with a
+    little jitter, the way real UI elements stay roughly in place.
+    """
+    rng = np.random.default_rng(seed)
+    images = {name: img for name, img in ((n, _read_rgb(p)) for n, p in templates.items())
+              if img is not None}
+    names = sorted(images)
+    anchors = {name: (float(rng.uniform(0.05, 0.95)), float(rng.uniform(0.05, 0.95)))
+               for name in names}
+
+    cases: List[BenchmarkCase] = []
+    for width, height in resolutions:
+        for scale in scales:
+            background = _desktop(width, height, rng)
+            scaled = {name: cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_LINEAR)
+                      if scale != 1.0 else img for name, img in images.items()}
+            for index, name in enumerate(names):
+                image = scaled[name]
+                h, w = image.shape[:2]
+                if w >= width or h >= height:
+                    continue
+                ax, ay = anchors[name]
+                jitter_x, jitter_y = (int(v) for v in rng.integers(-width // 50, width // 50 + 1, size=2))
+                x = min(max(0, int(ax * (width - w)) + jitter_x), width - w)
+                y = min(max(0, int(ay * (height - h)) + jitter_y), height - h)
+                label = f"{width}x{height}@{scale:g}"
+
+                positive = background.copy()
+                _paste(positive, image, x, y)
+                cases.append(BenchmarkCase(f"{label}/{name}", positive, name, (x, y, w, h), scale=scale))
+
+                # Negative twin: a different element occupies the same spot
+                negative = background.copy()
+                other = scaled[names[(index + 1) % len(names)]]
+                oh, ow = other.shape[:2]
+                if len(names) > 1 and ow < width and oh < height:
+                    _paste(negative, other, min(x, width - ow), min(y, height - oh))
+                cases.append(BenchmarkCase(f"{label}/{name}:absent", negative, name, None, scale=scale))
+    return cases
+
+
+def load_recorded_cases(capture_paths: Iterable[Path], elements: Iterable[str]) -> List[BenchmarkCase]:
+    """
+    Cases from recorded screenshots.
+
+    Ground truth comes from annotations.json in the capture's folder; elements
+    it does not mention are replayed unlabelled (latency only).
+    """
+    elements = list(elements)
+    annotations: Dict[Path, Dict[str, Dict[str, Optional[List[int]]]]] = {}
+    cases: List[BenchmarkCase] = []
+    for path in capture_paths:
+        path = Path(path)
+        if path.parent not in annotations:
+            ann_file = path.parent / ANNOTATIONS_FILE
+            try:
+                annotations[path.parent] = json.loads(ann_file.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                annotations[path.parent] = {}
+            except (OSError, ValueError) as e:
+                logger.warning("[Benchmark] Ignoring unreadable %s: %s", ann_file, e)
+                annotations[path.parent] = {}
+        frame = _read_rgb(path)
+        if frame is None:
+            logger.warning("[Benchmark] Could not read capture: %s", path)
+            continue
+        labels = annotations[path.parent].get(path.name, {})
+        for element in elements:
+            if element in labels:
+                box = labels[element]
+                truth = tuple(int(v) for v in box) if box else None
+                cases.append(BenchmarkCase(f"{path.name}/{element}", frame, element, truth,
+                                           source="recorded"))
+            else:
+                cases.append(BenchmarkCase(f"{path.name}/{element}", frame, element, None,
+                                           source="recorded", labelled=False))
+    return cases
+
+
+# ── Running ─────────────────────────────────────────────────────────────────
+
+def _inside(point: Point, box: Box, tolerance: int = HIT_TOLERANCE) -> bool:
+    x, y, w, h = box
+    return x - tolerance <= point[0] <= x + w + tolerance and y - tolerance <= point[1] <= y + h + tolerance
+
+
+def run_benchmark(cases: Sequence[BenchmarkCase], detectors: Sequence, repeat: int = 1) -> List[ElementStats]:
+    """Run every detector over every case it supports; one stats row per (detector, element)."""
+    stats: Dict[Tuple[str, str], ElementStats] = {}
+    for detector in detectors:
+        detector.prepare(cases)
+        for case in cases:
+            if not detector.supports(case.element):
+                continue
+            row = stats.setdefault((detector.name, case.element), ElementStats(detector.name, case.element))
+            point = None
+            for _ in range(max(1, repeat)):
+                started = time.perf_counter()
+                try:
+                    point = detector.locate(case)
+                except Exception as e:
+                    logger.debug("[Benchmark] %s failed on %s: %s", detector.name, case.name, e)
+                    point = None
+                row.latencies_ms.append((time.perf_counter() - started) * 1000.0)
+
+            row.cases += 1
+            if point is not None:
+                row.detections += 1
+            if not case.labelled:
+                continue
+            if case.truth is None:
+                row.negatives += 1
+                if point is not None:
+                    row.false_positives += 1
+            else:
+                row.positives += 1
+                if point is not None and _inside(point, case.truth):
+                    row.hits += 1
+                elif point is not None:
+                    row.mislocated += 1
+    return sorted(stats.values(), key=lambda s: (s.detector, s.element))
+
+
+def format_report(rows: Sequence[ElementStats]) -> str:
+    """Plain-text table of the benchmark results."""
+    def pct(value: Optional[float]) -> str:
+        return "   -" if value is None else f"{value * 100:3.0f}%"
+
+    def ms(value: Optional[float]) -> str:
+        return "     -" if value is None else f"{value:6.1f}"
+
+    lines = [f"{'detector':<21}{'element':<38}{'n':>5}{'hit':>6}{'fp':>6}{'misloc':>7}"
+             f"{'p50ms':>8}{'p95ms':>8}{'p99ms':>8}"]
+    for row in rows:
+        lines.append(f"{row.detector:<21}{row.element[:37]:<38}{row.cases:>5}{pct(row.hit_rate):>6}"
+                     f"{pct(row.fp_rate):>6}{row.mislocated:>7}{ms(row.percentile(50)):>8}"
+                     f"{ms(row.percentile(95)):>8}{ms(row.percentile(99)):>8}")
+    return "\n".join(lines)
+
+
+def _parse_resolutions(text: str) -> List[Tuple[int, int]]:
+    return [tuple(int(v) for v in item.lower().split("x")) for item in text.split(",") if item]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from .screen_detector import get_default_images_dir
+
+    parser = argparse.ArgumentParser(description="Offline benchmark of the uploader's visual detectors")
+    parser.add_argument("--images", type=Path, default=get_default_images_dir(),
+                        help="helper_images folder (templates + captures)")
+    parser.add_argument("--captures", type=Path, action="append", default=[],
+                        help="extra folder of recorded screenshots (repeatable)")
+    parser.add_argument("--resolutions", default=",".join(f"{w}x{h}" for w, h in DEFAULT_RESOLUTIONS))
+    parser.add_argument("--scales", default=",".join(f"{s:g}" for s in DEFAULT_SCALES))
+    parser.add_argument("--detectors", default="", help="comma separated subset of detector names")
+    parser.add_argument("--confidence", type=float, default=TEMPLATE_CONFIDENCE,
+                        help="template matching threshold")
+    parser.add_argument("--no-synthetic", action="store_true")
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs per case")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, help="also write the report as JSON")
+    args = parser.parse_args(argv)
+
+    if not CV2_AVAILABLE:
+        parser.error("OpenCV is required for the detector benchmark")
+
+    templates, captures = split_helper_images(args.images)
+    for folder in args.captures:
+        captures.extend(sorted(folder.glob("*.png")))
+
+    cases = load_recorded_cases(captures, templates)
+    if not args.no_synthetic:
+        cases += render_synthetic_cases(templates, _parse_resolutions(args.resolutions),
+                                        [float(s) for s in args.scales.split(",") if s], args.seed)
+
+    names = [n.strip() for n in args.detectors.split(",") if n.strip()]
+    rows = run_benchmark(cases, default_detectors(templates, names or None, args.confidence), repeat=args.repeat)
+    print(f"{len(cases)} cases ({len(templates)} templates, {len(captures)} captures)")
+    print(format_report(rows))
+
+    if args.json:
+        args.json.write_text(json.dumps([row.summary() for row in rows], indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
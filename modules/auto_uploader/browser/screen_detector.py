@@ -26,6 +26,8 @@ except ImportError:
     CV2_AVAILABLE = False
     logging.warning("OpenCV or pyautogui not available. Screen detection will not work.")
 
+from .screen_matcher import get_screen_matcher
+
 
 def get_default_images_dir() -> Path:
     """Get helper_images directory - works for both dev and frozen EXE."""
@@ -293,44 +295,25 @@ class ScreenDetector:
             return {'found': False, 'position': None, 'confidence': 0.0}
 
         try:
-            # Capture screenshot
-            screenshot = self.capture_screen(region=region)
-
-            # Load template
-            template = cv2.imread(str(template_path))
-            if template is None:
-                logging.error("Failed to load template image: %s", template_path)
+            # Shared frame of this detection tick + cached grayscale template
+            match = get_screen_matcher().find(template_path, confidence=self.confidence, region=region)
+            if match is None:
+                logging.debug("Template match below threshold %.2f: %s", self.confidence, template_path.name)
                 return {'found': False, 'position': None, 'confidence': 0.0}
 
-            # Perform template matching
-            result = cv2.matchTemplate(screenshot, template, cv2.TM_CCOEFF_NORMED)
-            min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
-
-            # Check if match confidence exceeds threshold
-            if max_val >= self.confidence:
-                # Get center of matched region
-                template_h, template_w = template.shape[:2]
-                center_x = max_loc[0] + template_w // 2
-                center_y = max_loc[1] + template_h // 2
-
-                # If region was specified, adjust coordinates
-                if region:
-                    center_x += region[0]
-                    center_y += region[1]
-
-                logging.debug("Template match found: position=(%d, %d), confidence=%.2f",
-                            center_x, center_y, max_val)
-
-                return {
-                    'found': True,
-                    'position': (center_x, center_y),
-                    'confidence': float(max_val),
-                    'top_left': max_loc,
-                    'size': (template_w, template_h)
-                }
-            else:
-                logging.debug("Template match below threshold: %.2f < %.2f", max_val, self.confidence)
-                return {'found': False, 'position': None, 'confidence': float(max_val)}
+            center_x, center_y = match.center
+            logging.debug("Template match found: position=(%d, %d), confidence=%.2f",
+                        center_x, center_y, match.confidence)
+
+            # top_left stays relative to the search region (as before)
+            offset_x, offset_y = (region[0], region[1]) if region else (0, 0)
+            return {
+                'found': True,
+                'position': (center_x, center_y),
+                'confidence': float(match.confidence),
+                'top_left': (match.left - offset_x, match.top - offset_y),
+                'size': (match.width, match.height)
+            }
 
         except Exception as e:
             logging.error("Error during template matching: %s", e, exc_info=True)
@@ -0,0 +1,356 @@
+"""
+Screen Matcher
+==============
+One template-matching service for every image lookup of the uploader.
+
+ScreenDetector, the ixBrowser upload/login helpers and the video upload
+workflow each grabbed a fresh full-screen screenshot and re-read the
+template PNG with cv2.imread for every single lookup. ScreenMatcher:
+
+- captures the screen once per detection tick: a grayscale frame younger
+  than tick_seconds is shared by every query (invalidate() after a click
+  when the very next lookup must see the new screen)
+- loads each template once, grayscaled, together with a half-scale copy
+  (reloaded only if the PNG changes on disk)
+- matches coarse-to-fine: a half-resolution pass finds candidates, a
+  full-resolution pass in a small window around each confirms the score
+- remembers where each template was last found and searches there first
+- answers batches ("find any of these buttons") against one frame
+
+Results are Match tuples (left, top, width, height, confidence), so they
+drop in where pyautogui.locateOnScreen boxes were used
+(pyautogui.center(match) works on them).
+
+Example Usage:
+--------------
+from modules.auto_uploader.browser.screen_matcher import get_screen_matcher
+
+matcher = get_screen_matcher()
+match = matcher.find("helper_images/add_videos_button.png", confidence=0.8)
+hit = matcher.find_any([ENABLED_IMAGE, DISABLED_IMAGE], confidence=0.8)
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+    logging.warning("OpenCV not available. Screen matching will not work.")
+
+logger = logging.getLogger(__name__)
+
+Region = Tuple[int, int, int, int]
+TemplateRef = Union[str, Path]
+
+DEFAULT_TICK_SECONDS = 0.2
+COARSE_SCALE = 0.5
+# Templates smaller than this (either side) lose too much detail at half
+# scale; they are matched at full resolution only (thin search bars ~30px
+# high were missed at odd pixel offsets, see detector_benchmark)
+COARSE_MIN_TEMPLATE_SIDE = 40
+# A true match scores lower at half scale: line-art icons drop to ~0.45
+# when they sit on an odd pixel offset
+COARSE_SLACK = 0.4
+COARSE_CANDIDATES = 3
+
+
+class Match(NamedTuple):
+    """A template hit in screen coordinates (pyautogui Box compatible)."""
+
+    left: int
+    top: int
+    width: int
+    height: int
+    confidence: float
+
+    @property
+    def center(self) -> Tuple[int, int]:
+        return (self.left + self.width // 2, self.top + self.height // 2)
+
+
+class _Template:
+    __slots__ = ("gray", "coarse", "signature")
+
+    def __init__(self, gray: np.ndarray, signature):
+        self.gray = gray
+        self.signature = signature
+        h, w = gray.shape[:2]
+        if min(h, w) >= COARSE_MIN_TEMPLATE_SIDE:
+            self.coarse = cv2.resize(gray, None, fx=COARSE_SCALE, fy=COARSE_SCALE,
+                                     interpolation=cv2.INTER_AREA)
+        else:
+            self.coarse = None
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        h, w = self.gray.shape[:2]
+        return (w, h)
+
+
+def _grab_screen_gray() -> np.ndarray:
+    import pyautogui
+    return cv2.cvtColor(np.array(pyautogui.screenshot()), cv2.COLOR_RGB2GRAY)
+
+
+def _to_gray(image: np.ndarray) -> np.ndarray:
+    """Grayscale view of an RGB screenshot array (pyautogui channel order)."""
+    if image.ndim == 2:
+        return image
+    if image.shape[2] == 4:
+        return cv2.cvtColor(image, cv2.COLOR_RGBA2GRAY)
+    return cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+
+
+def _peaks(result: np.ndarray, threshold: float, w: int, h: int, limit: int) -> List[Tuple[int, int, float]]:
+    """Best non-overlapping (x, y, score) peaks of a matchTemplate result."""
+    result = result.copy()
+    peaks = []
+    while len(peaks) < limit:
+        _, max_val, _, (x, y) = cv2.minMaxLoc(result)
+        if max_val < threshold:
+            break
+        peaks.append((x, y, float(max_val)))
+        # Suppress everything a template width/height around this peak
+        result[max(0, y - h // 2):y + h // 2 + 1, max(0, x - w // 2):x + w // 2 + 1] = -1.0
+    return peaks
+
+
+class ScreenMatcher:
+    """Shared screen capture + cached templates + coarse-to-fine matching."""
+
+    def __init__(self, tick_seconds: float = DEFAULT_TICK_SECONDS,
+                 grab: Optional[Callable[[], np.ndarray]] = None):
+        """
+        Initialize screen matcher.
+
+        Args:
+            tick_seconds: How long one captured frame is shared by queries
+            grab: Returns the screen as a grayscale array (default: pyautogui)
+        """
+        if not CV2_AVAILABLE:
+            raise ImportError("OpenCV is required for screen matching")
+
+        self.tick_seconds = tick_seconds
+        self._grab = grab or _grab_screen_gray
+        self._lock = threading.RLock()
+        self._frame: Optional[np.ndarray] = None
+        self._coarse_frame: Optional[np.ndarray] = None
+        self._frame_at = 0.0
+        self._templates: Dict[str, _Template] = {}
+        self._last_hits: Dict[str, Match] = {}
+
+    # ── Frames ──────────────────────────────────────────────────────────────
+
+    def frame(self, fresh: bool = False) -> np.ndarray:
+        """Grayscale screen of the current tick (captured at most once per tick)."""
+        with self._lock:
+            now = time.monotonic()
+            if fresh or self._frame is None or now - self._frame_at > self.tick_seconds:
+                self._frame = self._grab()
+                self._coarse_frame = None
+                self._frame_at = time.monotonic()
+            return self._frame
+
+    def invalidate(self) -> None:
+        """Forget the current frame (the screen changed, e.g. after a click)."""
+        with self._lock:
+            self._frame = None
+            self._coarse_frame = None
+
+    def _frames(self, frame: Optional[np.ndarray]) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        if frame is not None:
+            gray = _to_gray(frame)
+            return gray, cv2.resize(gray, None, fx=COARSE_SCALE, fy=COARSE_SCALE,
+                                    interpolation=cv2.INTER_AREA)
+        gray = self.frame()
+        with self._lock:
+            if self._coarse_frame is None and self._frame is gray:
+                self._coarse_frame = cv2.resize(gray, None, fx=COARSE_SCALE, fy=COARSE_SCALE,
+                                                interpolation=cv2.INTER_AREA)
+            return gray, self._coarse_frame
+
+    # ── Templates ───────────────────────────────────────────────────────────
+
+    def template(self, path: TemplateRef) -> Optional[_Template]:
+        """Cached grayscale template (None when missing or unreadable)."""
+        key = str(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            return None
+        signature = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._templates.get(key)
+            if cached is not None and cached.signature == signature:
+                return cached
+        gray = cv2.imread(key, cv2.IMREAD_GRAYSCALE)
+        if gray is None:
+            logger.error("[ScreenMatcher] Failed to load template: %s", key)
+            return None
+        loaded = _Template(gray, signature)
+        with self._lock:
+            self._templates[key] = loaded
+            self._last_hits.pop(key, None)
+        return loaded
+
+    def preload(self, paths: Iterable[TemplateRef]) -> int:
+        """Load templates ahead of the first lookup; returns how many loaded."""
+        return sum(1 for p in paths if self.template(p) is not None)
+
+    # ── Matching ────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _crop(gray: np.ndarray, region: Optional[Region]) -> Tuple[np.ndarray, int, int]:
+        if not region:
+            return gray, 0, 0
+        left, top, width, height = (int(v) for v in region)
+        left, top = max(0, left), max(0, top)
+        return gray[top:top + height, left:left + width], left, top
+
+    @staticmethod
+    def _score_window(gray: np.ndarray, tpl: np.ndarray, x0: int, y0: int, x1: int, y1: int,
+                      method: int) -> Optional[Tuple[int, int, float]]:
+        """Best (x, y, score) of tpl with its top-left inside [x0, x1] x [y0, y1]."""
+        h, w = tpl.shape[:2]
+        x0, y0 = max(0, x0), max(0, y0)
+        x1 = min(gray.shape[1] - w, x1)
+        y1 = min(gray.shape[0] - h, y1)
+        if x1 < x0 or y1 < y0:
+            return None
+        window = gray[y0:y1 + h, x0:x1 + w]
+        result = cv2.matchTemplate(window, tpl, method)
+        _, max_val, _, (x, y) = cv2.minMaxLoc(result)
+        return (x0 + x, y0 + y, float(max_val))
+
+    def _search(self, tpl: _Template, gray: np.ndarray, coarse: Optional[np.ndarray],
+                confidence: float, method: int, limit: int) -> List[Tuple[int, int, float]]:
+        """Top-left (x, y, score) hits in gray coordinates, best first."""
+        w, h = tpl.size
+        if gray.shape[0] < h or gray.shape[1] < w:
+            return []
+
+        use_coarse = tpl.coarse is not None and coarse is not None
+        if use_coarse:
+            ch, cw = tpl.coarse.shape[:2]
+            use_coarse = coarse.shape[0] >= ch and coarse.shape[1] >= cw
+        if not use_coarse:
+            result = cv2.matchTemplate(gray, tpl.gray, method)
+            return _peaks(result, confidence, w, h, limit)
+
+        # Coarse pass over the whole frame, then confirm each candidate at
+        # full resolution within a couple of coarse pixels
+        coarse_result = cv2.matchTemplate(coarse, tpl.coarse, method)
+        candidates = _peaks(coarse_result, confidence - COARSE_SLACK, cw, ch,
+                            max(limit, COARSE_CANDIDATES))
+        slop = int(round(2 / COARSE_SCALE))
+        hits = []
+        for cx, cy, _ in candidates:
+            x, y = int(cx / COARSE_SCALE), int(cy / COARSE_SCALE)
+            hit = self._score_window(gray, tpl.gray, x - slop, y - slop, x + slop, y + slop, method)
+            if hit and hit[2] >= confidence:
+                hits.append(hit)
+        hits.sort(key=lambda item: item[2], reverse=True)
+        return hits[:limit]
+
+    def _find(self, path: TemplateRef, gray: np.ndarray, coarse: Optional[np.ndarray],
+              confidence: float, region: Optional[Region], method: int) -> Optional[Match]:
+        key = str(path)
+        tpl = self.template(path)
+        if tpl is None:
+            return None
+        w, h = tpl.size
+        area, ox, oy = self._crop(gray, region)
+
+        # Where it was last time, plus a template-sized margin
+        last = self._last_hits.get(key)
+        if last is not None:
+            hit = self._score_window(area, tpl.gray, last.left - ox - w, last.top - oy - h,
+                                     last.left - ox + w, last.top - oy + h, method)
+            if hit and hit[2] >= confidence:
+                match = Match(hit[0] + ox, hit[1] + oy, w, h, hit[2])
+                self._last_hits[key] = match
+                return match
+
+        area_coarse = coarse if not region else None
+        hits = self._search(tpl, area, area_coarse, confidence, method, limit=1)
+        if not hits:
+            return None
+        x, y, score = hits[0]
+        match = Match(x + ox, y + oy, w, h, score)
+        self._last_hits[key] = match
+        return match
+
+    def find(self, path: TemplateRef, confidence: float = 0.8, region: Optional[Region] = None,
+             frame: Optional[np.ndarray] = None, method: Optional[int] = None) -> Optional[Match]:
+        """
+        Best match of one template.
+
+        Args:
+            path: Template image path
+            confidence: Minimum score (0.0 to 1.0)
+            region: Optional (left, top, width, height) to search within
+            frame: Screenshot to search instead of the shared tick frame
+            method: OpenCV matching method (default TM_CCOEFF_NORMED)
+
+        Returns:
+            Match in screen coordinates, or None
+        """
+        gray, coarse = self._frames(frame)
+        return self._find(path, gray, coarse, confidence, region, method or cv2.TM_CCOEFF_NORMED)
+
+    def find_all(self, path: TemplateRef, confidence: float = 0.8, region: Optional[Region] = None,
+                 frame: Optional[np.ndarray] = None, limit: int = 20) -> List[Match]:
+        """All non-overlapping matches of one template, top-to-bottom, left-to-right."""
+        tpl = self.template(path)
+        if tpl is None:
+            return []
+        gray, coarse = self._frames(frame)
+        area, ox, oy = self._crop(gray, region)
+        hits = self._search(tpl, area, coarse if not region else None,
+                            confidence, cv2.TM_CCOEFF_NORMED, limit)
+        w, h = tpl.size
+        matches = sorted((Match(x + ox, y + oy, w, h, s) for x, y, s in hits),
+                         key=lambda m: (m.top, m.left))
+        if matches:
+            self._last_hits[str(path)] = max(matches, key=lambda m: m.confidence)
+        return matches
+
+    def find_any(self, paths: Iterable[TemplateRef], confidence: float = 0.8,
+                 region: Optional[Region] = None,
+                 frame: Optional[np.ndarray] = None) -> Optional[Tuple[str, Match]]:
+        """
+        First template (in the given priority order) found on one shared frame.
+
+        Returns:
+            (template path, Match) or None
+        """
+        gray, coarse = self._frames(frame)
+        for path in paths:
+            match = self._find(path, gray, coarse, confidence, region, cv2.TM_CCOEFF_NORMED)
+            if match is not None:
+                return str(path), match
+        return None
+
+
+_screen_matcher = None
+_screen_matcher_lock = threading.Lock()
+
+
+def get_screen_matcher() -> ScreenMatcher:
+    """Get global screen matcher instance"""
+    global _screen_matcher
+
+    with _screen_matcher_lock:
+        if _screen_matcher is None:
+            _screen_matcher = ScreenMatcher()
+
+    return _screen_matcher
@@ -15,6 +15,8 @@ import numpy as np
 from pathlib import Path
 from typing import Optional, Dict, Tuple
 
+from ..screen_matcher import get_screen_matcher
+
 # Configure Tesseract path for Windows
 import os
 try:
@@ -96,13 +98,11 @@ class AddVideosFinder:
                 logger.debug(f"[PHASE 4] Helper image not found: {image_path}")
                 return None
 
-            helper_image = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
-            if helper_image is None:
+            matcher = get_screen_matcher()
+            if matcher.template(image_path) is None:
                 logger.debug("[PHASE 4] Could not read helper image")
                 return None
 
-            screenshot_gray = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
-
             # Try multiple matching methods for better accuracy
             methods = [
                 (cv2.TM_CCOEFF_NORMED, "CCOEFF_NORMED"),
@@ -110,29 +110,21 @@ class AddVideosFinder:
             ]
 
             best_match = None
-            best_confidence = 0
-
             for method, method_name in methods:
-                result = cv2.matchTemplate(screenshot_gray, helper_image, method)
-                _, max_val, _, max_loc = cv2.minMaxLoc(result)
-
-                logger.debug(f"[PHASE 4] {method_name} confidence: {max_val:.3f}")
-
-                if max_val > best_confidence:
-                    best_confidence = max_val
-                    best_match = (max_loc, max_val, method_name)
-
-            if best_match and best_confidence >= confidence:
-                x, y = best_match[0]
-                h, w = helper_image.shape
-                center_x = x + w // 2
-                center_y = y + h // 2
-
-                logger.info(f"[PHASE 4] ✅ Button found via {best_match[2]} at ({center_x}, {center_y}) (confidence: {best_confidence:.3f})")
-                return {'coords': (center_x, center_y), 'confidence': best_confidence}
+                match = matcher.find(image_path, confidence=confidence, frame=screenshot, method=method)
+                if match is not None:
+                    logger.debug(f"[PHASE 4] {method_name} confidence: {match.confidence:.3f}")
+                    if best_match is None or match.confidence > best_match[0].confidence:
+                        best_match = (match, method_name)
+
+            if best_match:
+                match, method_name = best_match
+                center_x, center_y = match.center
+
+                logger.info(f"[PHASE 4] ✅ Button found via {method_name} at ({center_x}, {center_y}) (confidence: {match.confidence:.3f})")
+                return {'coords': (center_x, center_y), 'confidence': match.confidence}
             else:
-                if best_match:
-                    logger.debug(f"[PHASE 4] Best match confidence {best_confidence:.3f} below threshold {confidence:.3f}")
+                logger.debug(f"[PHASE 4] No match at or above threshold {confidence:.3f}")
 
         except Exception as e:
             logger.debug(f"[PHASE 4] Image matching error: {e}")
@@ -26,12 +26,13 @@ try:
 except Exception as e:
     pytesseract = None
 
-import cv2
 import numpy as np
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 from difflib import SequenceMatcher
 
+from ..screen_matcher import get_screen_matcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -462,21 +463,14 @@ class BookmarkNavigator:
                 logger.debug(f"[PHASE 1B] Helper image not found: {image_name}")
                 return False
 
-            screenshot = self._capture_screenshot()
-            helper_image = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
-            screenshot_gray = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
-
-            result = cv2.matchTemplate(screenshot_gray, helper_image, cv2.TM_CCOEFF_NORMED)
-            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            match = get_screen_matcher().find(image_path, confidence=confidence)
 
-            if max_val >= confidence:
-                x, y = max_loc
-                h, w = helper_image.shape
-                center_x = x + w // 2
-                center_y = y + h // 2
+            if match is not None:
+                center_x, center_y = match.center
 
                 logger.debug(f"[PHASE 1B] Matched {image_name} at ({center_x}, {center_y})")
                 pyautogui.click(center_x, center_y)
+                get_screen_matcher().invalidate()
                 return True
 
         except Exception as e:
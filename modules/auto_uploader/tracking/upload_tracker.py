@@ -1,14 +1,38 @@
-"""Upload Tracker - Persist upload history for the modular workflow."""
+"""Upload Tracker - Persist upload history for the modular workflow.
+
+Storage layout (next to ``tracking_path``):
+
+* ``history.json`` - small summary index: totals, per-account counters
+  and the list of day segments.
+* ``history_segments/YYYY-MM-DD.jsonl`` - one JSON record per upload
+  attempt (completed ones included), append-only, one file per (UTC) day.
+* ``history_completed.jsonl`` - append-only index of the completed
+  ``[creator, video]`` keys.
+
+Records are buffered and written by a background flush that coalesces
+everything recorded within ``flush_window`` seconds. A flush only appends
+to the segments and the completed index and rewrites the fixed-size
+summary, so its cost stays flat however long the history gets. Loading
+reads the completed index plus the most recent segments; older segments
+are never opened. Histories without an index (single-file or older
+segmented ones) are migrated on first load.
+"""
 
 from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
+SUMMARY_FORMAT = 3
+FLUSH_WINDOW_SECONDS = 2.0
+RECENT_SEGMENTS = 2
+
 
 def _timestamp() -> str:
     """Return an ISO-8601 timestamp in UTC."""
@@ -17,35 +41,71 @@ def _timestamp() -> str:
 
 @dataclass(slots=True)
 class _TrackerData:
-    """Internal representation of the tracking file."""
+    """Internal representation of the summary index."""
 
-    upload_history: List[Dict[str, object]] = field(default_factory=list)
-    failed_uploads: List[Dict[str, object]] = field(default_factory=list)
+    # Completed keys of format 2 summaries; newer ones live in the completed index
+    completed: Dict[str, List[str]] = field(default_factory=dict)
+    totals: Dict[str, int] = field(default_factory=lambda: {"uploads": 0, "failures": 0})
     browser_accounts: Dict[str, Dict[str, object]] = field(default_factory=dict)
+    segments: List[str] = field(default_factory=list)
     last_updated: Optional[str] = None
 
     def to_dict(self) -> Dict[str, object]:
         return {
-            "upload_history": self.upload_history,
-            "failed_uploads": self.failed_uploads,
+            "format": SUMMARY_FORMAT,
+            "totals": self.totals,
             "browser_accounts": self.browser_accounts,
+            "segments": self.segments,
             "last_updated": self.last_updated,
         }
 
+    def apply(self, entry: Dict[str, object]) -> None:
+        """Fold one history entry into the summary."""
+        status = entry.get("status")
+        if status == "completed":
+            self.totals["uploads"] += 1
+        else:
+            self.totals["failures"] += 1
+
+        account = entry.get("account")
+        if account:
+            account_block = self.browser_accounts.setdefault(
+                account,
+                {"browser_type": None, "uploads": 0, "failures": 0, "last_status": None},
+            )
+            account_block["browser_type"] = entry.get("browser_type")
+            account_block["last_status"] = status
+            account_block["last_timestamp"] = entry.get("timestamp")
+            key = "uploads" if status == "completed" else "failures"
+            account_block[key] = int(account_block.get(key) or 0) + 1
+
+        self.last_updated = entry.get("timestamp")
+
 
 class UploadTracker:
     """Small helper that keeps track of completed and failed uploads."""
 
-    def __init__(self, tracking_path: Path) -> None:
+    def __init__(
+        self,
+        tracking_path: Path,
+        flush_window: float = FLUSH_WINDOW_SECONDS,
+        recent_segments: int = RECENT_SEGMENTS,
+    ) -> None:
         self._path = Path(tracking_path)
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._data = self._load()
-        self._completed_cache = {
-            (entry.get("creator"), entry.get("video"))
-            for entry in self._data.upload_history
-            if entry.get("status") == "completed"
-        }
+        self._segments_dir = self._path.with_name(f"{self._path.stem}_segments")
+        self._completed_path = self._path.with_name(f"{self._path.stem}_completed.jsonl")
+        self._flush_window = flush_window
+        self._recent_segments = recent_segments
+
+        self._lock = threading.RLock()
+        self._pending: List[Dict[str, object]] = []
+        self._timer: Optional[threading.Timer] = None
         self._dirty = False
+
+        self._data = self._load()
+        self._completed_cache = self._load_completed()
+        self._recent = self._load_recent()
         logging.debug("UploadTracker initialized at %s", self._path)
 
     # ------------------------------------------------------------------ #
@@ -60,7 +120,7 @@ class UploadTracker:
         browser_type: Optional[str] = None,
         metadata: Optional[Dict[str, object]] = None,
     ) -> None:
-        """Record the outcome of an upload attempt."""
+        """Record the outcome of an upload attempt (written by the next flush)."""
         entry = {
             "creator": creator,
             "video": video,
@@ -74,69 +134,202 @@ class UploadTracker:
         if metadata:
             entry["metadata"] = metadata
 
-        self._data.upload_history.append(entry)
-        if status != "completed":
-            self._data.failed_uploads.append(entry)
-        else:
-            self._completed_cache.add((creator, video))
-
-        if account:
-            account_block = self._data.browser_accounts.setdefault(
-                account,
-                {
-                    "browser_type": browser_type,
-                    "uploads": [],
-                    "failures": [],
-                    "last_status": None,
-                },
-            )
-            account_block["browser_type"] = browser_type
-            account_block["last_status"] = status
-            target_list = account_block["uploads"] if status == "completed" else account_block["failures"]
-            target_list.append(
-                {
-                    "creator": creator,
-                    "video": video,
-                    "timestamp": entry["timestamp"],
-                }
-            )
-
-        self._data.last_updated = entry["timestamp"]
-        self._dirty = True
+        with self._lock:
+            self._data.apply(entry)
+            if status == "completed":
+                self._completed_cache.add((creator, video))
+            self._recent.append(entry)
+            self._pending.append(entry)
+            self._dirty = True
+            self._schedule_flush()
         logging.debug("Recorded upload (%s/%s) status=%s", creator, video, status)
 
     def was_uploaded(self, creator: str, video: str) -> bool:
         """Return True if a creator/video pair has already been marked as completed."""
         return (creator, video) in self._completed_cache
 
+    def recent_history(self) -> List[Dict[str, object]]:
+        """Entries of the most recent day segments (oldest first)."""
+        with self._lock:
+            return list(self._recent)
+
     def flush(self) -> None:
-        """Persist the in-memory state to disk if it changed."""
-        if not self._dirty:
-            return
+        """Persist buffered records and the summary to disk if they changed."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
 
-        payload = self._data.to_dict()
-        try:
-            self._path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-            self._dirty = False
-            logging.debug("Upload history persisted to %s", self._path)
-        except OSError as exc:  # pragma: no cover - filesystem guard
-            logging.error("Unable to write upload tracking file %s: %s", self._path, exc)
+            try:
+                # Index first: after a crash a key may lack its record, never the reverse
+                self._append_completed(
+                    (entry["creator"], entry["video"])
+                    for entry in self._pending
+                    if entry.get("status") == "completed"
+                )
+                self._append_segments(self._pending)
+                self._pending = []
+                self._write_summary()
+
+                # Only the most recent day segments stay in memory
+                recent_days = set(self._data.segments[-self._recent_segments:]) if self._recent_segments > 0 else set()
+                self._recent = [entry for entry in self._recent if str(entry.get("timestamp"))[:10] in recent_days]
+                self._dirty = False
+                logging.debug("Upload history persisted to %s", self._path)
+            except OSError as exc:  # pragma: no cover - filesystem guard
+                logging.error("Unable to write upload tracking file %s: %s", self._path, exc)
+
+    def close(self) -> None:
+        """Flush pending records and stop the background flush."""
+        self.flush()
 
     # ------------------------------------------------------------------ #
     # Internal helpers                                                   #
     # ------------------------------------------------------------------ #
+    def _schedule_flush(self) -> None:
+        if self._flush_window <= 0:
+            self.flush()
+            return
+        if self._timer is None:
+            self._timer = threading.Timer(self._flush_window, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _append_segments(self, entries: List[Dict[str, object]]) -> None:
+        by_day: Dict[str, List[str]] = {}
+        for entry in entries:
+            day = str(entry.get("timestamp") or _timestamp())[:10]
+            by_day.setdefault(day, []).append(json.dumps(entry, separators=(",", ":")))
+
+        if by_day:
+            self._segments_dir.mkdir(parents=True, exist_ok=True)
+        for day, lines in sorted(by_day.items()):
+            with open(self._segments_dir / f"{day}.jsonl", "a", encoding="utf-8") as handle:
+                handle.write("\n".join(lines) + "\n")
+            if day not in self._data.segments:
+                self._data.segments.append(day)
+                self._data.segments.sort()
+
+    def _append_completed(self, keys: Iterable[Tuple[str, str]]) -> None:
+        lines = [json.dumps([creator, video], separators=(",", ":")) for creator, video in keys]
+        if lines:
+            with open(self._completed_path, "a", encoding="utf-8") as handle:
+                handle.write("\n".join(lines) + "\n")
+
+    def _write_summary(self) -> None:
+        temp_path = self._path.with_name(self._path.name + ".tmp")
+        temp_path.write_text(json.dumps(self._data.to_dict(), separators=(",", ":")), encoding="utf-8")
+        os.replace(temp_path, self._path)
+
+    def _read_segment(self, day: str) -> List[Dict[str, object]]:
+        entries: List[Dict[str, object]] = []
+        try:
+            with open(self._segments_dir / f"{day}.jsonl", "r", encoding="utf-8") as handle:
+                for line in handle:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # torn last line after a crash
+                        logging.warning("UploadTracker: skipping damaged record in segment %s", day)
+        except OSError:
+            pass
+        return entries
+
+    def _load_completed(self) -> set:
+        """Creator/video keys of every completed upload, read from the completed index."""
+        completed = set()
+        try:
+            with open(self._completed_path, "r", encoding="utf-8") as handle:
+                for line in handle:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        creator, video = json.loads(line)
+                    except (json.JSONDecodeError, TypeError, ValueError):
+                        # torn last line after a crash
+                        logging.warning("UploadTracker: skipping damaged key in %s", self._completed_path)
+                        continue
+                    completed.add((creator, video))
+            return completed
+        except FileNotFoundError:
+            pass
+        except OSError as exc:  # pragma: no cover - filesystem guard
+            logging.error("UploadTracker: unable to read %s: %s", self._completed_path, exc)
+            return completed
+
+        if not self._data.segments and not self._data.completed:
+            return completed
+        return self._rebuild_completed()
+
+    def _rebuild_completed(self) -> set:
+        """Build the completed index once from the summary and every segment."""
+        completed = {
+            (creator, video)
+            for creator, videos in self._data.completed.items()
+            for video in videos
+        }
+        for day in self._data.segments:
+            for entry in self._read_segment(day):
+                if entry.get("status") == "completed":
+                    completed.add((entry.get("creator"), entry.get("video")))
+
+        try:
+            temp_path = self._completed_path.with_name(self._completed_path.name + ".tmp")
+            temp_path.write_text(
+                "".join(json.dumps([creator, video], separators=(",", ":")) + "\n"
+                        for creator, video in sorted(completed, key=str)),
+                encoding="utf-8",
+            )
+            os.replace(temp_path, self._completed_path)
+            logging.info("UploadTracker: indexed %d completed uploads in %s", len(completed), self._completed_path)
+        except OSError as exc:  # pragma: no cover - filesystem guard
+            logging.error("UploadTracker: unable to write %s: %s", self._completed_path, exc)
+        return completed
+
+    def _load_recent(self) -> List[Dict[str, object]]:
+        entries: List[Dict[str, object]] = []
+        for day in self._data.segments[-self._recent_segments:] if self._recent_segments > 0 else []:
+            entries.extend(self._read_segment(day))
+        return entries
+
     def _load(self) -> _TrackerData:
-        """Load tracker data from disk, falling back to defaults on failure."""
+        """Load the summary index from disk, falling back to defaults on failure."""
         if self._path.is_file():
             try:
                 raw = json.loads(self._path.read_text(encoding="utf-8"))
+                if "upload_history" in raw:
+                    return self._migrate(raw)
                 return _TrackerData(
-                    upload_history=list(raw.get("upload_history", [])),
-                    failed_uploads=list(raw.get("failed_uploads", [])),
+                    completed={key: list(value) for key, value in raw.get("completed", {}).items()},
+                    totals={"uploads": 0, "failures": 0, **raw.get("totals", {})},
                     browser_accounts=dict(raw.get("browser_accounts", {})),
+                    segments=list(raw.get("segments", [])),
                     last_updated=raw.get("last_updated"),
                 )
             except (OSError, json.JSONDecodeError) as exc:
                 logging.warning("UploadTracker: failed to parse %s (%s). Recreating fresh state.", self._path, exc)
 
         return _TrackerData()
+
+    def _migrate(self, raw: Dict[str, object]) -> _TrackerData:
+        """Convert a single-file history (format 1) into segments + summary."""
+        history = list(raw.get("upload_history", []))
+        data = _TrackerData()
+        for entry in history:
+            data.apply(entry)
+        data.last_updated = raw.get("last_updated") or data.last_updated
+
+        self._data = data
+        try:
+            self._append_segments(history)
+            self._write_summary()
+            logging.info("UploadTracker: migrated %d history entries to %s", len(history), self._segments_dir)
+        except OSError as exc:  # pragma: no cover - filesystem guard
+            logging.error("UploadTracker: migration of %s failed: %s", self._path, exc)
+        return data
@@ -69,6 +69,7 @@ class ConfigManager:
             "concurrent_downloads": 3,
             "auto_retry": True,
             "max_retries": 3,
+            "ytdlp_pool_workers": 3,  # Warm yt-dlp worker processes (0 = build YoutubeDL in-process)
             "show_notifications": True
         },
         "editor": {
@@ -113,9 +114,30 @@ class ConfigManager:
             "max_videos": 0,  # 0 = unlimited
             "instagram_feed_count": 200,  # yt-dlp instagram:feed_count override (0 = yt-dlp default)
             "exhaustive_mode": True,  # Try all methods and merge results for best coverage
+            "race_methods": True,  # Start the top cheap extraction methods in parallel
+            "race_top_k": 3,
+            "bulk_workers": 3,  # Bulk URLs extracted at once (1 = sequential)
+            "bulk_per_platform_workers": 1,
+            "incremental": True,  # Stop re-listing profiles at already-known links
+            "full_resync_hours": 168,
             "save_folder": str(Path.home() / "Desktop" / "Links Grabber"),
             "auto_save": False
         },
+        "creator_queue": {
+            "max_parallel_creators": 1,  # 1 = classic sequential queue
+            "platform_limits": {
+                "youtube": 4,
+                "tiktok": 2,
+                "instagram": 2,
+                "facebook": 2,
+                "twitter": 2
+            },
+            "resource_limits": {
+                "link_grab": 1,  # browser-bound link grabbing
+                "download": 4,  # plain yt-dlp downloads
+                "postprocess": 2  # ffmpeg post-processing
+            }
+        },
         "folder_mapping": {
             "enabled": True,
             "mappings_file": str(Path.home() / ".onesoul" / "folder_mappings.json"),
@@ -5,11 +5,14 @@ Per-creator JSON config — save/load settings per folder.
 
 import json
 import re
+import uuid
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional
 from urllib.parse import parse_qs, urlparse
 
+from modules.shared.downloaded_store import DownloadedScope, creator_scope, get_downloaded_store, scope_for
+
 _WATERMARK_TEXT_DEFAULTS = {
     "enabled": False,
     "text": "",                   # empty = use @folderName
@@ -124,6 +127,8 @@ _DEFAULTS = {
     "preset_name": "",
     "split_duration": 15.0,
     "parts_count": 2,
+    "fast_split": False,              # keyframe-aligned stream-copy split (no re-encode)
+    "fast_split_tolerance_sec": 2.0,  # max cut drift before falling back to re-encode
     "split_edit_settings": get_split_edit_defaults(),
     "duplication_control": True,
     "popular_fallback": True,
@@ -139,6 +144,7 @@ _DEFAULTS = {
     "watermark_avatar": _WATERMARK_AVATAR_DEFAULTS.copy(),
     "downloaded_ids": [],
     "downloaded_url_history": [],
+    "downloaded_scope_id": "",        # stable downloaded-store key; travels with the folder
     "last_activity": {
         "date": None,
         "result": None,           # "success" | "partial" | "failed"
@@ -226,40 +232,64 @@ class CreatorConfig:
             print(f"[CreatorConfig] save error: {e}")
             return False
 
-    # ── Video ID tracking ────────────────────────────────────────────────────
+    # ── Video ID tracking (shared downloaded store) ─────────────────────────
+
+    _URL_HISTORY_CAP = 300
+
+    @property
+    def downloaded(self) -> DownloadedScope:
+        """This creator's view of the downloaded store (supports `in` and len())."""
+        scope = getattr(self, "_downloaded_scope", None)
+        if scope is None:
+            store = get_downloaded_store()
+            scope_id = str(self.data.get("downloaded_scope_id") or "")
+            if not scope_id:
+                # Keyed by an id saved in this folder's config, not by the
+                # folder path, so a renamed or moved folder keeps its history
+                scope_id = uuid.uuid4().hex
+                self.data["downloaded_scope_id"] = scope_id
+                store.adopt(creator_scope(scope_id), scope_for(self.folder))
+                self.save()
+            scope = DownloadedScope(store, creator_scope(scope_id))
+            self._downloaded_scope = scope
+            self._migrate_downloaded_lists(scope)
+        return scope
+
+    def _migrate_downloaded_lists(self, scope: DownloadedScope):
+        """Move legacy downloaded_ids / downloaded_url_history into the store once."""
+        ids = self.data.get("downloaded_ids") or []
+        history = self.data.get("downloaded_url_history") or []
+        if not ids and not history:
+            return
+        records = [{"video_id": vid} for vid in ids if vid]
+        records += [h for h in history if isinstance(h, dict) and h.get("url")]
+        scope.store.add_many(scope.scope, records)
+        self.data["downloaded_ids"] = []
+        self.data["downloaded_url_history"] = []
+        self.save()
 
-    def add_downloaded_id(self, video_id: str):
-        if video_id and video_id not in self.data["downloaded_ids"]:
-            self.data["downloaded_ids"].append(video_id)
+    def add_downloaded_id(self, video_id: str, url: str = "", platform: str = "", creator: str = ""):
+        if video_id or url:
+            self.downloaded.add(url=url, video_id=video_id, platform=platform, creator=creator)
 
     def is_downloaded(self, video_id: str) -> bool:
-        return video_id in self.data["downloaded_ids"]
+        return video_id in self.downloaded
 
-    # ── URL history (capped at 300) ──────────────────────────────────────────
+    def clear_downloaded(self):
+        self.downloaded.store.clear(self.downloaded.scope)
+        self.data["downloaded_ids"] = []
+        self.data["downloaded_url_history"] = []
 
-    _URL_HISTORY_CAP = 300
+    # ── URL history ──────────────────────────────────────────────────────────
 
     def add_url_to_history(self, url: str, platform: str = "", creator: str = ""):
         """Record a successfully-downloaded URL for history fallback."""
-        if not url:
-            return
-        history = self.data.setdefault("downloaded_url_history", [])
-        # Avoid duplicate entries for the same URL
-        if any(h.get("url") == url for h in history):
-            return
-        history.append({
-            "url": url,
-            "platform": platform,
-            "creator": creator,
-            "downloaded_at": datetime.now().isoformat(),
-        })
-        # Cap: keep most recent entries
-        if len(history) > self._URL_HISTORY_CAP:
-            self.data["downloaded_url_history"] = history[-self._URL_HISTORY_CAP:]
+        if url:
+            self.downloaded.add(url=url, platform=platform, creator=creator)
 
     def get_url_history(self) -> list:
-        """Return the downloaded URL history list."""
-        return self.data.get("downloaded_url_history", [])
+        """Return the most recent downloaded URLs (oldest first)."""
+        return self.downloaded.store.recent(self.downloaded.scope, self._URL_HISTORY_CAP)
 
     # ── Activity ─────────────────────────────────────────────────────────────
 
@@ -471,6 +501,17 @@ class CreatorConfig:
     def parts_count(self) -> int:
         return _normalize_parts_count(self.data.get("parts_count", 2))
 
+    @property
+    def fast_split(self) -> bool:
+        return bool(self.data.get("fast_split", False))
+
+    @property
+    def fast_split_tolerance(self) -> float:
+        try:
+            return max(0.0, float(self.data.get("fast_split_tolerance_sec", 2.0)))
+        except (TypeError, ValueError):
+            return 2.0
+
     @property
     def split_edit_settings(self) -> dict:
         return merge_split_edit_settings(self.data.get("split_edit_settings"))
@@ -7,6 +7,9 @@ Downloading: uses method3-style approach from VideoDownloaderThread (same as Vid
 Never reads links.txt files Ã¢â‚¬â€ always visits profile fresh via browser.
 """
 
+import bisect
+import contextlib
+import csv
 import json
 import logging
 import os
@@ -19,16 +22,34 @@ import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 import yt_dlp
 from PyQt5.QtCore import QThread, pyqtSignal
 
 from .config_manager import CreatorConfig
+from .postprocess_planner import (
+    STEP_BYPASS,
+    STEP_EDIT,
+    STEP_PRESET,
+    STEP_WATERMARK,
+    FusedGraph,
+    PostProcessPlanner,
+    preset_video_filter,
+    resolve_preset_size,
+)
+from .scheduler import (
+    RESOURCE_DOWNLOAD,
+    RESOURCE_LINK_GRAB,
+    RESOURCE_POSTPROCESS,
+    ResourceGate,
+    SlotCancelled,
+)
 from modules.config.paths import find_ytdlp_executable
 from modules.config.paths import get_cookies_dir
 from modules.shared.auth_network_hub import AuthNetworkHub
+from modules.shared.output_tracker import YTDLP_PRINT_FILEPATH_ARGS, OutputTracker
 from modules.shared.pacing import PacingManager
 from modules.video_downloader.core import VideoDownloaderThread
 
@@ -590,7 +611,7 @@ def download_video(
         ".mp4", ".mov", ".avi", ".mkv", ".webm", ".flv", ".wmv", ".m4v", ".mpeg", ".mpg"
     }
 
-    before_files = {str(p) for p in output_folder.rglob("*") if p.is_file()}
+    tracker = OutputTracker(output_folder)
     result_path: List[Optional[Path]] = [None]
     cancelled = [False]
 
@@ -619,6 +640,7 @@ def download_video(
         if cancel_event and cancel_event.is_set():
             cancelled[0] = True
             raise yt_dlp.utils.DownloadError("Cancelled")
+        tracker.progress_hook(d)
         if d.get("status") == "finished":
             fp = d.get("filename") or d.get("info_dict", {}).get("_filename", "")
             if fp:
@@ -632,10 +654,7 @@ def download_video(
             if result_path[0] and result_path[0].exists():
                 return result_path[0]
 
-            fresh = [
-                p for p in output_folder.rglob("*")
-                if p.is_file() and str(p) not in before_files and p.suffix.lower() in video_exts
-            ]
+            fresh = [Path(p) for p in tracker.new_files(video_exts)]
             if len(fresh) > 1:
                 # YT-DLP often preserves original timestamps (from e.g. 2021). 
                 # Instead of mtime, pick the largest file, which is usually the merged video.
@@ -712,6 +731,7 @@ def download_video(
             "fragment_retries": 3,
             "http_headers": headers,
             "progress_hooks": [_hook],
+            "postprocessor_hooks": [tracker.postprocessor_hook],
         }
         if fmt:
             opts["format"] = fmt
@@ -779,6 +799,7 @@ def download_video(
             cmd.extend(["--ffmpeg-location", str(Path(ffmpeg).parent), "--merge-output-format", "mp4"])
         for k, v in _CHROME120_HEADERS.items():
             cmd.extend(["--add-header", f"{k}:{v}"])
+        cmd.extend(YTDLP_PRINT_FILEPATH_ARGS)
         cmd.append(url)
 
         try:
@@ -800,6 +821,7 @@ def download_video(
             _set_error(err)
             return False, err
 
+        tracker.note_output(run.stdout)
         if run.returncode == 0:
             if result_path[0] and result_path[0].exists():
                 return True, ""
@@ -1186,84 +1208,344 @@ def _can_decode_media(input_path: Path, ffmpeg: str = "ffmpeg") -> bool:
         return False
 
 
-def split_video(
-    input_path: Path,
-    output_folder: Path,
-    segment_sec: float,
-    ffmpeg: str = "ffmpeg",
-    progress_cb: Callable[[str], None] = None,
-) -> List[Path]:
-    input_path = Path(input_path)
-    output_folder = Path(output_folder)
-    output_folder.mkdir(parents=True, exist_ok=True)
+_SPLIT_MIN_VALID_PART_SEC = 0.20
+_SPLIT_AUDIO_RESYNC = "aresample=async=1:first_pts=0"
 
+
+def _run_ffmpeg_capture(command: List[str]) -> Tuple[int, str]:
     try:
-        segment_sec = float(segment_sec)
+        res = _run_subprocess_safe(command, timeout=1800, capture_output=True)
+        stdout = res.stdout if res.stdout else b""
+        stderr = res.stderr if res.stderr else b""
+        if isinstance(stdout, str):
+            stdout = stdout.encode(errors="ignore")
+        if isinstance(stderr, str):
+            stderr = stderr.encode(errors="ignore")
+        text = (stderr + b"\n" + stdout).decode(errors="ignore")
+        return res.returncode, re.sub(r"\s+", " ", text).strip()
     except Exception:
-        segment_sec = 0.0
-    if segment_sec <= 0:
-        return []
+        return -1, "ffmpeg process timed out or was terminated"
 
-    stem = input_path.stem
+
+def _split_output_ext(input_path: Path) -> str:
     input_ext = input_path.suffix.lower()
-    out_ext = input_ext if input_ext in {".mp4", ".m4v", ".mov"} else ".mp4"
+    return input_ext if input_ext in {".mp4", ".m4v", ".mov"} else ".mp4"
 
-    duration = _probe_duration_seconds(input_path, ffmpeg)
-    if duration <= 0:
-        return []
 
+def _remove_stale_parts(output_folder: Path, stem: str, out_ext: str) -> None:
     for stale in output_folder.glob(f"{stem}_part*{out_ext}"):
         try:
             stale.unlink()
         except Exception:
             pass
 
-    parts: List[Path] = []
-    start = 0.0
-    idx = 1
-    epsilon = 0.02
-    min_tail_sec = 0.35
-    min_valid_part_sec = 0.20
 
-    while start < duration - epsilon and idx <= 2000:
-        remaining = duration - start
-        if remaining <= min_tail_sec:
+def _split_part_command(
+    ffmpeg: str,
+    input_path: Path,
+    out_path: Path,
+    start: float,
+    chunk: float,
+) -> List[str]:
+    trim = ["-ss", f"{start:.3f}", "-t", f"{chunk:.3f}"]
+    return [
+        ffmpeg, "-hide_banner", "-loglevel", "error",
+        "-i", str(input_path),
+        *trim,
+        "-map", "0:v:0", "-map", "0:a?",
+        "-fflags", "+genpts",
+        "-c:v", "libx264", "-preset", "veryfast", "-crf", "20",
+        "-pix_fmt", "yuv420p", "-fps_mode", "cfr",
+        "-af", _SPLIT_AUDIO_RESYNC,
+        "-c:a", "aac", "-b:a", "160k",
+        "-avoid_negative_ts", "make_zero",
+        "-movflags", "+faststart",
+        str(out_path), "-y",
+    ]
+
+
+_SEGMENT_CONTAINER_ARGS = ["-segment_format_options", "movflags=+faststart"]
+
+
+def _segment_muxer_args(
+    pattern: Path,
+    list_path: Path,
+    cut_times: List[float],
+    end: float,
+) -> List[str]:
+    args = ["-f", "segment"]
+    if cut_times:
+        args += ["-segment_times", ",".join(f"{t:.3f}" for t in cut_times)]
+    else:
+        args += ["-segment_time", f"{end + 1.0:.3f}"]
+    args += [
+        "-segment_format", "mov" if pattern.suffix.lower() == ".mov" else "mp4",
+        "-segment_start_number", "1",
+        "-reset_timestamps", "1",
+        "-segment_list", str(list_path),
+        "-segment_list_type", "csv",
+        "-avoid_negative_ts", "make_zero",
+    ]
+    return args
+
+
+def _segment_command(
+    ffmpeg: str,
+    input_path: Path,
+    pattern: Path,
+    list_path: Path,
+    spans: List[Tuple[float, float]],
+    graph: Optional[FusedGraph] = None,
+) -> List[str]:
+    """
+    One ffmpeg pass writing every part through the segment muxer.
+
+    Keyframes are forced at the cut points so the muxer cuts exactly there;
+    -t drops the same short tail the per-part loop used to skip.
+    """
+    cut_times = [start for start, _ in spans[1:]]
+    end = spans[-1][0] + spans[-1][1]
+    out_args = ["-t", f"{end:.3f}", "-fflags", "+genpts", "-fps_mode", "cfr"]
+    if cut_times:
+        out_args += ["-force_key_frames", ",".join(f"{t:.3f}" for t in cut_times)]
+    out_args += _segment_muxer_args(pattern, list_path, cut_times, end)
+    container_args = _SEGMENT_CONTAINER_ARGS
+
+    if graph is not None:
+        return graph.command(
+            ffmpeg,
+            input_path,
+            pattern,
+            extra_output_args=out_args,
+            audio_prefix=_SPLIT_AUDIO_RESYNC,
+            audio_bitrate="160k",
+            container_args=container_args,
+        )
+    return [
+        ffmpeg, "-hide_banner", "-loglevel", "error", "-y",
+        "-i", str(input_path),
+        "-map", "0:v:0", "-map", "0:a?",
+        "-c:v", "libx264", "-preset", "veryfast", "-crf", "20",
+        "-pix_fmt", "yuv420p",
+        "-af", _SPLIT_AUDIO_RESYNC,
+        "-c:a", "aac", "-b:a", "160k",
+        *out_args,
+        *container_args,
+        str(pattern),
+    ]
+
+
+def _segment_copy_command(
+    ffmpeg: str,
+    input_path: Path,
+    pattern: Path,
+    list_path: Path,
+    cut_times: List[float],
+    end: float,
+    output_args: Sequence[str] = (),
+) -> List[str]:
+    """
+    Stream-copy segment pass; cut_times must already sit on keyframes.
+
+    output_args (e.g. the bypass metadata args) must work without encoding.
+    """
+    return [
+        ffmpeg, "-hide_banner", "-loglevel", "error", "-y",
+        "-i", str(input_path),
+        "-map", "0:v:0", "-map", "0:a?",
+        "-c", "copy",
+        "-t", f"{end:.3f}",
+        *output_args,
+        *_segment_muxer_args(pattern, list_path, cut_times, end),
+        "-segment_time_delta", "0.050",   # absorb ms rounding of the snapped times
+        *_SEGMENT_CONTAINER_ARGS,
+        str(pattern),
+    ]
+
+
+def _probe_keyframe_times(input_path: Path, ffmpeg: str = "ffmpeg") -> List[float]:
+    """
+    Video keyframe timestamps from the packet index (demux only, no decode).
+
+    Times are shifted by the container start time so they match the
+    zero-based timeline ffmpeg uses on output.
+    """
+    flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+    try:
+        r = _run_subprocess_safe(
+            [
+                _ffprobe_path(ffmpeg), "-v", "error",
+                "-select_streams", "v:0",
+                "-show_entries", "packet=pts_time,flags:format=start_time",
+                "-of", "json",
+                str(input_path),
+            ],
+            capture_output=True,
+            text=True,
+            timeout=120,
+            creationflags=flags,
+        )
+        if r.returncode != 0:
+            return []
+        data = json.loads(r.stdout or "{}")
+    except Exception:
+        return []
+
+    try:
+        offset = float((data.get("format") or {}).get("start_time") or 0.0)
+    except (TypeError, ValueError):
+        offset = 0.0
+    times = set()
+    for pkt in data.get("packets") or []:
+        if "K" not in str(pkt.get("flags", "")):
+            continue
+        try:
+            times.add(round(float(pkt["pts_time"]) - offset, 6))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return sorted(times)
+
+
+def _snap_to_keyframes(
+    cut_times: List[float],
+    keyframes: List[float],
+    tolerance: float,
+) -> Optional[List[float]]:
+    """
+    Move every cut to its nearest keyframe.
+
+    Returns None when a cut would drift more than tolerance seconds, or two
+    cuts collapse onto the same keyframe (GOP longer than the part length).
+    """
+    snapped: List[float] = []
+    for t in cut_times:
+        i = bisect.bisect_left(keyframes, t)
+        candidates = keyframes[max(0, i - 1):i + 1]
+        if not candidates:
+            return None
+        nearest = min(candidates, key=lambda k: abs(k - t))
+        if abs(nearest - t) > tolerance:
+            return None
+        if nearest <= (snapped[-1] if snapped else 0.0) + _SPLIT_MIN_VALID_PART_SEC:
+            return None
+        snapped.append(nearest)
+    return snapped
+
+
+def _read_segment_list(list_path: Path, output_folder: Path) -> List[Tuple[Path, float, float]]:
+    """Parse the segment muxer's csv list: filename,start,end per written part."""
+    entries: List[Tuple[Path, float, float]] = []
+    try:
+        with open(list_path, encoding="utf-8", newline="") as fh:
+            for row in csv.reader(fh):
+                if len(row) < 3:
+                    continue
+                try:
+                    entries.append((output_folder / Path(row[0]).name, float(row[1]), float(row[2])))
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return entries
+
+
+def _segment_video(
+    input_path: Path,
+    output_folder: Path,
+    spans: List[Tuple[float, float]],
+    ffmpeg: str,
+    progress_cb: Callable[[str], None] = None,
+    graph: Optional[FusedGraph] = None,
+    label: str = "Split",
+    copy_cuts: Optional[List[float]] = None,
+) -> Optional[List[Path]]:
+    """
+    Decode the source once and write all spans as parts.
+
+    With copy_cuts (keyframe-snapped cut times) the streams are copied
+    instead of re-encoded. Parts are validated from the muxer's segment
+    list instead of probing each file. Returns None when the pass failed
+    (nothing is left behind).
+    """
+    stem = input_path.stem
+    out_ext = _split_output_ext(input_path)
+    pattern = output_folder / f"{stem.replace('%', '%%')}_part%03d{out_ext}"
+    list_path = output_folder / f"{stem}_segments.csv"
+    end = spans[-1][0] + spans[-1][1]
+
+    if copy_cuts is not None:
+        copy_args = graph.output_args if graph is not None else ()
+        cmd = _segment_copy_command(ffmpeg, input_path, pattern, list_path, copy_cuts, end, copy_args)
+        how = "stream copy at keyframes"
+    else:
+        cmd = _segment_command(ffmpeg, input_path, pattern, list_path, spans, graph)
+        how = "one pass"
+    if progress_cb:
+        progress_cb(f"    {label}: {len(spans)} part(s), {how} (0.00s -> {end:.2f}s)")
+
+    try:
+        rc, err_text = _run_ffmpeg_capture(cmd)
+        entries = _read_segment_list(list_path, output_folder)
+    finally:
+        try:
+            list_path.unlink(missing_ok=True)
+        except Exception:
+            pass
+
+    if rc != 0 or not entries:
+        if progress_cb:
+            progress_cb(f"    {label}: segment pass failed (rc={rc})")
+            if err_text:
+                progress_cb(f"    {label}: {err_text[:180]}")
+        _remove_stale_parts(output_folder, stem, out_ext)
+        return None
+
+    parts: List[Path] = []
+    for idx, (part_path, seg_start, seg_end) in enumerate(entries, 1):
+        if not part_path.exists() or part_path.stat().st_size <= 0:
+            if progress_cb:
+                progress_cb(f"    {label}: no output created for part {idx}")
             break
-        chunk = min(segment_sec, remaining)
+        if seg_end - seg_start < _SPLIT_MIN_VALID_PART_SEC:
+            if progress_cb:
+                progress_cb(
+                    f"    {label}: invalid part {idx} "
+                    f"(size={part_path.stat().st_size} bytes, duration={seg_end - seg_start:.2f}s)"
+                )
+            break
+        parts.append(part_path)
+
+    for part_path, _, _ in entries[len(parts):]:
+        try:
+            part_path.unlink(missing_ok=True)
+        except Exception:
+            pass
+    return parts
+
+
+def _split_spans_individually(
+    input_path: Path,
+    output_folder: Path,
+    spans: List[Tuple[float, float]],
+    ffmpeg: str,
+    progress_cb: Callable[[str], None] = None,
+    label: str = "Split",
+) -> List[Path]:
+    """One ffmpeg process per part — fallback when the segment pass fails."""
+    stem = input_path.stem
+    out_ext = _split_output_ext(input_path)
+    parts: List[Path] = []
+
+    for idx, (start, chunk) in enumerate(spans, 1):
         out_path = output_folder / f"{stem}_part{idx:03d}{out_ext}"
 
         if progress_cb:
-            progress_cb(f"    Split part {idx}: {start:.2f}s -> {start + chunk:.2f}s")
-
-        cmd = [
-            ffmpeg, "-hide_banner", "-loglevel", "error",
-            "-i", str(input_path),
-            "-ss", f"{start:.3f}", "-t", f"{chunk:.3f}",
-            "-map", "0:v:0", "-map", "0:a?",
-            "-fflags", "+genpts",
-            "-c:v", "libx264", "-preset", "veryfast", "-crf", "20",
-            "-pix_fmt", "yuv420p", "-fps_mode", "cfr",
-            "-af", "aresample=async=1:first_pts=0",
-            "-c:a", "aac", "-b:a", "160k",
-            "-avoid_negative_ts", "make_zero",
-            "-movflags", "+faststart",
-            str(out_path), "-y",
-        ]
+            progress_cb(f"    {label} part {idx}/{len(spans)}: {start:.2f}s -> {start + chunk:.2f}s")
 
-        def _run_safe(command: List[str]) -> Tuple[int, str]:
-            try:
-                res = _run_subprocess_safe(command, timeout=1800, capture_output=True)
-                stdout = res.stdout if res.stdout else b""
-                stderr = res.stderr if res.stderr else b""
-                if isinstance(stdout, str): stdout = stdout.encode(errors="ignore")
-                if isinstance(stderr, str): stderr = stderr.encode(errors="ignore")
-                text = (stderr + b"\n" + stdout).decode(errors="ignore")
-                return res.returncode, re.sub(r"\s+", " ", text).strip()
-            except Exception:
-                return -1, "ffmpeg process timed out or was terminated"
+        cmd = _split_part_command(ffmpeg, input_path, out_path, start, chunk)
 
         try:
-            rc, err_text = _run_safe(cmd)
+            rc, err_text = _run_ffmpeg_capture(cmd)
             if rc != 0:
                 cmd2 = [
                     ffmpeg, "-hide_banner", "-loglevel", "error",
@@ -1272,36 +1554,36 @@ def split_video(
                     "-fflags", "+genpts",
                     "-c:v", "libx264", "-preset", "veryfast", "-crf", "22",
                     "-pix_fmt", "yuv420p", "-fps_mode", "cfr",
-                    "-af", "aresample=async=1:first_pts=0",
+                    "-af", _SPLIT_AUDIO_RESYNC,
                     "-c:a", "aac", "-b:a", "128k",
                     "-avoid_negative_ts", "make_zero",
                     str(out_path), "-y",
                 ]
-                rc2, err_text2 = _run_safe(cmd2)
+                rc2, err_text2 = _run_ffmpeg_capture(cmd2)
                 if rc2 != 0:
                     if progress_cb:
-                        progress_cb(f"    Split: ffmpeg failed for part {idx} (rc={rc2})")
+                        progress_cb(f"    {label}: ffmpeg failed for part {idx} (rc={rc2})")
                         preview = (err_text2 or err_text)[:180]
                         if preview:
-                            progress_cb(f"    Split: {preview}")
+                            progress_cb(f"    {label}: {preview}")
                     break
 
             if out_path.exists() and out_path.stat().st_size > 0:
                 actual = _probe_duration_with_retry(out_path, ffmpeg)
-                if actual >= min_valid_part_sec:
+                if actual >= _SPLIT_MIN_VALID_PART_SEC:
                     parts.append(out_path)
                 else:
                     if _can_decode_media(out_path, ffmpeg):
                         if progress_cb:
                             progress_cb(
-                                f"    Split: keeping {out_path.name} after decode fallback "
+                                f"    {label}: keeping {out_path.name} after decode fallback "
                                 "(duration probe lagged)"
                             )
                         parts.append(out_path)
                     else:
                         if progress_cb:
                             progress_cb(
-                                f"    Split: invalid part {idx} "
+                                f"    {label}: invalid part {idx} "
                                 f"(size={out_path.stat().st_size} bytes, duration={actual:.2f}s)"
                             )
                         try:
@@ -1311,17 +1593,111 @@ def split_video(
                         break
             else:
                 if progress_cb:
-                    progress_cb(f"    Split: no output created for part {idx}")
+                    progress_cb(f"    {label}: no output created for part {idx}")
                 break
         except Exception as exc:
             if progress_cb:
-                progress_cb(f"    Split: exception on part {idx}: {exc}")
+                progress_cb(f"    {label}: exception on part {idx}: {exc}")
             break
 
+    return parts
+
+
+def _copy_splittable(graph: Optional[FusedGraph]) -> bool:
+    """True if a split with this graph may be a keyframe stream copy instead."""
+    return graph is None or set(graph.steps) <= {STEP_BYPASS}
+
+
+def _split_spans(
+    input_path: Path,
+    output_folder: Path,
+    spans: List[Tuple[float, float]],
+    ffmpeg: str,
+    progress_cb: Callable[[str], None] = None,
+    graph: Optional[FusedGraph] = None,
+    label: str = "Split",
+    fast_split: bool = False,
+    keyframe_tolerance: float = 2.0,
+) -> List[Path]:
+    """Cut spans (start, length) out of input_path as {stem}_partNNN files."""
+    if not spans:
+        return []
+    _remove_stale_parts(output_folder, input_path.stem, _split_output_ext(input_path))
+
+    # Fast split applies when nothing but the bypass has to be filtered on
+    # the way: the parts are copied and keep only the bypass metadata args.
+    # Edit/watermark graphs re-encode anyway and cut exactly at forced keyframes.
+    if fast_split and _copy_splittable(graph):
+        cuts = _snap_to_keyframes(
+            [start for start, _ in spans[1:]],
+            _probe_keyframe_times(input_path, ffmpeg),
+            keyframe_tolerance,
+        )
+        if cuts is None:
+            if progress_cb:
+                progress_cb(
+                    f"    {label}: keyframes too far apart for fast split "
+                    f"(tolerance {keyframe_tolerance:.1f}s) - re-encoding"
+                )
+        else:
+            parts = _segment_video(
+                input_path, output_folder, spans, ffmpeg, progress_cb, graph, label, copy_cuts=cuts
+            )
+            if parts:
+                return parts
+
+    parts = _segment_video(input_path, output_folder, spans, ffmpeg, progress_cb, graph, label)
+    if parts is not None:
+        return parts
+    if graph is not None:
+        return []   # caller redoes the clip step by step
+    if progress_cb:
+        progress_cb(f"    {label}: retrying part by part...")
+    return _split_spans_individually(input_path, output_folder, spans, ffmpeg, progress_cb, label)
+
+
+def split_video(
+    input_path: Path,
+    output_folder: Path,
+    segment_sec: float,
+    ffmpeg: str = "ffmpeg",
+    progress_cb: Callable[[str], None] = None,
+    graph: Optional[FusedGraph] = None,
+    fast_split: bool = False,
+    keyframe_tolerance: float = 2.0,
+) -> List[Path]:
+    input_path = Path(input_path)
+    output_folder = Path(output_folder)
+    output_folder.mkdir(parents=True, exist_ok=True)
+
+    try:
+        segment_sec = float(segment_sec)
+    except Exception:
+        segment_sec = 0.0
+    if segment_sec <= 0:
+        return []
+
+    duration = _probe_duration_seconds(input_path, ffmpeg)
+    if duration <= 0:
+        return []
+
+    spans: List[Tuple[float, float]] = []
+    start = 0.0
+    epsilon = 0.02
+    min_tail_sec = 0.35
+
+    while start < duration - epsilon and len(spans) < 2000:
+        remaining = duration - start
+        if remaining <= min_tail_sec:
+            break
+        chunk = min(segment_sec, remaining)
+        spans.append((start, chunk))
         start += chunk
-        idx += 1
 
-    return parts
+    return _split_spans(
+        input_path, output_folder, spans, ffmpeg, progress_cb, graph, "Split",
+        fast_split=fast_split, keyframe_tolerance=keyframe_tolerance,
+    )
 
 
 def split_video_by_parts(
@@ -1330,6 +1706,9 @@ def split_video_by_parts(
     parts_count: int,
     ffmpeg: str = "ffmpeg",
     progress_cb: Callable[[str], None] = None,
+    graph: Optional[FusedGraph] = None,
+    fast_split: bool = False,
+    keyframe_tolerance: float = 2.0,
 ) -> List[Path]:
     input_path = Path(input_path)
     output_folder = Path(output_folder)
@@ -1342,10 +1721,6 @@ def split_video_by_parts(
     if parts_count < 2:
         return []
 
-    stem = input_path.stem
-    input_ext = input_path.suffix.lower()
-    out_ext = input_ext if input_ext in {".mp4", ".m4v", ".mov"} else ".mp4"
-
     duration = _probe_duration_seconds(input_path, ffmpeg)
     if duration <= 0:
         return []
@@ -1357,9 +1732,8 @@ def split_video_by_parts(
             )
         return []
 
-    min_valid_part_sec = 0.20
     target_part_sec = duration / parts_count
-    if target_part_sec < min_valid_part_sec:
+    if target_part_sec < _SPLIT_MIN_VALID_PART_SEC:
         if progress_cb:
             progress_cb(
                 f"    Parts split: skipped {input_path.name} "
@@ -1367,111 +1741,16 @@ def split_video_by_parts(
             )
         return []
 
-    for stale in output_folder.glob(f"{stem}_part*{out_ext}"):
-        try:
-            stale.unlink()
-        except Exception:
-            pass
-
-    parts: List[Path] = []
+    spans: List[Tuple[float, float]] = []
     for idx in range(1, parts_count + 1):
         start = duration * (idx - 1) / parts_count
         end = duration * idx / parts_count
-        chunk = max(0.0, end - start)
-        out_path = output_folder / f"{stem}_part{idx:03d}{out_ext}"
-
-        if progress_cb:
-            progress_cb(
-                f"    Parts split {idx}/{parts_count}: "
-                f"{start:.2f}s -> {start + chunk:.2f}s"
-            )
-
-        cmd = [
-            ffmpeg, "-hide_banner", "-loglevel", "error",
-            "-i", str(input_path),
-            "-ss", f"{start:.3f}", "-t", f"{chunk:.3f}",
-            "-map", "0:v:0", "-map", "0:a?",
-            "-fflags", "+genpts",
-            "-c:v", "libx264", "-preset", "veryfast", "-crf", "20",
-            "-pix_fmt", "yuv420p", "-fps_mode", "cfr",
-            "-af", "aresample=async=1:first_pts=0",
-            "-c:a", "aac", "-b:a", "160k",
-            "-avoid_negative_ts", "make_zero",
-            "-movflags", "+faststart",
-            str(out_path), "-y",
-        ]
-
-        def _run_safe(command: List[str]) -> Tuple[int, str]:
-            try:
-                res = _run_subprocess_safe(command, timeout=1800, capture_output=True)
-                stdout = res.stdout if res.stdout else b""
-                stderr = res.stderr if res.stderr else b""
-                if isinstance(stdout, str):
-                    stdout = stdout.encode(errors="ignore")
-                if isinstance(stderr, str):
-                    stderr = stderr.encode(errors="ignore")
-                text = (stderr + b"\n" + stdout).decode(errors="ignore")
-                return res.returncode, re.sub(r"\s+", " ", text).strip()
-            except Exception:
-                return -1, "ffmpeg process timed out or was terminated"
-
-        try:
-            rc, err_text = _run_safe(cmd)
-            if rc != 0:
-                cmd2 = [
-                    ffmpeg, "-hide_banner", "-loglevel", "error",
-                    "-i", str(input_path),
-                    "-ss", f"{start:.3f}", "-t", f"{chunk:.3f}",
-                    "-fflags", "+genpts",
-                    "-c:v", "libx264", "-preset", "veryfast", "-crf", "22",
-                    "-pix_fmt", "yuv420p", "-fps_mode", "cfr",
-                    "-af", "aresample=async=1:first_pts=0",
-                    "-c:a", "aac", "-b:a", "128k",
-                    "-avoid_negative_ts", "make_zero",
-                    str(out_path), "-y",
-                ]
-                rc2, err_text2 = _run_safe(cmd2)
-                if rc2 != 0:
-                    if progress_cb:
-                        progress_cb(f"    Parts split: ffmpeg failed for part {idx} (rc={rc2})")
-                        preview = (err_text2 or err_text)[:180]
-                        if preview:
-                            progress_cb(f"    Parts split: {preview}")
-                    break
-
-            if out_path.exists() and out_path.stat().st_size > 0:
-                actual = _probe_duration_with_retry(out_path, ffmpeg)
-                if actual >= min_valid_part_sec:
-                    parts.append(out_path)
-                else:
-                    if _can_decode_media(out_path, ffmpeg):
-                        if progress_cb:
-                            progress_cb(
-                                f"    Parts split: keeping {out_path.name} after decode fallback "
-                                "(duration probe lagged)"
-                            )
-                        parts.append(out_path)
-                    else:
-                        if progress_cb:
-                            progress_cb(
-                                f"    Parts split: invalid part {idx} "
-                                f"(size={out_path.stat().st_size} bytes, duration={actual:.2f}s)"
-                            )
-                        try:
-                            out_path.unlink()
-                        except Exception:
-                            pass
-                        break
-            else:
-                if progress_cb:
-                    progress_cb(f"    Parts split: no output created for part {idx}")
-                break
-        except Exception as exc:
-            if progress_cb:
-                progress_cb(f"    Parts split: exception on part {idx}: {exc}")
-            break
+        spans.append((start, max(0.0, end - start)))
 
-    return parts
+    return _split_spans(
+        input_path, output_folder, spans, ffmpeg, progress_cb, graph, "Parts split",
+        fast_split=fast_split, keyframe_tolerance=keyframe_tolerance,
+    )
 
 
 def apply_preset(
@@ -1480,32 +1759,14 @@ def apply_preset(
     preset_name: str,
     ffmpeg: str = "ffmpeg",
 ) -> Optional[Path]:
-    target_w, target_h = 1080, 1920
-    for d in ["presets/system", "presets/user", "presets/imported"]:
-        p = Path(d)
-        if not p.exists():
-            continue
-        for f in p.glob("*.json"):
-            if preset_name.lower() in f.stem.lower():
-                try:
-                    with open(f, encoding="utf-8") as fh:
-                        data = json.load(fh)
-                    exp = data.get("export_settings", {})
-                    target_w = int(exp.get("width", target_w))
-                    target_h = int(exp.get("height", target_h))
-                except Exception:
-                    pass
-                break
+    target_w, target_h = resolve_preset_size(preset_name)
 
     input_path = Path(input_path)
     output_folder = Path(output_folder)
     output_folder.mkdir(parents=True, exist_ok=True)
 
     out = output_folder / f"{input_path.stem}_edited{input_path.suffix or '.mp4'}"
-    vf = (
-        f"scale={target_w}:{target_h}:force_original_aspect_ratio=increase,"
-        f"crop={target_w}:{target_h}"
-    )
+    vf = preset_video_filter(target_w, target_h)
     cmd = [ffmpeg, "-i", str(input_path), "-vf", vf, "-c:a", "copy", str(out), "-y"]
     
     try:
@@ -1528,10 +1789,19 @@ class CreatorDownloadWorker(QThread):
     progress_percent = pyqtSignal(int)
     login_required = pyqtSignal(str)   # emitted when IXBrowser profile not logged in
 
-    def __init__(self, creator_folder: Path, creator_url: str, parent=None):
+    def __init__(
+        self,
+        creator_folder: Path,
+        creator_url: str,
+        parent=None,
+        resource_gate: Optional[ResourceGate] = None,
+    ):
         super().__init__(parent)
         self.creator_folder = Path(creator_folder)
         self.creator_url = (creator_url or "").strip()
+        # Shared stage caps when the queue runs several creators at once.
+        # None = standalone run, stages are never throttled.
+        self.resource_gate = resource_gate
         self.config = CreatorConfig(creator_folder)
         self.auth_hub = AuthNetworkHub()
         self.proxies = self.auth_hub.get_proxy_pool()
@@ -1589,6 +1859,20 @@ class CreatorDownloadWorker(QThread):
             self._resume_event.wait()   # blocks until resume() is called
         return self._stop
 
+    def _resource_slot(self, resource: str):
+        """
+        Hold a concurrency slot for one pipeline stage (no-op without a gate).
+
+        Raises SlotCancelled when stop() fires while waiting for the slot.
+        """
+        if self.resource_gate is None:
+            return contextlib.nullcontext()
+        return self.resource_gate.slot(
+            resource,
+            cancel_event=self._cancel_event,
+            on_wait=self.progress.emit,
+        )
+
     def _on_single_video_percent(self, video_pct: int):
         """Convert per-video % into overall % and emit to GUI."""
         if self._n_target <= 0:
@@ -2050,7 +2334,11 @@ class CreatorDownloadWorker(QThread):
             "runtime_readiness": runtime_readiness,
         }
         
-        ok, reason, verified_path = _run_once(robust_opts)
+        try:
+            with self._resource_slot(RESOURCE_DOWNLOAD):
+                ok, reason, verified_path = _run_once(robust_opts)
+        except SlotCancelled:
+            ok, reason, verified_path = False, "Cancelled", None
         self._terminal_log("Downloader", f"_run_once result: ok={ok}, reason='{reason}'")
 
         temp_media = []
@@ -2363,9 +2651,7 @@ class CreatorDownloadWorker(QThread):
 
         from .selection_policy import normalise_entry, select_videos, _is_supported_video_url
 
-        raw_downloaded_ids: frozenset = frozenset(
-            self.config.data.get("downloaded_ids", [])
-        ) if dup_ctrl else frozenset()
+        raw_downloaded_ids = self.config.downloaded if dup_ctrl else frozenset()
         self._terminal_log(
             "Selection",
             (
@@ -2572,11 +2858,9 @@ class CreatorDownloadWorker(QThread):
                 msg_success = f"[CreatorProfile] Successfully downloaded to: {fp.absolute()}"
                 print(msg_success)
                 vid_id = vid.get("id") or _safe_id_from_url(url)
-                if vid_id:
-                    self.config.add_downloaded_id(vid_id)
-                    self.config.save()  # persist immediately so concurrent workers see this ID
-                self.config.add_url_to_history(
-                    url, platform=platform_key,
+                # Committed to the shared store at once, so concurrent workers see it
+                self.config.add_downloaded_id(
+                    vid_id, url=url, platform=platform_key,
                     creator=vid.get("creator", self.creator_folder.name),
                 )
                 session_ids.add(_key(vid))
@@ -2755,13 +3039,14 @@ class CreatorDownloadWorker(QThread):
             self._terminal_log("LinkGrab", f"{stage_label}: {request_detail} from {source_url}")
 
             try:
-                extracted_data = extract_links_intelligent(
-                    url=source_url,
-                    platform_key=platform_key,
-                    options=grab_opts,
-                    cookies_dir=get_cookies_dir(),
-                    progress_callback=self.progress.emit,
-                )
+                with self._resource_slot(RESOURCE_LINK_GRAB):
+                    extracted_data = extract_links_intelligent(
+                        url=source_url,
+                        platform_key=platform_key,
+                        options=grab_opts,
+                        cookies_dir=get_cookies_dir(),
+                        progress_callback=self.progress.emit,
+                    )
                 extracted_entries = extracted_data[0] if isinstance(extracted_data, tuple) else extracted_data
                 extracted_creator_name = (
                     extracted_data[1]
@@ -2941,13 +3226,14 @@ class CreatorDownloadWorker(QThread):
 
                 print(f"[CreatorProfile] Starting intelligent link grab for {creator_url} on {platform_key}")
 
-                extracted_data = extract_links_intelligent(
-                    url=creator_url,
-                    platform_key=platform_key,
-                    cookies_dir=get_cookies_dir(),
-                    options=grab_opts,
-                    progress_callback=self.progress.emit,
-                )
+                with self._resource_slot(RESOURCE_LINK_GRAB):
+                    extracted_data = extract_links_intelligent(
+                        url=creator_url,
+                        platform_key=platform_key,
+                        cookies_dir=get_cookies_dir(),
+                        options=grab_opts,
+                        progress_callback=self.progress.emit,
+                    )
 
                 latest_entries = extracted_data[0] if isinstance(extracted_data, tuple) else extracted_data
                 creator_name = extracted_data[1] if isinstance(extracted_data, tuple) and len(extracted_data) > 1 else ""
@@ -3014,9 +3300,8 @@ class CreatorDownloadWorker(QThread):
         self._terminal_log("Selection", f"annotated entries ready: {len(annotated)}")
 
         # ── Select: apply user preference logic BEFORE downloader ─────
-        raw_downloaded_ids = frozenset(self.config.data.get("downloaded_ids", []))
         effective_skip_downloaded = bool(dup_ctrl)
-        already_downloaded: frozenset = raw_downloaded_ids
+        already_downloaded = self.config.downloaded
 
         selected, debug_log = select_videos(
             entries=annotated,
@@ -3487,24 +3772,25 @@ class CreatorDownloadWorker(QThread):
             remaining_needed = max(1, n_target - len(downloads))
             self.progress.emit("[Public] Auth paths exhausted. Trying limited public fallback...")
             try:
-                public_data = extract_links_intelligent(
-                    url=creator_url,
-                    platform_key=platform_key,
-                    cookies_dir=get_cookies_dir(),
-                    options={
-                        "max_videos": remaining_needed + 5,
-                        "force_all_methods": False,
-                        "respect_global_exhaustive_mode": False,
-                        "fast_mode": False,
-                        "managed_profile_only": True,
-                        "public_fallback_only": True,
-                        "interactive_login_fallback": False,
-                        "yt_content_type": yt_content_type,
-                        "auth_ticket": dict(self._current_auth_ticket or {}),
-                        "include_meta": True,
-                    },
-                    progress_callback=self.progress.emit,
-                )
+                with self._resource_slot(RESOURCE_LINK_GRAB):
+                    public_data = extract_links_intelligent(
+                        url=creator_url,
+                        platform_key=platform_key,
+                        cookies_dir=get_cookies_dir(),
+                        options={
+                            "max_videos": remaining_needed + 5,
+                            "force_all_methods": False,
+                            "respect_global_exhaustive_mode": False,
+                            "fast_mode": False,
+                            "managed_profile_only": True,
+                            "public_fallback_only": True,
+                            "interactive_login_fallback": False,
+                            "yt_content_type": yt_content_type,
+                            "auth_ticket": dict(self._current_auth_ticket or {}),
+                            "include_meta": True,
+                        },
+                        progress_callback=self.progress.emit,
+                    )
                 public_entries = public_data[0] if isinstance(public_data, tuple) else public_data
                 public_meta = (
                     public_data[2]
@@ -3687,243 +3973,11 @@ class CreatorDownloadWorker(QThread):
                     )
 
         if downloads and not self._stop and not self._check_pause():
-            self._terminal_log(
-                "Post",
-                f"download phase complete ({len(downloads)} videos). Starting post-processing...",
-            )
-
-            # Validate ffmpeg BEFORE starting any editing — re-resolve if broken
-            from modules.video_editor.utils import check_ffmpeg, get_ffmpeg_path
-            ffmpeg_ok = False
             try:
-                _run_subprocess_safe(
-                    [self.ffmpeg, "-version"],
-                    capture_output=True, timeout=5,
-                )
-                ffmpeg_ok = True
-            except Exception:
-                pass
-
-            if not ffmpeg_ok:
-                self.progress.emit(f"Bundled ffmpeg failed ({self.ffmpeg}), searching for alternative...")
-                print(f"[CreatorProfile] Bundled ffmpeg failed ({self.ffmpeg}), re-resolving...")
-                if check_ffmpeg():
-                    self.ffmpeg = get_ffmpeg_path()
-                    ffmpeg_ok = True
-                    self.progress.emit(f"Found working ffmpeg: {self.ffmpeg}")
-                    print(f"[CreatorProfile] Re-resolved ffmpeg to: {self.ffmpeg}")
-
-            if not ffmpeg_ok:
-                self.progress.emit("ERROR: ffmpeg not found! Editing/watermark/split SKIPPED")
-                self.progress.emit("FIX: Copy ffmpeg folder to C:\\ffmpeg (with bin\\ffmpeg.exe + DLLs)")
-                print(f"[CreatorProfile] CRITICAL: No working ffmpeg found - skipping all post-processing")
-            else:
-                self.progress.emit(f"ffmpeg OK: {self.ffmpeg}")
-
-            # --- Universal Facebook Policy Bypass (Apply to all platforms) ---
-            if ffmpeg_ok:
-                from .split_edit_engine import apply_facebook_bypass
-                self.progress.emit("Applying Universal Facebook-Safe Optimization (Studio-Quality)...")
-                processed_downloads = []
-                for fp in downloads:
-                    if self._stop: break
-                    # Apply bypass to ensure content is safe for Facebook upload regardless of source
-                    hq_path = apply_facebook_bypass(fp, self.creator_folder, self.ffmpeg, self.progress.emit)
-                    if hq_path and hq_path.exists():
-                        # Replace the original with the bypassed high-quality version
-                        # Rename hq_path to original name to ensure all downstream logic uses it
-                        final_target = fp
-                        try:
-                            if fp.exists(): fp.unlink()
-                            shutil.move(str(hq_path), str(final_target))
-                            processed_downloads.append(final_target)
-                            self.progress.emit(f"  HQ Replacement Success: {final_target.name}")
-                        except Exception as e:
-                            self.progress.emit(f"  HQ Move Error: {e}")
-                            processed_downloads.append(hq_path if hq_path.exists() else fp)
-                    else:
-                        processed_downloads.append(fp)
-                downloads = processed_downloads
-
-            from .watermark_engine import apply_watermark_inplace
-
-            wm_enabled = self.config.watermark_enabled
-            wm_text_cfg = self.config.watermark_text
-            wm_logo_cfg = self.config.watermark_logo
-            wm_avatar_cfg = self.config.watermark_avatar
-            split_edit_cfg = self.config.split_edit_settings
-
-            def _apply_wm(fp: Path, preserve_source: bool = False) -> Path:
-                if not wm_enabled:
-                    return fp
-                if not ffmpeg_ok:
-                    self.progress.emit(f"  SKIP watermark for {fp.name} (ffmpeg unavailable)")
-                    return fp
-                result_path = apply_watermark_inplace(
-                    video_path=fp,
-                    creator_folder=self.creator_folder,
-                    wm_text_cfg=wm_text_cfg,
-                    wm_logo_cfg=wm_logo_cfg,
-                    wm_avatar_cfg=wm_avatar_cfg,
-                    keep_original=preserve_source,
-                    ffmpeg=self.ffmpeg,
-                    progress_cb=self.progress.emit,
-                )
-                if not result_path:
-                    self.progress.emit(f"  WARNING: watermark failed for {fp.name} - kept original")
-                    return fp
-                return result_path
-
-            mode = self.config.editing_mode
-            if mode == "split_edit" and ffmpeg_ok:
-                from .config_manager import summarize_split_edit_settings
-                from .split_edit_engine import apply_split_edit_to_clip
-
-                self.progress.emit(f"Editing: splitting into {self.config.split_duration}s segments...")
-                self.progress.emit(
-                    f"Editing: split+edit ({summarize_split_edit_settings(split_edit_cfg)})..."
-                )
-                for fp in downloads:
-                    if self._stop:
-                        break
-                    parts = split_video(
-                        fp,
-                        self.creator_folder,
-                        self.config.split_duration,
-                        self.ffmpeg,
-                        self.progress.emit,
-                    )
-                    if not parts:
-                        self.progress.emit(f"  WARNING: split failed for {fp.name} - kept original")
-                    for part in parts:
-                        if self._stop:
-                            break
-                        edited_part = apply_split_edit_to_clip(
-                            part,
-                            self.creator_folder,
-                            split_edit_cfg,
-                            self.ffmpeg,
-                            self.progress.emit,
-                        )
-                        final_part = edited_part or part
-                        if edited_part and edited_part != part and part.exists():
-                            try:
-                                part.unlink()
-                            except Exception:
-                                pass
-                        if wm_enabled:
-                            final_part = _apply_wm(final_part, preserve_source=False)
-                        self.config.append_activity_event(
-                            "split_edit_part_finalized",
-                            {
-                                "source": fp.name,
-                                "part": final_part.name if final_part else part.name,
-                                "edited": bool(edited_part),
-                            },
-                        )
-                    self.config.append_activity_event(
-                        "output_finalized",
-                        {"mode": "split_edit", "source": fp.name, "parts": len(parts)},
-                    )
-                    if parts and not keep_original and fp.exists():
-                        try:
-                            fp.unlink()
-                            self.progress.emit(f"Removed original: {fp.name}")
-                        except Exception:
-                            pass
-            elif mode == "split_edit" and not ffmpeg_ok:
-                self.progress.emit("SKIP split+edit: ffmpeg not available")
-
-            elif mode == "split" and ffmpeg_ok:
-                self.progress.emit(f"Editing: splitting into {self.config.split_duration}s segments...")
-                for fp in downloads:
-                    if self._stop:
-                        break
-                    parts = split_video(
-                        fp,
-                        self.creator_folder,
-                        self.config.split_duration,
-                        self.ffmpeg,
-                        self.progress.emit,
-                    )
-                    if not parts:
-                        self.progress.emit(f"  WARNING: split failed for {fp.name} - kept original")
-                    for part in parts:
-                        if self._stop:
-                            break
-                        _apply_wm(part, preserve_source=False)
-                    self.config.append_activity_event(
-                        "output_finalized",
-                        {"mode": "split", "source": fp.name, "parts": len(parts)},
-                    )
-                    if parts and not keep_original and fp.exists():
-                        try:
-                            fp.unlink()
-                            self.progress.emit(f"Removed original: {fp.name}")
-                        except Exception:
-                            pass
-            elif mode == "split" and not ffmpeg_ok:
-                self.progress.emit("SKIP split: ffmpeg not available")
-
-            elif mode == "parts" and ffmpeg_ok:
-                self.progress.emit(f"Editing: splitting into {self.config.parts_count} equal parts...")
-                for fp in downloads:
-                    if self._stop:
-                        break
-                    parts = split_video_by_parts(
-                        fp,
-                        self.creator_folder,
-                        self.config.parts_count,
-                        self.ffmpeg,
-                        self.progress.emit,
-                    )
-                    if not parts:
-                        self.progress.emit(f"  INFO: parts split skipped or failed for {fp.name} - kept original")
-                    for part in parts:
-                        if self._stop:
-                            break
-                        _apply_wm(part, preserve_source=False)
-                    self.config.append_activity_event(
-                        "output_finalized",
-                        {"mode": "parts", "source": fp.name, "parts": len(parts)},
-                    )
-                    if parts and not keep_original and fp.exists():
-                        try:
-                            fp.unlink()
-                            self.progress.emit(f"Removed original: {fp.name}")
-                        except Exception:
-                            pass
-            elif mode == "parts" and not ffmpeg_ok:
-                self.progress.emit("SKIP parts: ffmpeg not available")
-
-            elif mode == "preset" and self.config.preset_name and ffmpeg_ok:
-                self.progress.emit(f"Editing: applying preset '{self.config.preset_name}'...")
-                for fp in downloads:
-                    if self._stop:
-                        break
-                    out = apply_preset(fp, self.creator_folder, self.config.preset_name, self.ffmpeg)
-                    if not out:
-                        self.progress.emit(f"  WARNING: preset failed for {fp.name} - kept original")
-                    if out:
-                        _apply_wm(out, preserve_source=False)
-                    self.config.append_activity_event(
-                        "output_finalized",
-                        {"mode": "preset", "source": fp.name, "output": out.name if out else ""},
-                    )
-                    if out and not keep_original and fp.exists():
-                        try:
-                            fp.unlink()
-                            self.progress.emit(f"Removed original: {fp.name}")
-                        except Exception:
-                            pass
-            elif mode == "preset" and not ffmpeg_ok:
-                self.progress.emit("SKIP preset: ffmpeg not available")
-
-            else:
-                for fp in downloads:
-                    if self._stop:
-                        break
-                    _apply_wm(fp, preserve_source=keep_original)
+                with self._resource_slot(RESOURCE_POSTPROCESS):
+                    downloads = self._post_process_downloads(downloads, keep_original)
+            except SlotCancelled:
+                pass   # stopped while queued for ffmpeg; keep the raw downloads
 
         # Ã¢â€â‚¬Ã¢â€â‚¬ Finalize Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬Ã¢â€â‚¬
         count = len(downloads)
@@ -3987,3 +4041,476 @@ class CreatorDownloadWorker(QThread):
             )
         except Exception:
             pass
+
+    def _post_process_downloads(self, downloads: List[Path], keep_original: bool) -> List[Path]:
+        """Facebook bypass, watermark and editing-mode pass over finished downloads."""
+        self._terminal_log(
+            "Post",
+            f"download phase complete ({len(downloads)} videos). Starting post-processing...",
+        )
+
+        # Validate ffmpeg BEFORE starting any editing — re-resolve if broken
+        from modules.video_editor.utils import check_ffmpeg, get_ffmpeg_path
+        ffmpeg_ok = False
+        try:
+            _run_subprocess_safe(
+                [self.ffmpeg, "-version"],
+                capture_output=True, timeout=5,
+            )
+            ffmpeg_ok = True
+        except Exception:
+            pass
+
+        if not ffmpeg_ok:
+            self.progress.emit(f"Bundled ffmpeg failed ({self.ffmpeg}), searching for alternative...")
+            print(f"[CreatorProfile] Bundled ffmpeg failed ({self.ffmpeg}), re-resolving...")
+            if check_ffmpeg():
+                self.ffmpeg = get_ffmpeg_path()
+                ffmpeg_ok = True
+                self.progress.emit(f"Found working ffmpeg: {self.ffmpeg}")
+                print(f"[CreatorProfile] Re-resolved ffmpeg to: {self.ffmpeg}")
+
+        if not ffmpeg_ok:
+            self.progress.emit("ERROR: ffmpeg not found! Editing/watermark/split SKIPPED")
+            self.progress.emit("FIX: Copy ffmpeg folder to C:\\ffmpeg (with bin\\ffmpeg.exe + DLLs)")
+            print(f"[CreatorProfile] CRITICAL: No working ffmpeg found - skipping all post-processing")
+        else:
+            self.progress.emit(f"ffmpeg OK: {self.ffmpeg}")
+
+        if not ffmpeg_ok:
+            return self._post_process_legacy(downloads, keep_original, ffmpeg_ok=False)
+        return self._post_process_fused(downloads, keep_original)
+
+    def _post_process_legacy(
+        self,
+        downloads: List[Path],
+        keep_original: bool,
+        ffmpeg_ok: bool,
+    ) -> List[Path]:
+        """Step-by-step post-processing: one ffmpeg pass per step."""
+        # --- Universal Facebook Policy Bypass (Apply to all platforms) ---
+        if ffmpeg_ok:
+            from .split_edit_engine import apply_facebook_bypass
+            self.progress.emit("Applying Universal Facebook-Safe Optimization (Studio-Quality)...")
+            processed_downloads = []
+            for fp in downloads:
+                if self._stop: break
+                # Apply bypass to ensure content is safe for Facebook upload regardless of source
+                hq_path = apply_facebook_bypass(fp, self.creator_folder, self.ffmpeg, self.progress.emit)
+                if hq_path and hq_path.exists():
+                    # Replace the original with the bypassed high-quality version
+                    # Rename hq_path to original name to ensure all downstream logic uses it
+                    final_target = fp
+                    try:
+                        if fp.exists(): fp.unlink()
+                        shutil.move(str(hq_path), str(final_target))
+                        processed_downloads.append(final_target)
+                        self.progress.emit(f"  HQ Replacement Success: {final_target.name}")
+                    except Exception as e:
+                        self.progress.emit(f"  HQ Move Error: {e}")
+                        processed_downloads.append(hq_path if hq_path.exists() else fp)
+                else:
+                    processed_downloads.append(fp)
+            downloads = processed_downloads
+
+        wm_enabled = self.config.watermark_enabled
+        split_edit_cfg = self.config.split_edit_settings
+
+        def _apply_wm(fp: Path, preserve_source: bool = False) -> Path:
+            if not wm_enabled:
+                return fp
+            if not ffmpeg_ok:
+                self.progress.emit(f"  SKIP watermark for {fp.name} (ffmpeg unavailable)")
+                return fp
+            return self._watermark_clip(fp, preserve_source=preserve_source)
+
+        mode = self.config.editing_mode
+        if mode == "split_edit" and ffmpeg_ok:
+            from .config_manager import summarize_split_edit_settings
+            from .split_edit_engine import apply_split_edit_to_clip
+
+            self.progress.emit(f"Editing: splitting into {self.config.split_duration}s segments...")
+            self.progress.emit(
+                f"Editing: split+edit ({summarize_split_edit_settings(split_edit_cfg)})..."
+            )
+            for fp in downloads:
+                if self._stop:
+                    break
+                parts = split_video(
+                    fp,
+                    self.creator_folder,
+                    self.config.split_duration,
+                    self.ffmpeg,
+                    self.progress.emit,
+                    fast_split=self.config.fast_split,
+                    keyframe_tolerance=self.config.fast_split_tolerance,
+                )
+                if not parts:
+                    self.progress.emit(f"  WARNING: split failed for {fp.name} - kept original")
+                for part in parts:
+                    if self._stop:
+                        break
+                    edited_part = apply_split_edit_to_clip(
+                        part,
+                        self.creator_folder,
+                        split_edit_cfg,
+                        self.ffmpeg,
+                        self.progress.emit,
+                    )
+                    final_part = edited_part or part
+                    if edited_part and edited_part != part and part.exists():
+                        try:
+                            part.unlink()
+                        except Exception:
+                            pass
+                    if wm_enabled:
+                        final_part = _apply_wm(final_part, preserve_source=False)
+                    self.config.append_activity_event(
+                        "split_edit_part_finalized",
+                        {
+                            "source": fp.name,
+                            "part": final_part.name if final_part else part.name,
+                            "edited": bool(edited_part),
+                        },
+                    )
+                self.config.append_activity_event(
+                    "output_finalized",
+                    {"mode": "split_edit", "source": fp.name, "parts": len(parts)},
+                )
+                if parts and not keep_original and fp.exists():
+                    try:
+                        fp.unlink()
+                        self.progress.emit(f"Removed original: {fp.name}")
+                    except Exception:
+                        pass
+        elif mode == "split_edit" and not ffmpeg_ok:
+            self.progress.emit("SKIP split+edit: ffmpeg not available")
+
+        elif mode == "split" and ffmpeg_ok:
+            self.progress.emit(f"Editing: splitting into {self.config.split_duration}s segments...")
+            for fp in downloads:
+                if self._stop:
+                    break
+                parts = split_video(
+                    fp,
+                    self.creator_folder,
+                    self.config.split_duration,
+                    self.ffmpeg,
+                    self.progress.emit,
+                    fast_split=self.config.fast_split,
+                    keyframe_tolerance=self.config.fast_split_tolerance,
+                )
+                if not parts:
+                    self.progress.emit(f"  WARNING: split failed for {fp.name} - kept original")
+                for part in parts:
+                    if self._stop:
+                        break
+                    _apply_wm(part, preserve_source=False)
+                self.config.append_activity_event(
+                    "output_finalized",
+                    {"mode": "split", "source": fp.name, "parts": len(parts)},
+                )
+                if parts and not keep_original and fp.exists():
+                    try:
+                        fp.unlink()
+                        self.progress.emit(f"Removed original: {fp.name}")
+                    except Exception:
+                        pass
+        elif mode == "split" and not ffmpeg_ok:
+            self.progress.emit("SKIP split: ffmpeg not available")
+
+        elif mode == "parts" and ffmpeg_ok:
+            self.progress.emit(f"Editing: splitting into {self.config.parts_count} equal parts...")
+            for fp in downloads:
+                if self._stop:
+                    break
+                parts = split_video_by_parts(
+                    fp,
+                    self.creator_folder,
+                    self.config.parts_count,
+                    self.ffmpeg,
+                    self.progress.emit,
+                    fast_split=self.config.fast_split,
+                    keyframe_tolerance=self.config.fast_split_tolerance,
+                )
+                if not parts:
+                    self.progress.emit(f"  INFO: parts split skipped or failed for {fp.name} - kept original")
+                for part in parts:
+                    if self._stop:
+                        break
+                    _apply_wm(part, preserve_source=False)
+                self.config.append_activity_event(
+                    "output_finalized",
+                    {"mode": "parts", "source": fp.name, "parts": len(parts)},
+                )
+                if parts and not keep_original and fp.exists():
+                    try:
+                        fp.unlink()
+                        self.progress.emit(f"Removed original: {fp.name}")
+                    except Exception:
+                        pass
+        elif mode == "parts" and not ffmpeg_ok:
+            self.progress.emit("SKIP parts: ffmpeg not available")
+
+        elif mode == "preset" and self.config.preset_name and ffmpeg_ok:
+            self.progress.emit(f"Editing: applying preset '{self.config.preset_name}'...")
+            for fp in downloads:
+                if self._stop:
+                    break
+                out = apply_preset(fp, self.creator_folder, self.config.preset_name, self.ffmpeg)
+                if not out:
+                    self.progress.emit(f"  WARNING: preset failed for {fp.name} - kept original")
+                if out:
+                    _apply_wm(out, preserve_source=False)
+                self.config.append_activity_event(
+                    "output_finalized",
+                    {"mode": "preset", "source": fp.name, "output": out.name if out else ""},
+                )
+                if out and not keep_original and fp.exists():
+                    try:
+                        fp.unlink()
+                        self.progress.emit(f"Removed original: {fp.name}")
+                    except Exception:
+                        pass
+        elif mode == "preset" and not ffmpeg_ok:
+            self.progress.emit("SKIP preset: ffmpeg not available")
+
+        else:
+            for fp in downloads:
+                if self._stop:
+                    break
+                _apply_wm(fp, preserve_source=keep_original)
+
+        return downloads
+
+    def _post_process_fused(self, downloads: List[Path], keep_original: bool) -> List[Path]:
+        """
+        Single-pass post-processing: bypass, split+edit, preset and watermark
+        share one filtergraph (see postprocess_planner). A clip whose fused
+        pass fails is redone by _post_process_legacy.
+        """
+        mode = self.config.editing_mode
+        wm_cfgs = None
+        if self.config.watermark_enabled:
+            wm_cfgs = (
+                self.config.watermark_text,
+                self.config.watermark_logo,
+                self.config.watermark_avatar,
+            )
+        planner = PostProcessPlanner(
+            ffmpeg=self.ffmpeg,
+            creator_folder=self.creator_folder,
+            bypass=True,
+            edit_settings=self.config.split_edit_settings if mode == "split_edit" else None,
+            preset_name=self.config.preset_name if mode == "preset" else "",
+            watermark_cfgs=wm_cfgs,
+            progress_cb=self.progress.emit,
+        )
+
+        self.progress.emit("Applying Universal Facebook-Safe Optimization (Studio-Quality)...")
+        if mode in ("split", "split_edit"):
+            self.progress.emit(f"Editing: splitting into {self.config.split_duration}s segments...")
+        if mode == "split_edit":
+            from .config_manager import summarize_split_edit_settings
+            self.progress.emit(
+                f"Editing: split+edit ({summarize_split_edit_settings(planner.edit_settings)})..."
+            )
+        elif mode == "parts":
+            self.progress.emit(f"Editing: splitting into {self.config.parts_count} equal parts...")
+        elif planner.preset_size:
+            self.progress.emit(f"Editing: applying preset '{self.config.preset_name}'...")
+
+        processed: List[Path] = []
+        for i, fp in enumerate(downloads):
+            if self._stop:
+                processed.extend(downloads[i:])
+                break
+            if mode in ("split", "split_edit", "parts"):
+                ok = self._fused_split_clip(planner, fp, mode, keep_original)
+            else:
+                ok = self._fused_whole_clip(planner, fp, keep_original)
+            if not ok and not self._stop:
+                self.progress.emit(f"  Single pass failed for {fp.name} - falling back to step-by-step")
+                self._post_process_legacy([fp], keep_original, ffmpeg_ok=True)
+            processed.append(fp)
+        return processed
+
+    def _fused_whole_clip(self, planner: PostProcessPlanner, fp: Path, keep_original: bool) -> bool:
+        """Bypass [+ preset] [+ watermark] in one encode."""
+        layers = planner.watermark_layers(fp)
+        graph = planner.build([STEP_BYPASS, STEP_PRESET, STEP_WATERMARK], layers)
+        if graph is None:
+            return True
+
+        suffix = fp.suffix or ".mp4"
+        is_preset = STEP_PRESET in graph.steps
+        if is_preset:
+            out = self.creator_folder / f"{fp.stem}_edited{suffix}"
+        elif STEP_WATERMARK in graph.steps and keep_original:
+            out = fp.with_name(f"{fp.stem}_wm{suffix}")
+        else:
+            out = fp.with_name(f"{fp.stem}_fused_tmp{suffix}")
+        replaces_source = not is_preset and out.name.endswith(f"_fused_tmp{suffix}")
+
+        self.progress.emit(f"  Single pass ({' + '.join(graph.steps)}): {fp.name}")
+        try:
+            ok = self._run_fused_pass(graph.command(self.ffmpeg, fp, out), out)
+        finally:
+            graph.cleanup()
+        if not ok:
+            return False
+
+        if replaces_source:
+            try:
+                out.replace(fp)
+            except Exception as e:
+                self.progress.emit(f"  HQ Move Error: {e}")
+                return False
+        self.progress.emit(f"  Single pass done: {(fp if replaces_source else out).name}")
+
+        if is_preset:
+            self.config.append_activity_event(
+                "output_finalized",
+                {"mode": "preset", "source": fp.name, "output": out.name},
+            )
+            if not keep_original and fp.exists():
+                try:
+                    fp.unlink()
+                    self.progress.emit(f"Removed original: {fp.name}")
+                except Exception:
+                    pass
+        return True
+
+    def _fused_split_clip(
+        self,
+        planner: PostProcessPlanner,
+        fp: Path,
+        mode: str,
+        keep_original: bool,
+    ) -> bool:
+        """
+        Split with bypass/edit/static watermark riding on the split encode.
+
+        The graph is None when nothing rides on the split (planner without
+        bypass, edit or static watermark); the clip is then split plainly.
+        """
+        layers = planner.watermark_layers(fp)
+        graph = planner.build(planner.split_steps(layers), layers)
+        steps = graph.steps if graph is not None else []
+        if layers is not None and (graph is None or graph.watermark is None):
+            layers.cleanup()   # animated: drawn per part below
+
+        fast_split = self.config.fast_split and _copy_splittable(graph)
+        if fast_split:
+            self.progress.emit(f"  Fast split (keyframe stream copy, no bypass re-encode): {fp.name}")
+        else:
+            self.progress.emit(f"  Single pass ({' + '.join(steps + ['split'])}): {fp.name}")
+        try:
+            if mode == "parts":
+                parts = split_video_by_parts(
+                    fp,
+                    self.creator_folder,
+                    self.config.parts_count,
+                    self.ffmpeg,
+                    self.progress.emit,
+                    graph=graph,
+                    fast_split=fast_split,
+                    keyframe_tolerance=self.config.fast_split_tolerance,
+                )
+            else:
+                parts = split_video(
+                    fp,
+                    self.creator_folder,
+                    self.config.split_duration,
+                    self.ffmpeg,
+                    self.progress.emit,
+                    graph=graph,
+                    fast_split=fast_split,
+                    keyframe_tolerance=self.config.fast_split_tolerance,
+                )
+        finally:
+            if graph is not None:
+                graph.cleanup()
+        if not parts:
+            return False
+
+        edit_in_pass = STEP_EDIT in steps
+        wm_per_part = planner.watermark_cfgs is not None and STEP_WATERMARK not in steps
+        for part in parts:
+            if self._stop:
+                break
+            final_part = part
+            edited = edit_in_pass
+            if mode == "split_edit" and not edit_in_pass:
+                from .split_edit_engine import apply_split_edit_to_clip
+
+                edited_part = apply_split_edit_to_clip(
+                    part,
+                    self.creator_folder,
+                    planner.edit_settings,
+                    self.ffmpeg,
+                    self.progress.emit,
+                )
+                edited = bool(edited_part)
+                if edited_part and edited_part != part:
+                    final_part = edited_part
+                    if part.exists():
+                        try:
+                            part.unlink()
+                        except Exception:
+                            pass
+            if wm_per_part:
+                final_part = self._watermark_clip(final_part, preserve_source=False)
+            if mode == "split_edit":
+                self.config.append_activity_event(
+                    "split_edit_part_finalized",
+                    {"source": fp.name, "part": final_part.name, "edited": edited},
+                )
+
+        self.config.append_activity_event(
+            "output_finalized",
+            {"mode": mode, "source": fp.name, "parts": len(parts)},
+        )
+        if not keep_original and fp.exists():
+            try:
+                fp.unlink()
+                self.progress.emit(f"Removed original: {fp.name}")
+            except Exception:
+                pass
+        return True
+
+    def _run_fused_pass(self, cmd: List[str], out: Path) -> bool:
+        try:
+            res = _run_subprocess_safe(cmd, timeout=1800, capture_output=True)
+        except Exception as e:
+            self.progress.emit(f"  Single pass error: {e}")
+            res = None
+        if res is not None and res.returncode == 0 and out.exists() and out.stat().st_size > 0:
+            return True
+        if res is not None:
+            err = res.stderr.decode(errors="ignore") if isinstance(res.stderr, bytes) else str(res.stderr or "")
+            if err.strip():
+                self.progress.emit(f"  Single pass ffmpeg error: {err.strip()[-200:]}")
+        try:
+            out.unlink(missing_ok=True)
+        except Exception:
+            pass
+        return False
+
+    def _watermark_clip(self, fp: Path, preserve_source: bool = False) -> Path:
+        from .watermark_engine import apply_watermark_inplace
+
+        result_path = apply_watermark_inplace(
+            video_path=fp,
+            creator_folder=self.creator_folder,
+            wm_text_cfg=self.config.watermark_text,
+            wm_logo_cfg=self.config.watermark_logo,
+            wm_avatar_cfg=self.config.watermark_avatar,
+            keep_original=preserve_source,
+            ffmpeg=self.ffmpeg,
+            progress_cb=self.progress.emit,
+        )
+        if not result_path:
+            self.progress.emit(f"  WARNING: watermark failed for {fp.name} - kept original")
+            return fp
+        return result_path
@@ -180,6 +180,31 @@ class EditCreatorDialog(QDialog):
         self.parts_spin.setFixedWidth(140)
         form.addRow(self.parts_lbl, self.parts_spin)
 
+        # Fast split (stream copy at keyframes)
+        self.fast_split_lbl = QLabel("Fast Split:")
+        fast_row = QHBoxLayout()
+        self.fast_split_btn = QPushButton("OFF")
+        self.fast_split_btn.setCheckable(True)
+        self.fast_split_btn.setFixedWidth(86)
+        self.fast_split_btn.clicked.connect(lambda: self._apply_toggle_style(self.fast_split_btn))
+        fast_note = QLabel(
+            "Cut at the nearest keyframe and copy streams (no re-encode,\n"
+            "skips the bypass filters; edits/watermarks still re-encode).\n"
+            "Falls back to re-encoding when keyframes are too far apart."
+        )
+        fast_note.setStyleSheet(
+            "color: rgba(255,255,255,0.38); font-size: 10px;"
+            " background: transparent; border: none;"
+        )
+        fast_row.addWidget(self.fast_split_btn)
+        fast_row.addSpacing(8)
+        fast_row.addWidget(fast_note)
+        fast_row.addStretch()
+        self.fast_split_w = QWidget()
+        self.fast_split_w.setStyleSheet("background: transparent; border: none;")
+        self.fast_split_w.setLayout(fast_row)
+        form.addRow(self.fast_split_lbl, self.fast_split_w)
+
         self.split_edit_btn = QPushButton("Configure Split + Edit")
         self.split_edit_btn.clicked.connect(self._open_split_edit_dialog)
         self.split_edit_summary_lbl = QLabel("")
@@ -611,6 +636,8 @@ class EditCreatorDialog(QDialog):
         self.pop_btn.setChecked(c.popular_fallback)
         self.rnd_btn.setChecked(c.randomize_links)
         self.keep_btn.setChecked(c.keep_original_after_edit)
+        self.fast_split_btn.setChecked(c.fast_split)
+        self._apply_toggle_style(self.fast_split_btn)
         self._apply_toggle_style(self.dup_btn)
         self._apply_toggle_style(self.pop_btn)
         self._apply_toggle_style(self.rnd_btn)
@@ -677,6 +704,8 @@ class EditCreatorDialog(QDialog):
         self.split_spin.setVisible(mode in {"split", "split_edit"})
         self.parts_lbl.setVisible(mode == "parts")
         self.parts_spin.setVisible(mode == "parts")
+        self.fast_split_lbl.setVisible(mode in {"split", "split_edit", "parts"})
+        self.fast_split_w.setVisible(mode in {"split", "split_edit", "parts"})
         self.split_edit_panel.setVisible(mode == "split_edit")
         if mode == "split_edit" and not getattr(self, "_loading_settings", False):
             self._open_split_edit_dialog()
@@ -737,6 +766,7 @@ class EditCreatorDialog(QDialog):
             "preset_name":         self.preset_combo.currentText(),
             "split_duration":      self.split_spin.value(),
             "parts_count":         self.parts_spin.value(),
+            "fast_split":          self.fast_split_btn.isChecked(),
             "split_edit_settings": getattr(self, "_split_edit_settings", None),
             "duplication_control": self.dup_btn.isChecked(),
             "popular_fallback":    self.pop_btn.isChecked(),
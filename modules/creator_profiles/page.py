@@ -3172,12 +3172,15 @@ class CreatorProfilesPage(QWidget):
 
     def _on_queue_creator_started(self, creator_name: str):
         """Highlight the card being processed (queue manager runs its own worker)."""
+        # Concurrent queues keep several cards active; each one is released
+        # by its own creator_finished.
+        concurrent = self._queue_manager.is_concurrent
         for fp, card in self.cards.items():
             if fp.name == creator_name:
                 card.set_queue_active(True)
                 card._set_state("running", "Queue: Starting...")
             else:
-                if not card._queue_active:
+                if concurrent or not card._queue_active:
                     continue
                 card.set_queue_active(False)
 
@@ -3369,7 +3372,7 @@ class CreatorProfilesPage(QWidget):
             return
         for fp, card in self.cards.items():
             cfg = CreatorConfig(fp)
-            cfg.data["downloaded_ids"] = []
+            cfg.clear_downloaded()
             cfg.data["last_activity"]  = {
                 "date": None, "result": None,
                 "tier_used": None, "videos_downloaded": 0,
@@ -3412,6 +3415,8 @@ class CreatorProfilesPage(QWidget):
                 "preset_name":         cfg.preset_name,
                 "split_duration":      cfg.split_duration,
                 "parts_count":         cfg.parts_count,
+                "fast_split":          cfg.fast_split,
+                "fast_split_tolerance_sec": cfg.fast_split_tolerance,
                 "split_edit_settings": cfg.split_edit_settings,
                 "duplication_control": cfg.duplication_control,
                 "popular_fallback":    cfg.popular_fallback,
@@ -3450,7 +3455,8 @@ class CreatorProfilesPage(QWidget):
                 folder.mkdir(parents=True, exist_ok=True)
                 cfg = CreatorConfig(folder)
                 for key in ("creator_url", "n_videos", "editing_mode",
-                            "preset_name", "split_duration", "parts_count", "split_edit_settings", "duplication_control",
+                            "preset_name", "split_duration", "parts_count", "fast_split",
+                            "fast_split_tolerance_sec", "split_edit_settings", "duplication_control",
                             "popular_fallback", "prefer_popular_first", "randomize_links",
                             "keep_original_after_edit", "delete_before_download",
                             "yt_content_type", "uploading_target",
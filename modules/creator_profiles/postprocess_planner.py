@@ -0,0 +1,243 @@
+"""
+modules/creator_profiles/postprocess_planner.py
+Fuse creator post-processing steps into as few ffmpeg passes as possible.
+
+After a download the worker used to re-encode the same clip once per step:
+Facebook bypass -> split/parts -> split+edit -> watermark
+(or bypass -> preset -> watermark). Every pass decodes the whole clip,
+re-encodes with libx264 and loses a little quality.
+
+The planner turns the enabled steps into one filtergraph:
+
+    [0:v] bypass filters, edit filters, preset scale/crop -> [vpre]
+    [vpre] + watermark overlay inputs                      -> [vout]
+    [0:a] bypass + edit audio filters
+
+Only steps that genuinely need their own pass stay separate:
+- split+edit with background-music removal (Demucs works on each part's
+  own extracted audio)
+- animated watermarks when splitting (they follow each part's timeline)
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .config_manager import merge_split_edit_settings
+from .split_edit_engine import (
+    _FACEBOOK_BYPASS_AUDIO_FILTERS,
+    _FACEBOOK_BYPASS_METADATA_ARGS,
+    _FACEBOOK_BYPASS_VIDEO_ARGS,
+    _FACEBOOK_BYPASS_VIDEO_FILTERS,
+    _build_audio_filter,
+    _build_video_filter,
+    _metadata_args,
+)
+from .watermark_engine import WatermarkLayers, build_watermark_layers
+
+STEP_BYPASS = "bypass"
+STEP_EDIT = "edit"
+STEP_PRESET = "preset"
+STEP_WATERMARK = "watermark"
+
+_PRE_LABEL = "[vpre]"
+_DEFAULT_PRESET_SIZE = (1080, 1920)
+_PRESET_DIRS = ("presets/system", "presets/user", "presets/imported")
+
+_FAST_VIDEO_ARGS = ("-c:v", "libx264", "-preset", "veryfast", "-crf", "20")
+
+
+def resolve_preset_size(preset_name: str) -> Tuple[int, int]:
+    """Target (width, height) from the first preset JSON matching preset_name."""
+    target_w, target_h = _DEFAULT_PRESET_SIZE
+    for d in _PRESET_DIRS:
+        p = Path(d)
+        if not p.exists():
+            continue
+        for f in p.glob("*.json"):
+            if preset_name.lower() in f.stem.lower():
+                try:
+                    with open(f, encoding="utf-8") as fh:
+                        data = json.load(fh)
+                    exp = data.get("export_settings", {})
+                    target_w = int(exp.get("width", target_w))
+                    target_h = int(exp.get("height", target_h))
+                except Exception:
+                    pass
+                break
+    return target_w, target_h
+
+
+def preset_video_filter(width: int, height: int) -> str:
+    return (
+        f"scale={width}:{height}:force_original_aspect_ratio=increase,"
+        f"crop={width}:{height}"
+    )
+
+
+@dataclass
+class FusedGraph:
+    """One ffmpeg pass covering several post-processing steps."""
+    steps: List[str]
+    filter_complex: str
+    video_label: str
+    audio_filter: str = ""
+    extra_inputs: List[str] = field(default_factory=list)
+    video_args: List[str] = field(default_factory=list)
+    output_args: List[str] = field(default_factory=list)
+    watermark: Optional[WatermarkLayers] = None
+
+    def command(
+        self,
+        ffmpeg: str,
+        input_path: Path,
+        output_path: Path,
+        trim_args: Sequence[str] = (),
+        extra_output_args: Sequence[str] = (),
+        audio_prefix: str = "",
+        audio_bitrate: str = "192k",
+        container_args: Sequence[str] = ("-movflags", "+faststart"),
+    ) -> List[str]:
+        """
+        Full ffmpeg command for input_path -> output_path.
+
+        trim_args (-ss/-t) and extra_output_args are placed after the inputs,
+        so the split helpers can cut parts out of the fused graph;
+        container_args lets the segment muxer carry its own mp4 options.
+        """
+        cmd = [ffmpeg, "-hide_banner", "-loglevel", "error", "-y", "-i", str(input_path)]
+        cmd += list(self.extra_inputs)
+        cmd += list(trim_args)
+        cmd += ["-filter_complex", self.filter_complex, "-map", self.video_label, "-map", "0:a?"]
+        cmd += list(self.video_args)
+        cmd += ["-pix_fmt", "yuv420p"]
+        audio_filter = ",".join(f for f in (audio_prefix, self.audio_filter) if f)
+        if audio_filter:
+            cmd += ["-af", audio_filter, "-c:a", "aac", "-b:a", audio_bitrate]
+        else:
+            cmd += ["-c:a", "copy"]
+        cmd += list(extra_output_args)
+        cmd += list(self.output_args)
+        cmd += list(container_args)
+        cmd.append(str(output_path))
+        return cmd
+
+    def cleanup(self) -> None:
+        if self.watermark is not None:
+            self.watermark.cleanup()
+
+
+class PostProcessPlanner:
+    """
+    Decide which post-processing steps can share one ffmpeg pass and build
+    the fused filtergraph for them.
+    """
+
+    def __init__(
+        self,
+        ffmpeg: str,
+        creator_folder: Path,
+        bypass: bool = True,
+        edit_settings: Optional[Dict] = None,
+        preset_name: str = "",
+        watermark_cfgs: Optional[Tuple[Dict, Dict, Dict]] = None,
+        progress_cb: Callable[[str], None] = None,
+    ):
+        self.ffmpeg = ffmpeg
+        self.creator_folder = Path(creator_folder)
+        self.bypass = bool(bypass)
+        self.edit_settings = merge_split_edit_settings(edit_settings) if edit_settings is not None else None
+        self.preset_size = resolve_preset_size(preset_name) if preset_name else None
+        self.watermark_cfgs = watermark_cfgs
+        self.progress_cb = progress_cb
+
+    @property
+    def edit_fusable(self) -> bool:
+        """Split+edit can join the graph unless it needs Demucs vocals per part."""
+        return self.edit_settings is not None and not self.edit_settings["remove_background_music"]
+
+    def watermark_layers(self, input_path: Path) -> Optional[WatermarkLayers]:
+        """Overlay layers reading from the pre-watermark label, or None."""
+        if not self.watermark_cfgs:
+            return None
+        text_cfg, logo_cfg, avatar_cfg = self.watermark_cfgs
+        return build_watermark_layers(
+            input_path=input_path,
+            creator_folder=self.creator_folder,
+            wm_text_cfg=text_cfg,
+            wm_logo_cfg=logo_cfg,
+            wm_avatar_cfg=avatar_cfg,
+            ffmpeg=self.ffmpeg,
+            progress_cb=self.progress_cb,
+            base_label=_PRE_LABEL,
+            first_input_index=1,
+        )
+
+    def split_steps(self, layers: Optional[WatermarkLayers]) -> List[str]:
+        """Steps that can ride on the split pass (time-invariant over the clip)."""
+        steps: List[str] = []
+        if self.bypass:
+            steps.append(STEP_BYPASS)
+        if self.edit_fusable:
+            steps.append(STEP_EDIT)
+        if layers is not None and not layers.animated:
+            steps.append(STEP_WATERMARK)
+        return steps
+
+    def build(
+        self,
+        steps: Sequence[str],
+        layers: Optional[WatermarkLayers] = None,
+    ) -> Optional[FusedGraph]:
+        """Fused graph for steps, or None when there is nothing to apply."""
+        video_filters: List[str] = []
+        audio_filters: List[str] = []
+        output_args: List[str] = []
+        fused: List[str] = []
+        video_args: List[str] = list(_FAST_VIDEO_ARGS)
+
+        if STEP_BYPASS in steps:
+            video_filters.extend(_FACEBOOK_BYPASS_VIDEO_FILTERS)
+            audio_filters.extend(_FACEBOOK_BYPASS_AUDIO_FILTERS)
+            output_args.extend(_FACEBOOK_BYPASS_METADATA_ARGS)
+            video_args = list(_FACEBOOK_BYPASS_VIDEO_ARGS)
+            fused.append(STEP_BYPASS)
+
+        if STEP_EDIT in steps and self.edit_fusable:
+            video_filters.append(_build_video_filter(self.edit_settings))
+            edit_audio = _build_audio_filter(self.edit_settings, music_isolated=False)
+            if edit_audio:
+                audio_filters.append(edit_audio)
+            edit_metadata = _metadata_args(self.edit_settings["metadata_level"])
+            if STEP_BYPASS in fused and edit_metadata[:2] == ["-map_metadata", "-1"]:
+                edit_metadata = edit_metadata[2:]   # already stripped by the bypass args
+            output_args.extend(edit_metadata)
+            fused.append(STEP_EDIT)
+
+        if STEP_PRESET in steps and self.preset_size:
+            video_filters.append(preset_video_filter(*self.preset_size))
+            fused.append(STEP_PRESET)
+
+        filter_parts = [f"[0:v]{','.join(video_filters) or 'null'}{_PRE_LABEL}"]
+        video_label = _PRE_LABEL
+        extra_inputs: List[str] = []
+        if STEP_WATERMARK in steps and layers is not None:
+            filter_parts.extend(layers.filter_parts)
+            video_label = layers.output_label
+            extra_inputs = list(layers.input_args)
+            fused.append(STEP_WATERMARK)
+
+        if not fused:
+            return None
+
+        return FusedGraph(
+            steps=fused,
+            filter_complex=";".join(filter_parts),
+            video_label=video_label,
+            audio_filter=",".join(audio_filters),
+            extra_inputs=extra_inputs,
+            video_args=video_args,
+            output_args=output_args,
+            watermark=layers if STEP_WATERMARK in fused else None,
+        )
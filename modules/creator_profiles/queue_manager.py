@@ -1,10 +1,12 @@
 """
 modules/creator_profiles/queue_manager.py
-Sequential queue manager for processing creator profiles one at a time.
+Queue manager for processing creator profiles.
 
 Features:
 - Run All: always starts fresh from index 0 (card display order)
-- One creator at a time (no parallel processing)
+- One creator at a time by default; optional concurrent mode runs up to
+  creator_queue.max_parallel_creators workers with per-platform and
+  per-stage caps (see scheduler.py)
 - Pause: stops after current download finishes, saves state
 - Resume: continues from exactly where stopped
 - State persisted to Desktop/Links Grabber/.queue_state.json (atomic write)
@@ -18,13 +20,14 @@ import time
 import uuid
 import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
 from PyQt5.QtCore import QThread, pyqtSignal
 
-from .download_engine import CreatorDownloadWorker
+from .download_engine import CreatorDownloadWorker, _detect_platform
+from .scheduler import ResourceGate, SchedulerLimits, load_scheduler_limits
 from modules.shared.pacing import get_delay_multiplier, resolve_user_plan
 
 
@@ -41,6 +44,10 @@ def _is_network_available() -> bool:
     return False
 
 
+# Failure codes that must not trigger the wait-for-network retry loop.
+_NON_NETWORK_CODES = {"failed_auth", "no_url_configured", "runtime_unavailable"}
+
+
 def _state_file() -> Path:
     return Path.home() / "Desktop" / "Links Grabber" / ".queue_state.json"
 
@@ -54,7 +61,8 @@ def _creator_display_name(name: str) -> str:
 
 class CreatorQueueManager(QThread):
     """
-    Manages sequential downloading for multiple creator folders.
+    Manages downloading for multiple creator folders — sequentially, or
+    several at once when the concurrent scheduler is enabled.
 
     Signals:
         queue_progress(str)          — status message for the queue status label
@@ -85,11 +93,18 @@ class CreatorQueueManager(QThread):
         self._resume_event = threading.Event()
         self._resume_event.set()   # not paused initially
 
-        self._current_worker: Optional[CreatorDownloadWorker] = None
-        self._worker_done_event = threading.Event()
+        self._active_workers: Dict[str, CreatorDownloadWorker] = {}
+        self._completed: set = set()   # folder paths finished past _current_index
+        self._limits: SchedulerLimits = SchedulerLimits()
+        self._gate: Optional[ResourceGate] = None
         self._total_videos_downloaded: int = 0
         self._last_result: dict = {}
 
+    @property
+    def is_concurrent(self) -> bool:
+        """True while the queue runs several creators at once."""
+        return self._limits.concurrent
+
     # ── Public API ────────────────────────────────────────────────────────
 
     def start_queue(self, folders: List[Path]):
@@ -101,6 +116,7 @@ class CreatorQueueManager(QThread):
             return
         self._queue = list(folders)
         self._current_index = 0
+        self._completed = set()
         self._session_id = str(uuid.uuid4())
         self._pause_flag = False
         self._stop_flag = False
@@ -117,9 +133,9 @@ class CreatorQueueManager(QThread):
         with self._pause_lock:
             self._pause_flag = True
             self._resume_event.clear()
-        # Also pause the active worker (between videos)
-        if self._current_worker:
-            self._current_worker.pause()
+        # Also pause the active workers (between videos)
+        for worker in list(self._active_workers.values()):
+            worker.pause()
         self.queue_progress.emit("Queue: Pausing after current video...")
 
     def resume(self):
@@ -127,9 +143,9 @@ class CreatorQueueManager(QThread):
         with self._pause_lock:
             self._pause_flag = False
             self._resume_event.set()
-        # Resume active worker if it's waiting
-        if self._current_worker:
-            self._current_worker.resume()
+        # Resume active workers if they're waiting
+        for worker in list(self._active_workers.values()):
+            worker.resume()
         if not self.isRunning():
             # Thread exited while paused — restart from saved index
             self.start()
@@ -139,8 +155,8 @@ class CreatorQueueManager(QThread):
         self._stop_flag = True
         self._pause_flag = False
         self._resume_event.set()
-        if self._current_worker:
-            self._current_worker.stop()
+        for worker in list(self._active_workers.values()):
+            worker.stop()
         self._delete_state()
 
     def reset(self):
@@ -148,6 +164,7 @@ class CreatorQueueManager(QThread):
         self.stop()
         self._queue = []
         self._current_index = 0
+        self._completed = set()
 
     # ── State persistence ─────────────────────────────────────────────────
 
@@ -168,6 +185,7 @@ class CreatorQueueManager(QThread):
         """Restore queue from saved state (for crash recovery). Does NOT start running."""
         self._queue = [Path(p) for p in state.get("queue", [])]
         self._current_index = int(state.get("current_index", 0))
+        self._completed = {str(p) for p in state.get("completed", [])}
         self._session_id = state.get("session_id", str(uuid.uuid4()))
         self._pause_flag = True
         self._resume_event.clear()
@@ -183,6 +201,10 @@ class CreatorQueueManager(QThread):
                 "current_index": self._current_index,
                 "paused_at": str(self._queue[self._current_index]) if self._current_index < len(self._queue) else "",
                 "session_id": self._session_id,
+                # Concurrent mode finishes creators out of order: remember the
+                # ones already done past current_index so resume skips them.
+                "completed": sorted(self._completed),
+                "running": sorted(self._active_workers.keys()),
             }
             tmp = sf.with_suffix(".tmp")
             with open(tmp, "w", encoding="utf-8") as f:
@@ -203,10 +225,15 @@ class CreatorQueueManager(QThread):
         total = len(self._queue)
         delay_multiplier = get_delay_multiplier()
         user_plan = resolve_user_plan()
+        self._limits = load_scheduler_limits()
 
         self.queue_progress.emit(
             f"Queue: pacing profile {user_plan.upper()} ({delay_multiplier:.1f}x delays)"
         )
+        if self._limits.concurrent:
+            self.queue_progress.emit(
+                f"Queue: concurrent mode — up to {self._limits.max_parallel} creators at once"
+            )
 
         # ── Managed Chrome: start once, keep alive for entire queue ──────────
         # Chrome must be running before any creator starts so CDP attach-first
@@ -231,6 +258,24 @@ class CreatorQueueManager(QThread):
             print(f"[Queue][Browser] Browser init skipped: {_ce}", flush=True)
         # Chrome is intentionally NOT closed at queue end — stays open until app exits.
 
+        if self._limits.concurrent:
+            self._gate = ResourceGate(self._limits.resource_limits)
+            self._run_concurrent(total, delay_multiplier)
+        else:
+            self._gate = None
+            self._run_sequential(total, delay_multiplier)
+
+        # Queue complete (or stopped)
+        self._delete_state()
+        if not self._stop_flag:
+            self.queue_progress.emit(f"Queue: Done — {total} creator(s) processed")
+            self.queue_finished.emit(False)
+        else:
+            self.queue_progress.emit("Queue: Stopped")
+            self.queue_finished.emit(True)
+
+    def _run_sequential(self, total: int, delay_multiplier: float):
+        """Classic queue: one creator at a time in card order."""
         while self._current_index < total:
             # Check pause at top of each creator iteration (lock ensures flag+event are consistent)
             with self._pause_lock:
@@ -246,6 +291,11 @@ class CreatorQueueManager(QThread):
             if self._stop_flag:
                 break
 
+            # Already finished by an earlier concurrent run of this session
+            if str(self._queue[self._current_index]) in self._completed:
+                self._current_index += 1
+                continue
+
             # Network check before starting next creator
             if not _is_network_available():
                 self._save_state()
@@ -296,7 +346,6 @@ class CreatorQueueManager(QThread):
 
             # If failed, only retry for network-related failures.
             # Auth/config failures should not trigger network retry loop.
-            _NON_NETWORK_CODES = {"failed_auth", "no_url_configured", "runtime_unavailable"}
             last_status = str(self._last_result.get("status_code", "") or "")
             if not success and last_status not in _NON_NETWORK_CODES and not _is_network_available():
                 self._save_state()
@@ -326,14 +375,160 @@ class CreatorQueueManager(QThread):
                 self.queue_progress.emit(f"Queue: Cooldown {delay:.1f}s before next creator...")
                 time.sleep(delay)
 
-        # Queue complete (or stopped)
-        self._delete_state()
-        if not self._stop_flag:
-            self.queue_progress.emit(f"Queue: Done — {total} creator(s) processed")
-            self.queue_finished.emit(False)
-        else:
-            self.queue_progress.emit("Queue: Stopped")
-            self.queue_finished.emit(True)
+    def _run_concurrent(self, total: int, delay_multiplier: float):
+        """
+        Keep up to max_parallel workers running, respecting per-platform caps.
+
+        Workers are created, connected and reaped on this thread exactly like
+        the sequential path; only the blocking wait is replaced by polling.
+        Network outages and launch staggering never sleep here: they only hold
+        back new launches, so finished workers keep being reaped meanwhile.
+        """
+        limits = self._limits
+        pending: List[int] = [
+            idx for idx in range(self._current_index, total)
+            if str(self._queue[idx]) not in self._completed
+        ]
+        active: Dict[int, dict] = {}
+        platform_running: Dict[str, int] = {}
+        platform_cache: Dict[int, str] = {}
+        next_launch_at = 0.0
+        pause_announced = False
+        network = {"down": False, "check_at": 0.0}
+
+        def _platform_of(idx: int) -> str:
+            if idx not in platform_cache:
+                from .config_manager import CreatorConfig
+                try:
+                    url = (CreatorConfig(self._queue[idx]).creator_url or "").strip()
+                except Exception:
+                    url = ""
+                platform_cache[idx] = _detect_platform(url) if url else "unknown"
+            return platform_cache[idx]
+
+        def _network_down(message: str):
+            """Hold back launches until the network is back."""
+            if network["down"]:
+                return
+            network["down"] = True
+            network["check_at"] = time.monotonic() + 5
+            self._save_state()
+            self.queue_progress.emit(message)
+            self.paused.emit()
+
+        def _network_ready() -> bool:
+            """Non-blocking launch gate; re-probes every 5s while the network is down."""
+            nonlocal next_launch_at
+            if not network["down"]:
+                return True
+            now = time.monotonic()
+            if now < network["check_at"]:
+                return False
+            if not _is_network_available():
+                network["check_at"] = now + 5
+                return False
+            network["down"] = False
+            self.queue_progress.emit("Queue: Network restored — resuming...")
+            next_launch_at = max(next_launch_at, now + 2)  # brief stabilization delay
+            return False
+
+        while (pending or active) and not self._stop_flag:
+            # ── Reap finished workers ─────────────────────────────────────
+            network_lost = False
+            for idx, slot in list(active.items()):
+                worker = slot["worker"]
+                if worker is not None and not slot["done"].is_set() and worker.isRunning():
+                    continue
+                del active[idx]
+                platform_running[slot["platform"]] = max(0, platform_running.get(slot["platform"], 1) - 1)
+                success = self._finish_worker(slot)
+                if self._stop_flag:
+                    break
+
+                last_status = str(slot["result"].get("status_code", "") or "")
+                if not success and last_status not in _NON_NETWORK_CODES and not _is_network_available():
+                    # Retry this creator first once the network is back
+                    pending.insert(0, idx)
+                    network_lost = True
+                    continue
+
+                self._completed.add(str(self._queue[idx]))
+                while (
+                    self._current_index < total
+                    and str(self._queue[self._current_index]) in self._completed
+                ):
+                    self._current_index += 1
+                self.creator_finished.emit(slot["folder"].name, success, dict(slot["result"] or {}))
+                self._save_state()
+
+            if self._stop_flag:
+                break
+            if network_lost:
+                _network_down("Queue: Network lost during download — waiting...")
+
+            # ── Pause: stop dispatching, let in-flight workers park ───────
+            with self._pause_lock:
+                should_pause = self._pause_flag
+            if should_pause:
+                if not pause_announced:
+                    pause_announced = True
+                    self._save_state()
+                    self.paused.emit()
+                    self.queue_progress.emit(
+                        f"Queue: Paused — {len(self._completed)}/{total} done, {len(active)} in flight"
+                    )
+                if not active:
+                    self._resume_event.wait()   # block until resume()
+                else:
+                    time.sleep(0.25)
+                continue
+            pause_announced = False
+
+            # ── Dispatch new creators into free slots ─────────────────────
+            if pending and len(active) < limits.max_parallel and time.monotonic() >= next_launch_at:
+                launch_pos = None
+                for pos, idx in enumerate(pending):
+                    platform = _platform_of(idx)
+                    if platform_running.get(platform, 0) < limits.platform_limit(platform):
+                        launch_pos = pos
+                        break
+
+                if launch_pos is not None and not _network_ready():
+                    launch_pos = None
+                elif launch_pos is not None and not _is_network_available():
+                    _network_down("Queue: Network unavailable — waiting for reconnection...")
+                    launch_pos = None
+
+                if launch_pos is not None:
+                    idx = pending.pop(launch_pos)
+                    folder = self._queue[idx]
+                    platform = _platform_of(idx)
+                    self.creator_started.emit(folder.name)
+                    slot = self._launch_worker(folder)
+                    slot["platform"] = platform
+                    active[idx] = slot
+                    platform_running[platform] = platform_running.get(platform, 0) + 1
+                    self._save_state()
+
+                    running = ", ".join(_creator_display_name(s["folder"].name) for s in active.values())
+                    self.queue_progress.emit(
+                        f"Queue: {len(self._completed)}/{total} done — running {len(active)}: {running}"
+                    )
+
+                    # Stagger launches (1-4s) so platforms never see a burst
+                    if pending:
+                        delay = random.uniform(1.0, 4.0) * delay_multiplier
+                        next_launch_at = time.monotonic() + delay
+                    continue
+
+            time.sleep(0.25)
+
+        if self._stop_flag:
+            for slot in active.values():
+                if slot["worker"] is not None:
+                    slot["worker"].stop()
+            for slot in active.values():
+                self._finish_worker(slot)
 
     def _run_one(self, folder: Path) -> bool:
         """
@@ -341,9 +536,34 @@ class CreatorQueueManager(QThread):
         Blocks until the worker finishes or is stopped.
         Returns True on success.
         """
+        slot = self._launch_worker(folder)
+        worker = slot["worker"]
+        if worker is not None:
+            # Wait for worker to finish (blocking, with stop checks).
+            while not slot["done"].wait(0.25):
+                if self._stop_flag or (not worker.isRunning()):
+                    # Worker died or we stopped — either way, don't hang the queue.
+                    break
+        return self._finish_worker(slot)
+
+    def _launch_worker(self, folder: Path) -> dict:
+        """
+        Create, wire and start a CreatorDownloadWorker for one creator folder.
+
+        Returns a slot dict consumed by _finish_worker(). When the creator has
+        no URL the slot carries a ready-made failure result and no worker.
+        """
         from .config_manager import CreatorConfig
 
-        self._last_result = {}
+        slot = {
+            "folder": folder,
+            "worker": None,
+            "done": threading.Event(),
+            "result_holder": [{"success": False}],
+            "connections": [],
+            "result": {},
+            "platform": "",
+        }
         config = CreatorConfig(folder)
         creator_url = (config.creator_url or "").strip()
 
@@ -353,22 +573,24 @@ class CreatorQueueManager(QThread):
 
         if not creator_url:
             self.queue_progress.emit(f"Skipped {folder.name}: no URL configured")
-            self._last_result = {
+            slot["result_holder"][0] = {
                 "success": False,
                 "status_code": "no_url_configured",
                 "error": "No creator URL configured",
             }
-            return False
+            slot["done"].set()
+            return slot
+
+        result_holder = slot["result_holder"]
+        done_event = slot["done"]
 
-        self._worker_done_event.clear()
-        result_holder = [{"success": False}]
-        
         # Local state for combined status display
         status_state = {"msg": "", "speed": "", "eta": ""}
         creator_display = _creator_display_name(folder.name)
 
-        worker = CreatorDownloadWorker(folder, creator_url)
-        self._current_worker = worker
+        worker = CreatorDownloadWorker(folder, creator_url, resource_gate=self._gate)
+        slot["worker"] = worker
+        self._active_workers[folder.name] = worker
 
         # Forward pause/resume to worker
         if self._pause_flag:
@@ -407,47 +629,51 @@ class CreatorQueueManager(QThread):
 
         def _on_finished(res: dict):
             result_holder[0] = res
-            self._worker_done_event.set()
+            done_event.set()
 
         def _on_pct(pct: int):
             self.creator_progress_pct.emit(folder.name, pct)
 
-        worker.progress.connect(_on_progress)
-        worker.download_speed.connect(_on_speed)
-        worker.eta.connect(_on_eta)
-        worker.progress_percent.connect(_on_pct)
-        worker.finished.connect(_on_finished)
-        worker.paused.connect(self._on_worker_paused)
+        slot["connections"] = [
+            (worker.progress,         _on_progress),
+            (worker.download_speed,   _on_speed),
+            (worker.eta,              _on_eta),
+            (worker.progress_percent, _on_pct),
+            (worker.finished,         _on_finished),
+            (worker.paused,           self._on_worker_paused),
+        ]
+        for sig, handler in slot["connections"]:
+            sig.connect(handler)
         worker.start()
+        return slot
 
-        # Wait for worker to finish (blocking, with stop checks).
-        while not self._worker_done_event.wait(0.25):
-            if self._stop_flag or (not worker.isRunning()):
-                # Worker died or we stopped — either way, don't hang the queue.
-                break
+    def _finish_worker(self, slot: dict) -> bool:
+        """Collect a worker's result, disconnect it and apply anti-spam pacing."""
+        folder = slot["folder"]
+        worker = slot["worker"]
+        result_holder = slot["result_holder"]
 
-        # Ensure worker thread is fully done
-        worker.wait(3000)
+        if worker is not None:
+            # Ensure worker thread is fully done
+            worker.wait(3000)
 
-        # Read result directly from worker attribute (avoids cross-thread signal issues)
-        final_result = getattr(worker, '_result', None) or result_holder[0]
-        result_holder[0] = final_result
-        self._last_result = dict(final_result or {})
+            # Read result directly from worker attribute (avoids cross-thread signal issues)
+            final_result = getattr(worker, '_result', None) or result_holder[0]
+            result_holder[0] = final_result
 
-        # Cleanup — disconnect ALL connected signals to prevent memory leaks
-        for sig, slot in [
-            (worker.progress,        _on_progress),
-            (worker.download_speed,  _on_speed),
-            (worker.eta,             _on_eta),
-            (worker.progress_percent, _on_pct),
-            (worker.finished,        _on_finished),
-            (worker.paused,          self._on_worker_paused),
-        ]:
-            try:
-                sig.disconnect(slot)
-            except Exception:
-                pass
-        self._current_worker = None
+            # Cleanup — disconnect ALL connected signals to prevent memory leaks
+            for sig, handler in slot["connections"]:
+                try:
+                    sig.disconnect(handler)
+                except Exception:
+                    pass
+            if self._active_workers.get(folder.name) is worker:
+                del self._active_workers[folder.name]
+
+        slot["result"] = dict(result_holder[0] or {})
+        self._last_result = dict(slot["result"])
+        if worker is None:
+            return False
 
         # Track total videos downloaded across entire queue for anti-spam
         downloaded_count = int(result_holder[0].get("downloaded", 0) or 0)
@@ -455,7 +681,7 @@ class CreatorQueueManager(QThread):
         self._total_videos_downloaded += downloaded_count
 
         # Anti-spam: extra delay every 20 videos (3-7s)
-        if downloaded_count > 0:
+        if downloaded_count > 0 and not self._stop_flag:
             crossed_20 = (prev_total // 20) != (self._total_videos_downloaded // 20)
             if crossed_20:
                 delay = random.uniform(3.0, 7.0) * get_delay_multiplier()
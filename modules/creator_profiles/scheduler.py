@@ -0,0 +1,151 @@
+"""
+modules/creator_profiles/scheduler.py
+Concurrency caps for running several creator workers at once.
+
+Two kinds of caps:
+- platform caps: how many creators of one platform may run at the same time
+  (enforced by CreatorQueueManager when it dispatches the next creator)
+- resource caps: how many workers may be inside a given stage at the same
+  time — browser-bound link grabbing, yt-dlp downloads, ffmpeg
+  post-processing (enforced by CreatorDownloadWorker around each stage)
+
+max_parallel_creators = 1 keeps the classic one-creator-at-a-time queue.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_LINK_GRAB = "link_grab"
+RESOURCE_DOWNLOAD = "download"
+RESOURCE_POSTPROCESS = "postprocess"
+
+_DEFAULT_PLATFORM_LIMITS = {
+    "youtube": 4,
+    "tiktok": 2,
+    "instagram": 2,
+    "facebook": 2,
+    "twitter": 2,
+}
+_DEFAULT_PLATFORM_LIMIT = 2   # platforms without an explicit entry
+
+_DEFAULT_RESOURCE_LIMITS = {
+    RESOURCE_LINK_GRAB: 1,     # one managed Chrome — keep browser work serialized
+    RESOURCE_DOWNLOAD: 4,
+    RESOURCE_POSTPROCESS: 2,   # libx264 already uses every core per encode
+}
+
+_MAX_PARALLEL_CAP = 16
+
+
+class SlotCancelled(Exception):
+    """Raised by ResourceGate.slot when cancel_event fires before a slot frees up."""
+
+
+def _clamp_int(value, default: int, low: int = 1, high: int = _MAX_PARALLEL_CAP) -> int:
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        number = default
+    return max(low, min(high, number))
+
+
+@dataclass
+class SchedulerLimits:
+    """Resolved concurrency caps for one queue run."""
+    max_parallel: int = 1
+    platform_limits: Dict[str, int] = field(default_factory=lambda: dict(_DEFAULT_PLATFORM_LIMITS))
+    resource_limits: Dict[str, int] = field(default_factory=lambda: dict(_DEFAULT_RESOURCE_LIMITS))
+
+    @property
+    def concurrent(self) -> bool:
+        return self.max_parallel > 1
+
+    def platform_limit(self, platform: str) -> int:
+        key = str(platform or "").strip().lower()
+        return int(self.platform_limits.get(key, _DEFAULT_PLATFORM_LIMIT))
+
+
+def load_scheduler_limits() -> SchedulerLimits:
+    """
+    Read caps from ConfigManager 'creator_queue' section.
+
+    Missing or invalid values fall back to the module defaults, so an old
+    config.json keeps the sequential queue.
+    """
+    section = {}
+    try:
+        from modules.config.config_manager import ConfigManager
+        section = ConfigManager().get("creator_queue", {}) or {}
+    except Exception as exc:
+        logger.debug("[Scheduler] config unavailable, using defaults: %s", exc)
+
+    limits = SchedulerLimits(
+        max_parallel=_clamp_int(section.get("max_parallel_creators", 1), 1),
+    )
+    for key, value in (section.get("platform_limits") or {}).items():
+        limits.platform_limits[str(key).strip().lower()] = _clamp_int(value, _DEFAULT_PLATFORM_LIMIT)
+    for key, value in (section.get("resource_limits") or {}).items():
+        default = _DEFAULT_RESOURCE_LIMITS.get(key, 1)
+        limits.resource_limits[str(key).strip().lower()] = _clamp_int(value, default)
+    return limits
+
+
+class ResourceGate:
+    """
+    Per-resource-class semaphores shared by every worker of one queue run.
+
+    Waiting is interruptible: when cancel_event is set the wait ends with
+    SlotCancelled instead of entering the stage, so Stop never deadlocks
+    behind a busy stage and no stage runs past its cap.
+    """
+
+    def __init__(self, resource_limits: Optional[Dict[str, int]] = None):
+        limits = dict(_DEFAULT_RESOURCE_LIMITS)
+        limits.update(resource_limits or {})
+        self._limits = {key: max(1, int(value)) for key, value in limits.items()}
+        self._semaphores = {
+            key: threading.BoundedSemaphore(value) for key, value in self._limits.items()
+        }
+        self._lock = threading.Lock()
+        self._in_use: Dict[str, int] = {key: 0 for key in self._limits}
+
+    def limit(self, resource: str) -> int:
+        return self._limits.get(resource, 0)
+
+    def in_use(self, resource: str) -> int:
+        with self._lock:
+            return self._in_use.get(resource, 0)
+
+    @contextmanager
+    def slot(
+        self,
+        resource: str,
+        cancel_event: Optional[threading.Event] = None,
+        on_wait: Optional[Callable[[str], None]] = None,
+    ):
+        sem = self._semaphores.get(resource)
+        if sem is None:
+            yield
+            return
+
+        acquired = sem.acquire(blocking=False)
+        if not acquired and on_wait:
+            on_wait(f"Waiting for free {resource.replace('_', ' ')} slot ({self._limits[resource]} max)...")
+        while not acquired:
+            if cancel_event is not None and cancel_event.is_set():
+                raise SlotCancelled(f"{resource} slot wait cancelled")
+            acquired = sem.acquire(timeout=0.5)
+
+        with self._lock:
+            self._in_use[resource] += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_use[resource] -= 1
+            sem.release()
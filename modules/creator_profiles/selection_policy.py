@@ -111,6 +111,10 @@ def select_videos(
 ) -> Tuple[List[dict], List[dict]]:
     """Select videos according to user preferences.
 
+    already_downloaded is a set of video ids, or any object with a
+    known(values, platform) bulk lookup (the shared downloaded store);
+    the latter also matches entries by canonical URL.
+
     Returns:
         (selected, debug_log)
         - selected: final entries for downloader (len <= n_videos)
@@ -188,7 +192,16 @@ def select_videos(
     # Remove already-downloaded if skip enabled
     if skip_downloaded:
         before = len(pool)
-        pool = [e for e in pool if e["id"] not in already_downloaded]
+        bulk_lookup = getattr(already_downloaded, "known", None)
+        if bulk_lookup is not None:
+            # Indexed store: one bulk query for every id and canonical URL
+            known = bulk_lookup(
+                [e["id"] for e in pool if e["id"]] + [e["url"] for e in pool],
+                platform_hint,
+            )
+            pool = [e for e in pool if e["id"] not in known and e["url"] not in known]
+        else:
+            pool = [e for e in pool if e["id"] not in already_downloaded]
         skipped = before - len(pool)
         if skipped:
             debug.append({"action": "skip_downloaded", "count": skipped})
@@ -664,6 +664,43 @@ def apply_hq_cleanup(
     
     return None
 
+# --- Studio Quality Bypass Logic (Enhanced) ---
+# 1. Subtle Visual Change (1.1% zoom + brightness/contrast tweak)
+# 2. Metadata Scrubbing + Decoy (Adobe After Effects)
+# 3. Audio Fingerprint Break (0.1% speed shift)
+# 4. Upscaling + Grain: Break pixel-perfect matching even further
+# Shared with postprocess_planner so the fused single pass applies the
+# exact same treatment.
+_FACEBOOK_BYPASS_VIDEO_FILTERS = (
+    "scale=iw*1.011:-1:flags=lanczos,crop=iw/1.011:ih/1.011", # Zoom + HQ Scale
+    "scale=w='if(gt(iw,ih),1920,-2)':h='if(gt(iw,ih),-2,1920)':flags=lanczos", # Upscale to 1080p if smaller
+    "eq=brightness=0.01:contrast=1.01:saturation=1.02", # Subtle color shift
+    "noise=alls=1:allf=t", # Add very subtle moving grain
+    "setsar=1",
+    "format=yuv420p",
+)
+
+_FACEBOOK_BYPASS_AUDIO_FILTERS = (
+    "atempo=1.001",
+    "aresample=44100",
+)
+
+_FACEBOOK_BYPASS_VIDEO_ARGS = (
+    "-r", "30",            # Normalize frame rate to 30fps
+    "-c:v", "libx264",
+    "-preset", "slow",     # Slower encoding = better quality, avoids 'blur' artifacts
+    "-crf", "18",          # Visually lossless
+    "-tune", "film",
+)
+
+_FACEBOOK_BYPASS_METADATA_ARGS = (
+    "-map_metadata", "-1", # Strip all original metadata
+    "-metadata", "title=",
+    "-metadata", "comment=Processed for High Fidelity",
+    "-metadata", "encoder=Adobe After Effects 2026 (Windows)", # Pro Decoy
+)
+
+
 def apply_facebook_bypass(
     input_path: Path,
     output_folder: Path,
@@ -681,40 +718,13 @@ def apply_facebook_bypass(
     output_path = output_folder / f"{input_path.stem}_hq{input_path.suffix or '.mp4'}"
     flags = _creationflags()
 
-    # --- Studio Quality Bypass Logic (Enhanced) ---
-    # 1. Subtle Visual Change (1.1% zoom + brightness/contrast tweak)
-    # 2. Metadata Scrubbing + Decoy (Adobe After Effects)
-    # 3. Audio Fingerprint Break (0.1% speed shift)
-    # 4. Upscaling + Grain: Break pixel-perfect matching even further
-    
-    video_filters = [
-        "scale=iw*1.011:-1:flags=lanczos,crop=iw/1.011:ih/1.011", # Zoom + HQ Scale
-        "scale=w='if(gt(iw,ih),1920,-2)':h='if(gt(iw,ih),-2,1920)':flags=lanczos", # Upscale to 1080p if smaller
-        "eq=brightness=0.01:contrast=1.01:saturation=1.02", # Subtle color shift
-        "noise=alls=1:allf=t", # Add very subtle moving grain
-        "setsar=1",
-        "format=yuv420p"
-    ]
-    
-    audio_filters = [
-        "atempo=1.001",
-        "aresample=44100"
-    ]
-
     cmd = [
         ffmpeg, "-hide_banner", "-loglevel", "error", "-y",
         "-i", str(input_path),
-        "-vf", ",".join(video_filters),
-        "-af", ",".join(audio_filters),
-        "-r", "30",            # Normalize frame rate to 30fps
-        "-c:v", "libx264",
-        "-preset", "slow",     # Slower encoding = better quality, avoids 'blur' artifacts
-        "-crf", "18",          # Visually lossless
-        "-tune", "film",
-        "-map_metadata", "-1", # Strip all original metadata
-        "-metadata", "title=",
-        "-metadata", "comment=Processed for High Fidelity",
-        "-metadata", "encoder=Adobe After Effects 2026 (Windows)", # Pro Decoy
+        "-vf", ",".join(_FACEBOOK_BYPASS_VIDEO_FILTERS),
+        "-af", ",".join(_FACEBOOK_BYPASS_AUDIO_FILTERS),
+        *_FACEBOOK_BYPASS_VIDEO_ARGS,
+        *_FACEBOOK_BYPASS_METADATA_ARGS,
         "-movflags", "+faststart",
         str(output_path)
     ]
@@ -13,6 +13,7 @@ import os
 import shutil
 import subprocess
 import tempfile
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Dict, List, Optional
 
@@ -536,26 +537,47 @@ def _render_text_overlay_image(
     return image.save(str(output_path), "PNG")
 
 
-def apply_watermark(
+@dataclass
+class WatermarkLayers:
+    """Overlay filters + extra inputs for one watermark pass."""
+    input_args: List[str]
+    filter_parts: List[str]
+    output_label: str
+    temp_files: List[Path] = field(default_factory=list)
+    # True when a layer moves over time (AnimateAround) or loops a clip.
+    # Such layers depend on the clip's own timeline and must be drawn per part.
+    animated: bool = False
+
+    def cleanup(self) -> None:
+        for temp_path in self.temp_files:
+            try:
+                temp_path.unlink(missing_ok=True)
+            except Exception:
+                pass
+
+
+def build_watermark_layers(
     input_path: Path,
-    output_path: Path,
     creator_folder: Path,
     wm_text_cfg: Dict,
     wm_logo_cfg: Dict,
     wm_avatar_cfg: Dict,
     ffmpeg: str = None,
     progress_cb: Callable[[str], None] = None,
-) -> bool:
+    base_label: str = "[0:v]",
+    first_input_index: int = 1,
+) -> Optional[WatermarkLayers]:
     """
-    Apply text and/or logo watermark to a video using ffmpeg.
+    Build the watermark overlay part of an ffmpeg filtergraph.
 
-    Returns True on success, False on failure.
+    The returned layers read video from base_label and expect their extra
+    inputs to start at first_input_index, so callers can splice them into a
+    larger graph. Returns None when no layer is enabled.
     """
     if ffmpeg is None:
         ffmpeg = _ffmpeg_path()
 
     input_path = Path(input_path)
-    output_path = Path(output_path)
     media_duration_sec = _probe_duration_sec(input_path, ffmpeg) or _ANIMATE_CYCLE_SEC_DEFAULT
     temp_overlay_files: List[Path] = []
 
@@ -569,12 +591,7 @@ def apply_watermark(
     avatar_enabled = bool(wm_avatar_cfg.get("enabled", False)) if explicit_layer_selection else False
 
     if not text_enabled and not logo_enabled and not avatar_enabled:
-        # Nothing to do — copy as-is
-        try:
-            shutil.copy2(str(input_path), str(output_path))
-            return True
-        except Exception:
-            return False
+        return None
 
     # ── Resolve logo path ──────────────────────────────────────────────────
     logo_path: Optional[str] = None
@@ -632,8 +649,8 @@ def apply_watermark(
                 progress_cb(f"    WaterMark: text overlay prep failed ({e})")
 
     # ── Build ffmpeg filter chain ──────────────────────────────────────────
-    inputs: List[str] = ["-i", str(input_path)]
-    next_input_index = 1
+    inputs: List[str] = []
+    next_input_index = first_input_index
     avatar_input_index: Optional[int] = None
     if avatar_enabled and avatar_path:
         avatar_input_index = next_input_index
@@ -655,7 +672,7 @@ def apply_watermark(
         logo_input_index = None
 
     filter_parts: List[str] = []
-    last_label = "[0:v]"
+    last_label = base_label
 
     if avatar_enabled and avatar_path and avatar_input_index is not None:
         avatar_opacity = int(wm_avatar_cfg.get("opacity") or 80)
@@ -865,6 +882,66 @@ def apply_watermark(
         )
         last_label = out_label
 
+    animated = (
+        (text_enabled and (wm_text_cfg.get("position") or "") == "AnimateAround")
+        or (logo_enabled and bool(logo_path) and (wm_logo_cfg.get("position") or "") == "AnimateAround")
+        or (
+            avatar_enabled
+            and bool(avatar_path)
+            and ((wm_avatar_cfg.get("position") or "") == "AnimateAround" or avatar_kind == "video")
+        )
+    )
+    return WatermarkLayers(
+        input_args=inputs,
+        filter_parts=filter_parts,
+        output_label=last_label,
+        temp_files=temp_overlay_files,
+        animated=bool(animated),
+    )
+
+
+def apply_watermark(
+    input_path: Path,
+    output_path: Path,
+    creator_folder: Path,
+    wm_text_cfg: Dict,
+    wm_logo_cfg: Dict,
+    wm_avatar_cfg: Dict,
+    ffmpeg: str = None,
+    progress_cb: Callable[[str], None] = None,
+) -> bool:
+    """
+    Apply text and/or logo watermark to a video using ffmpeg.
+
+    Returns True on success, False on failure.
+    """
+    if ffmpeg is None:
+        ffmpeg = _ffmpeg_path()
+
+    input_path = Path(input_path)
+    output_path = Path(output_path)
+    layers = build_watermark_layers(
+        input_path=input_path,
+        creator_folder=creator_folder,
+        wm_text_cfg=wm_text_cfg,
+        wm_logo_cfg=wm_logo_cfg,
+        wm_avatar_cfg=wm_avatar_cfg,
+        ffmpeg=ffmpeg,
+        progress_cb=progress_cb,
+    )
+
+    if layers is None:
+        # Nothing to do — copy as-is
+        try:
+            shutil.copy2(str(input_path), str(output_path))
+            return True
+        except Exception:
+            return False
+
+    inputs: List[str] = ["-i", str(input_path)] + layers.input_args
+    filter_parts = layers.filter_parts
+    last_label = layers.output_label
+
     # ── Build full command ─────────────────────────────────────────────────
     filter_str = ";".join(filter_parts)
 
@@ -900,11 +977,7 @@ def apply_watermark(
         if progress_cb:
             progress_cb(f"    WaterMark: exception: {e}")
     finally:
-        for temp_path in temp_overlay_files:
-            try:
-                temp_path.unlink(missing_ok=True)
-            except Exception:
-                pass
+        layers.cleanup()
     return ok
 
 
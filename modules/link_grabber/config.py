@@ -63,6 +63,12 @@ RATE_LIMITS = {
     'default': 3,      # Default for other platforms
 }
 
+# Bulk grabbing: URLs of different platforms are extracted in parallel.
+BULK_GRAB_CONFIG = {
+    'max_workers': 3,             # Extractions running at once (1 = sequential)
+    'per_platform_workers': 1,    # Extractions of the same platform at once
+}
+
 # ============================================================================
 # RETRY SETTINGS
 # ============================================================================
@@ -82,8 +88,6 @@ DELAY_CONFIG = {
     # General delays (applied to all platforms unless overridden)
     'before_request_min': 1.5,   # Minimum delay before request (seconds)
     'before_request_max': 4.0,   # Maximum delay before request (seconds)
-    'after_fail_min': 5,         # Minimum delay after failed attempt
-    'after_fail_max': 10,        # Maximum delay after failed attempt
 
     # Platform-specific delay ranges (for stricter platforms)
     'platform_delays': {
@@ -94,14 +98,36 @@ DELAY_CONFIG = {
         'twitter': (1.5, 4.0),      # Twitter/X moderate detection
     },
 
-    # Human-like pause patterns (simulate reading/thinking)
-    'human_patterns': {
-        'short_pause': (0.5, 1.5),  # Quick glance
-        'medium_pause': (2.0, 4.0), # Reading content
-        'long_pause': (5.0, 8.0),   # Thinking/decision making
-    }
+    # Requests allowed back to back after an idle period
+    'platform_burst': {
+        'youtube': 2,
+    },
+
+    # Share of each delay range added as a random wait after a token
+    'jitter_fraction': 0.25,
 }
 
+
+def _token_bucket_limits(delays: dict) -> dict:
+    """Turn the delay ranges into token bucket specs (see throttle.py)."""
+    ranges = dict(delays['platform_delays'])
+    ranges['default'] = (delays['before_request_min'], delays['before_request_max'])
+    limits = {}
+    for platform, (low, high) in ranges.items():
+        limits[platform] = {
+            'rate': 2.0 / (low + high),                          # one request per mean delay
+            'burst': delays['platform_burst'].get(platform, 1),
+            'jitter': (high - low) * delays['jitter_fraction'],  # max extra seconds
+        }
+    return limits
+
+
+# Token buckets shared by all link-grab threads (see throttle.py).
+# rate   = requests per second the bucket refills
+# burst  = requests allowed back to back after an idle period
+# jitter = upper bound of the random wait added once a token is handed out
+TOKEN_BUCKET_LIMITS = _token_bucket_limits(DELAY_CONFIG)
+
 # ============================================================================
 # PROXY SETTINGS
 # ============================================================================
@@ -193,6 +219,26 @@ EXTRACTION_CONFIG = {
     'exhaustive_mode_default': False,
 }
 
+# ============================================================================
+# METHOD RACING (parallel cheap methods, see racing.py)
+# ============================================================================
+
+METHOD_RACE_CONFIG = {
+    'enabled': True,          # Race cheap HTTP/yt-dlp methods instead of trying them one by one
+    'top_k': 3,               # How many methods start at once
+    'timeout': 240,           # Max seconds to wait for racers before moving on
+}
+
+# ============================================================================
+# INCREMENTAL EXTRACTION (per-creator cursor, see cursor.py)
+# ============================================================================
+
+INCREMENTAL_CONFIG = {
+    'enabled': True,              # Stop listing profiles at already-known links
+    'full_resync_hours': 168,     # Re-list the whole profile once a week
+    'stop_window': 20,            # Newest known links that end a delta scan
+}
+
 # ============================================================================
 # CHROMIUM BROWSER AUTH CONFIGURATION
 # ============================================================================
@@ -300,6 +346,78 @@ def get_exhaustive_mode() -> bool:
     except Exception:
         return default_value
 
+
+def get_method_race_config() -> dict:
+    """
+    Resolve method racing settings.
+
+    ConfigManager keys link_grabber.race_methods / link_grabber.race_top_k
+    override METHOD_RACE_CONFIG.
+    """
+    resolved = dict(METHOD_RACE_CONFIG)
+    try:
+        from modules.config.config_manager import ConfigManager
+        manager = ConfigManager()
+        resolved['enabled'] = bool(manager.get('link_grabber.race_methods', resolved['enabled']))
+        resolved['top_k'] = manager.get('link_grabber.race_top_k', resolved['top_k'])
+    except Exception:
+        pass
+    try:
+        resolved['top_k'] = max(1, int(resolved['top_k']))
+    except (TypeError, ValueError):
+        resolved['top_k'] = METHOD_RACE_CONFIG['top_k']
+    return resolved
+
+
+def get_incremental_config() -> dict:
+    """
+    Resolve incremental extraction settings.
+
+    ConfigManager keys link_grabber.incremental /
+    link_grabber.full_resync_hours override INCREMENTAL_CONFIG.
+    """
+    resolved = dict(INCREMENTAL_CONFIG)
+    try:
+        from modules.config.config_manager import ConfigManager
+        manager = ConfigManager()
+        resolved['enabled'] = bool(manager.get('link_grabber.incremental', resolved['enabled']))
+        resolved['full_resync_hours'] = manager.get(
+            'link_grabber.full_resync_hours', resolved['full_resync_hours']
+        )
+    except Exception:
+        pass
+    try:
+        resolved['full_resync_hours'] = max(0.0, float(resolved['full_resync_hours']))
+    except (TypeError, ValueError):
+        resolved['full_resync_hours'] = INCREMENTAL_CONFIG['full_resync_hours']
+    return resolved
+
+
+def get_bulk_grab_config() -> dict:
+    """
+    Resolve bulk grabbing concurrency.
+
+    ConfigManager keys link_grabber.bulk_workers /
+    link_grabber.bulk_per_platform_workers override BULK_GRAB_CONFIG.
+    """
+    resolved = dict(BULK_GRAB_CONFIG)
+    try:
+        from modules.config.config_manager import ConfigManager
+        manager = ConfigManager()
+        resolved['max_workers'] = manager.get('link_grabber.bulk_workers', resolved['max_workers'])
+        resolved['per_platform_workers'] = manager.get(
+            'link_grabber.bulk_per_platform_workers', resolved['per_platform_workers']
+        )
+    except Exception:
+        pass
+    for key in ('max_workers', 'per_platform_workers'):
+        try:
+            resolved[key] = max(1, int(resolved[key]))
+        except (TypeError, ValueError):
+            resolved[key] = BULK_GRAB_CONFIG[key]
+    return resolved
+
+
 def get_rate_limit(platform: str) -> int:
     """
     Get rate limit for a specific platform
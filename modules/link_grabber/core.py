@@ -22,6 +22,9 @@ import typing
 import json
 import logging
 import random
+import contextlib
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from urllib.parse import urlparse, parse_qs
 
@@ -33,6 +36,17 @@ except ImportError:
     def get_learning_system():
         return None
 
+from .racing import (
+    BROWSER_METHOD_IDS,
+    browser_lease,
+    pick_racers,
+    race_cancelled,
+    race_methods,
+    run_cancellable,
+)
+from .cursor import DeltaScan, get_cursor_store
+from modules.shared.ytdlp_pool import YtdlpJobError, YtdlpPoolUnavailable, get_ytdlp_pool
+
 try:
     from .browser_auth import ChromiumAuthManager
     from .content_filter import ContentFilter
@@ -1718,7 +1732,10 @@ def _apply_rate_limit(platform_key: str, custom_delay: float = None):
     """
     ENHANCED: Apply intelligent rate limit delay based on platform
 
-    Uses platform-specific delays to mimic human behavior and avoid detection.
+    Takes a token from the platform's shared bucket (TOKEN_BUCKET_LIMITS,
+    derived from DELAY_CONFIG), so concurrent extractions share one
+    politeness budget per platform; each token comes with a small random
+    wait so requests do not follow an exact beat.
 
     Args:
         platform_key: Platform name (youtube, instagram, etc.)
@@ -1729,27 +1746,11 @@ def _apply_rate_limit(platform_key: str, custom_delay: float = None):
             time.sleep(custom_delay)
             return
 
-        from .config import DELAY_CONFIG
-        import random
-
-        # ENHANCED: Use platform-specific delays if available
-        platform_delays = DELAY_CONFIG.get('platform_delays', {})
-
-        if platform_key in platform_delays:
-            # Platform-specific delay range
-            min_delay, max_delay = platform_delays[platform_key]
-            logging.debug(f"Using platform-specific delay for {platform_key}: {min_delay}-{max_delay}s")
-        else:
-            # General delay range
-            min_delay = DELAY_CONFIG['before_request_min']
-            max_delay = DELAY_CONFIG['before_request_max']
-            logging.debug(f"Using general delay for {platform_key}: {min_delay}-{max_delay}s")
-
-        # Add random jitter (human-like behavior)
-        delay = random.uniform(min_delay, max_delay)
+        from .throttle import get_platform_limiter
 
-        logging.debug(f"Ã¢ÂÂ±Ã¯Â¸Â Rate limit: waiting {delay:.2f}s for {platform_key}")
-        time.sleep(delay)
+        waited = get_platform_limiter().acquire(platform_key)
+        if waited > 0:
+            logging.debug(f"Rate limit: waited {waited:.2f}s for {platform_key}")
 
     except Exception as e:
         # Fallback: 2-3 second delay
@@ -1821,7 +1822,13 @@ class _YTDLPQuietLogger:
         logging.warning("yt-dlp: %s", text)
 
 
-def _execute_ytdlp_dual(url: str, options: dict, proxy: str = None, user_agent: str = None) -> typing.List[dict]:
+def _execute_ytdlp_dual(
+    url: str,
+    options: dict,
+    proxy: str = None,
+    user_agent: str = None,
+    delta: DeltaScan = None,
+) -> typing.List[dict]:
     """
     DUAL YT-DLP APPROACH: Try Python API first, fallback to binary
 
@@ -1830,11 +1837,13 @@ def _execute_ytdlp_dual(url: str, options: dict, proxy: str = None, user_agent:
         options: yt-dlp options dict
         proxy: Proxy string (optional)
         user_agent: User agent string (optional)
+        delta: Incremental stop window; listing stops at the first known entry
 
     Returns:
         List of extracted entries with url, title, date
     """
     entries = []
+    collected = []
 
     # Add proxy and user agent to options
     if proxy:
@@ -1850,39 +1859,75 @@ def _execute_ytdlp_dual(url: str, options: dict, proxy: str = None, user_agent:
         if skip_python_api:
             raise RuntimeError("skip_python_api_for_browser_cookies")
 
-        import yt_dlp
-
         logging.debug("Trying yt-dlp Python API...")
 
         python_api_options = dict(options)
-        python_api_options['logger'] = _YTDLPQuietLogger()
-
-        with yt_dlp.YoutubeDL(python_api_options) as ydl:
-            info = ydl.extract_info(url, download=False)
-
-            if info:
-                # Handle playlist
-                if 'entries' in info:
-                    for entry in info['entries']:
-                        if entry:
-                            entries.append({
-                                'url': entry.get('webpage_url') or entry.get('url', ''),
-                                'title': entry.get('title', 'Untitled')[:100],
-                                'date': entry.get('upload_date', '00000000')
-                            })
-                # Handle single video
-                else:
-                    entries.append({
-                        'url': info.get('webpage_url') or info.get('url', ''),
-                        'title': info.get('title', 'Untitled')[:100],
-                        'date': info.get('upload_date', '00000000')
-                    })
+        if delta is not None:
+            python_api_options.update(delta.ytdlp_options())
 
-                if entries:
-                    logging.debug(f"Ã¢Å“â€œ Python API success: {len(entries)} links")
-                    return entries
+        info = None
+        pool = get_ytdlp_pool()
+        if pool is not None:
+            # Warm worker: no yt_dlp import or cookie-jar load per call
+            try:
+                info = pool.extract_info(url, python_api_options, should_cancel=race_cancelled)
+            except YtdlpPoolUnavailable:
+                pool = None
+            except YtdlpJobError as job_error:
+                collected.extend(job_error.partial)
+                raise
+
+        if pool is None:
+            import yt_dlp
+
+            python_api_options['logger'] = _YTDLPQuietLogger()
+            if delta is not None:
+                def _collect_entry(info, *args, **kwargs):
+                    # Runs for every listed entry that is not in the archive, so
+                    # entries seen before break_on_existing fires are kept
+                    collected.append(info)
+                    return None
+
+                python_api_options['match_filter'] = _collect_entry
+
+            with yt_dlp.YoutubeDL(python_api_options) as ydl:
+                info = ydl.extract_info(url, download=False)
+
+        if info:
+            # Handle playlist
+            if 'entries' in info:
+                for entry in info['entries']:
+                    if entry:
+                        entries.append({
+                            'url': entry.get('webpage_url') or entry.get('url', ''),
+                            'title': entry.get('title', 'Untitled')[:100],
+                            'date': entry.get('upload_date', '00000000')
+                        })
+            # Handle single video
+            else:
+                entries.append({
+                    'url': info.get('webpage_url') or info.get('url', ''),
+                    'title': info.get('title', 'Untitled')[:100],
+                    'date': info.get('upload_date', '00000000')
+                })
+
+            if entries:
+                logging.debug(f"Ã¢Å“â€œ Python API success: {len(entries)} links")
+                return entries
 
     except Exception as e:
+        if delta is not None and getattr(e, 'error_type', type(e).__name__) == 'ExistingVideoReached':
+            delta.mark_caught_up()
+            for entry in collected:
+                entry_url = entry.get('webpage_url') or entry.get('url')
+                if entry_url and entry.get('_type') != 'playlist':
+                    entries.append({
+                        'url': entry_url,
+                        'title': (entry.get('title') or 'Untitled')[:100],
+                        'date': entry.get('upload_date') or '00000000'
+                    })
+            logging.debug(f"yt-dlp Python API reached known entries after {len(entries)} new links")
+            return entries
         if str(e) == "skip_python_api_for_browser_cookies":
             logging.debug("Skipping yt-dlp Python API because browser-cookie mode is enabled")
         else:
@@ -1893,6 +1938,8 @@ def _execute_ytdlp_dual(url: str, options: dict, proxy: str = None, user_agent:
             logging.warning(f"   User-Agent: {options.get('user_agent', 'Default')[:50]}")
 
     # ===== APPROACH 2: Binary Subprocess (Fallback) =====
+    if race_cancelled():
+        return entries
     try:
         logging.debug("Falling back to yt-dlp binary...")
 
@@ -1921,9 +1968,12 @@ def _execute_ytdlp_dual(url: str, options: dict, proxy: str = None, user_agent:
         if 'playlistend' in options:
             cmd.extend(['--playlist-end', str(options['playlistend'])])
 
+        if delta is not None:
+            cmd.extend(delta.ytdlp_args())
+
         cmd.append(url)
 
-        result = subprocess.run(
+        result = run_cancellable(
             cmd,
             capture_output=True,
             text=True,
@@ -1931,6 +1981,8 @@ def _execute_ytdlp_dual(url: str, options: dict, proxy: str = None, user_agent:
             encoding='utf-8',
             errors='replace'
         )
+        if delta is not None:
+            delta.note_ytdlp_exit(result.returncode)
 
         if result.stdout:
             for line in result.stdout.splitlines():
@@ -1991,7 +2043,8 @@ def _method_ytdlp_primary(
     cookie_browser: str = None,
     proxy: str = None,
     user_agent: str = None,
-    apply_delay: bool = True
+    apply_delay: bool = True,
+    delta: DeltaScan = None,
 ) -> typing.List[dict]:
     """
     ENHANCED YT-DLP METHOD: Uses dual approach (Python API + Binary fallback)
@@ -2037,7 +2090,7 @@ def _method_ytdlp_primary(
             options['extractor_args'] = {'youtube': {'player_client': 'android'}}
 
         # Execute with dual approach
-        entries = _execute_ytdlp_dual(url, options, proxy, user_agent)
+        entries = _execute_ytdlp_dual(url, options, proxy, user_agent, delta=delta)
 
         if entries:
             # Sort by date (newest first)
@@ -2059,7 +2112,7 @@ def _method_ytdlp_primary(
     return []
 
 
-def _method_ytdlp_dump_json(url: str, platform_key: str, cookie_file: str = None, max_videos: int = 0, cookie_browser: str = None, proxy: str = None, user_agent: str = None) -> typing.List[dict]:
+def _method_ytdlp_dump_json(url: str, platform_key: str, cookie_file: str = None, max_videos: int = 0, cookie_browser: str = None, proxy: str = None, user_agent: str = None, delta: DeltaScan = None) -> typing.List[dict]:
     """METHOD 1: yt-dlp --dump-json (WITH DATES) - PRIMARY METHOD + Proxy + Chrome Headers"""
     try:
         cmd = [_get_ytdlp_binary_path(), '--dump-json', '--flat-playlist', '--ignore-errors', '--no-warnings']
@@ -2096,9 +2149,12 @@ def _method_ytdlp_dump_json(url: str, platform_key: str, cookie_file: str = None
         elif platform_key == 'youtube':
             cmd.extend(['--extractor-args', 'youtube:player_client=android'])
 
+        if delta is not None:
+            cmd.extend(delta.ytdlp_args())
+
         cmd.append(url)
 
-        result = subprocess.run(
+        result = run_cancellable(
             cmd,
             capture_output=True,
             text=True,
@@ -2106,6 +2162,8 @@ def _method_ytdlp_dump_json(url: str, platform_key: str, cookie_file: str = None
             encoding='utf-8',
             errors='replace'
         )
+        if delta is not None:
+            delta.note_ytdlp_exit(result.returncode)
 
         if result.stdout:
             entries = []
@@ -2145,7 +2203,7 @@ def _method_ytdlp_dump_json(url: str, platform_key: str, cookie_file: str = None
     return []
 
 
-def _method_ytdlp_get_url(url: str, platform_key: str, cookie_file: str = None, max_videos: int = 0, cookie_browser: str = None, proxy: str = None) -> typing.List[dict]:
+def _method_ytdlp_get_url(url: str, platform_key: str, cookie_file: str = None, max_videos: int = 0, cookie_browser: str = None, proxy: str = None, delta: DeltaScan = None) -> typing.List[dict]:
     """METHOD 2: yt-dlp --get-url (FAST, NO DATES) - SIMPLIFIED + Proxy + Chrome Headers"""
     try:
         # SIMPLE COMMAND like the working batch script: yt-dlp URL --flat-playlist --get-url
@@ -2175,12 +2233,15 @@ def _method_ytdlp_get_url(url: str, platform_key: str, cookie_file: str = None,
             if feed_count > 0:
                 cmd.extend(['--extractor-args', f'instagram:feed_count={feed_count}'])
 
+        if delta is not None:
+            cmd.extend(delta.ytdlp_args())
+
         cmd.append(url)
 
         # DEBUG: Log the exact command being run
         logging.info(f"Running command: {' '.join(cmd)}")
 
-        result = subprocess.run(
+        result = run_cancellable(
             cmd,
             capture_output=True,
             text=True,
@@ -2188,6 +2249,8 @@ def _method_ytdlp_get_url(url: str, platform_key: str, cookie_file: str = None,
             encoding='utf-8',
             errors='replace'
         )
+        if delta is not None:
+            delta.note_ytdlp_exit(result.returncode)
 
         # DEBUG: Log stdout and stderr
         if result.stdout:
@@ -2229,7 +2292,7 @@ def _method_ytdlp_get_url(url: str, platform_key: str, cookie_file: str = None,
     return []
 
 
-def _method_ytdlp_with_retry(url: str, platform_key: str, cookie_file: str = None, max_videos: int = 0, cookie_browser: str = None, proxy: str = None) -> typing.List[dict]:
+def _method_ytdlp_with_retry(url: str, platform_key: str, cookie_file: str = None, max_videos: int = 0, cookie_browser: str = None, proxy: str = None, delta: DeltaScan = None) -> typing.List[dict]:
     """METHOD 3: yt-dlp with retries (PERSISTENT) + Proxy + Chrome Headers"""
     try:
         cmd = [_get_ytdlp_binary_path(), '--dump-json', '--flat-playlist', '--ignore-errors',
@@ -2260,9 +2323,12 @@ def _method_ytdlp_with_retry(url: str, platform_key: str, cookie_file: str = Non
             if feed_count > 0:
                 cmd.extend(['--extractor-args', f'instagram:feed_count={feed_count}'])
 
+        if delta is not None:
+            cmd.extend(delta.ytdlp_args())
+
         cmd.append(url)
 
-        result = subprocess.run(
+        result = run_cancellable(
             cmd,
             capture_output=True,
             text=True,
@@ -2270,6 +2336,8 @@ def _method_ytdlp_with_retry(url: str, platform_key: str, cookie_file: str = Non
             encoding='utf-8',
             errors='replace'
         )
+        if delta is not None:
+            delta.note_ytdlp_exit(result.returncode)
 
         if result.stdout:
             entries = []
@@ -2399,6 +2467,8 @@ def _method_instagram_graphql(
         pagination_added = False
 
         while has_next and cursor:
+            if race_cancelled():
+                break  # Lost the method race
             remaining = max_videos - len(entries) if max_videos > 0 else 50
             batch_size = min(50, remaining) if remaining > 0 else 50
 
@@ -2506,6 +2576,8 @@ def _method_instaloader(url: str, platform_key: str, cookie_file: str = None, ma
         while attempt < max_attempts:
             try:
                 for idx, post in enumerate(profile.get_posts(), 1):
+                    if race_cancelled():
+                        break  # Lost the method race
                     shortcode = getattr(post, 'shortcode', None)
                     if not shortcode or shortcode in seen_shortcodes:
                         continue
@@ -2585,7 +2657,7 @@ def _method_gallery_dl(url: str, platform_key: str, cookie_file: str = None, pro
 
         cmd.append(url)
 
-        result = subprocess.run(
+        result = run_cancellable(
             cmd,
             capture_output=True,
             text=True,
@@ -2629,7 +2701,7 @@ def _method_gallery_dl(url: str, platform_key: str, cookie_file: str = None, pro
     return []
 
 
-def _method_playwright(url: str, platform_key: str, cookie_file: str = None, proxy: str = None, max_videos: int = 0) -> typing.List[dict]:
+def _method_playwright(url: str, platform_key: str, cookie_file: str = None, proxy: str = None, max_videos: int = 0, delta: DeltaScan = None) -> typing.List[dict]:
     """
     METHOD 7: Playwright Browser Automation - ENHANCED WITH STEALTH
 
@@ -2804,6 +2876,8 @@ def _method_playwright(url: str, platform_key: str, cookie_file: str = None, pro
 
                 while no_change_count < 3 and scroll_count < max_scrolls:
                     video_links = page.query_selector_all('a[href*="/video/"]')
+                    if delta is not None and delta.reached_any(link.get_attribute('href') for link in video_links):
+                        break  # Reached links from the last sync
                     current_count = len(video_links)
 
                     if current_count == previous_count:
@@ -2840,6 +2914,8 @@ def _method_playwright(url: str, platform_key: str, cookie_file: str = None, pro
 
                 while no_change_count < 3 and scroll_count < max_scrolls:
                     post_links = page.query_selector_all('a[href*="/p/"], a[href*="/reel/"], a[href*="/tv/"]')
+                    if delta is not None and delta.reached_any(link.get_attribute('href') for link in post_links):
+                        break  # Reached links from the last sync
                     current_count = len(post_links)
 
                     if current_count == previous_count:
@@ -2879,6 +2955,8 @@ def _method_playwright(url: str, platform_key: str, cookie_file: str = None, pro
                     # FIXED: Use same simple selector as Selenium (PROVEN TO WORK!)
                     # Finds: /watch?v= (regular videos) AND /shorts/ (shorts)
                     video_links = page.query_selector_all('a[href*="/watch?v="], a[href*="/shorts/"]')
+                    if delta is not None and delta.reached_any(link.get_attribute('href') for link in video_links):
+                        break  # Reached links from the last sync
                     current_count = len(video_links)
 
                     if current_count == previous_count:
@@ -2929,6 +3007,8 @@ def _method_playwright(url: str, platform_key: str, cookie_file: str = None, pro
                     fb_links = page.query_selector_all(
                         'a[href*="/reel/"], a[href*="/videos/"], a[href*="/watch/"], a[href*="/share/v/"]'
                     )
+                    if delta is not None and delta.reached_any(link.get_attribute('href') for link in fb_links):
+                        break  # Reached links from the last sync
                     current_count = len(fb_links)
 
                     if current_count == previous_count:
@@ -2985,7 +3065,8 @@ def _method_selenium(
     cookie_file: str = None,
     proxy: str = None,
     progress_callback=None,
-    expected_count: int = 0
+    expected_count: int = 0,
+    delta: DeltaScan = None,
 ) -> typing.List[dict]:
     """
     METHOD 8: Selenium Headless (ENHANCED with Proxy + Cookies + Stealth)
@@ -3171,6 +3252,7 @@ def _method_selenium(
         while scroll_attempts < max_scrolls and stagnant_rounds < stagnant_limit:
             links = driver.find_elements(By.CSS_SELECTOR, selector)
             before_count = len(seen_urls)
+            reached_known = False
 
             for link in links:
                 href = link.get_attribute('href')
@@ -3187,6 +3269,8 @@ def _method_selenium(
                     if '/reel/' not in lower_href and '/videos/' not in lower_href and '/watch/' not in lower_href and '/share/v/' not in lower_href:
                         continue
                 seen_urls.add(href)
+                if delta is not None and delta.reached(href):
+                    reached_known = True
                 if target_count and len(seen_urls) >= target_count:
                     break
 
@@ -3195,6 +3279,11 @@ def _method_selenium(
                     progress_callback(f"Selenium: Reached limit of {target_count} items")
                 break
 
+            if reached_known:
+                if progress_callback:
+                    progress_callback(f"Selenium: Reached links from the last sync ({len(seen_urls)} on page)")
+                break
+
             new_links_found = len(seen_urls) - before_count
             try:
                 current_height = driver.execute_script("return document.body.scrollHeight")
@@ -3280,6 +3369,7 @@ def _extract_links_from_selenium_driver(
     max_videos: int = 0,
     expected_count: int = 0,
     progress_callback=None,
+    delta: DeltaScan = None,
 ) -> typing.List[dict]:
     """Shared extractor for selenium drivers (headless/non-headless)."""
     selector_map = {
@@ -3325,6 +3415,7 @@ def _extract_links_from_selenium_driver(
             links = []
 
         before_count = len(seen_urls)
+        reached_known = False
 
         for link in links:
             href = link.get_attribute('href')
@@ -3340,6 +3431,8 @@ def _extract_links_from_selenium_driver(
                 if '/reel/' not in lower_href and '/videos/' not in lower_href and '/watch/' not in lower_href and '/share/v/' not in lower_href:
                     continue
             seen_urls.add(href)
+            if delta is not None and delta.reached(href):
+                reached_known = True
             if target_count and len(seen_urls) >= target_count:
                 break
 
@@ -3348,6 +3441,11 @@ def _extract_links_from_selenium_driver(
                 progress_callback(f"Selenium: Reached limit of {target_count} items")
             break
 
+        if reached_known:
+            if progress_callback:
+                progress_callback(f"Selenium: Reached links from the last sync ({len(seen_urls)} on page)")
+            break
+
         new_links_found = len(seen_urls) - before_count
         try:
             current_height = driver.execute_script("return document.body.scrollHeight")
@@ -3433,6 +3531,7 @@ def _method_selenium_profile(
     cookies_dir: Path,
     max_videos: int = 0,
     progress_callback=None,
+    delta: DeltaScan = None,
 ) -> typing.List[dict]:
     """
     Try to reuse an already logged-in local Chrome profile before manual login fallback.
@@ -3498,6 +3597,7 @@ def _method_selenium_profile(
                     max_videos=max_videos,
                     expected_count=0,
                     progress_callback=progress_callback,
+                    delta=delta,
                 )
                 if entries:
                     saved_cookie = _save_driver_cookies_to_file(driver, cookies_dir, platform_key)
@@ -3628,7 +3728,7 @@ def _method_instagram_mobile_api(
     max_id  = None
 
     for page in range(15):  # max 15 pages Ã— 50 = 750 posts
-        if len(results) >= limit:
+        if len(results) >= limit or race_cancelled():
             break
 
         params: dict = {'count': min(50, limit - len(results))}
@@ -3774,7 +3874,7 @@ def _method_facebook_json(
         ]
 
     for tab_url in tab_urls:
-        if len(results) >= limit:
+        if len(results) >= limit or race_cancelled():
             break
         try:
             r = session.get(tab_url, timeout=20, allow_redirects=True)
@@ -3801,6 +3901,7 @@ def _method_selenium_cdp_attach(
     max_videos: int = 0,
     progress_callback=None,
     expected_count: int = 0,
+    delta: DeltaScan = None,
 ) -> typing.List[dict]:
     """
     Method D: Attach Selenium to the user's running Chrome via CDP debug port.
@@ -3856,6 +3957,7 @@ def _method_selenium_cdp_attach(
             max_videos=max_videos,
             expected_count=expected_count,
             progress_callback=progress_callback,
+            delta=delta,
         )
         if progress_callback and entries:
             progress_callback(f"Method D (CDP attach): {len(entries)} links found")
@@ -4257,7 +4359,7 @@ def extract_links_intelligent(
                 parsed_proxies.append(parsed)
         active_proxy = parsed_proxies[0] if parsed_proxies else None  # Use first proxy if available
         use_enhancements = options.get('use_enhancements', True)  # Enable enhancements by default
-        from .config import get_exhaustive_mode
+        from .config import get_exhaustive_mode, get_incremental_config, get_method_race_config
         exhaustive_mode = force_all_methods or (
             respect_global_exhaustive_mode and get_exhaustive_mode()
         )
@@ -4663,6 +4765,29 @@ def extract_links_intelligent(
                 return [], creator, meta
             return [], creator
 
+        # INCREMENTAL: stop listing the profile at links known from the last run.
+        # The stored links are merged back in below, so callers still see the
+        # full list; only the re-listing work is skipped.
+        extraction_cursor = None
+        delta_scan = None
+        incremental_cfg = get_incremental_config()
+        if incremental_cfg['enabled'] and options.get('incremental', True) and url_type == 'profile':
+            extraction_cursor = get_cursor_store().load(creator, platform_key, scope=url.rstrip('/').lower())
+            stop_ids = extraction_cursor.stop_ids(incremental_cfg['stop_window'])
+            if (
+                stop_ids
+                and not options.get('force_full_sync')
+                and not extraction_cursor.needs_full_sync(incremental_cfg['full_resync_hours'], max_videos)
+            ):
+                delta_scan = DeltaScan(platform_key, stop_ids)
+                if progress_callback:
+                    progress_callback(
+                        f"Incremental scan: {len(extraction_cursor.entries)} links known, "
+                        f"stopping at the newest {len(stop_ids)}"
+                    )
+            elif progress_callback and extraction_cursor.entries:
+                progress_callback("Incremental scan: full resync of the profile")
+
         # Define all available methods
         # PRIORITY ORDER: Fast API methods first, browser methods as fallback
         # Stable method-id -> number mapping for debug logs.
@@ -4685,22 +4810,22 @@ def extract_links_intelligent(
         all_methods = [
             # â”€â”€ yt-dlp methods (YouTube, TikTok, Facebook â€” NOT Instagram) â”€â”€
             ("Method 0: yt-dlp primary (Dual API + Proxy + UA Rotation)",
-             lambda: _method_ytdlp_primary(url, platform_key, cookie_file, max_videos, cookie_browser, active_proxy),
+             lambda: _method_ytdlp_primary(url, platform_key, cookie_file, max_videos, cookie_browser, active_proxy, delta=delta_scan),
              "ytdlp_primary",
              use_enhancements),
 
             ("Method 2: yt-dlp --get-url",
-             lambda: _method_ytdlp_get_url(url, platform_key, cookie_file, max_videos, cookie_browser, active_proxy),
+             lambda: _method_ytdlp_get_url(url, platform_key, cookie_file, max_videos, cookie_browser, active_proxy, delta=delta_scan),
              "ytdlp_get_url",
              True),
 
             ("Method 1: yt-dlp --dump-json (with dates)",
-             lambda: _method_ytdlp_dump_json(url, platform_key, cookie_file, max_videos, cookie_browser, active_proxy),
+             lambda: _method_ytdlp_dump_json(url, platform_key, cookie_file, max_videos, cookie_browser, active_proxy, delta=delta_scan),
              "ytdlp_dump_json",
              True),
 
             ("Method 3: yt-dlp with retries",
-             lambda: _method_ytdlp_with_retry(url, platform_key, cookie_file, max_videos, cookie_browser, active_proxy),
+             lambda: _method_ytdlp_with_retry(url, platform_key, cookie_file, max_videos, cookie_browser, active_proxy, delta=delta_scan),
              "ytdlp_with_retry",
              True),
 
@@ -4734,7 +4859,7 @@ def extract_links_intelligent(
              platform_key == 'instagram'),
 
             ("Method D: Attach Selenium to running Chrome (CDP port)",
-             lambda: _method_selenium_cdp_attach(url, platform_key, max_videos, progress_callback, expected_count or 0),
+             lambda: _method_selenium_cdp_attach(url, platform_key, max_videos, progress_callback, expected_count or 0, delta=delta_scan),
              "selenium_cdp_attach",
              # CDP attach is always safe: it attaches to an already-running Chrome and returns []
              # immediately when no debug-port Chrome is found. managed_profile_only does NOT
@@ -4742,17 +4867,17 @@ def extract_links_intelligent(
              platform_key in {'instagram', 'facebook', 'tiktok', 'youtube'}),
 
             ("Method A: Selenium (Chrome user-data-dir profile)",
-             lambda: _method_selenium_profile(url, platform_key, cookies_dir, max_videos, progress_callback),
+             lambda: _method_selenium_profile(url, platform_key, cookies_dir, max_videos, progress_callback, delta=delta_scan),
              "selenium_profile",
              (platform_key in {'instagram', 'facebook'}) and (not managed_profile_only)),
 
             ("Method 7: Playwright (Stealth + Proxy + Human Behavior)",
-             lambda: _method_playwright(url, platform_key, cookie_file, active_proxy, max_videos),
+             lambda: _method_playwright(url, platform_key, cookie_file, active_proxy, max_videos, delta=delta_scan),
              "playwright",
              platform_key in ['tiktok', 'instagram', 'youtube', 'facebook']),
 
             ("Method 8: Selenium Headless (Proxy + Cookies + Stealth)",
-             lambda: _method_selenium(url, platform_key, max_videos, cookie_file, active_proxy, progress_callback, expected_count),
+             lambda: _method_selenium(url, platform_key, max_videos, cookie_file, active_proxy, progress_callback, expected_count, delta=delta_scan),
              "selenium_headless",
              not managed_profile_only),
         ]
@@ -4882,27 +5007,11 @@ def extract_links_intelligent(
             if not exhaustive_mode:
                 available_methods = []
 
-        for _idx, (method_name, method_func, method_id) in enumerate(available_methods):
-            if max_videos > 0 and len(entries) >= max_videos:
-                break
-
+        def _absorb_method_result(method_name, method_id, method_entries, error_msg, time_taken, raced=False):
+            """Merge one method's links into entries, record it and report the attempt."""
+            nonlocal successful_method, successful_method_id
             _lg_tag = f"[LG-{_LG_NUM.get(method_id, '?')}]"
-            if progress_callback:
-                progress_callback(f"{_lg_tag} Scanning...")
-
-            start_time = time.time()
-            method_entries = []
-            error_msg = ""
-
-            try:
-                method_entries = method_func()
-            except Exception as e:
-                error_msg = str(e)[:200]
-                last_method_error = error_msg
-                if progress_callback:
-                    progress_callback(f"Ã¢Å¡Â Ã¯Â¸Â {_lg_tag} failed: {error_msg[:100]}")
-
-            time_taken = time.time() - start_time
+            method_entries = method_entries or []
 
             # Merge unique entries
             added = 0
@@ -4922,15 +5031,20 @@ def extract_links_intelligent(
                 entries.append(entry)
                 added += 1
 
-            # Record performance in learning system
-            if learning_system:
-                success = added > 0
+            # Nothing new because the listing reached links from the last sync
+            up_to_date = added == 0 and not error_msg and delta_scan is not None and delta_scan.caught_up
+
+            # Record performance in learning system.
+            # A raced method is scored on what it returned, even when another
+            # racer already delivered the same links first.
+            if learning_system and not up_to_date:
+                scored = len(method_entries) if raced else added
                 learning_system.record_performance(
                     creator,
                     platform_key,
                     method_id,
-                    success,
-                    added,
+                    scored > 0,
+                    scored,
                     time_taken,
                     error_msg
                 )
@@ -4938,13 +5052,18 @@ def extract_links_intelligent(
                 "stage": "authenticated_extractors" if cookie_file else "public_fallback",
                 "method_id": method_id,
                 "auth_source": (_auth_ticket or {}).get("source_kind") or (_auth_source_id or ("browser_profile" if cookie_file else "none")),
-                "result": "success" if added > 0 else "failed",
-                "failure_type": "" if added > 0 else (error_msg or "no_links"),
+                "result": "success" if added > 0 else ("up_to_date" if up_to_date else "failed"),
+                "failure_type": "" if added > 0 or up_to_date else (error_msg or "no_links"),
                 "links_added": added,
                 "retry_used": False,
             })
 
-            if added > 0:
+            if up_to_date:
+                successful_method = successful_method or method_name
+                successful_method_id = successful_method_id or method_id
+                if progress_callback:
+                    progress_callback(f"{_lg_tag} No new links since the last sync")
+            elif added > 0:
                 successful_method = method_name
                 successful_method_id = method_id
                 meta["status_code"] = "success"
@@ -4952,14 +5071,6 @@ def extract_links_intelligent(
                 meta["failure_type"] = ""
                 if progress_callback:
                     progress_callback(f"{_lg_tag} Found {added} links")
-
-                if target_count > 0 and len(entries) >= target_count:
-                    if progress_callback:
-                        progress_callback(f"{_lg_tag} Target reached: {len(entries)}/{target_count} links")
-                    break
-
-                if not exhaustive_mode:
-                    break  # Stop on first success
             else:
                 meta["stage_failed"] = meta.get("stage_failed") or (
                     "authenticated_extractors" if cookie_file else "public_fallback"
@@ -4968,10 +5079,122 @@ def extract_links_intelligent(
                     meta["failure_type"] = error_msg or "no_links"
                 if progress_callback:
                     progress_callback(f"Ã¢Å¡Â Ã¯Â¸Â {_lg_tag} Ã¢â€ â€™ 0 links")
+            return added
 
-                    # If this was the learned "best" method and it failed, inform user we'll try others
-                    if method_id == best_method_id and best_method_id:
-                        progress_callback("Trying other approaches...")
+        # Race the cheap HTTP / yt-dlp methods instead of paying for their
+        # timeouts one by one. Browser methods stay in the sequential loop.
+        race_cfg = get_method_race_config()
+        racers = []
+        if available_methods and race_cfg['enabled']:
+            learned_order = learning_system.get_method_order(creator, platform_key) if learning_system else []
+            racers = pick_racers(available_methods, learned_order, race_cfg['top_k'])
+
+        if len(racers) >= 2:
+            if progress_callback:
+                progress_callback(
+                    "Racing " + ", ".join(f"[LG-{_LG_NUM.get(mid, '?')}]" for _, _, mid in racers) + "..."
+                )
+
+            def _race_enough(results):
+                if delta_scan is not None and delta_scan.caught_up:
+                    return True
+                fresh = {
+                    _normalize_url(entry.get('url'))
+                    for result in results
+                    for entry in result.entries
+                    if entry.get('url')
+                } - seen_normalized
+                if target_count > 0:
+                    return len(entries) + len(fresh) >= target_count
+                return (not exhaustive_mode) and bool(fresh)
+
+            def _record_late_result(result):
+                # Loser finished after the race settled: keep its timing unless
+                # it was cut short by the cancellation.
+                if learning_system and not result.cancelled:
+                    learning_system.record_performance(
+                        creator,
+                        platform_key,
+                        result.method_id,
+                        bool(result.entries),
+                        len(result.entries),
+                        result.elapsed,
+                        result.error
+                    )
+
+            race_added = 0
+            for result in race_methods(
+                racers,
+                _race_enough,
+                timeout=race_cfg['timeout'],
+                on_late_result=_record_late_result,
+            ):
+                if result.error:
+                    last_method_error = result.error
+                race_added += _absorb_method_result(
+                    result.method_name,
+                    result.method_id,
+                    result.entries,
+                    result.error,
+                    result.elapsed,
+                    raced=True,
+                )
+
+            raced_ids = {mid for _, _, mid in racers}
+            available_methods = [m for m in available_methods if m[2] not in raced_ids]
+            if delta_scan is not None and delta_scan.caught_up:
+                available_methods = []  # Listing reached links from the last sync
+            if race_added > 0:
+                if target_count > 0 and len(entries) >= target_count:
+                    if progress_callback:
+                        progress_callback(f"Target reached: {len(entries)}/{target_count} links")
+                    available_methods = []
+                elif not exhaustive_mode:
+                    available_methods = []  # Stop on first success
+
+        for _idx, (method_name, method_func, method_id) in enumerate(available_methods):
+            if max_videos > 0 and len(entries) >= max_videos:
+                break
+
+            _lg_tag = f"[LG-{_LG_NUM.get(method_id, '?')}]"
+            if progress_callback:
+                progress_callback(f"{_lg_tag} Scanning...")
+
+            start_time = time.time()
+            method_entries = []
+            error_msg = ""
+
+            # Only one browser-driven method may run at a time across threads
+            lease = browser_lease(progress_callback) if method_id in BROWSER_METHOD_IDS else contextlib.nullcontext()
+            try:
+                with lease:
+                    start_time = time.time()
+                    method_entries = method_func()
+            except Exception as e:
+                error_msg = str(e)[:200]
+                last_method_error = error_msg
+                if progress_callback:
+                    progress_callback(f"Ã¢Å¡Â Ã¯Â¸Â {_lg_tag} failed: {error_msg[:100]}")
+
+            time_taken = time.time() - start_time
+
+            added = _absorb_method_result(method_name, method_id, method_entries, error_msg, time_taken)
+
+            if delta_scan is not None and delta_scan.caught_up:
+                break  # Everything past this point is already known
+
+            if added > 0:
+                if target_count > 0 and len(entries) >= target_count:
+                    if progress_callback:
+                        progress_callback(f"{_lg_tag} Target reached: {len(entries)}/{target_count} links")
+                    break
+
+                if not exhaustive_mode:
+                    break  # Stop on first success
+            else:
+                # If this was the learned "best" method and it failed, inform user we'll try others
+                if progress_callback and method_id == best_method_id and best_method_id:
+                    progress_callback("Trying other approaches...")
 
                 # ============================================================
                 # IP PROTECTION: Mandatory delay between failed method attempts
@@ -4984,6 +5207,26 @@ def extract_links_intelligent(
                         progress_callback(f"Waiting {delay:.1f}s...")
                     time.sleep(delay)
 
+        if delta_scan is not None:
+            delta_scan.cleanup()
+            if delta_scan.caught_up:
+                new_count = len(entries)
+                for entry in extraction_cursor.entries:
+                    if max_videos > 0 and len(entries) >= max_videos:
+                        break
+                    normalized = _normalize_url(entry.get('url', ''))
+                    if not normalized or normalized in seen_normalized:
+                        continue
+                    seen_normalized.add(normalized)
+                    entries.append(dict(entry))
+                meta["status_code"] = "success"
+                meta["stage_failed"] = ""
+                meta["failure_type"] = ""
+                if progress_callback:
+                    progress_callback(
+                        f"Incremental scan: {new_count} new + {len(entries) - new_count} known links"
+                    )
+
         # â”€â”€ Step 2.3 Tab Fallback: only expand into extra tabs when we still need more â”€
         # This keeps creator-profile extraction result-driven instead of always
         # collecting homepage + videos + shorts when one pass already satisfied the need.
@@ -4991,9 +5234,9 @@ def extract_links_intelligent(
         _chosen_tab_fb = options.get('_chosen_tab', '')
         _avail_tabs_fb = options.get('_available_tabs', [])
         _base_url_fb   = options.get('_profile_base_url', _profile_base_url)
-        _need_more_entries_for_tab_fallback = (not entries) or (
+        _need_more_entries_for_tab_fallback = ((not entries) or (
             max_videos > 0 and len(entries) < max_videos
-        )
+        )) and not (delta_scan is not None and delta_scan.caught_up)
 
         if (
             platform_key == 'youtube'
@@ -5361,6 +5604,11 @@ def extract_links_intelligent(
             # Limit if needed
             if max_videos > 0:
                 entries = entries[:max_videos]
+
+            if extraction_cursor is not None:
+                extraction_cursor.record(entries, full_sync=delta_scan is None, max_videos=max_videos)
+                get_cursor_store().save(extraction_cursor)
+
             meta["status_code"] = "success"
             meta["stage_failed"] = ""
             meta["failure_type"] = ""
@@ -5592,56 +5840,19 @@ class BulkLinkGrabberThread(QThread):
             self.found_links = []
             self.creator_data = {}
 
-            # Process each URL
-            for i, url in enumerate(unique_urls, 1):
-                if self.is_cancelled:
-                    break
-
-                self.progress.emit(f"\nÃ°Å¸â€œÅ’ [{i}/{len(unique_urls)}] {url[:60]}...")
-                self.progress_percent.emit(int((i / len(unique_urls)) * 30))
-
-                platform_key = _detect_platform_key(url)
-
-                def progress_cb(msg):
-                    self.progress.emit(f"  {msg}")
-                    logging.info("[EXTRACT] %s", msg)  # Mirror to terminal for debugging
-
-                entries, creator = extract_links_intelligent(
-                    url,
-                    platform_key,
-                    self.cookies_dir,
-                    self.options,
-                    progress_callback=progress_cb
+            from .config import get_bulk_grab_config
+            bulk_cfg = get_bulk_grab_config()
+            if bulk_cfg['max_workers'] > 1 and len(unique_urls) > 1:
+                self.progress.emit(
+                    f"Running up to {bulk_cfg['max_workers']} extractions at once "
+                    f"({bulk_cfg['per_platform_workers']} per platform)"
                 )
 
-                # Initialize creator data if not exists
-                if creator not in self.creator_data:
-                    self.creator_data[creator] = {
-                        'links': [],
-                        'source_urls': [],
-                        'platform': platform_key
-                    }
-
-                # Add to results
-                for entry in entries:
-                    if self.is_cancelled:
-                        break
-                    self.found_links.append(entry)
-                    self.creator_data[creator]['links'].append(entry)
-                    self.creator_data[creator]['source_urls'].append(url)
-
-                    # Format with date
-                    date_str = _parse_upload_date(entry.get('date', '00000000'))
-                    display_text = entry['url']
-                    if date_str != 'Unknown':
-                        display_text += f"  ({date_str})"
-
-                    self.link_found.emit(entry['url'], display_text)
-
-                self.progress.emit(f"Ã¢Å“â€¦ [{i}/{len(unique_urls)}] {len(entries)} links from @{creator}")
-
-                pct = 30 + int((i / len(unique_urls)) * 65)
-                self.progress_percent.emit(pct)
+            self._run_extraction_pool(
+                unique_urls,
+                bulk_cfg['max_workers'],
+                bulk_cfg['per_platform_workers'],
+            )
 
             if self.is_cancelled:
                 self.finished.emit(False, f"Ã¢Å¡Â Ã¯Â¸Â Cancelled. {len(self.found_links)} total links.", self.found_links)
@@ -5672,6 +5883,110 @@ class BulkLinkGrabberThread(QThread):
             self.progress.emit(error_msg)
             self.finished.emit(False, error_msg, self.found_links)
 
+    def _run_extraction_pool(self, unique_urls: typing.List[str], max_workers: int, per_platform: int):
+        """
+        Extract unique_urls on a small thread pool.
+
+        URLs are dispatched in input order, at most per_platform at a time for
+        one platform, so each platform keeps its politeness budget (requests are
+        additionally throttled by the shared token buckets) while different
+        platforms run side by side. Results are published per creator in input
+        order, whatever order the extractions finish in.
+        """
+        total = len(unique_urls)
+        jobs = [(i, url, _detect_platform_key(url)) for i, url in enumerate(unique_urls, 1)]
+
+        # Publication queue per creator (as predicted from the URL)
+        creator_queues: typing.Dict[str, deque] = {}
+        for index, url, platform_key in jobs:
+            creator_queues.setdefault(self._creator_key_for(url, platform_key), deque()).append(index)
+
+        pending = list(jobs)
+        running = {}
+        busy_per_platform: typing.Dict[str, int] = {}
+        results = {}
+        completed = 0
+
+        pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="BulkLinkGrab")
+        try:
+            while (pending or running) and not self.is_cancelled:
+                for job in list(pending):
+                    if len(running) >= max_workers:
+                        break
+                    index, url, platform_key = job
+                    if busy_per_platform.get(platform_key, 0) >= per_platform:
+                        continue
+                    pending.remove(job)
+                    busy_per_platform[platform_key] = busy_per_platform.get(platform_key, 0) + 1
+                    self.progress.emit(f"\nÃ°Å¸â€œÅ’ [{index}/{total}] {url[:60]}...")
+                    running[pool.submit(self._extract_one, index, total, url, platform_key, max_workers > 1)] = job
+
+                done, _ = wait(list(running), timeout=0.5, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, url, platform_key = running.pop(future)
+                    busy_per_platform[platform_key] -= 1
+                    entries, creator = future.result()
+                    results[index] = (url, platform_key, entries, creator)
+                    completed += 1
+                    self.progress_percent.emit(int((completed / total) * 95))
+
+                for queue_indexes in creator_queues.values():
+                    while queue_indexes and queue_indexes[0] in results:
+                        index = queue_indexes.popleft()
+                        self._publish_result(index, total, *results.pop(index))
+        finally:
+            # Extractions cannot be interrupted; on cancel just stop waiting for them
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _creator_key_for(url: str, platform_key: str) -> str:
+        try:
+            return f"{platform_key}:{_extract_creator_from_url(url, platform_key).lower()}"
+        except Exception:
+            return f"{platform_key}:{_normalize_url(url)}"
+
+    def _extract_one(self, index: int, total: int, url: str, platform_key: str, tagged: bool):
+        prefix = f"  [{index}/{total}] " if tagged else "  "
+
+        def progress_cb(msg):
+            self.progress.emit(f"{prefix}{msg}")
+            logging.info("[EXTRACT] %s", msg)  # Mirror to terminal for debugging
+
+        return extract_links_intelligent(
+            url,
+            platform_key,
+            self.cookies_dir,
+            self.options,
+            progress_callback=progress_cb
+        )
+
+    def _publish_result(self, index: int, total: int, url: str, platform_key: str, entries: list, creator: str):
+        # Initialize creator data if not exists
+        if creator not in self.creator_data:
+            self.creator_data[creator] = {
+                'links': [],
+                'source_urls': [],
+                'platform': platform_key
+            }
+
+        # Add to results
+        for entry in entries:
+            if self.is_cancelled:
+                break
+            self.found_links.append(entry)
+            self.creator_data[creator]['links'].append(entry)
+            self.creator_data[creator]['source_urls'].append(url)
+
+            # Format with date
+            date_str = _parse_upload_date(entry.get('date', '00000000'))
+            display_text = entry['url']
+            if date_str != 'Unknown':
+                display_text += f"  ({date_str})"
+
+            self.link_found.emit(entry['url'], display_text)
+
+        self.progress.emit(f"Ã¢Å“â€¦ [{index}/{total}] {len(entries)} links from @{creator}")
+
     def _save_creator_immediately(self, creator_name: str) -> str:
         """Save a creator's links immediately and return file path"""
         if creator_name not in self.creator_data:
@@ -0,0 +1,310 @@
+"""
+modules/link_grabber/cursor.py
+Persistent per-creator extraction cursor for incremental (delta) grabs.
+
+A full listing of a creator profile is stored next to the learning cache
+(data_files/extraction_cursors/). On the next run the newest known entries
+become a stop window:
+
+- yt-dlp methods get them as a download archive with break_on_existing,
+  so pagination stops at the first already-known video
+- selenium / playwright scroll loops stop once a known link is on screen
+
+The new links are then merged with the stored ones, so callers still get
+the complete list while re-grab time scales with new uploads instead of
+profile size. A full resync runs every `full_resync_hours`.
+
+Pinned posts: TikTok/Instagram list pinned (often old) posts first, which
+would end every delta scan right away. The leading pinned run of the stored
+listing (entries older than one listed after them) is kept out of the stop
+window, and scroll scans only stop after CONFIRM_RUN known links in a row,
+which also covers a post pinned since the last full sync.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+# yt-dlp exits with 101 when --break-on-existing (or --max-downloads) stops it
+_YTDLP_CANCELLED_EXIT = 101
+
+_ID_PATTERNS = {
+    "youtube": [r"(?:[?&]v=|/shorts/|youtu\.be/)([A-Za-z0-9_-]{11})"],
+    "tiktok": [r"/video/(\d+)"],
+    "instagram": [r"/(?:p|reel|reels|tv)/([A-Za-z0-9_-]+)"],
+    "facebook": [r"/reel/(\d+)", r"/videos/(?:[^/?#]+/)?(\d+)", r"[?&]v=(\d+)"],
+    "twitter": [r"/status/(\d+)"],
+}
+
+# Extractor keys yt-dlp may use for the same video id in its archive
+_ARCHIVE_ALIASES = {
+    "facebook": ("facebook", "facebookreel"),
+}
+
+# Most posts a profile can pin above its newest uploads
+PINNED_MAX = 3
+
+# Known links in a row (feed order) before a scroll scan counts as caught up
+CONFIRM_RUN = 2
+
+# Platforms whose video ids grow with upload time
+_SEQUENTIAL_IDS = ("tiktok", "twitter", "facebook")
+_SHORTCODE_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+
+
+def archive_id_for_url(url: str, platform_key: str) -> Optional[str]:
+    """'<platform> <video id>' as yt-dlp writes it to a download archive."""
+    for pattern in _ID_PATTERNS.get(platform_key, []):
+        match = re.search(pattern, url or "")
+        if match:
+            return f"{platform_key} {match.group(1)}"
+    return None
+
+
+def _recency(entry: dict, platform_key: str) -> Optional[tuple]:
+    """Sortable upload-time key of a stored entry (None if unknown)."""
+    archive_id = archive_id_for_url(entry.get("url", ""), platform_key)
+    if archive_id:
+        video_id = archive_id.split(" ", 1)[1]
+        if platform_key in _SEQUENTIAL_IDS and video_id.isdigit():
+            return ("id", int(video_id))
+        if platform_key == "instagram" and len(video_id) <= 11:
+            value = 0
+            for char in video_id:
+                value = value * 64 + _SHORTCODE_ALPHABET.index(char)
+            return ("id", value)
+    date = entry.get("date") or ""
+    if date.isdigit() and date != "00000000":
+        return ("date", int(date))
+    return None
+
+
+def _newer(first: Optional[tuple], second: Optional[tuple]) -> bool:
+    return first is not None and second is not None and first[0] == second[0] and first[1] > second[1]
+
+
+class DeltaScan:
+    """
+    Stop window for one incremental extraction run.
+
+    Shared by every method of the run (including raced ones), so
+    caught_up is set by whichever method reaches known entries first.
+    Links checked one by one (reached) or as a page in feed order
+    (reached_any) only stop the scan after `confirm` known ones in a row.
+    """
+
+    def __init__(self, platform_key: str, stop_ids: Iterable[str], confirm: int = CONFIRM_RUN):
+        self.platform_key = platform_key
+        self.stop_ids = set(stop_ids)
+        self.confirm = max(1, min(int(confirm), len(self.stop_ids)))
+        self._runs = threading.local()   # per method: raced methods scan concurrently
+        self._caught_up = threading.Event()
+        self._archive_path: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def caught_up(self) -> bool:
+        return self._caught_up.is_set()
+
+    def mark_caught_up(self) -> None:
+        self._caught_up.set()
+
+    def _known(self, url: str) -> bool:
+        return archive_id_for_url(url, self.platform_key) in self.stop_ids
+
+    def reached(self, url: str) -> bool:
+        """
+        True (and caught up) once `confirm` links in a row, checked in feed
+        order, are known newest entries.
+        """
+        run = getattr(self._runs, "count", 0) + 1 if self._known(url) else 0
+        self._runs.count = run
+        if run >= self.confirm:
+            self._caught_up.set()
+            return True
+        return False
+
+    def reached_any(self, urls: Iterable[str]) -> bool:
+        """Same as reached for a page of links in feed order."""
+        run = 0
+        for url in urls:
+            if not url:
+                continue
+            run = run + 1 if self._known(url) else 0
+            if run >= self.confirm:
+                self._caught_up.set()
+                return True
+        return False
+
+    def archive_path(self) -> str:
+        """Temporary yt-dlp download archive holding the stop window."""
+        with self._lock:
+            if self._archive_path is None:
+                fd, path = tempfile.mkstemp(prefix="lg_delta_", suffix=".txt")
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    for archive_id in sorted(self.stop_ids):
+                        platform, video_id = archive_id.split(" ", 1)
+                        for key in _ARCHIVE_ALIASES.get(platform, (platform,)):
+                            fh.write(f"{key} {video_id}\n")
+                self._archive_path = path
+            return self._archive_path
+
+    def ytdlp_options(self) -> dict:
+        return {"download_archive": self.archive_path(), "break_on_existing": True}
+
+    def ytdlp_args(self) -> List[str]:
+        return ["--download-archive", self.archive_path(), "--break-on-existing"]
+
+    def note_ytdlp_exit(self, returncode: int) -> None:
+        if returncode == _YTDLP_CANCELLED_EXIT:
+            self._caught_up.set()
+
+    def cleanup(self) -> None:
+        with self._lock:
+            path, self._archive_path = self._archive_path, None
+        if path:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+@dataclass
+class ExtractionCursor:
+    creator: str
+    platform: str
+    scope: str = ""
+    entries: List[dict] = field(default_factory=list)   # newest first
+    newest_id: str = ""
+    newest_date: str = ""
+    listing_limit: int = 0          # max_videos of the last full sync (0 = whole profile)
+    last_full_sync: str = ""
+    last_sync: str = ""
+
+    def needs_full_sync(self, full_resync_hours: float, max_videos: int = 0) -> bool:
+        if not self.entries or not self.last_full_sync:
+            return True
+        if self.listing_limit and (max_videos <= 0 or max_videos > self.listing_limit):
+            return True   # last full sync listed less than this run asks for
+        try:
+            synced = datetime.fromisoformat(self.last_full_sync)
+        except ValueError:
+            return True
+        return datetime.now() - synced >= timedelta(hours=full_resync_hours)
+
+    def pinned_count(self) -> int:
+        """Length of the leading run of pinned entries (older than a later one)."""
+        head = self.entries[:PINNED_MAX + 1]
+        keys = [_recency(entry, self.platform) for entry in head]
+        count = 0
+        for i in range(min(PINNED_MAX, len(head))):
+            if not any(_newer(later, keys[i]) for later in keys[i + 1:]):
+                break
+            count += 1
+        return count
+
+    def stop_ids(self, window: int) -> List[str]:
+        """Ids of the newest `window` entries, skipping the pinned ones."""
+        ids = []
+        for entry in self.entries[self.pinned_count():]:
+            archive_id = archive_id_for_url(entry.get("url", ""), self.platform)
+            if archive_id and archive_id not in ids:
+                ids.append(archive_id)
+            if len(ids) >= window:
+                break
+        return ids
+
+    def record(self, entries: List[dict], full_sync: bool, max_videos: int = 0) -> None:
+        """Store entries (newest first); a delta run keeps older known ones."""
+        fresh = [
+            {"url": e.get("url", ""), "title": e.get("title", ""), "date": e.get("date", "00000000")}
+            for e in entries
+            if e.get("url")
+        ]
+        if not full_sync:
+            urls = {e["url"] for e in fresh}
+            fresh.extend(e for e in self.entries if e.get("url") not in urls)
+        self.entries = fresh
+
+        now = datetime.now().isoformat()
+        self.last_sync = now
+        if full_sync:
+            self.last_full_sync = now
+            self.listing_limit = max(0, int(max_videos or 0))
+
+        first_ids = self.stop_ids(1)
+        self.newest_id = first_ids[0] if first_ids else ""
+        dates = [e["date"] for e in self.entries if e.get("date") and e["date"] != "00000000"]
+        self.newest_date = max(dates) if dates else ""
+
+
+class ExtractionCursorStore:
+    """One JSON file per creator listing, in a folder next to the learning cache."""
+
+    def __init__(self, folder: Optional[Path] = None):
+        if folder is None:
+            try:
+                from modules.config.paths import get_data_dir
+                data_folder = get_data_dir()
+            except ImportError:
+                data_folder = Path(__file__).parent.parent.parent / "data_files"
+            folder = data_folder / "extraction_cursors"
+        self.folder = Path(folder)
+        self._lock = threading.Lock()
+
+    def _path(self, creator: str, platform: str, scope: str) -> Path:
+        creator_clean = re.sub(r"[^a-z0-9._-]+", "_", creator.lower().strip().lstrip("@")) or "unknown"
+        scope_hash = hashlib.sha1(scope.lower().encode("utf-8")).hexdigest()[:8]
+        return self.folder / f"{platform.lower()}_{creator_clean}_{scope_hash}.json"
+
+    def load(self, creator: str, platform: str, scope: str = "") -> ExtractionCursor:
+        path = self._path(creator, platform, scope)
+        try:
+            if path.exists():
+                with open(path, "r", encoding="utf-8") as fh:
+                    data = json.load(fh)
+                known = {k: v for k, v in data.items() if k in ExtractionCursor.__dataclass_fields__}
+                return ExtractionCursor(**known)
+        except Exception as exc:
+            logging.warning("Failed to load extraction cursor %s: %s", path.name, exc)
+        return ExtractionCursor(creator=creator, platform=platform, scope=scope)
+
+    def save(self, cursor: ExtractionCursor) -> None:
+        path = self._path(cursor.creator, cursor.platform, cursor.scope)
+        with self._lock:
+            try:
+                self.folder.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=str(self.folder))
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                        json.dump(asdict(cursor), fh, indent=2, ensure_ascii=False)
+                    os.replace(tmp_path, str(path))
+                except Exception:
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+                    raise
+            except Exception as exc:
+                logging.warning("Failed to save extraction cursor %s: %s", path.name, exc)
+
+
+_cursor_store = None
+
+
+def get_cursor_store() -> ExtractionCursorStore:
+    """Get global cursor store instance"""
+    global _cursor_store
+
+    if _cursor_store is None:
+        _cursor_store = ExtractionCursorStore()
+
+    return _cursor_store
@@ -66,6 +66,8 @@ class MethodLearningSystem:
 
         self.cache_file = cache_file
         self._save_lock = threading.Lock()
+        # Racing extraction methods report from worker threads
+        self._state_lock = threading.RLock()
         self.cache: Dict = self.load_cache()
         self._migrate_cache_keys()
 
@@ -189,11 +191,12 @@ class MethodLearningSystem:
         """
         creator_key = self._make_creator_key(creator, platform)
 
-        if creator_key not in self.cache:
-            return []
+        with self._state_lock:
+            if creator_key not in self.cache:
+                return []
 
-        # Get all methods with performance data
-        perf_history = self.cache[creator_key].get('performance_history', {})
+            # Get all methods with performance data
+            perf_history = dict(self.cache[creator_key].get('performance_history', {}))
 
         if not perf_history:
             return []
@@ -232,69 +235,70 @@ class MethodLearningSystem:
             time_taken: Time taken in seconds
             error_msg: Error message if failed
         """
-        creator_key = self._make_creator_key(creator, platform)
-
-        # Initialize creator entry if not exists
-        if creator_key not in self.cache:
-            self.cache[creator_key] = {
-                'creator': creator,
-                'platform': platform,
-                'best_method': None,
-                'best_tab': None,
-                'total_extractions': 0,
-                'first_seen': datetime.now().isoformat(),
-                'last_extraction': None,
-                'performance_history': {},
-                'tab_history': {},
-            }
-
-        # Update extraction count and timestamp
-        self.cache[creator_key]['total_extractions'] += 1
-        self.cache[creator_key]['last_extraction'] = datetime.now().isoformat()
-
-        # Initialize method stats if not exists
-        if method not in self.cache[creator_key]['performance_history']:
-            self.cache[creator_key]['performance_history'][method] = {
-                'success_count': 0,
-                'fail_count': 0,
-                'total_links': 0,
-                'total_time': 0.0,
-                'avg_links': 0.0,
-                'avg_time': 0.0,
-                'success_rate': 0.0,
-                'score': 0.0,
-                'last_error': None,
-                'last_success': None
-            }
-
-        stats = self.cache[creator_key]['performance_history'][method]
-
-        # Update stats
-        if success:
-            stats['success_count'] += 1
-            stats['total_links'] += links_count
-            stats['total_time'] += time_taken
-            stats['last_success'] = datetime.now().isoformat()
-
-            # Calculate averages
-            stats['avg_links'] = stats['total_links'] / stats['success_count']
-            stats['avg_time'] = stats['total_time'] / stats['success_count']
-        else:
-            stats['fail_count'] += 1
-            stats['last_error'] = error_msg[:200] if error_msg else "Unknown error"
+        with self._state_lock:
+            creator_key = self._make_creator_key(creator, platform)
+
+            # Initialize creator entry if not exists
+            if creator_key not in self.cache:
+                self.cache[creator_key] = {
+                    'creator': creator,
+                    'platform': platform,
+                    'best_method': None,
+                    'best_tab': None,
+                    'total_extractions': 0,
+                    'first_seen': datetime.now().isoformat(),
+                    'last_extraction': None,
+                    'performance_history': {},
+                    'tab_history': {},
+                }
+
+            # Update extraction count and timestamp
+            self.cache[creator_key]['total_extractions'] += 1
+            self.cache[creator_key]['last_extraction'] = datetime.now().isoformat()
+
+            # Initialize method stats if not exists
+            if method not in self.cache[creator_key]['performance_history']:
+                self.cache[creator_key]['performance_history'][method] = {
+                    'success_count': 0,
+                    'fail_count': 0,
+                    'total_links': 0,
+                    'total_time': 0.0,
+                    'avg_links': 0.0,
+                    'avg_time': 0.0,
+                    'success_rate': 0.0,
+                    'score': 0.0,
+                    'last_error': None,
+                    'last_success': None
+                }
+
+            stats = self.cache[creator_key]['performance_history'][method]
+
+            # Update stats
+            if success:
+                stats['success_count'] += 1
+                stats['total_links'] += links_count
+                stats['total_time'] += time_taken
+                stats['last_success'] = datetime.now().isoformat()
+
+                # Calculate averages
+                stats['avg_links'] = stats['total_links'] / stats['success_count']
+                stats['avg_time'] = stats['total_time'] / stats['success_count']
+            else:
+                stats['fail_count'] += 1
+                stats['last_error'] = error_msg[:200] if error_msg else "Unknown error"
 
-        # Calculate success rate
-        total_attempts = stats['success_count'] + stats['fail_count']
-        stats['success_rate'] = (stats['success_count'] / total_attempts * 100) if total_attempts > 0 else 0
+            # Calculate success rate
+            total_attempts = stats['success_count'] + stats['fail_count']
+            stats['success_rate'] = (stats['success_count'] / total_attempts * 100) if total_attempts > 0 else 0
 
-        # Calculate performance score
-        stats['score'] = self._calculate_score(stats)
+            # Calculate performance score
+            stats['score'] = self._calculate_score(stats)
 
-        # Update best method for this creator
-        self._update_best_method(creator_key)
+            # Update best method for this creator
+            self._update_best_method(creator_key)
 
-        # Save cache
-        self.save_cache()
+            # Save cache
+            self.save_cache()
 
     def record_best_tab(self, creator: str, platform: str, tab: str, available_tabs: List[str]):
         """Record which content tab worked best for a creator."""
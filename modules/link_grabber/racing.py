@@ -0,0 +1,224 @@
+"""
+modules/link_grabber/racing.py
+Parallel method racing for extract_links_intelligent.
+
+The cheap HTTP / yt-dlp methods are started together (top-k by learned
+score) and the first result that satisfies the caller wins. Browser-bound
+methods never race: they run one at a time behind a process-wide lease,
+because they share the managed Chrome and the user's profiles.
+
+Once the race settles every loser is cancelled: its result is no longer
+merged, and its cancel event is set. Subprocess-backed racers (yt-dlp,
+gallery-dl) run through run_cancellable(), which kills the child process;
+HTTP racers poll race_cancelled() between pages. Whatever a loser returns
+afterwards still goes to on_late_result.
+"""
+
+import logging
+import queue
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence, Tuple
+
+# Methods that talk to plain HTTP / yt-dlp and are safe to run side by side.
+RACE_METHOD_IDS = {
+    "ytdlp_primary",
+    "ytdlp_get_url",
+    "ytdlp_dump_json",
+    "ytdlp_with_retry",
+    "gallery_dl",
+    "instagram_graphql",
+    "instaloader",
+    "facebook_json",
+    "instagram_mobile_api",
+}
+
+# Methods that drive a real browser — serialized behind browser_lease().
+BROWSER_METHOD_IDS = {
+    "selenium_cdp_attach",
+    "selenium_profile",
+    "playwright",
+    "selenium_headless",
+}
+
+_BROWSER_LEASE = threading.Lock()
+
+_CANCEL_POLL = 0.25   # seconds between cancel checks while a child process runs
+
+_racer = threading.local()   # .cancel (Event) / .stopped (bool) of the racer on this thread
+
+MethodSpec = Tuple[str, Callable[[], list], str]   # (display name, callable, method_id)
+
+
+@contextmanager
+def browser_lease(progress_callback: Optional[Callable[[str], None]] = None):
+    """Hold the single browser lease while a browser-bound method runs."""
+    if not _BROWSER_LEASE.acquire(blocking=False):
+        if progress_callback:
+            progress_callback("Waiting for browser (another extraction is using it)...")
+        _BROWSER_LEASE.acquire()
+    try:
+        yield
+    finally:
+        _BROWSER_LEASE.release()
+
+
+class RaceCancelled(Exception):
+    """Raised inside a losing racer when its child process was killed."""
+
+
+def race_cancel_event() -> Optional[threading.Event]:
+    """Cancel event of the racer running on this thread (None outside a race)."""
+    return getattr(_racer, "cancel", None)
+
+
+def race_cancelled() -> bool:
+    """
+    True once the race this thread belongs to was settled without it.
+
+    A racer that sees True is expected to stop; its result is then flagged
+    as cancelled.
+    """
+    event = race_cancel_event()
+    if event is None or not event.is_set():
+        return False
+    _racer.stopped = True
+    return True
+
+
+def run_cancellable(cmd, timeout: Optional[float] = None, **kwargs) -> subprocess.CompletedProcess:
+    """
+    subprocess.run() that kills the child when the current racer is cancelled.
+
+    Outside a race this is plain subprocess.run(). Raises RaceCancelled
+    after the kill, and subprocess.TimeoutExpired like subprocess.run().
+    """
+    cancel = race_cancel_event()
+    if cancel is None:
+        return subprocess.run(cmd, timeout=timeout, **kwargs)
+
+    if kwargs.pop("capture_output", False):
+        kwargs["stdout"] = subprocess.PIPE
+        kwargs["stderr"] = subprocess.PIPE
+    deadline = time.monotonic() + timeout if timeout else None
+    with subprocess.Popen(cmd, **kwargs) as proc:
+        while True:
+            try:
+                stdout, stderr = proc.communicate(timeout=_CANCEL_POLL)
+                break
+            except subprocess.TimeoutExpired:
+                if race_cancelled():
+                    proc.kill()
+                    proc.communicate()
+                    raise RaceCancelled(f"{cmd[0]} cancelled: race already settled")
+                if deadline is not None and time.monotonic() >= deadline:
+                    proc.kill()
+                    proc.communicate()
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+
+@dataclass
+class RaceResult:
+    method_name: str
+    method_id: str
+    entries: List[dict] = field(default_factory=list)
+    error: str = ""
+    elapsed: float = 0.0
+    cancelled: bool = False   # stopped after losing, so elapsed is not a real timing
+
+
+def pick_racers(
+    methods: Sequence[MethodSpec],
+    learned_order: Sequence[str],
+    top_k: int,
+) -> List[MethodSpec]:
+    """
+    Top-k raceable methods: learned winners first (by score), then the rest
+    in the caller's platform priority order.
+    """
+    raceable = [m for m in methods if m[2] in RACE_METHOD_IDS]
+    rank = {mid: i for i, mid in enumerate(learned_order or [])}
+    ordered = sorted(
+        enumerate(raceable),
+        key=lambda item: (rank.get(item[1][2], len(rank)), item[0]),
+    )
+    return [m for _, m in ordered][:max(0, int(top_k))]
+
+
+def race_methods(
+    methods: Sequence[MethodSpec],
+    is_enough: Callable[[List[RaceResult]], bool],
+    timeout: float = 0.0,
+    on_late_result: Optional[Callable[[RaceResult], None]] = None,
+) -> List[RaceResult]:
+    """
+    Run methods concurrently until is_enough(results) or all have finished.
+
+    Returns the results that arrived before the race was settled, in
+    finishing order. Methods still running are cancelled; whatever they
+    return afterwards goes to on_late_result instead.
+    """
+    results_q: "queue.Queue[RaceResult]" = queue.Queue()
+    settle_lock = threading.Lock()
+    settled = False
+    cancel = threading.Event()
+
+    def _run(name: str, func: Callable[[], list], method_id: str) -> None:
+        _racer.cancel = cancel
+        _racer.stopped = False
+        started = time.time()
+        result = RaceResult(name, method_id)
+        try:
+            result.entries = list(func() or [])
+        except Exception as exc:
+            result.error = str(exc)[:200]
+        finally:
+            # Methods may swallow RaceCancelled in their own error handling
+            result.cancelled = bool(_racer.stopped)
+            _racer.cancel = None
+        result.elapsed = time.time() - started
+
+        with settle_lock:
+            if not settled:
+                results_q.put(result)
+                return
+        if on_late_result:
+            try:
+                on_late_result(result)
+            except Exception as exc:
+                logging.debug("[MethodRace] late result handler failed: %s", exc)
+
+    for name, func, method_id in methods:
+        threading.Thread(
+            target=_run,
+            args=(name, func, method_id),
+            name=f"LinkGrabRace-{method_id}",
+            daemon=True,
+        ).start()
+
+    results: List[RaceResult] = []
+    deadline = time.time() + timeout if timeout and timeout > 0 else None
+    while len(results) < len(methods):
+        wait = 0.5 if deadline is None else max(0.0, min(0.5, deadline - time.time()))
+        try:
+            results.append(results_q.get(timeout=wait))
+        except queue.Empty:
+            if deadline is not None and time.time() >= deadline:
+                break
+            continue
+        if is_enough(results):
+            break
+
+    with settle_lock:
+        settled = True
+    cancel.set()
+    while True:
+        try:
+            results.append(results_q.get_nowait())
+        except queue.Empty:
+            break
+    return results
@@ -0,0 +1,317 @@
+"""
+modules/shared/downloaded_store.py
+One indexed "already downloaded" store for every downloader.
+
+Replaces the per-folder .downloaded_links.txt files and the
+creator_config.json `downloaded_ids` / `downloaded_url_history` lists with
+a single SQLite database (WAL mode) under get_data_dir():
+
+- rows are keyed by (scope, canonical video URL); scope is the folder the
+  old file/list belonged to, so dedupe stays per folder as before. Creator
+  folders use a stable id kept in their creator_config.json instead
+  (creator_scope), so renaming or moving the folder keeps its history
+- membership is an index lookup, bulk checks are one query per 500 values
+- workers in several threads share it: one connection per thread, WAL lets
+  readers run alongside the writer, busy_timeout absorbs write contention
+
+Legacy files are imported the first time their scope is opened
+(migrate_text_file / add_many); each source is recorded so it is only
+read once.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS downloaded (
+        scope TEXT NOT NULL,
+        video_key TEXT NOT NULL,
+        video_id TEXT NOT NULL DEFAULT '',
+        url TEXT NOT NULL DEFAULT '',
+        platform TEXT NOT NULL DEFAULT '',
+        creator TEXT NOT NULL DEFAULT '',
+        downloaded_at TEXT NOT NULL,
+        PRIMARY KEY (scope, video_key)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_downloaded_id ON downloaded (scope, video_id)",
+    "CREATE INDEX IF NOT EXISTS idx_downloaded_at ON downloaded (scope, downloaded_at)",
+    """
+    CREATE TABLE IF NOT EXISTS migrated_sources (
+        source TEXT PRIMARY KEY,
+        migrated_at TEXT NOT NULL
+    )
+    """,
+)
+
+_QUERY_CHUNK = 500
+
+
+def canonical_video_key(url: str, platform_hint: str = "") -> str:
+    """Canonical video URL (selection_policy rules), or the trimmed URL."""
+    url = (url or "").strip()
+    if not url:
+        return ""
+    try:
+        from modules.creator_profiles.selection_policy import _canonical_video_url
+        return _canonical_video_url(url, platform_hint) or url
+    except Exception:
+        return url
+
+
+def scope_for(folder) -> str:
+    """Scope string for a folder (absolute, case-folded like the OS does)."""
+    return os.path.normcase(os.path.abspath(str(folder)))
+
+
+def creator_scope(scope_id: str) -> str:
+    """Scope string for a stable creator id (survives folder renames/moves)."""
+    return f"creator:{scope_id}"
+
+
+def _looks_like_url(value: str) -> bool:
+    return value.startswith(("http://", "https://"))
+
+
+def _chunks(values: List[str]) -> Iterable[List[str]]:
+    for start in range(0, len(values), _QUERY_CHUNK):
+        yield values[start:start + _QUERY_CHUNK]
+
+
+class DownloadedStore:
+    """SQLite-backed "already downloaded" index shared by all threads."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        if db_path is None:
+            try:
+                from modules.config.paths import get_data_dir
+                data_folder = get_data_dir()
+            except ImportError:
+                data_folder = Path(__file__).parent.parent.parent / "data_files"
+            db_path = data_folder / "downloaded.sqlite3"
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    # ── Connection ──────────────────────────────────────────────────────────
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=10000")
+            with self._schema_lock:
+                if not self._schema_ready:
+                    with conn:
+                        for statement in _SCHEMA:
+                            conn.execute(statement)
+                    self._schema_ready = True
+            self._local.conn = conn
+        return conn
+
+    # ── Writes ──────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _row(scope: str, record: Dict, now: str) -> Optional[tuple]:
+        url = str(record.get("url") or "").strip()
+        video_id = str(record.get("video_id") or record.get("id") or "").strip()
+        platform = str(record.get("platform") or "").strip()
+        key = canonical_video_key(url, platform) if url else (f"id:{video_id}" if video_id else "")
+        if not key:
+            return None
+        return (
+            scope,
+            key,
+            video_id,
+            url,
+            platform,
+            str(record.get("creator") or ""),
+            str(record.get("downloaded_at") or now),
+        )
+
+    def add_many(self, scope: str, records: Iterable[Dict]) -> int:
+        """Insert records ({url, video_id, platform, creator}) in one transaction."""
+        now = datetime.now().isoformat()
+        rows = [row for row in (self._row(scope, r, now) for r in records) if row]
+        if not rows:
+            return 0
+        conn = self._conn()
+        with conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO downloaded "
+                "(scope, video_key, video_id, url, platform, creator, downloaded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            return conn.total_changes - before
+
+    def add(self, scope: str, url: str = "", video_id: str = "", platform: str = "", creator: str = "") -> bool:
+        return self.add_many(scope, [{
+            "url": url, "video_id": video_id, "platform": platform, "creator": creator,
+        }]) > 0
+
+    def adopt(self, scope: str, old_scope: str) -> int:
+        """Move every row of old_scope into scope; returns rows added to scope."""
+        if scope == old_scope:
+            return 0
+        conn = self._conn()
+        with conn:
+            before = conn.total_changes
+            conn.execute(
+                "INSERT OR IGNORE INTO downloaded "
+                "(scope, video_key, video_id, url, platform, creator, downloaded_at) "
+                "SELECT ?, video_key, video_id, url, platform, creator, downloaded_at "
+                "FROM downloaded WHERE scope = ?",
+                (scope, old_scope),
+            )
+            added = conn.total_changes - before
+            conn.execute("DELETE FROM downloaded WHERE scope = ?", (old_scope,))
+        return added
+
+    def clear(self, scope: str) -> None:
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM downloaded WHERE scope = ?", (scope,))
+
+    # ── Reads ───────────────────────────────────────────────────────────────
+
+    def known(self, scope: str, values: Iterable[str], platform_hint: str = "") -> Set[str]:
+        """
+        Subset of values (video ids and/or URLs) already downloaded in scope.
+
+        URLs match on their canonical form; anything else is a video id.
+        """
+        by_key: Dict[str, List[str]] = {}
+        ids: List[str] = []
+        for value in values:
+            value = str(value or "").strip()
+            if not value:
+                continue
+            if _looks_like_url(value):
+                by_key.setdefault(canonical_video_key(value, platform_hint), []).append(value)
+            else:
+                ids.append(value)
+
+        found: Set[str] = set()
+        conn = self._conn()
+        keys = list(by_key)
+        for chunk in _chunks(keys):
+            marks = ",".join("?" * len(chunk))
+            for (key,) in conn.execute(
+                f"SELECT video_key FROM downloaded WHERE scope = ? AND video_key IN ({marks})",
+                [scope, *chunk],
+            ):
+                found.update(by_key.get(key, ()))
+        unique_ids = list(dict.fromkeys(ids))
+        for chunk in _chunks(unique_ids):
+            marks = ",".join("?" * len(chunk))
+            for (video_id,) in conn.execute(
+                f"SELECT video_id FROM downloaded WHERE scope = ? AND video_id IN ({marks})",
+                [scope, *chunk],
+            ):
+                found.add(video_id)
+        return found
+
+    def contains(self, scope: str, value: str, platform_hint: str = "") -> bool:
+        return bool(self.known(scope, [value], platform_hint))
+
+    def count(self, scope: str) -> int:
+        row = self._conn().execute("SELECT COUNT(*) FROM downloaded WHERE scope = ?", (scope,)).fetchone()
+        return int(row[0]) if row else 0
+
+    def recent(self, scope: str, limit: int = 300) -> List[Dict]:
+        """Newest downloads with a URL, oldest first (the old history list order)."""
+        rows = self._conn().execute(
+            "SELECT url, platform, creator, downloaded_at FROM downloaded "
+            "WHERE scope = ? AND url != '' ORDER BY downloaded_at DESC LIMIT ?",
+            (scope, int(limit)),
+        ).fetchall()
+        return [
+            {"url": url, "platform": platform, "creator": creator, "downloaded_at": at}
+            for url, platform, creator, at in reversed(rows)
+        ]
+
+    # ── Migration ───────────────────────────────────────────────────────────
+
+    def is_migrated(self, source: str) -> bool:
+        row = self._conn().execute(
+            "SELECT 1 FROM migrated_sources WHERE source = ?", (source,)
+        ).fetchone()
+        return row is not None
+
+    def mark_migrated(self, source: str) -> None:
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO migrated_sources (source, migrated_at) VALUES (?, ?)",
+                (source, datetime.now().isoformat()),
+            )
+
+    def migrate_text_file(self, scope: str, path: Path) -> int:
+        """Import a legacy one-URL-per-line file once; returns rows added."""
+        path = Path(path)
+        source = f"text:{scope_for(path)}"
+        if self.is_migrated(source):
+            return 0
+        added = 0
+        try:
+            if path.exists():
+                with open(path, "r", encoding="utf-8", errors="ignore") as fh:
+                    urls = [line.strip() for line in fh if line.strip()]
+                added = self.add_many(scope, ({"url": u} for u in urls))
+            self.mark_migrated(source)
+        except Exception as exc:
+            logging.warning("Failed to migrate %s into downloaded store: %s", path, exc)
+        return added
+
+    def scope(self, folder) -> "DownloadedScope":
+        return DownloadedScope(self, scope_for(folder))
+
+
+class DownloadedScope:
+    """
+    The store seen from one folder. Supports `in` and len() so it can stand
+    in for the old frozenset of downloaded ids.
+    """
+
+    def __init__(self, store: DownloadedStore, scope: str):
+        self.store = store
+        self.scope = scope
+
+    def __contains__(self, value) -> bool:
+        return self.store.contains(self.scope, str(value or ""))
+
+    def __len__(self) -> int:
+        return self.store.count(self.scope)
+
+    def known(self, values: Iterable[str], platform_hint: str = "") -> Set[str]:
+        return self.store.known(self.scope, values, platform_hint)
+
+    def add(self, url: str = "", video_id: str = "", platform: str = "", creator: str = "") -> bool:
+        return self.store.add(self.scope, url=url, video_id=video_id, platform=platform, creator=creator)
+
+
+_downloaded_store = None
+_downloaded_store_lock = threading.Lock()
+
+
+def get_downloaded_store() -> DownloadedStore:
+    """Get global downloaded store instance"""
+    global _downloaded_store
+
+    with _downloaded_store_lock:
+        if _downloaded_store is None:
+            _downloaded_store = DownloadedStore()
+
+    return _downloaded_store
@@ -0,0 +1,151 @@
+"""
+modules/shared/output_tracker.py
+Find the file a download attempt produced without walking the whole folder.
+
+The downloaders used to os.walk + stat the full output folder before and
+after every attempt and diff the two snapshots. Creator folders hold
+thousands of files, so that cost grew with the library.
+
+An OutputTracker is opened per attempt instead:
+
+- yt-dlp reports the final path itself: progress hook 'finished'
+  (filename), postprocessor hook 'finished' (info_dict filepath, i.e. the
+  merged / moved file) and `--print after_move:filepath` for the CLI
+- tools that print their output paths (gallery-dl) go through note_output()
+- only when nothing was reported, the download directory is scanned
+  non-recursively (plus any tool-specific subfolder registered with
+  add_search_dir) for files created since the attempt started
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+# yt-dlp CLI args that print the final file path once it is in place
+YTDLP_PRINT_FILEPATH_ARGS = ("--print", "after_move:filepath")
+
+# File times are compared with the attempt start; allow for coarse clocks
+_CLOCK_SLACK_NS = 2_000_000_000
+
+
+class OutputTracker:
+    """
+    Files produced by one download attempt into folder.
+
+    A tracker opened inside another attempt (a retry helper) passes its
+    reports up to the parent, so the outer attempt sees them too.
+    """
+
+    def __init__(self, folder, parent: Optional["OutputTracker"] = None):
+        self.folder = Path(folder)
+        self.parent = parent
+        self.started_ns = time.time_ns() - _CLOCK_SLACK_NS
+        self._reported: List[str] = []
+        self._search_dirs: List[Path] = []
+        self._lock = threading.Lock()
+
+    # ── Reports ─────────────────────────────────────────────────────────────
+
+    def report(self, path) -> None:
+        if not path:
+            return
+        path = os.path.abspath(str(path))
+        with self._lock:
+            if path in self._reported:
+                self._reported.remove(path)
+            self._reported.append(path)   # latest report last
+        if self.parent is not None:
+            self.parent.report(path)
+
+    def progress_hook(self, d: dict) -> None:
+        """yt-dlp progress hook: a finished download names its file."""
+        if d.get("status") == "finished":
+            self.report(d.get("filename") or (d.get("info_dict") or {}).get("_filename"))
+
+    def postprocessor_hook(self, d: dict) -> None:
+        """yt-dlp postprocessor hook: the merged / moved final file."""
+        if d.get("status") == "finished":
+            info = d.get("info_dict") or {}
+            self.report(info.get("filepath") or info.get("_filename"))
+
+    def note_output(self, text: Optional[str]) -> None:
+        """Record file paths printed one per line by a CLI tool."""
+        for line in (text or "").splitlines():
+            candidate = line.strip().strip('"').lstrip("# ").strip()
+            if candidate and os.path.isabs(candidate) and os.path.isfile(candidate):
+                self.report(candidate)
+
+    def add_search_dir(self, path) -> None:
+        """Extra folder a tool writes into (scanned recursively as a fallback)."""
+        with self._lock:
+            self._search_dirs.append(Path(path))
+
+    # ── Results ─────────────────────────────────────────────────────────────
+
+    def new_files(
+        self,
+        extensions: Iterable[str],
+        min_size: int = 0,
+        skip_extensions: Iterable[str] = (),
+    ) -> List[str]:
+        """
+        Valid media files from this attempt, most recently reported first.
+
+        Falls back to scanning the download directory when no tool reported
+        a usable path.
+        """
+        extensions = {e.lower() for e in extensions}
+        skip_extensions = {e.lower() for e in skip_extensions}
+
+        def _valid(path: str, size: int) -> bool:
+            ext = os.path.splitext(path)[1].lower()
+            return ext not in skip_extensions and ext in extensions and size >= min_size
+
+        with self._lock:
+            reported = list(reversed(self._reported))
+            search_dirs = list(self._search_dirs)
+
+        found = []
+        for path in reported:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue   # e.g. a format file removed after merging
+            if _valid(path, st.st_size):
+                found.append(path)
+        if found:
+            return found
+
+        for entry in self._scan(self.folder, recursive=False):
+            if _valid(entry[0], entry[1]):
+                found.append(entry[0])
+        for folder in search_dirs:
+            for entry in self._scan(folder, recursive=True):
+                if _valid(entry[0], entry[1]) and entry[0] not in found:
+                    found.append(entry[0])
+        return found
+
+    def _scan(self, folder: Path, recursive: bool):
+        """(path, size) of files created or modified since the attempt began."""
+        try:
+            with os.scandir(folder) as it:
+                entries = list(it)
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        yield from self._scan(Path(entry.path), recursive=True)
+                    continue
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            # yt-dlp may set mtime to the upload date; ctime still shows the
+            # new file (creation time on Windows, inode change on POSIX)
+            if max(st.st_mtime_ns, st.st_ctime_ns) >= self.started_ns:
+                yield entry.path, st.st_size
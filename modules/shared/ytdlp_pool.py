@@ -0,0 +1,453 @@
+"""
+modules/shared/ytdlp_pool.py
+Long-lived yt-dlp worker processes shared by the link grabber and downloader.
+
+Building a YoutubeDL per attempt (or spawning the yt-dlp binary) pays the
+yt_dlp import, extractor registration and cookie-jar load every time. The
+pool keeps a few worker processes alive instead:
+
+- each worker imports yt_dlp once and caches YoutubeDL instances keyed by
+  (cookie file, proxy, impersonation target) plus the remaining options,
+  so repeated jobs for the same account reuse the loaded jar and handlers
+- jobs go down a pipe; progress, log lines and errors come back as plain
+  dicts and are replayed on the caller's own progress / postprocessor
+  hooks and logger,
+  in the caller's thread, exactly as an in-process YoutubeDL would call them
+
+Callables cannot cross the process boundary. progress_hooks,
+postprocessor_hooks and logger are relayed; any other callable option (match_filter, ...) raises
+YtdlpPoolUnavailable so the caller can run that job in-process.
+"""
+
+import atexit
+import hashlib
+import itertools
+import json
+import logging
+import multiprocessing
+import pickle
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional, Tuple
+
+DEFAULT_POOL_WORKERS = 3
+_INSTANCE_CACHE_SIZE = 6
+_PROGRESS_INTERVAL = 0.1
+_POLL_INTERVAL = 0.25
+
+# Progress fields the callers' hooks read (everything else may not pickle)
+_PROGRESS_FIELDS = (
+    "status", "filename", "tmpfilename", "downloaded_bytes", "total_bytes",
+    "total_bytes_estimate", "elapsed", "eta", "speed", "fragment_index",
+    "fragment_count", "_percent_str", "_speed_str", "_eta_str",
+)
+
+# Postprocessor fields relayed (the final file path once in place)
+_POSTPROCESSOR_FIELDS = ("status", "postprocessor")
+_POSTPROCESSOR_INFO_FIELDS = ("id", "filepath", "_filename", "ext")
+
+# Entry fields returned from extract jobs (link listings only need these)
+_ENTRY_FIELDS = ("id", "_type", "url", "webpage_url", "title", "upload_date", "timestamp", "duration")
+
+
+class YtdlpPoolUnavailable(RuntimeError):
+    """The job cannot run in the pool; run it in-process instead."""
+
+
+class YtdlpJobError(RuntimeError):
+    """A job failed inside a worker (message is yt-dlp's own)."""
+
+    def __init__(self, message: str, error_type: str = "", partial: Optional[list] = None):
+        super().__init__(message)
+        self.error_type = error_type
+        self.partial = list(partial or [])
+
+
+def split_options(opts: dict) -> Tuple[dict, list, list, object]:
+    """
+    Split yt-dlp options into (picklable worker options, progress hooks,
+    postprocessor hooks, logger).
+
+    Raises YtdlpPoolUnavailable when another option cannot be sent to a worker.
+    """
+    remote = dict(opts or {})
+    hooks = list(remote.pop("progress_hooks", None) or [])
+    pp_hooks = list(remote.pop("postprocessor_hooks", None) or [])
+    logger = remote.pop("logger", None)
+    for key, value in remote.items():
+        if callable(value):
+            raise YtdlpPoolUnavailable(f"option '{key}' is not transferable")
+    try:
+        pickle.dumps(remote)
+    except Exception as exc:
+        raise YtdlpPoolUnavailable(f"options are not transferable: {exc}")
+    return remote, hooks, pp_hooks, logger
+
+
+def instance_key(opts: dict) -> Tuple[str, str, str, str]:
+    """(cookie file, proxy, impersonation, digest of the other options)."""
+    rest = {k: v for k, v in opts.items() if k not in ("cookiefile", "proxy", "impersonate")}
+    digest = hashlib.sha1(
+        json.dumps(rest, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()[:12]
+    return (
+        str(opts.get("cookiefile") or ""),
+        str(opts.get("proxy") or ""),
+        str(opts.get("impersonate") or ""),
+        digest,
+    )
+
+
+def _slim(source: dict, fields: Iterable[str]) -> dict:
+    return {k: source[k] for k in fields if k in source and isinstance(source[k], (str, int, float, type(None)))}
+
+
+# ============ WORKER PROCESS ============
+
+def _worker_main(jobs, events) -> None:
+    """Worker loop: one job at a time, cancel requests read on a side thread."""
+    import yt_dlp
+
+    instances: "OrderedDict[tuple, yt_dlp.YoutubeDL]" = OrderedDict()
+    pending: "queue.Queue" = queue.Queue()
+    current = {
+        "job_id": None,
+        "last_progress": 0.0,
+        "forward_log": False,
+        "collected": [],
+    }
+    cancelled = set()   # job ids; a cancel may arrive before its job starts
+    send_lock = threading.Lock()
+
+    def _send(message) -> None:
+        with send_lock:
+            events.send(message)
+
+    def _reader() -> None:
+        while True:
+            try:
+                message = jobs.recv()
+            except (EOFError, OSError):
+                pending.put(None)
+                return
+            if message[0] == "cancel":
+                cancelled.add(message[1])
+                continue
+            pending.put(message)
+            if message[0] == "stop":
+                return
+
+    class _RelayLogger:
+        def _emit(self, level, msg):
+            if current["forward_log"] and current["job_id"] is not None:
+                _send(("log", current["job_id"], level, str(msg)))
+
+        def debug(self, msg):
+            self._emit("debug", msg)
+
+        def info(self, msg):
+            self._emit("info", msg)
+
+        def warning(self, msg):
+            self._emit("warning", msg)
+
+        def error(self, msg):
+            self._emit("error", msg)
+
+    def _progress(d):
+        if current["job_id"] in cancelled:
+            raise yt_dlp.utils.DownloadCancelled("Cancelled by caller")
+        now = time.monotonic()
+        if d.get("status") == "downloading" and now - current["last_progress"] < _PROGRESS_INTERVAL:
+            return
+        current["last_progress"] = now
+        _send(("progress", current["job_id"], _slim(d, _PROGRESS_FIELDS)))
+
+    def _postprocessed(d):
+        if d.get("status") != "finished":
+            return
+        event = _slim(d, _POSTPROCESSOR_FIELDS)
+        event["info_dict"] = _slim(d.get("info_dict") or {}, _POSTPROCESSOR_INFO_FIELDS)
+        _send(("pp", current["job_id"], event))
+
+    def _collect(info, *args, **kwargs):
+        # Entries listed before break_on_existing stops the listing
+        current["collected"].append(_slim(info, _ENTRY_FIELDS))
+        return None
+
+    def _instance(opts: dict):
+        key = instance_key(opts)
+        ydl = instances.pop(key, None)
+        if ydl is None:
+            params = dict(opts)
+            params["logger"] = _RelayLogger()
+            params["progress_hooks"] = [_progress]
+            params["postprocessor_hooks"] = [_postprocessed]
+            if params.get("break_on_existing"):
+                params["match_filter"] = _collect
+            ydl = yt_dlp.YoutubeDL(params)
+            while len(instances) >= _INSTANCE_CACHE_SIZE:
+                _, old = instances.popitem(last=False)
+                old.close()
+        instances[key] = ydl
+        return ydl
+
+    threading.Thread(target=_reader, name="YtdlpPoolReader", daemon=True).start()
+
+    while True:
+        message = pending.get()
+        if message is None or message[0] == "stop":
+            break
+        _, job_id, kind, url, opts, forward_log = message
+        current.update(
+            job_id=job_id,
+            last_progress=0.0,
+            forward_log=forward_log,
+            collected=[],
+        )
+        try:
+            ydl = _instance(opts)
+            # A reused instance keeps the return code of its previous job
+            ydl._download_retcode = 0
+            if kind == "download":
+                result = ydl.download([url])
+            else:
+                info = ydl.extract_info(url, download=False) or {}
+                result = _slim(info, _ENTRY_FIELDS)
+                if "entries" in info:
+                    result["entries"] = [_slim(e, _ENTRY_FIELDS) for e in info["entries"] if e]
+            try:
+                ydl.save_cookies()
+            except Exception:
+                pass
+            _send(("done", job_id, result))
+        except BaseException as exc:
+            _send(("error", job_id, {
+                "type": type(exc).__name__,
+                "message": str(exc) or type(exc).__name__,
+                "partial": current["collected"],
+            }))
+        finally:
+            current["job_id"] = None
+            cancelled.discard(job_id)
+
+    for ydl in instances.values():
+        try:
+            ydl.close()
+        except Exception:
+            pass
+
+
+# ============ PARENT SIDE ============
+
+class _WorkerHandle:
+    def __init__(self, ctx, index: int):
+        job_reader, self.jobs = ctx.Pipe(duplex=False)
+        self.events, event_writer = ctx.Pipe(duplex=False)
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(job_reader, event_writer),
+            name=f"YtdlpWorker-{index}",
+            daemon=True,
+        )
+        self.process.start()
+        job_reader.close()
+        event_writer.close()
+
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def close(self, kill: bool = False) -> None:
+        try:
+            if kill:
+                self.process.kill()
+            else:
+                self.jobs.send(("stop",))
+                self.process.join(timeout=2)
+                if self.process.is_alive():
+                    self.process.kill()
+        except Exception:
+            pass
+        for conn in (self.jobs, self.events):
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+
+class YtdlpWorkerPool:
+    """
+    Up to `size` warm yt-dlp workers, checked out by one job at a time.
+
+    When every worker is busy the job is refused with YtdlpPoolUnavailable
+    rather than queued, so callers fall back to in-process yt-dlp and keep
+    their own concurrency.
+    """
+
+    def __init__(self, size: int = DEFAULT_POOL_WORKERS, context=None):
+        self.size = max(1, int(size))
+        self._ctx = context or multiprocessing.get_context("spawn")
+        self._idle = []
+        self._spawned = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._job_ids = itertools.count(1)
+
+    def _checkout(self) -> _WorkerHandle:
+        with self._lock:
+            if self._closed:
+                raise YtdlpPoolUnavailable("pool is shut down")
+            while self._idle:
+                handle = self._idle.pop()
+                if handle.alive():
+                    return handle
+                handle.close(kill=True)
+                self._spawned -= 1
+            if self._spawned >= self.size:
+                raise YtdlpPoolUnavailable("all yt-dlp workers are busy")
+            self._spawned += 1
+            index = self._spawned
+        try:
+            return _WorkerHandle(self._ctx, index)
+        except Exception as exc:
+            with self._lock:
+                self._spawned -= 1
+            raise YtdlpPoolUnavailable(f"could not start yt-dlp worker: {exc}")
+
+    def _checkin(self, handle: _WorkerHandle, healthy: bool) -> None:
+        with self._lock:
+            if healthy and not self._closed and handle.alive():
+                self._idle.append(handle)
+                return
+            self._spawned -= 1
+        handle.close(kill=not healthy)
+
+    def _run(
+        self,
+        kind: str,
+        url: str,
+        opts: dict,
+        should_cancel: Optional[Callable[[], bool]] = None,
+        timeout: Optional[float] = None,
+    ):
+        remote_opts, hooks, pp_hooks, logger = split_options(opts)
+        handle = self._checkout()
+        job_id = next(self._job_ids)
+        healthy = False
+        hook_error = None
+        cancel_sent = False
+        deadline = time.monotonic() + timeout if timeout else None
+        try:
+            handle.jobs.send(("job", job_id, kind, url, remote_opts, logger is not None))
+            while True:
+                if not handle.events.poll(_POLL_INTERVAL):
+                    if deadline is not None and time.monotonic() >= deadline:
+                        raise YtdlpJobError(f"yt-dlp worker timed out after {timeout:.0f}s", "TimeoutError")
+                    if not cancel_sent and should_cancel is not None and should_cancel():
+                        if kind == "extract":
+                            # Listings never reach a progress hook: drop the worker instead
+                            raise YtdlpJobError("Cancelled by caller", "DownloadCancelled")
+                        handle.jobs.send(("cancel", job_id))
+                        cancel_sent = True
+                    continue
+
+                message = handle.events.recv()
+                event, event_job = message[0], message[1]
+                if event_job != job_id:
+                    continue
+                if event in ("progress", "pp"):
+                    for hook in (hooks if event == "progress" else pp_hooks):
+                        try:
+                            hook(message[2])
+                        except Exception as exc:
+                            # Same contract as in-process: a raising hook aborts the job
+                            hook_error = hook_error or exc
+                            if not cancel_sent:
+                                handle.jobs.send(("cancel", job_id))
+                                cancel_sent = True
+                elif event == "log":
+                    log_method = getattr(logger, message[2], None) or getattr(logger, "debug", None)
+                    if log_method is not None:
+                        try:
+                            log_method(message[3])
+                        except Exception:
+                            pass
+                elif event == "done":
+                    healthy = True
+                    if hook_error is not None:
+                        raise hook_error
+                    return message[2]
+                elif event == "error":
+                    healthy = True
+                    if hook_error is not None:
+                        raise hook_error
+                    detail = message[2]
+                    raise YtdlpJobError(detail["message"], detail["type"], detail.get("partial"))
+        except (EOFError, OSError) as exc:
+            raise YtdlpJobError(f"yt-dlp worker exited unexpectedly: {exc}", type(exc).__name__)
+        finally:
+            self._checkin(handle, healthy)
+
+    def download(self, url: str, opts: dict, should_cancel: Optional[Callable[[], bool]] = None) -> int:
+        """YoutubeDL.download([url]) in a worker; returns yt-dlp's return code."""
+        return int(self._run("download", url, opts, should_cancel=should_cancel) or 0)
+
+    def extract_info(
+        self,
+        url: str,
+        opts: dict,
+        timeout: Optional[float] = None,
+        should_cancel: Optional[Callable[[], bool]] = None,
+    ) -> dict:
+        """
+        Trimmed extract_info(url, download=False): id/url/title/date fields,
+        plus trimmed 'entries' for playlists.
+
+        With break_on_existing, the entries listed before the stop are on the
+        YtdlpJobError (error_type 'ExistingVideoReached') as .partial.
+        should_cancel() turning True kills the busy worker (error_type
+        'DownloadCancelled').
+        """
+        return self._run("extract", url, opts, should_cancel=should_cancel, timeout=timeout) or {}
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for handle in idle:
+            handle.close()
+
+
+_shared_pool: Optional[YtdlpWorkerPool] = None
+_shared_disabled = False
+_shared_lock = threading.Lock()
+
+
+def get_ytdlp_pool() -> Optional[YtdlpWorkerPool]:
+    """
+    Process-wide pool, or None when disabled (downloader.ytdlp_pool_workers = 0)
+    or when yt_dlp is not importable. Worker processes start lazily.
+    """
+    global _shared_pool, _shared_disabled
+    with _shared_lock:
+        if _shared_pool is None and not _shared_disabled:
+            workers = DEFAULT_POOL_WORKERS
+            try:
+                from modules.config.config_manager import ConfigManager
+                workers = int(ConfigManager().get('downloader.ytdlp_pool_workers', workers))
+            except Exception:
+                pass
+            try:
+                import importlib.util
+                available = importlib.util.find_spec("yt_dlp") is not None
+            except Exception:
+                available = False
+            if workers <= 0 or not available:
+                _shared_disabled = True
+                return None
+            _shared_pool = YtdlpWorkerPool(workers)
+            atexit.register(_shared_pool.shutdown)
+            logging.debug("yt-dlp worker pool enabled (%d workers)", workers)
+        return _shared_pool
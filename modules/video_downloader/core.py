@@ -15,6 +15,9 @@ from typing import Optional
 import yt_dlp
 from PyQt5.QtCore import QThread, pyqtSignal
 from modules.shared.auth_network_hub import AuthNetworkHub
+from modules.shared.downloaded_store import get_downloaded_store
+from modules.shared.output_tracker import YTDLP_PRINT_FILEPATH_ARGS, OutputTracker
+from modules.shared.ytdlp_pool import YtdlpPoolUnavailable, get_ytdlp_pool
 from modules.config.paths import ensure_deno_in_path
 
 # Ensure Deno JS runtime is in PATH for yt-dlp YouTube EJS challenge solving
@@ -654,24 +657,27 @@ class VideoDownloaderThread(QThread):
         if self.is_bulk_mode:
             self.history_manager = bulk_mode_data.get('history_manager')
             self.bulk_creators = bulk_mode_data.get('creators', {})
-            # Only create tracking files in bulk mode
+            # Only track downloads in bulk mode (the file is imported into the store per path)
             self.downloaded_links_file = Path(save_path) / ".downloaded_links.txt"
+            self.downloaded_store = get_downloaded_store().scope(save_path)
             self.downloaded_links = self._load_downloaded_links()
         else:
             # Single mode: NO tracking files
             self.bulk_creators = {}
             self.downloaded_links_file = None
+            self.downloaded_store = None
             self.downloaded_links = set()
 
     def _load_downloaded_links(self) -> set:
-        """Load downloaded links (bulk mode only)"""
-        if not self.is_bulk_mode or not self.downloaded_links_file:
+        """Already-downloaded links among this run's URLs (bulk mode only)"""
+        if not self.is_bulk_mode or self.downloaded_store is None:
             return set()  # Single mode: never load files
 
         try:
-            if self.downloaded_links_file.exists():
-                with open(self.downloaded_links_file, 'r', encoding='utf-8') as f:
-                    return set(line.strip() for line in f if line.strip())
+            store = self.downloaded_store.store
+            store.migrate_text_file(self.downloaded_store.scope, self.downloaded_links_file)
+            # One bulk query instead of reading the whole history into memory
+            return self.downloaded_store.known(normalize_url(u) for u in self.urls)
         except Exception:
             pass
         return set()
@@ -682,14 +688,15 @@ class VideoDownloaderThread(QThread):
         if not self.is_bulk_mode:
             return  # Single mode: NO file operations
 
-        if not self.downloaded_links_file:
-            return  # Extra safety: no file path set
+        if self.downloaded_store is None:
+            return  # Extra safety: no store for this run
 
         try:
             normalized = normalize_url(url)
             self.downloaded_links.add(normalized)
+            self.downloaded_store.add(url=normalized, platform=_detect_platform(url))
 
-            # Write to file (only in bulk mode)
+            # Also kept in the folder's file, so a moved folder re-imports it
             with open(self.downloaded_links_file, 'a', encoding='utf-8') as f:
                 f.write(f"{normalized}\n")
         except Exception as e:
@@ -948,57 +955,32 @@ class VideoDownloaderThread(QThread):
             return frozenset(self._VIDEO_EXTENSIONS.union(self._AUDIO_EXTENSIONS))
         return self._MEDIA_EXTENSIONS
 
-    def _snapshot_folder(self, folder: str) -> set:
-        """Take a recursive snapshot of all files in folder (path → mtime+size)."""
-        result = set()
-        try:
-            for root, _dirs, files in os.walk(folder):
-                for f in files:
-                    fp = os.path.join(root, f)
-                    try:
-                        st = os.stat(fp)
-                        result.add((fp, st.st_size, st.st_mtime_ns))
-                    except OSError:
-                        pass
-        except OSError:
-            pass
-        return result
+    def _track_outputs(self, folder: str, nested: bool = False) -> OutputTracker:
+        """Start tracking the files the next download attempt writes to folder.
+
+        The yt-dlp hooks of this thread report into the active tracker;
+        nested trackers (retries inside a method) also report to the outer one.
+        """
+        parent = getattr(self, "_output_tracker", None) if nested else None
+        tracker = OutputTracker(folder, parent=parent)
+        self._output_tracker = tracker
+        return tracker
 
-    def _verify_download(self, folder: str, before: set, tag: str = "",
+    def _verify_download(self, folder: str, tracker: OutputTracker, tag: str = "",
                          expected_kind: Optional[str] = None) -> list:
-        """Compare folder state after download. Return list of new valid media files.
+        """Return list of new valid media files written since tracker started.
 
         A file is considered valid if:
-          - it did not exist in *before* snapshot (or grew in size)
+          - yt-dlp / the CLI reported it, or (fallback) it was created in
+            folder after the attempt started
           - extension is a known media type (not .part / .tmp / .ytdl)
           - size >= _MIN_MEDIA_SIZE
         """
-        new_files = []
-        expected_extensions = self._resolve_expected_extensions(expected_kind)
-        try:
-            for root, _dirs, files in os.walk(folder):
-                for f in files:
-                    fp = os.path.join(root, f)
-                    ext = os.path.splitext(f)[1].lower()
-                    # Skip junk / incomplete
-                    if ext in self._JUNK_EXTENSIONS:
-                        continue
-                    try:
-                        st = os.stat(fp)
-                    except OSError:
-                        continue
-                    # Must be new or changed
-                    key = (fp, st.st_size, st.st_mtime_ns)
-                    if key in before:
-                        continue
-                    # Must be a real media file
-                    if ext not in expected_extensions:
-                        continue
-                    if st.st_size < self._MIN_MEDIA_SIZE:
-                        continue
-                    new_files.append(fp)
-        except OSError:
-            pass
+        new_files = tracker.new_files(
+            self._resolve_expected_extensions(expected_kind),
+            min_size=self._MIN_MEDIA_SIZE,
+            skip_extensions=self._JUNK_EXTENSIONS,
+        )
 
         if new_files and tag:
             self.progress.emit(f"   {tag} verified: {Path(new_files[0]).name}")
@@ -1006,6 +988,20 @@ class VideoDownloaderThread(QThread):
             self.progress.emit(f"   {tag} no valid media file created")
         return new_files
 
+    def _note_cli_output(self, stdout: Optional[str]) -> None:
+        """Feed paths printed by a CLI downloader to the active tracker."""
+        tracker = getattr(self, "_output_tracker", None)
+        if tracker is not None:
+            tracker.note_output(stdout)
+
+    def _postprocessor_hook(self, d):
+        tracker = getattr(self, "_output_tracker", None)
+        if tracker is not None:
+            try:
+                tracker.postprocessor_hook(d)
+            except Exception:
+                pass
+
     def _remember_verified_output(self, url: str, verified_files: list) -> Optional[str]:
         """Persist the exact verified media path for downstream callers."""
         if not verified_files:
@@ -1056,7 +1052,7 @@ class VideoDownloaderThread(QThread):
         Returns True only when a valid media file is confirmed on disk.
         """
         self._last_method_error = ""
-        before = self._snapshot_folder(output_path)
+        tracker = self._track_outputs(output_path, nested=True)
         last_error = ""
 
         # Attempt 1: with healthy proxy
@@ -1066,7 +1062,7 @@ class VideoDownloaderThread(QThread):
             self.progress.emit(f"   {tag} proxy: {proxy.split('@')[-1][:25]}")
             try:
                 self._run_ytdlp(ydl_opts, url)
-                new_files = self._verify_download(output_path, before, tag)
+                new_files = self._verify_download(output_path, tracker, tag)
                 if new_files:
                     self._last_method_error = ""
                     return True
@@ -1086,10 +1082,10 @@ class VideoDownloaderThread(QThread):
         # Attempt 2: without proxy
         ydl_opts.pop('proxy', None)
         self.progress.emit(f"   {tag} retrying without proxy...")
-        before = self._snapshot_folder(output_path)  # re-snapshot
+        tracker = self._track_outputs(output_path, nested=True)  # fresh attempt
         try:
             self._run_ytdlp(ydl_opts, url)
-            new_files = self._verify_download(output_path, before, tag)
+            new_files = self._verify_download(output_path, tracker, tag)
             if new_files:
                 self._last_method_error = ""
                 return True
@@ -1117,6 +1113,7 @@ class VideoDownloaderThread(QThread):
                 opts['js_runtimes'] = js_runtime_cfg
         captured_messages = []
 
+        opts['postprocessor_hooks'] = list(opts.get('postprocessor_hooks') or []) + [self._postprocessor_hook]
         if not opts.get('logger'):
             class _CapturingLogger:
                 def debug(self, msg):
@@ -1140,8 +1137,16 @@ class VideoDownloaderThread(QThread):
             opts['logger'] = _CapturingLogger()
 
         try:
-            with yt_dlp.YoutubeDL(opts) as ydl:
-                rc = ydl.download([url])
+            rc = None
+            pool = get_ytdlp_pool()
+            if pool is not None:
+                try:
+                    rc = pool.download(url, opts, should_cancel=lambda: self.cancelled)
+                except YtdlpPoolUnavailable:
+                    rc = None
+            if rc is None:
+                with yt_dlp.YoutubeDL(opts) as ydl:
+                    rc = ydl.download([url])
         except Exception as exc:
             detail = ""
             detail = _pick_more_informative_error(detail, str(exc))
@@ -1581,10 +1586,12 @@ class VideoDownloaderThread(QThread):
                     if current_cookie:
                         cmd.extend(['--cookies', current_cookie])
 
+                    cmd.extend(YTDLP_PRINT_FILEPATH_ARGS)
                     cmd.append(url)
 
                     result = subprocess.run(cmd, capture_output=True, text=True,
                                           timeout=300, encoding='utf-8', errors='replace')
+                    self._note_cli_output(result.stdout)
 
                     if result.returncode == 0:
                         watermark_status = "ðŸŽ‰ NO WATERMARK!" if "hd-1" in fmt else ""
@@ -1989,6 +1996,8 @@ class VideoDownloaderThread(QThread):
 
             post = instaloader.Post.from_shortcode(loader.context, shortcode)
             target = post.owner_username or "instagram"
+            if getattr(self, "_output_tracker", None) is not None:
+                self._output_tracker.add_search_dir(os.path.join(output_path, target))
             loader.download_post(post, target=target)
             self.progress.emit("âœ… Instaloader SUCCESS")
             return True
@@ -2021,6 +2030,8 @@ class VideoDownloaderThread(QThread):
                 encoding='utf-8',
                 errors='replace'
             )
+            # gallery-dl prints each file it writes under --dest
+            self._note_cli_output(result.stdout)
 
             if result.returncode == 0:
                 self.progress.emit("âœ… gallery-dl SUCCESS!")
@@ -2069,6 +2080,7 @@ class VideoDownloaderThread(QThread):
             if cookie_file:
                 cmd.extend(['--cookies', cookie_file])
 
+            cmd.extend(YTDLP_PRINT_FILEPATH_ARGS)
             cmd.append(url)
 
             result = subprocess.run(
@@ -2079,6 +2091,7 @@ class VideoDownloaderThread(QThread):
                 encoding='utf-8',
                 errors='replace'
             )
+            self._note_cli_output(result.stdout)
             cli_detail = _clean_download_error_message(
                 f"{result.stderr or ''} {result.stdout or ''}"
             )
@@ -2402,6 +2415,7 @@ class VideoDownloaderThread(QThread):
                 self.progress.emit(f"   ðŸª Cookies: {Path(cookie_file).name}")
 
             self.progress.emit(f"   ðŸŽ­ UA: {user_agent[:45]}...")
+            cmd.extend(YTDLP_PRINT_FILEPATH_ARGS)
             cmd.append(url)
             result = subprocess.run(
                 cmd,
@@ -2411,6 +2425,7 @@ class VideoDownloaderThread(QThread):
                 encoding='utf-8',
                 errors='replace'
             )
+            self._note_cli_output(result.stdout)
             if result.returncode == 0:
                 self.progress.emit("âœ… Method 5 SUCCESS!")
                 return True
@@ -2425,6 +2440,9 @@ class VideoDownloaderThread(QThread):
             return False
 
     def _progress_hook(self, d):
+        tracker = getattr(self, "_output_tracker", None)
+        if tracker is not None:
+            tracker.progress_hook(d)
         try:
             if self.cancelled:
                 raise Exception("Cancelled by user")
@@ -2478,7 +2496,7 @@ class VideoDownloaderThread(QThread):
                 self.progress.emit(f"ðŸ“‚ Creators: {len(self.bulk_creators)}")
                 self.progress.emit("âœ… History tracking: ON")
                 self.progress.emit("âœ… Auto URL cleanup: ON")
-                self.progress.emit(f"ðŸ“ Track file: {self.downloaded_links_file.name}")
+                self.progress.emit(f"ðŸ“ Track store: {self.downloaded_store.store.db_path.name}")
             else:
                 self.progress.emit("ðŸ“ Save: Desktop/Toseeq Downloads")
                 self.progress.emit("âš¡ Simple mode: No tracking, no extra files")
@@ -2654,10 +2672,10 @@ class VideoDownloaderThread(QThread):
                     method_error = ""
                     try:
                         self._last_method_error = ""
-                        method_before = self._snapshot_folder(folder)
+                        method_tracker = self._track_outputs(folder)
                         method_ok = bool(method(url, folder, cookie_file))
                         verified_files = self._verify_download(
-                            folder, method_before, expected_kind=expected_media_kind,
+                            folder, method_tracker, expected_kind=expected_media_kind,
                         )
                         if verified_files:
                             success = True
@@ -2742,11 +2760,11 @@ class VideoDownloaderThread(QThread):
                                             self._emit_cookie_debug_try(_cdp_fresh)
                                             for method in methods[:2]:
                                                 try:
-                                                    method_before = self._snapshot_folder(folder)
+                                                    method_tracker = self._track_outputs(folder)
                                                     if method(url, folder, _cdp_fresh):
                                                         verified_files = self._verify_download(
                                                             folder,
-                                                            method_before,
+                                                            method_tracker,
                                                             expected_kind=expected_media_kind,
                                                         )
                                                         if verified_files:
@@ -2768,11 +2786,11 @@ class VideoDownloaderThread(QThread):
                                     self._emit_cookie_debug_try(cookie_file)
                                     for method in methods[:2]:
                                         try:
-                                            method_before = self._snapshot_folder(folder)
+                                            method_tracker = self._track_outputs(folder)
                                             if method(url, folder, cookie_file):
                                                 verified_files = self._verify_download(
                                                     folder,
-                                                    method_before,
+                                                    method_tracker,
                                                     expected_kind=expected_media_kind,
                                                 )
                                                 if verified_files:
@@ -2,6 +2,7 @@ import threading
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Callable, List
+from modules.shared.downloaded_store import get_downloaded_store
 from .yt_dlp_worker import YtDlpWorker
 import time
 
@@ -42,8 +43,13 @@ class DownloadManager:
         return self._tasks
 
     def _on_complete(self, task, success, message, on_complete):
-        # Called from worker thread; ensure we update downloaded_links atomically
+        # Called from worker thread; the shared store is safe for concurrent writers
         folder = task['folder']
+        try:
+            get_downloaded_store().scope(folder).add(url=task['url'])
+        except Exception:
+            pass
+        # The text file travels with the folder: a moved folder re-imports it
         dl_file = Path(folder) / ".downloaded_links.txt"
         try:
             lock = self._get_folder_lock(folder)
@@ -2,10 +2,14 @@
 modules/video_editor/editor_batch_processor.py
 Editor Batch Processor - Handles batch video processing in background thread
 Applies presets and exports videos with progress tracking
+Videos can run several at a time (settings.parallel_videos); results are
+still reported in batch order
 """
 
 import os
 import shutil
+import subprocess
+import threading
 import time
 from pathlib import Path
 from typing import Dict, List, Any, Optional
@@ -33,6 +37,10 @@ class ProcessingStatus(Enum):
     CANCELLED = "cancelled"
 
 
+class ProcessingCancelled(Exception):
+    """Raised when an in-flight video is stopped by cancel()"""
+
+
 @dataclass
 class VideoProcessResult:
     """Result of processing a single video"""
@@ -76,10 +84,24 @@ class EditorBatchWorker(QThread):
 
         self.results: List[VideoProcessResult] = []
 
+        # Worker pool state (see run)
+        self._lock = threading.Lock()
+        self._emit_lock = threading.Lock()
+        self._active_processes = set()
+        self._preset_manager = None
+        self._encoder_threads = 0
+
     def cancel(self):
-        """Cancel processing"""
+        """Cancel processing and stop the FFmpeg jobs still running"""
         self._cancelled = True
         self.log_message.emit("Processing cancelled by user", "warning")
+        with self._lock:
+            processes = list(self._active_processes)
+        for process in processes:
+            try:
+                process.terminate()
+            except Exception:
+                pass
 
     def pause(self):
         """Pause processing"""
@@ -107,8 +129,9 @@ class EditorBatchWorker(QThread):
         self.log_message.emit(f"Starting batch processing of {total} videos", "info")
         logger.info(f"   Processing loop starting...")
 
-        # Load preset if specified
+        # Load and compile preset once for the whole batch
         preset = None
+        operations = None
         logger.info(f"   Checking for preset...")
         logger.info(f"   Settings: {self.settings is not None}")
         if self.settings:
@@ -120,136 +143,49 @@ class EditorBatchWorker(QThread):
             if preset:
                 logger.info(f"   ✅ Preset loaded successfully")
                 self.log_message.emit(f"Loaded preset: {self.settings.preset_id}", "info")
+                operations = self._compile_preset(preset)
+                if operations is None:
+                    preset = None
             else:
                 logger.warning(f"   ⚠️  Preset not found or failed to load")
                 self.log_message.emit(f"Preset not found: {self.settings.preset_id}", "warning")
         else:
             logger.info(f"   No preset specified, will process without preset")
 
-        for idx, video_info in enumerate(self.videos):
-            logger.info(f"   📹 Processing video {idx + 1}/{total}")
-            logger.info(f"      Video info: {video_info}")
-
-            # Check if cancelled
-            if self._cancelled:
-                # Mark remaining as cancelled
-                for remaining_idx in range(idx, total):
-                    self.results.append(VideoProcessResult(
-                        source_path=self.videos[remaining_idx]['source'],
-                        destination_path=self.videos[remaining_idx]['destination'],
+        from modules.video_editor.videos_merger.batch_pool import BatchPool, encoder_threads_for
+
+        workers = 1
+        if self.settings and self.settings.parallel_videos:
+            workers = max(1, min(int(self.settings.parallel_videos), total))
+        self._encoder_threads = encoder_threads_for(workers) if workers > 1 else 0
+        if workers > 1:
+            logger.info(f"   Worker pool: {workers} videos at once, {self._encoder_threads} encoder threads each")
+            self.log_message.emit(f"Processing {workers} videos in parallel", "info")
+
+        self._started_count = 0
+        self._completed = [None] * total
+        self._not_started = set()
+        self._next_to_emit = 0
+
+        jobs = [
+            (lambda report, idx=idx, video_info=video_info:
+                self._process_video_job(idx, video_info, preset, operations))
+            for idx, video_info in enumerate(self.videos)
+        ]
+        pool = BatchPool(workers, control_state=lambda: (self._paused, self._cancelled))
+        pool.run(jobs)
+
+        # Videos that never started were cancelled; record them without emitting
+        with self._lock:
+            for idx, result in enumerate(self._completed):
+                if result is None:
+                    self._not_started.add(idx)
+                    self._completed[idx] = VideoProcessResult(
+                        source_path=self.videos[idx]['source'],
+                        destination_path=self.videos[idx]['destination'],
                         status=ProcessingStatus.CANCELLED
-                    ))
-                break
-
-            # Wait if paused
-            while self._paused and not self._cancelled:
-                time.sleep(0.5)
-
-            if self._cancelled:
-                break
-
-            source_path = video_info['source']
-            dest_path = video_info['destination']
-            is_dual_video = video_info.get('is_dual_video', False)
-            secondary_path = video_info.get('secondary', None)
-
-            logger.info(f"      Source path: {source_path}")
-            logger.info(f"      Dest path: {dest_path}")
-            if is_dual_video:
-                logger.info(f"      Secondary path: {secondary_path}")
-                logger.info(f"      Dual video mode: ENABLED")
-
-            # Emit progress
-            self.progress.emit(idx + 1, total)
-            self.video_started.emit(source_path, idx + 1, total)
-            # Show full path for better tracking
-            if is_dual_video:
-                self.log_message.emit(f"Processing [{idx + 1}/{total}] DUAL VIDEO: {source_path} + {os.path.basename(secondary_path)}", "info")
-            else:
-                self.log_message.emit(f"Processing [{idx + 1}/{total}]: {source_path}", "info")
-
-            # Update preset with secondary video path if dual video mode
-            if is_dual_video and secondary_path and preset:
-                logger.info(f"      🎬 Dual Video Mode - Updating secondary video path")
-                logger.info(f"      Secondary video: {secondary_path}")
-                updated = False
-                for operation in preset.operations:
-                    if operation['operation'] == 'dual_video_merge':
-                        logger.info(f"      Before update: {operation['params'].get('secondary_video_path')}")
-                        operation['params']['secondary_video_path'] = secondary_path
-                        logger.info(f"      After update: {operation['params'].get('secondary_video_path')}")
-                        logger.info(f"      ✅ Secondary video path updated in preset")
-                        updated = True
-                        break
-                if not updated:
-                    logger.warning(f"      ⚠️  No dual_video_merge operation found in preset!")
-            elif is_dual_video and not secondary_path:
-                logger.warning(f"      ⚠️  Dual video mode but no secondary path provided!")
-            elif is_dual_video and not preset:
-                logger.warning(f"      ⚠️  Dual video mode but no preset loaded!")
-
-            # Process video
-            start_time = time.time()
-            result = self._process_single_video(source_path, dest_path, preset)
-            result.processing_time = time.time() - start_time
-
-            # Delete secondary video if dual video mode and processing succeeded
-            if is_dual_video and secondary_path and result.status == ProcessingStatus.SUCCESS:
-                if self.settings and self.settings.delete_source_after_edit:
-                    logger.info(f"      Deleting secondary video: {secondary_path}")
-
-                    # Wait and force GC for file handle release
-                    import gc
-                    gc.collect()
-                    time.sleep(0.5)
-
-                    try:
-                        # Try with retry logic
-                        max_retries = 3
-                        for attempt in range(max_retries):
-                            try:
-                                if os.path.exists(secondary_path):
-                                    os.remove(secondary_path)
-                                    logger.info(f"      ✅ Secondary video deleted successfully")
-                                    self.log_message.emit(f"🗑️  Deleted secondary: {os.path.basename(secondary_path)}", "info")
-                                    break
-                            except PermissionError:
-                                if attempt < max_retries - 1:
-                                    logger.warning(f"      Retry {attempt + 1}/{max_retries}: Secondary file locked, waiting...")
-                                    time.sleep(1.0)
-                                else:
-                                    raise
-                    except Exception as e:
-                        logger.warning(f"      ⚠️  Failed to delete secondary video after {max_retries} attempts: {e}")
-                        self.log_message.emit(f"⚠️  Could not delete secondary (file in use): {os.path.basename(secondary_path)}", "warning")
-
-            self.results.append(result)
-
-            # Update plan counter on success
-            if result.status == ProcessingStatus.SUCCESS and self.plan_checker:
-                self.plan_checker.increment_processed(1)
-
-            # Emit result
-            self.video_completed.emit({
-                'source': result.source_path,
-                'destination': result.destination_path,
-                'status': result.status.value,
-                'error': result.error_message,
-                'time': result.processing_time,
-                'deleted': result.source_deleted
-            })
-
-            # Log result with full path
-            if result.status == ProcessingStatus.SUCCESS:
-                self.log_message.emit(
-                    f"✅ SUCCESS: {source_path}\n   → Saved to: {dest_path} ({result.processing_time:.1f}s)",
-                    "success"
-                )
-            else:
-                self.log_message.emit(
-                    f"❌ FAILED: {source_path}\n   → Error: {result.error_message}",
-                    "error"
-                )
+                    )
+        self._emit_completed()
 
         # Emit final summary
         summary = self._get_summary()
@@ -259,7 +195,163 @@ class EditorBatchWorker(QThread):
         )
         self.processing_finished.emit(summary)
 
-    def _process_single_video(self, source_path: str, dest_path: str, preset=None) -> VideoProcessResult:
+    def _process_video_job(self, idx: int, video_info: Dict[str, Any], preset, operations) -> VideoProcessResult:
+        """
+        Process one video of the batch (runs on a worker pool thread)
+
+        Args:
+            idx: Index of the video in self.videos
+            video_info: Video entry (source, destination, dual video fields)
+            preset: Loaded preset (None for simple edit)
+            operations: Preset compiled by PresetManager.compile_preset
+
+        Returns:
+            VideoProcessResult (FAILED if processing raised)
+        """
+        try:
+            result = self._run_video_job(idx, video_info, preset, operations)
+        except Exception as e:
+            logger.error(f"      ❌ Video {idx + 1} raised: {e}", exc_info=True)
+            result = VideoProcessResult(
+                source_path=video_info['source'],
+                destination_path=video_info['destination'],
+                status=ProcessingStatus.FAILED,
+                error_message=str(e)
+            )
+
+        with self._lock:
+            self._completed[idx] = result
+        self._emit_completed()
+        return result
+
+    def _run_video_job(self, idx: int, video_info: Dict[str, Any], preset, operations) -> VideoProcessResult:
+        """Body of _process_video_job; exceptions are turned into FAILED there"""
+        total = len(self.videos)
+        logger.info(f"   📹 Processing video {idx + 1}/{total}")
+        logger.info(f"      Video info: {video_info}")
+
+        source_path = video_info['source']
+        dest_path = video_info['destination']
+        is_dual_video = video_info.get('is_dual_video', False)
+        secondary_path = video_info.get('secondary', None)
+
+        logger.info(f"      Source path: {source_path}")
+        logger.info(f"      Dest path: {dest_path}")
+        if is_dual_video:
+            logger.info(f"      Secondary path: {secondary_path}")
+            logger.info(f"      Dual video mode: ENABLED")
+
+        # Emit progress
+        with self._lock:
+            self._started_count += 1
+            started = self._started_count
+        self.progress.emit(started, total)
+        self.video_started.emit(source_path, idx + 1, total)
+        # Show full path for better tracking
+        if is_dual_video:
+            self.log_message.emit(f"Processing [{idx + 1}/{total}] DUAL VIDEO: {source_path} + {os.path.basename(secondary_path)}", "info")
+        else:
+            self.log_message.emit(f"Processing [{idx + 1}/{total}]: {source_path}", "info")
+
+        # Point this video's copy of the dual video operation at its secondary video
+        if is_dual_video and secondary_path and preset:
+            logger.info(f"      🎬 Dual Video Mode - Updating secondary video path")
+            logger.info(f"      Secondary video: {secondary_path}")
+            updated = False
+            video_operations = []
+            for op_name, params in operations:
+                if op_name == 'dual_video_merge' and not updated:
+                    params = dict(params, secondary_video_path=secondary_path)
+                    logger.info(f"      ✅ Secondary video path updated in preset")
+                    updated = True
+                video_operations.append((op_name, params))
+            operations = video_operations
+            if not updated:
+                logger.warning(f"      ⚠️  No dual_video_merge operation found in preset!")
+        elif is_dual_video and not secondary_path:
+            logger.warning(f"      ⚠️  Dual video mode but no secondary path provided!")
+        elif is_dual_video and not preset:
+            logger.warning(f"      ⚠️  Dual video mode but no preset loaded!")
+
+        # Process video
+        start_time = time.time()
+        result = self._process_single_video(source_path, dest_path, preset, operations)
+        result.processing_time = time.time() - start_time
+
+        # Delete secondary video if dual video mode and processing succeeded
+        if is_dual_video and secondary_path and result.status == ProcessingStatus.SUCCESS:
+            if self.settings and self.settings.delete_source_after_edit:
+                logger.info(f"      Deleting secondary video: {secondary_path}")
+
+                # Wait and force GC for file handle release
+                import gc
+                gc.collect()
+                time.sleep(0.5)
+
+                try:
+                    # Try with retry logic
+                    max_retries = 3
+                    for attempt in range(max_retries):
+                        try:
+                            if os.path.exists(secondary_path):
+                                os.remove(secondary_path)
+                                logger.info(f"      ✅ Secondary video deleted successfully")
+                                self.log_message.emit(f"🗑️  Deleted secondary: {os.path.basename(secondary_path)}", "info")
+                                break
+                        except PermissionError:
+                            if attempt < max_retries - 1:
+                                logger.warning(f"      Retry {attempt + 1}/{max_retries}: Secondary file locked, waiting...")
+                                time.sleep(1.0)
+                            else:
+                                raise
+                except Exception as e:
+                    logger.warning(f"      ⚠️  Failed to delete secondary video after {max_retries} attempts: {e}")
+                    self.log_message.emit(f"⚠️  Could not delete secondary (file in use): {os.path.basename(secondary_path)}", "warning")
+
+        return result
+
+    def _emit_completed(self):
+        """Record and emit finished videos in batch order"""
+        with self._emit_lock:
+            while self._next_to_emit < len(self._completed):
+                result = self._completed[self._next_to_emit]
+                if result is None:
+                    break
+                self._next_to_emit += 1
+                self.results.append(result)
+                if self._next_to_emit - 1 in self._not_started:
+                    continue
+
+                # Update plan counter on success
+                if result.status == ProcessingStatus.SUCCESS and self.plan_checker:
+                    self.plan_checker.increment_processed(1)
+
+                # Emit result
+                self.video_completed.emit({
+                    'source': result.source_path,
+                    'destination': result.destination_path,
+                    'status': result.status.value,
+                    'error': result.error_message,
+                    'time': result.processing_time,
+                    'deleted': result.source_deleted
+                })
+
+                # Log result with full path
+                if result.status == ProcessingStatus.SUCCESS:
+                    self.log_message.emit(
+                        f"✅ SUCCESS: {result.source_path}\n   → Saved to: {result.destination_path} ({result.processing_time:.1f}s)",
+                        "success"
+                    )
+                elif result.status == ProcessingStatus.CANCELLED:
+                    self.log_message.emit(f"⏹️  CANCELLED: {result.source_path}", "warning")
+                else:
+                    self.log_message.emit(
+                        f"❌ FAILED: {result.source_path}\n   → Error: {result.error_message}",
+                        "error"
+                    )
+
+    def _process_single_video(self, source_path: str, dest_path: str, preset=None,
+                              operations=None) -> VideoProcessResult:
         """
         Process a single video
 
@@ -267,6 +359,7 @@ class EditorBatchWorker(QThread):
             source_path: Path to source video
             dest_path: Path to save processed video
             preset: Optional preset to apply
+            operations: Compiled preset operations for this video
 
         Returns:
             VideoProcessResult
@@ -302,10 +395,10 @@ class EditorBatchWorker(QThread):
             if preset:
                 # Try processing with preset using VideoEditor
                 logger.info(f"   Processing WITH preset...")
-                success = self._process_with_preset(source_path, dest_path, preset)
+                success = self._process_with_preset(source_path, dest_path, preset, operations)
 
                 # If preset fails, fallback to simple processing
-                if not success:
+                if not success and not self._cancelled:
                     logger.warning(f"   Preset processing failed, falling back to simple processing...")
                     self.log_message.emit(f"⚠️  Preset failed, using default processing (110% zoom + metadata removal)", "warning")
                     success = self._process_with_simple_edit(source_path, dest_path)
@@ -369,11 +462,18 @@ class EditorBatchWorker(QThread):
                     # Mark as deleted for statistics since the original was replaced
                     if self.settings and self.settings.delete_source_after_edit:
                         result.source_deleted = True
+            elif self._cancelled:
+                result.status = ProcessingStatus.CANCELLED
+                result.error_message = "Cancelled while processing"
             else:
                 result.status = ProcessingStatus.FAILED
                 if not result.error_message:
                     result.error_message = "Video processing failed - no detailed error available"
 
+        except ProcessingCancelled:
+            result.status = ProcessingStatus.CANCELLED
+            result.error_message = "Cancelled while processing"
+            logger.info(f"   Processing stopped by cancel: {source_path}")
         except Exception as e:
             result.status = ProcessingStatus.FAILED
             result.error_message = f"{type(e).__name__}: {str(e)}"
@@ -382,7 +482,7 @@ class EditorBatchWorker(QThread):
 
         return result
 
-    def _process_with_preset(self, source_path: str, dest_path: str, preset) -> bool:
+    def _process_with_preset(self, source_path: str, dest_path: str, preset, operations=None) -> bool:
         """
         Process video with preset
 
@@ -390,6 +490,7 @@ class EditorBatchWorker(QThread):
             source_path: Source video path
             dest_path: Destination path
             preset: EditingPreset to apply
+            operations: Operations compiled once per batch (see _compile_preset)
 
         Returns:
             True if successful
@@ -397,10 +498,7 @@ class EditorBatchWorker(QThread):
         temp_file = None
         try:
             logger.info(f"   🎨 _process_with_preset() starting")
-            from modules.video_editor.preset_manager import PresetManager
-
-            preset_manager = PresetManager()
-            logger.info(f"      PresetManager created")
+            preset_manager = self._get_preset_manager()
 
             # Check if in-place editing
             is_inplace = os.path.normpath(source_path) == os.path.normpath(dest_path)
@@ -434,7 +532,8 @@ class EditorBatchWorker(QThread):
                 video_path=source_path,
                 output_path=actual_output,
                 quality=quality,
-                progress_callback=lambda msg: self.log_message.emit(msg, "info")
+                progress_callback=lambda msg: self.log_message.emit(msg, "info"),
+                compiled_operations=operations
             )
 
             logger.info(f"      Preset apply result: {success}")
@@ -560,8 +659,6 @@ class EditorBatchWorker(QThread):
             True if successful
         """
         try:
-            import subprocess
-
             # Ensure destination directory exists
             dest_dir = os.path.dirname(dest_path)
             if dest_dir and not os.path.exists(dest_dir):
@@ -593,6 +690,7 @@ class EditorBatchWorker(QThread):
                 '-c:v', 'libx264',
                 '-c:a', 'aac',
                 *crf_preset,
+                *self._thread_args(),
                 '-y',  # Overwrite output
                 dest_path
             ]
@@ -600,12 +698,7 @@ class EditorBatchWorker(QThread):
             self.log_message.emit(f"🎬 Running FFmpeg (quality: {quality})...", "info")
 
             # Run FFmpeg with extended timeout
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=1800  # 30 minute timeout for basic conversion
-            )
+            result = self._run_ffmpeg(cmd, timeout=1800)  # 30 minute timeout for basic conversion
 
             if result.returncode != 0:
                 error_msg = result.stderr[-500:] if result.stderr else "Unknown FFmpeg error"
@@ -628,6 +721,10 @@ class EditorBatchWorker(QThread):
                 self.log_message.emit(f"❌ Output file not created after conversion", "error")
                 return False
 
+        except ProcessingCancelled:
+            if os.path.exists(dest_path):
+                os.remove(dest_path)
+            raise
         except subprocess.TimeoutExpired:
             logger.error("FFmpeg timeout (>30 min)")
             self.log_message.emit(f"⏱️  Conversion timeout (>30 min) - very large file, using direct copy", "warning")
@@ -766,8 +863,6 @@ class EditorBatchWorker(QThread):
             True if successful
         """
         try:
-            import subprocess
-
             logger.info(f"   🎬 _process_with_simple_edit() starting")
             logger.info(f"      Source: {source_path}")
             logger.info(f"      Dest: {dest_path}")
@@ -923,6 +1018,7 @@ class EditorBatchWorker(QThread):
                 '-c:v', 'libx264',
                 '-pix_fmt', 'yuv420p',
                 *crf_preset,
+                *self._thread_args(),
                 '-map_metadata', '-1',  # Remove all metadata
                 '-movflags', '+faststart',  # Optimize for web streaming
                 '-y',  # Overwrite output
@@ -947,12 +1043,7 @@ class EditorBatchWorker(QThread):
             logger.info(f"      Starting FFmpeg processing (max 1 hour)...")
             self.log_message.emit(f"⏳ Processing video (timeout: 1 hour)...", "info")
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=3600  # 1 hour timeout for complex processing
-            )
+            result = self._run_ffmpeg(cmd, timeout=3600)  # 1 hour timeout for complex processing
 
             if result.returncode != 0:
                 error_msg = result.stderr[-500:] if result.stderr else "Unknown FFmpeg error"
@@ -1011,6 +1102,11 @@ class EditorBatchWorker(QThread):
                 logger.error(f"      ❌ Output file not created")
                 return False
 
+        except ProcessingCancelled:
+            # Drop the partial output (temp file or destination)
+            if 'actual_output' in locals() and os.path.exists(actual_output):
+                os.remove(actual_output)
+            raise
         except subprocess.TimeoutExpired:
             logger.error("FFmpeg timeout (>1 hour)")
             self.log_message.emit(f"⏱️  Processing timeout (>1 hour) - video may be very large/complex", "error")
@@ -1051,14 +1147,76 @@ class EditorBatchWorker(QThread):
                 os.remove(actual_output)
             return False
 
+    def _thread_args(self) -> List[str]:
+        """FFmpeg thread limit so parallel videos share the cores"""
+        if self._encoder_threads > 0:
+            return ['-threads', str(self._encoder_threads)]
+        return []
+
+    def _run_ffmpeg(self, cmd: List[str], timeout: int) -> subprocess.CompletedProcess:
+        """
+        Run an FFmpeg command that cancel() can stop
+
+        Raises:
+            ProcessingCancelled: if the batch was cancelled
+            subprocess.TimeoutExpired: if FFmpeg ran longer than timeout
+        """
+        if self._cancelled:
+            raise ProcessingCancelled()
+
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors='replace'
+        )
+        with self._lock:
+            self._active_processes.add(process)
+        try:
+            # cancel() may have run before the process was registered
+            if self._cancelled:
+                process.terminate()
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise
+        finally:
+            with self._lock:
+                self._active_processes.discard(process)
+
+        if self._cancelled:
+            raise ProcessingCancelled()
+        return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+
+    def _get_preset_manager(self):
+        """PresetManager shared by every video of the batch"""
+        with self._lock:
+            if self._preset_manager is None:
+                from modules.video_editor.preset_manager import PresetManager
+                self._preset_manager = PresetManager()
+                logger.info(f"      PresetManager created")
+            return self._preset_manager
+
+    def _compile_preset(self, preset):
+        """Validate the preset and normalize its parameters once per batch"""
+        try:
+            operations = self._get_preset_manager().compile_preset(preset)
+            logger.info(f"   ✅ Preset compiled: {len(operations)} operations")
+            return operations
+        except Exception as e:
+            logger.error(f"   ❌ Error compiling preset: {e}", exc_info=True)
+            self.log_message.emit(f"⚠️  Preset could not be prepared, using default processing: {e}", "warning")
+            return None
+
     def _load_preset(self, preset_name: str):
         """Load preset by name - searches all folders (system, user, imported)"""
         try:
             logger.info(f"      _load_preset() called for: {preset_name}")
             from modules.video_editor.preset_manager import PresetManager
 
-            preset_manager = PresetManager()
-            logger.info(f"      PresetManager created")
+            preset_manager = self._get_preset_manager()
 
             # Try loading from all folders (system, user, imported)
             preset = None
@@ -48,6 +48,7 @@ class EditorMappingSettings:
     preset_id: Optional[str] = None
     output_format: str = 'mp4'
     quality: str = 'high'
+    parallel_videos: int = 1  # videos processed at once (1 = one by one)
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -58,7 +59,8 @@ class EditorMappingSettings:
             delete_source_after_edit=data.get('delete_source_after_edit', False),
             preset_id=data.get('preset_id'),
             output_format=data.get('output_format', 'mp4'),
-            quality=data.get('quality', 'high')
+            quality=data.get('quality', 'high'),
+            parallel_videos=data.get('parallel_videos', 1)
         )
 
 
@@ -350,6 +350,14 @@ class BulkProcessingDialog(QDialog):
         self.quality_combo.setCurrentText('high')
         layout.addWidget(self.quality_combo, 3, 1)
 
+        # Parallel videos
+        layout.addWidget(QLabel("Parallel Videos:"), 4, 0)
+        self.parallel_spin = QSpinBox()
+        self.parallel_spin.setRange(1, max(1, os.cpu_count() or 1))
+        self.parallel_spin.setValue(1)
+        self.parallel_spin.setToolTip("Number of videos processed at the same time (1 = one by one)")
+        layout.addWidget(self.parallel_spin, 4, 1)
+
         group.setLayout(layout)
         return group
 
@@ -985,7 +993,8 @@ class BulkProcessingDialog(QDialog):
             delete_source_after_edit=self.delete_yes_radio.isChecked(),
             preset_id=selected_preset_data['name'] if selected_preset_data else None,
             output_format=self.format_combo.currentText(),
-            quality=self.quality_combo.currentText()
+            quality=self.quality_combo.currentText(),
+            parallel_videos=self.parallel_spin.value()
         )
 
         # Add preset data to mapping for processor
@@ -1136,7 +1145,8 @@ class BulkProcessingDialog(QDialog):
             f"Delete source after edit: {'Yes' if config['settings'].delete_source_after_edit else 'No'}\n"
             f"Preset: {config['settings'].preset_id or 'None'}\n"
             f"Output format: {config['settings'].output_format}\n"
-            f"Quality: {config['settings'].quality}",
+            f"Quality: {config['settings'].quality}\n"
+            f"Parallel videos: {config['settings'].parallel_videos}",
             QMessageBox.Yes | QMessageBox.No
         )
 
@@ -6,7 +6,7 @@ Save editing operations as presets and apply to multiple videos
 
 import os
 import json
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -727,9 +727,69 @@ class PresetManager:
 
         return value
 
+    def compile_preset(self, preset: EditingPreset) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Validate a preset and normalize its operation parameters once
+
+        The result can be passed to apply_preset_to_video for every video of
+        a batch, so validation and parameter fixing don't run per video.
+
+        Args:
+            preset: EditingPreset to compile
+
+        Returns:
+            List of (operation name, params) ready to call on a VideoEditor
+        """
+        from modules.video_editor.core import VideoEditor
+
+        if self.preset_validator:
+            validation = self.preset_validator.validate_preset_data(preset.to_dict())
+            if not validation.valid:
+                logger.warning("Preset validation failed, attempting to continue with auto-fixes")
+            if validation.warnings:
+                logger.info(f"Preset validation warnings: {len(validation.warnings)}")
+
+        operations = preset.operations if isinstance(preset.operations, list) else []
+
+        compiled = []
+        for i, operation in enumerate(operations):
+            if not isinstance(operation, dict):
+                logger.warning(f"Skipping invalid operation at index {i}")
+                continue
+
+            op_name = operation.get('operation')
+            if not op_name or not isinstance(op_name, str):
+                logger.warning(f"Skipping invalid operation name at index {i}")
+                continue
+
+            params = operation.get('params', {})
+            if isinstance(params, dict):
+                params = params.copy()
+            else:
+                logger.warning(f"Invalid params for operation '{op_name}', using empty params")
+                params = {}
+
+            # Fix parameter names for specific operations
+            if op_name == 'crop':
+                # VideoEditor.crop() only accepts: x1, y1, x2, y2, preset
+                # Remove width, height parameters and rename aspect_ratio to preset
+                if 'aspect_ratio' in params:
+                    params['preset'] = params.pop('aspect_ratio')
+                # Remove unsupported parameters
+                params.pop('width', None)
+                params.pop('height', None)
+
+            # Validate and fix missing required parameters (against the
+            # VideoEditor class, so no video has to be loaded for it)
+            params = self._validate_and_fix_params(VideoEditor, op_name, params)
+            compiled.append((op_name, params))
+
+        return compiled
+
     def apply_preset_to_video(self, preset: EditingPreset, video_path: str,
                              output_path: str, quality: str = 'high',
-                             progress_callback=None) -> bool:
+                             progress_callback=None,
+                             compiled_operations: Optional[List[Tuple[str, Dict[str, Any]]]] = None) -> bool:
         """
         Apply preset to a single video
 
@@ -739,6 +799,7 @@ class PresetManager:
             output_path: Output video path
             quality: Export quality
             progress_callback: Optional callback function(message)
+            compiled_operations: Result of compile_preset (compiled here if None)
 
         Returns:
             True if successful, False otherwise
@@ -749,56 +810,22 @@ class PresetManager:
             if progress_callback:
                 progress_callback(f"Loading video: {os.path.basename(video_path)}")
 
+            if compiled_operations is None:
+                compiled_operations = self.compile_preset(preset)
+
             # Create editor
             editor = VideoEditor(video_path)
 
-            # Validate preset once before applying
-            if self.preset_validator:
-                validation = self.preset_validator.validate_preset_data(preset.to_dict())
-                if not validation.valid:
-                    logger.warning("Preset validation failed, attempting to continue with auto-fixes")
-                if validation.warnings:
-                    logger.info(f"Preset validation warnings: {len(validation.warnings)}")
-
-            operations = preset.operations if isinstance(preset.operations, list) else []
-
             # Apply all operations
-            for i, operation in enumerate(operations):
-                if not isinstance(operation, dict):
-                    logger.warning(f"Skipping invalid operation at index {i}")
-                    continue
-
-                op_name = operation.get('operation')
-                if not op_name or not isinstance(op_name, str):
-                    logger.warning(f"Skipping invalid operation name at index {i}")
-                    continue
-
-                params = operation.get('params', {})
-                if isinstance(params, dict):
-                    params = params.copy()
-                else:
-                    logger.warning(f"Invalid params for operation '{op_name}', using empty params")
-                    params = {}
+            for i, (op_name, params) in enumerate(compiled_operations):
+                params = dict(params)
 
                 if progress_callback:
-                    progress_callback(f"Applying {op_name}... ({i+1}/{len(operations)})")
+                    progress_callback(f"Applying {op_name}... ({i+1}/{len(compiled_operations)})")
 
                 logger.info(f"   Applying operation: {op_name}")
                 logger.info(f"   Operation params: {params}")
 
-                # Fix parameter names for specific operations
-                if op_name == 'crop':
-                    # VideoEditor.crop() only accepts: x1, y1, x2, y2, preset
-                    # Remove width, height parameters and rename aspect_ratio to preset
-                    if 'aspect_ratio' in params:
-                        params['preset'] = params.pop('aspect_ratio')
-                    # Remove unsupported parameters
-                    params.pop('width', None)
-                    params.pop('height', None)
-
-                # Validate and fix missing required parameters
-                params = self._validate_and_fix_params(editor, op_name, params)
-
                 # Execute operation
                 try:
                     if hasattr(editor, op_name):
@@ -854,6 +881,7 @@ class PresetManager:
         """
         os.makedirs(output_dir, exist_ok=True)
         results = []
+        compiled_operations = self.compile_preset(preset)
 
         for idx, video_path in enumerate(video_paths):
             try:
@@ -875,7 +903,8 @@ class PresetManager:
                         progress_callback(idx + 1, len(video_paths), video_path, msg)
 
                 success = self.apply_preset_to_video(
-                    preset, video_path, output_path, quality, file_progress
+                    preset, video_path, output_path, quality, file_progress,
+                    compiled_operations=compiled_operations
                 )
 
                 results.append({
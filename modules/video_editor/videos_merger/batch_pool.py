@@ -0,0 +1,118 @@
+"""
+modules/video_editor/videos_merger/batch_pool.py
+Run merge batches and clip extractions concurrently
+
+The heavy work of every job runs in an ffmpeg child process, so a thread
+per job is enough to keep all cores busy. Each job's encoder gets a share of
+the cores (see encoder_threads_for), so N jobs don't each start a full set of
+encoder threads. Pause/cancel go through the same control callback as the
+sequential code: jobs that have not started yet wait while paused and are
+skipped once cancelled. Jobs already running stop through the callback they
+receive.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+from modules.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Encoder threads one merge job needs to run at full speed
+ENCODER_THREADS_PER_JOB = 4
+
+
+def auto_workers(job_count: int, threads_per_job: int = ENCODER_THREADS_PER_JOB, limit: int = 0) -> int:
+    """
+    Number of jobs to run at once
+
+    Args:
+        job_count: Jobs waiting to run
+        threads_per_job: Encoder threads each job uses
+        limit: User cap (0 = automatic)
+
+    Returns:
+        Worker count (1 = sequential)
+    """
+    workers = max(1, (os.cpu_count() or 1) // max(1, threads_per_job))
+    if limit and limit > 0:
+        workers = min(workers, limit)
+    return max(1, min(workers, job_count))
+
+
+def encoder_threads_for(workers: int) -> int:
+    """Encoder threads per job so that all workers together use every core."""
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
+class BatchPool:
+    """Runs jobs on a thread pool, keeping results in job order."""
+
+    def __init__(self, workers: int,
+                 control_state: Optional[Callable[[], Tuple[bool, bool]]] = None):
+        """
+        Args:
+            workers: Jobs run at once
+            control_state: Returns (paused, cancelled)
+        """
+        self.workers = max(1, int(workers))
+        self.control_state = control_state
+        self.cancelled = False
+        self._lock = threading.Lock()
+
+    def _wait_turn(self) -> bool:
+        """Block while paused. Returns False once cancelled."""
+        if not self.control_state:
+            return True
+        paused, cancelled = self.control_state()
+        while paused and not cancelled:
+            time.sleep(0.1)
+            paused, cancelled = self.control_state()
+        return not cancelled
+
+    def run(self, jobs: List[Callable[[Callable[[float], None]], Any]],
+            progress_callback: Optional[Callable[[int, float, float], None]] = None) -> List[Any]:
+        """
+        Run all jobs.
+
+        Each job is called with a report(percent) function. Progress is
+        reported as progress_callback(job_index, job_percent, overall_percent).
+
+        Returns:
+            Job results in job order (None for jobs skipped or failed)
+        """
+        self.cancelled = False
+        results: List[Any] = [None] * len(jobs)
+        progress = [0.0] * len(jobs)
+
+        def report(index: int, percent: float):
+            with self._lock:
+                progress[index] = max(progress[index], min(100.0, float(percent)))
+                job_percent = progress[index]
+                overall = sum(progress) / len(progress)
+            if progress_callback:
+                progress_callback(index, job_percent, overall)
+
+        def execute(index: int):
+            if self.cancelled or not self._wait_turn():
+                self.cancelled = True
+                return
+            try:
+                results[index] = jobs[index](lambda percent: report(index, percent))
+            except Exception as e:
+                logger.error(f"Job {index + 1} failed: {e}", exc_info=True)
+                results[index] = None
+            report(index, 100.0)
+
+        if not jobs:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(jobs)),
+                                thread_name_prefix="merge-job") as pool:
+            for future in [pool.submit(execute, index) for index in range(len(jobs))]:
+                future.result()
+
+        return results
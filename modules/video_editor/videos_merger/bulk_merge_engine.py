@@ -3,9 +3,9 @@ modules/video_editor/videos_merger/bulk_merge_engine.py
 Intelligent bulk folder merging with round-robin batching
 """
 
-import time
 from typing import List, Dict, Any, Optional, Callable
 from pathlib import Path
+from .batch_pool import BatchPool, ENCODER_THREADS_PER_JOB, auto_workers, encoder_threads_for
 from .merge_engine import merge_videos, MergeSettings
 from .utils import get_videos_from_folder, generate_batch_filename
 from modules.logging.logger import get_logger
@@ -205,65 +205,74 @@ class BulkMergeEngine:
             'errors': []
         }
 
-        for i, batch in enumerate(active_batches, 1):
-            if control_callback:
-                paused, cancelled = _get_control_state(control_callback)
-                if cancelled:
-                    results['cancelled'] = True
-                    break
-                was_paused = paused
-                if paused:
-                    logger.info("Processing paused")
-                while paused and not cancelled:
-                    time.sleep(0.1)
-                    paused, cancelled = _get_control_state(control_callback)
-                if cancelled:
-                    results['cancelled'] = True
-                    break
-                if was_paused and not paused:
-                    logger.info("Processing resumed")
+        # Run several batches at once; each merge gets a share of the encoder threads
+        workers = auto_workers(total_active, ENCODER_THREADS_PER_JOB, settings.parallel_jobs)
+        job_settings = settings
+        if workers > 1:
+            job_settings = MergeSettings.from_dict(settings.to_dict())
+            if not job_settings.encoder_threads:
+                job_settings.encoder_threads = encoder_threads_for(workers)
+            logger.info(f"Merging {workers} batches at a time "
+                        f"({job_settings.encoder_threads} encoder threads each)")
+
+        messages = [""] * total_active
+
+        def make_job(index: int, batch: BatchInfo):
+            def job(report):
+                batch.status = 'processing'
+                messages[index] = f"Processing batch {batch.batch_number}"
+                report(0.0)
+
+                # Generate output filename
+                output_filename = generate_batch_filename(batch.batch_number, settings.output_format)
+                output_path = output_folder / output_filename
+                batch.output_path = str(output_path)
+
+                # Merge videos
+                logger.info(f"Merging batch {batch.batch_number}: {len(batch.video_paths)} videos")
+
+                def batch_progress(msg, pct):
+                    messages[index] = msg if workers == 1 else f"Batch {batch.batch_number}: {msg}"
+                    report(pct)
+
+                return merge_videos(
+                    batch.video_paths,
+                    str(output_path),
+                    job_settings,
+                    batch_progress,
+                    control_callback
+                )
+            return job
+
+        def pool_progress(index, batch_pct, overall_pct):
+            if progress_callback:
+                # one batch at a time: that batch's progress, otherwise all batches merged
+                pct = batch_pct if workers == 1 else overall_pct
+                progress_callback(index + 1, total_active, messages[index], pct)
 
-            batch.status = 'processing'
+        pool = BatchPool(workers, lambda: _get_control_state(control_callback))
+        outcomes = pool.run([make_job(index, batch) for index, batch in enumerate(active_batches)],
+                            pool_progress)
 
-            if progress_callback:
-                progress_callback(i, total_active, f"Processing batch {batch.batch_number}", 0)
-
-            # Generate output filename
-            output_filename = generate_batch_filename(batch.batch_number, settings.output_format)
-            output_path = output_folder / output_filename
-            batch.output_path = str(output_path)
-
-            # Merge videos
-            logger.info(f"Merging batch {batch.batch_number}: {len(batch.video_paths)} videos")
-
-            def batch_progress(msg, pct):
-                if progress_callback:
-                    progress_callback(i, total_active, msg, pct)
-
-            success = merge_videos(
-                batch.video_paths,
-                str(output_path),
-                settings,
-                batch_progress,
-                control_callback
-            )
-
-            if control_callback:
-                _, cancelled = _get_control_state(control_callback)
-                if cancelled:
-                    batch.status = 'failed'
-                    batch.error_message = "Cancelled"
-                    results['failed'] += 1
-                    results['errors'].append(f"Batch {batch.batch_number} cancelled")
-                    results['processed'] += 1
-                    results['cancelled'] = True
-                    break
+        for batch, success in zip(active_batches, outcomes):
+            if batch.status == 'pending':
+                # Not started (cancelled before its turn)
+                continue
+
+            _, cancelled = _get_control_state(control_callback)
+            if cancelled and not success:
+                batch.status = 'failed'
+                batch.error_message = "Cancelled"
+                results['failed'] += 1
+                results['errors'].append(f"Batch {batch.batch_number} cancelled")
+                results['processed'] += 1
+                continue
 
             if success:
                 batch.status = 'completed'
                 results['successful'] += 1
-                results['output_files'].append(str(output_path))
-                logger.info(f"Batch {batch.batch_number} completed: {output_path}")
+                results['output_files'].append(batch.output_path)
+                logger.info(f"Batch {batch.batch_number} completed: {batch.output_path}")
             else:
                 batch.status = 'failed'
                 batch.error_message = "Merge failed"
@@ -273,6 +282,9 @@ class BulkMergeEngine:
 
             results['processed'] += 1
 
+        if pool.cancelled or _get_control_state(control_callback)[1]:
+            results['cancelled'] = True
+
         logger.info(f"Bulk processing complete: {results['successful']} successful, "
                     f"{results['failed']} failed, {results['skipped']} skipped")
 
@@ -0,0 +1,217 @@
+"""
+modules/video_editor/videos_merger/clip_extractor.py
+Cut clip windows out of long videos without re-encoding them
+
+The window is snapped to a keyframe from an ffprobe keyframe index and the
+packets are stream-copied. When the exact start matters and no keyframe is
+close enough, only the partial GOP at the head (start -> next keyframe) is
+re-encoded and joined to the copied rest.
+
+The encoded head and the copied tail have different H.264 parameter sets
+(SPS/PPS), while an MP4 track keeps a single set in its header. Both parts
+are therefore written as MPEG-TS (Annex-B, parameter sets in-band before
+every keyframe) and only the joined stream is remuxed to MP4, so each part
+decodes with its own parameter sets. A failed smart cut falls back to
+encoding the whole window.
+"""
+
+import os
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from modules.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+# A keyframe this close (seconds) to an exact start counts as the start
+SNAP_TOLERANCE = 0.5
+
+# x264 profile names for ffprobe's h264 profile names
+X264_PROFILES = {
+    'Constrained Baseline': 'baseline',
+    'Baseline': 'baseline',
+    'Main': 'main',
+    'High': 'high',
+}
+
+
+@dataclass
+class CutPlan:
+    """Source range of a clip and where the stream copy starts."""
+
+    start: float
+    end: float
+    copy_from: float  # > start: [start, copy_from) is re-encoded
+
+    @property
+    def head_seconds(self) -> float:
+        """Seconds at the head that are re-encoded."""
+        return max(0.0, min(self.copy_from, self.end) - self.start)
+
+    @property
+    def is_copy(self) -> bool:
+        return self.head_seconds < 1e-3
+
+
+def keyframe_index(path: str, start: float, end: float, ffprobe_path: str = "ffprobe") -> List[float]:
+    """
+    Keyframe times of the first video stream around [start, end].
+
+    Reads packet flags only (no decoding). ffprobe seeks to the keyframe
+    before `start`, so the first entry is at or before the window.
+    """
+    cmd = [
+        ffprobe_path, "-v", "error", "-select_streams", "v:0",
+        "-read_intervals", f"{max(0.0, start):.3f}%{end:.3f}",
+        "-show_entries", "packet=pts_time,flags", "-of", "csv=p=0", path,
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip()[-300:] or "ffprobe failed")
+
+    keyframes = []
+    for line in result.stdout.splitlines():
+        pts_time, _, flags = line.strip().partition(",")
+        if "K" not in flags:
+            continue
+        try:
+            keyframes.append(float(pts_time))
+        except ValueError:
+            continue
+    return sorted(set(keyframes))
+
+
+def plan_cut(keyframes: List[float], start: float, end: float, duration: float,
+             exact: bool, tolerance: float = SNAP_TOLERANCE) -> CutPlan:
+    """
+    Decide how to cut [start, end).
+
+    Without `exact`, the window moves to the nearest keyframe from which its
+    full length still fits (pure copy). With `exact`, it only moves if that
+    keyframe is within `tolerance`; otherwise the head up to the next
+    keyframe is re-encoded.
+    """
+    length = end - start
+    before = max((k for k in keyframes if k <= start + 1e-3), default=None)
+    after = min((k for k in keyframes if start - 1e-3 <= k < end), default=None)
+
+    candidates = [k for k in (before, after) if k is not None and k + length <= duration + 1e-3]
+    if candidates:
+        snap = min(candidates, key=lambda k: abs(k - start))
+        if not exact or abs(snap - start) <= tolerance:
+            return CutPlan(start=snap, end=min(duration, snap + length), copy_from=snap)
+
+    if after is not None and after > start:
+        return CutPlan(start=start, end=end, copy_from=after)
+    # no keyframe inside the window: the whole window is re-encoded
+    return CutPlan(start=start, end=end, copy_from=end)
+
+
+def _run(cmd: List[str]) -> Tuple[bool, str]:
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=1800)
+    except subprocess.TimeoutExpired:
+        return False, "ffmpeg timeout"
+    if result.returncode != 0:
+        return False, (result.stderr or "").strip()[-300:] or f"ffmpeg exited with code {result.returncode}"
+    return True, ""
+
+
+def cut_clip(info, plan: CutPlan, output_path: str, ffmpeg_path: str = "ffmpeg",
+             threads: int = 2) -> Tuple[bool, str]:
+    """
+    Write the planned clip of a probed source (ClipInfo) to an MP4.
+
+    Returns:
+        (success, error message)
+    """
+    from .ffmpeg_filtergraph import COPY_CONTAINERS
+
+    video_codecs, audio_codecs = COPY_CONTAINERS['mp4']
+    copy_video = info.video_codec in video_codecs
+    audio = ["-c:a", "copy"] if info.audio_codec in audio_codecs else ["-c:a", "aac"]
+    audio_maps = ["-map", "0:a:0"] if info.has_audio else []
+    timescale = []
+    if info.time_base and "/" in info.time_base:
+        timescale = ["-video_track_timescale", info.time_base.split("/", 1)[1]]
+
+    base = [ffmpeg_path, "-hide_banner", "-nostdin", "-y", "-loglevel", "error"]
+    logger.debug(f"Cutting {os.path.basename(info.path)} {plan.start:.2f}-{plan.end:.2f}s "
+                 f"(re-encoded head: {plan.head_seconds:.2f}s)")
+
+    def encode_cmd(start: float, seconds: float, target: str, container: List[str] = ()) -> List[str]:
+        profile = X264_PROFILES.get(info.profile or "")
+        return base + [
+            "-ss", f"{start:.3f}", "-i", info.path, "-t", f"{seconds:.3f}",
+            "-map", "0:v:0", *audio_maps,
+            "-c:v", "libx264", "-preset", "medium", "-crf", "18",
+            "-pix_fmt", info.pix_fmt or "yuv420p", *(["-profile:v", profile] if profile else []),
+            "-threads", str(max(1, threads)), "-c:a", "aac",
+            *(container or timescale), "-avoid_negative_ts", "make_zero", target,
+        ]
+
+    # Keyframe times are rarely whole milliseconds (44.033333 at 1/15360).
+    # Seeking with full precision half a frame past the keyframe lands on
+    # that keyframe; a rounded-down target would land a whole GOP earlier.
+    seek_nudge = 0.5 / (getattr(info, "fps", 0) or 30.0)
+
+    def copy_cmd(start: float, seconds: float, target: str, audio_codec: List[str],
+                 container: List[str] = ()) -> List[str]:
+        return base + [
+            "-ss", f"{start + seek_nudge:.6f}", "-i", info.path, "-t", f"{max(0.0, seconds - seek_nudge):.6f}",
+            "-map", "0:v:0", *audio_maps, "-c:v", "copy", *audio_codec,
+            *(container or timescale), "-avoid_negative_ts", "make_zero", target,
+        ]
+
+    def full_encode() -> Tuple[bool, str]:
+        return _run(encode_cmd(plan.start, plan.end - plan.start, output_path))
+
+    # Sources that can't be copied into MP4 (or have no keyframe in the
+    # window) are encoded as a whole, still by ffmpeg.
+    if not copy_video or plan.copy_from >= plan.end:
+        return full_encode()
+
+    if plan.is_copy:
+        return _run(copy_cmd(plan.copy_from, plan.end - plan.copy_from, output_path, audio))
+
+    # Smart cut: encode the partial GOP at the head, copy the rest, join.
+    # Only h264 heads can be joined to an h264 tail.
+    if info.video_codec != "h264":
+        return full_encode()
+
+    work_dir = tempfile.mkdtemp(prefix="smart_cut_", dir=os.path.dirname(os.path.abspath(output_path)))
+    head_path = os.path.join(work_dir, "head.ts")
+    tail_path = os.path.join(work_dir, "tail.ts")
+    list_path = os.path.join(work_dir, "parts.ffconcat")
+    try:
+        # the tail's audio must match the AAC the head was encoded with
+        tail_audio = ["-c:a", "copy"] if info.audio_codec == "aac" else ["-c:a", "aac"]
+        ok, err = _run(encode_cmd(plan.start, plan.head_seconds, head_path, ["-f", "mpegts"]))
+        if ok:
+            # Annex-B with the source's SPS/PPS repeated before each keyframe
+            ok, err = _run(copy_cmd(plan.copy_from, plan.end - plan.copy_from, tail_path, tail_audio,
+                                    ["-bsf:v", "h264_mp4toannexb", "-f", "mpegts"]))
+        if ok:
+            with open(list_path, "w", encoding="utf-8") as handle:
+                handle.write("ffconcat version 1.0\n")
+                for part in (head_path, tail_path):
+                    handle.write(f"file '{os.path.basename(part)}'\n")
+            ok, err = _run(base + ["-f", "concat", "-safe", "0", "-i", list_path, "-c", "copy",
+                                   *timescale, "-movflags", "+faststart", output_path])
+        if ok:
+            return True, ""
+
+        logger.warning(f"Smart cut of {os.path.basename(info.path)} failed ({err}); encoding the whole window")
+        return full_encode()
+    finally:
+        for path in (head_path, tail_path, list_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        try:
+            os.rmdir(work_dir)
+        except OSError:
+            pass
@@ -0,0 +1,177 @@
+"""
+modules/video_editor/videos_merger/effect_kernels.py
+Precomputed per-frame effect kernels for the MoviePy merge path
+
+A kernel is built once per clip. The masks, lookup tables and work buffers
+it needs are made on the first frame and reused for every later frame, so
+a frame costs the arithmetic plus one output array:
+- ColorKernel: brightness + contrast as one uint8 LUT, saturation as one
+  3x3 matrix op
+- BlurSidesKernel: blurs only the side bands (downscale -> blur ->
+  upscale with OpenCV, band-only gaussian with SciPy) and blends them back
+  with a precomputed feather mask
+"""
+
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+try:
+    from scipy.ndimage import gaussian_filter
+except ImportError:
+    gaussian_filter = None
+
+# Luma weights used for saturation (same as the frame transforms)
+LUMA_WEIGHTS = (0.299, 0.587, 0.114)
+
+
+def kernels_available(blur: bool = False) -> bool:
+    """True if the kernels can run (blur also needs OpenCV or SciPy)."""
+    if np is None:
+        return False
+    return not blur or cv2 is not None or gaussian_filter is not None
+
+
+class ColorKernel:
+    """Brightness/contrast/saturation as a LUT plus one matrix op."""
+
+    def __init__(self, brightness: float = 1.0, contrast: float = 1.0, saturation: float = 1.0):
+        self.brightness = max(0.2, min(2.5, brightness))
+        self.contrast = max(0.2, min(2.5, contrast))
+        self.saturation = max(0.0, min(2.5, saturation))
+
+        values = np.arange(256, dtype=np.float32)
+        if abs(self.brightness - 1.0) > 0.01:
+            values = values * self.brightness
+        if abs(self.contrast - 1.0) > 0.01:
+            values = (values - 127.5) * self.contrast + 127.5
+        self.lut = np.clip(np.rint(values), 0, 255).astype(np.uint8)
+
+        # x' = s*x + (1-s)*gray, gray = weights . x  ->  one 3x3 matrix
+        self.matrix: Optional["np.ndarray"] = None
+        if abs(self.saturation - 1.0) > 0.01:
+            weights = np.array(LUMA_WEIGHTS, dtype=np.float32)
+            matrix = self.saturation * np.eye(3, dtype=np.float32) + (1.0 - self.saturation) * weights[None, :]
+            self.matrix = np.ascontiguousarray(matrix.T)
+
+        self._mapped = None
+        self._work = None
+
+    def __call__(self, frame):
+        if frame.ndim != 3 or frame.shape[2] < 3 or frame.dtype != np.uint8:
+            return frame
+
+        if self._mapped is None or self._mapped.shape != frame.shape:
+            self._mapped = np.empty_like(frame)
+            self._work = np.empty(frame.shape[:2] + (3,), dtype=np.float32)
+
+        np.take(self.lut, frame, out=self._mapped)
+        if self.matrix is None:
+            return self._mapped.copy()
+
+        np.matmul(self._mapped[:, :, :3], self.matrix, out=self._work)
+        np.clip(self._work, 0, 255, out=self._work)
+        result = self._mapped.copy()
+        np.copyto(result[:, :, :3], self._work, casting='unsafe')
+        return result
+
+
+class BlurSidesKernel:
+    """Blurs the left/right side bands with a precomputed feather mask."""
+
+    def __init__(self, strength: float = 6.0, width_percent: int = 18, feather_percent: int = 60):
+        self.width_percent = max(1, min(45, int(width_percent)))
+        self.strength = max(0.5, min(20.0, float(strength)))
+        self.feather_percent = max(0, min(100, int(feather_percent)))
+        self._shape = None
+
+    def _prepare(self, shape) -> None:
+        """Masks and buffers for one frame size (done once per clip)."""
+        self._shape = shape
+        h, w = shape[:2]
+        side_w = int((w * self.width_percent) / 100.0)
+        self.side_w = side_w if 0 < side_w and side_w * 2 < w else 0
+        if not self.side_w:
+            return
+
+        # Build smooth side blend mask so blur ends naturally.
+        feather_w = int(side_w * (self.feather_percent / 100.0))
+        edge_distance = np.minimum(np.arange(w), np.arange(w)[::-1]).astype(np.float32)
+        alpha_1d = np.zeros(w, dtype=np.float32)
+        if feather_w <= 0:
+            alpha_1d[edge_distance < side_w] = 1.0
+        else:
+            full_blur_limit = max(0, side_w - feather_w)
+            alpha_1d[edge_distance <= full_blur_limit] = 1.0
+            feather_mask = (edge_distance > full_blur_limit) & (edge_distance < side_w)
+            alpha_1d[feather_mask] = (side_w - edge_distance[feather_mask]) / max(feather_w, 1)
+
+        channels = min(shape[2], 3)
+        self.alpha_left = alpha_1d[:side_w].reshape(1, side_w, 1).copy()
+        self.alpha_right = alpha_1d[w - side_w:].reshape(1, side_w, 1).copy()
+
+        # Band plus enough inner context for the blur to match a full-frame blur
+        self.region_w = min(w // 2, side_w + int(3 * self.strength) + 1)
+        self.channels = channels
+        region_shape = (h, self.region_w, channels)
+        if cv2 is not None:
+            self.scale = max(1, int(self.strength // 2))
+            small_shape = (max(1, h // self.scale), max(1, self.region_w // self.scale), channels)
+            self._region = np.empty(region_shape, dtype=np.uint8)
+            self._small = np.empty(small_shape, dtype=np.uint8)
+            self._small_blurred = np.empty(small_shape, dtype=np.uint8)
+            self._blurred = np.empty(region_shape, dtype=np.uint8)
+        else:
+            self._region = np.empty(region_shape, dtype=np.float32)
+            self._blurred = np.empty(region_shape, dtype=np.float32)
+        self._work = np.empty((h, side_w, channels), dtype=np.float32)
+
+    def _blur_region(self, region_view):
+        """Blur one band region into the reused blur buffer."""
+        np.copyto(self._region, region_view, casting='unsafe')
+        if cv2 is not None:
+            small_h, small_w = self._small.shape[:2]
+            cv2.resize(self._region, (small_w, small_h), dst=self._small, interpolation=cv2.INTER_AREA)
+            cv2.GaussianBlur(self._small, (0, 0), self.strength / self.scale, dst=self._small_blurred)
+            cv2.resize(self._small_blurred, (self.region_w, self._region.shape[0]),
+                       dst=self._blurred, interpolation=cv2.INTER_LINEAR)
+        else:
+            gaussian_filter(self._region, sigma=(self.strength, self.strength, 0), output=self._blurred)
+
+    def _blend(self, result, band, blurred, alpha) -> None:
+        """result = band + (blurred - band) * alpha, in the reused work buffer."""
+        np.subtract(blurred, band, out=self._work, dtype=np.float32)
+        self._work *= alpha
+        self._work += band
+        np.clip(self._work, 0, 255, out=self._work)
+        np.copyto(result, self._work, casting='unsafe')
+
+    def __call__(self, frame):
+        if frame.ndim != 3 or frame.shape[1] < 10:
+            return frame
+        if frame.shape != self._shape:
+            self._prepare(frame.shape)
+        if not self.side_w:
+            return frame
+
+        w = frame.shape[1]
+        c = self.channels
+        side_w, region_w = self.side_w, self.region_w
+        result = frame.copy()
+
+        self._blur_region(frame[:, :region_w, :c])
+        self._blend(result[:, :side_w, :c], frame[:, :side_w, :c],
+                    self._blurred[:, :side_w], self.alpha_left)
+
+        self._blur_region(frame[:, w - region_w:, :c])
+        self._blend(result[:, w - side_w:, :c], frame[:, w - side_w:, :c],
+                    self._blurred[:, region_w - side_w:], self.alpha_right)
+        return result
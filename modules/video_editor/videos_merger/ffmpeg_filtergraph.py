@@ -0,0 +1,718 @@
+"""
+modules/video_editor/videos_merger/ffmpeg_filtergraph.py
+Compile merge settings into a single FFmpeg filter_complex and render it
+
+The whole merge (trim, crop, zoom, flip, color, side blur, speed, padding
+and transitions) runs inside one ffmpeg process, with ffmpeg's own
+threading. Anything that cannot be expressed as a filtergraph raises
+FilterGraphUnsupported so the caller can fall back to MoviePy.
+
+Plain joins (no effects, no transitions) of stream-compatible inputs skip
+the filtergraph: the concat demuxer copies the video packets and at most
+the audio is re-encoded.
+"""
+
+import json
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple
+
+from modules.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Aspect ratio presets
+ASPECT_PRESETS = {
+    '9:16': (9, 16),  # TikTok, Reels vertical
+    '16:9': (16, 9),  # YouTube horizontal
+    '1:1': (1, 1),  # Instagram square
+    '4:3': (4, 3),  # Classic TV
+    '4:5': (4, 5),  # Instagram portrait
+    '21:9': (21, 9)  # Ultrawide
+}
+
+# MoviePy transition name -> xfade transition (clips overlap by the duration)
+XFADE_TRANSITIONS = {
+    'crossfade': 'fade',
+    'slide_left': 'slideleft',
+    'slide_right': 'slideright',
+    'slide_up': 'slideup',
+    'slide_down': 'slidedown',
+    'wipe_left': 'wipeleft',
+    'wipe_right': 'wiperight',
+    'wipe_up': 'wipeup',
+    'wipe_down': 'wipedown',
+    'zoom_in': 'zoomin',
+    'dissolve_random': 'dissolve',
+    'dissolve_radial': 'radial',
+}
+
+AUDIO_FORMAT = "aresample=44100,aformat=sample_fmts=fltp:channel_layouts=stereo"
+
+# Output container -> (video codecs, audio codecs) it can take by stream copy
+COPY_CONTAINERS = {
+    'mp4': ({'h264', 'hevc', 'mpeg4', 'av1'}, {'aac', 'mp3', 'alac'}),
+    'mov': ({'h264', 'hevc', 'mpeg4', 'prores'}, {'aac', 'mp3', 'alac', 'pcm_s16le'}),
+    'm4v': ({'h264', 'hevc', 'mpeg4'}, {'aac', 'mp3'}),
+    'mkv': (None, None),  # anything
+}
+
+# Stream-copy plans
+PLAN_COPY = 'copy'           # copy video and audio
+PLAN_COPY_VIDEO = 'audio'    # copy video, re-encode audio only
+
+
+class FilterGraphUnsupported(Exception):
+    """Raised when the settings need an effect only MoviePy can render."""
+
+
+@dataclass
+class ClipInfo:
+    """Probed properties of one input video."""
+
+    path: str
+    width: int
+    height: int
+    duration: float
+    fps: float = 30.0
+    has_audio: bool = True
+    video_bitrate: Optional[int] = None  # bps
+    audio_bitrate: Optional[int] = None  # bps
+    video_codec: Optional[str] = None
+    profile: Optional[str] = None
+    pix_fmt: Optional[str] = None
+    time_base: Optional[str] = None
+    frame_rate: Optional[str] = None  # exact r_frame_rate, e.g. '30000/1001'
+    audio_codec: Optional[str] = None
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+
+    @property
+    def video_signature(self) -> tuple:
+        """Everything that must match for video packets to be concatenated as-is."""
+        return (self.video_codec, self.profile, self.pix_fmt, self.width, self.height,
+                self.time_base, self.frame_rate)
+
+    @property
+    def audio_signature(self) -> tuple:
+        """Everything that must match for audio packets to be concatenated as-is."""
+        return (self.audio_codec, self.sample_rate, self.channels) if self.has_audio else (None,)
+
+
+@dataclass
+class FilterGraph:
+    """Compiled filter_complex with its output labels."""
+
+    filter_complex: str
+    video_label: str
+    audio_label: Optional[str]
+    duration: float
+    size: Tuple[int, int]
+
+
+def _num(value: float) -> str:
+    """Compact number for filter arguments (no float noise)."""
+    text = f"{value:.4f}".rstrip('0').rstrip('.')
+    return text if text not in ('', '-0') else '0'
+
+
+def _atempo_chain(speed: float) -> List[str]:
+    """atempo filters for a speed factor (each stage kept in 0.5..2.0)."""
+    filters = []
+    while speed > 2.0:
+        filters.append("atempo=2.0")
+        speed /= 2.0
+    while speed < 0.5:
+        filters.append("atempo=0.5")
+        speed /= 0.5
+    filters.append(f"atempo={_num(speed)}")
+    return filters
+
+
+def _clip_speed(settings: Any, index: int, duration: float) -> float:
+    """Per-clip speed (auto 1.40x for clips longer than 90s when not specified)."""
+    speed = None
+    if settings.clip_speeds and index < len(settings.clip_speeds):
+        speed = settings.clip_speeds[index]
+    if speed is None:
+        speed = 1.4 if duration > 90 else 1.0
+    if speed <= 0:
+        speed = 1.0
+    return speed
+
+
+def _crop_rect(settings: Any, width: int, height: int) -> Optional[Tuple[int, int, int, int]]:
+    """Crop rectangle (x, y, w, h) for the crop settings, None if nothing to crop."""
+    if settings.crop_coords:
+        x1, y1, x2, y2 = (int(v) for v in settings.crop_coords)
+        return x1, y1, x2 - x1, y2 - y1
+
+    preset = settings.crop_preset
+    if not preset or preset not in ASPECT_PRESETS:
+        return None
+
+    target_w, target_h = ASPECT_PRESETS[preset]
+    target_ratio = target_w / target_h
+    current_ratio = width / height
+    if abs(current_ratio - target_ratio) < 0.01:
+        return None
+
+    if current_ratio > target_ratio:
+        new_width = int(height * target_ratio)
+        return (width - new_width) // 2, 0, new_width, height
+
+    new_height = int(width / target_ratio)
+    return 0, (height - new_height) // 2, width, new_height
+
+
+def _color_filter(settings: Any) -> Optional[str]:
+    """Brightness/contrast/saturation as one lutyuv (same math as the MoviePy path)."""
+    brightness, contrast, saturation = settings.brightness, settings.contrast, settings.saturation
+    if abs(brightness - 1.0) < 0.01 and abs(contrast - 1.0) < 0.01 and abs(saturation - 1.0) < 0.01:
+        return None
+
+    brightness = max(0.2, min(2.5, brightness))
+    contrast = max(0.2, min(2.5, contrast))
+    saturation = max(0.0, min(2.5, saturation))
+
+    # RGB*brightness, then contrast around mid grey, then saturation:
+    # luma gets brightness+contrast, chroma distance scales by all three.
+    chroma = _num(brightness * contrast * saturation)
+    luma = f"clip((val*{_num(brightness)}-127.5)*{_num(contrast)}+127.5,0,255)"
+    chroma_expr = f"clip((val-128)*{chroma}+128,0,255)"
+    return f"lutyuv=y='{luma}':u='{chroma_expr}':v='{chroma_expr}'"
+
+
+def _blur_sides(settings: Any, source: str, prefix: str, width: int, height: int,
+                statements: List[str]) -> str:
+    """
+    Blur the left/right bands: split, boxblur only the bands, overlay back.
+
+    Only the bands (plus the blur radius) are blurred; a feathered band gets
+    an alpha ramp so the blur ends smoothly. Returns the output label.
+    """
+    width_percent = max(1, min(45, int(settings.blur_sides_width_percent)))
+    strength = max(0.5, min(20.0, float(settings.blur_sides_strength)))
+    feather_percent = max(0, min(100, int(settings.blur_sides_feather_percent)))
+
+    side_w = int((width * width_percent) / 100.0)
+    if width < 10 or side_w <= 0 or (side_w * 2) >= width:
+        return source
+
+    # Two box passes approximate a gaussian of sigma ~ radius / 1.2; boxblur
+    # limits the chroma radius to a quarter of the (band) plane.
+    radius = max(0, min(int(round(strength * 1.2)), min(side_w, height) // 4))
+    band_w = min(width, side_w + 2 * radius)
+    feather_w = int(side_w * (feather_percent / 100.0))
+
+    statements.append(f"[{source}]split=3[{prefix}m][{prefix}l][{prefix}r]")
+    for side, x, inner_x, alpha in (
+        ('l', 0, 0, f"255*clip(({side_w}-X)/{feather_w},0,1)"),
+        ('r', width - band_w, band_w - side_w, f"255*clip((X+1)/{feather_w},0,1)"),
+    ):
+        chain = [
+            f"crop={band_w}:{height}:{x}:0",
+            f"boxblur=luma_radius={radius}:luma_power=2",
+            f"crop={side_w}:{height}:{inner_x}:0",
+        ]
+        if feather_w > 0:
+            chain.append("format=yuva420p")
+            chain.append(f"geq=lum='lum(X,Y)':cb='cb(X,Y)':cr='cr(X,Y)':a='{alpha}'")
+        statements.append(f"[{prefix}{side}]{','.join(chain)}[{prefix}{side}b]")
+
+    statements.append(f"[{prefix}m][{prefix}lb]overlay=0:0[{prefix}ol]")
+    statements.append(f"[{prefix}ol][{prefix}rb]overlay={width - side_w}:0[{prefix}bs]")
+    return f"{prefix}bs"
+
+
+def compile_filtergraph(settings: Any, clips: List[ClipInfo]) -> FilterGraph:
+    """
+    Compile merge settings and probed clips into one filter_complex.
+
+    Input i of the ffmpeg command must be clips[i].path.
+
+    Raises:
+        FilterGraphUnsupported: settings need the MoviePy fallback
+        ValueError: clips cannot be merged with these settings
+    """
+    if not clips:
+        raise ValueError("No clips to merge")
+
+    transition = settings.transition_type or 'none'
+    overlap = max(0.0, float(settings.transition_duration or 0.0))
+    if len(clips) < 2 or overlap <= 0:
+        transition = 'none'
+    if transition not in ('none', 'fade') and transition not in XFADE_TRANSITIONS:
+        raise FilterGraphUnsupported(f"transition '{transition}' has no xfade equivalent")
+
+    statements: List[str] = []
+    segments = []  # (video label, audio label, duration, (w, h))
+
+    for i, clip in enumerate(clips):
+        prefix = f"c{i}"
+        video: List[str] = []
+        audio: List[str] = []
+        width, height = clip.width, clip.height
+        duration = clip.duration
+
+        # Trim
+        if settings.trim_start > 0 or settings.trim_end > 0:
+            start = settings.trim_start
+            end = duration - settings.trim_end
+            if end <= start:
+                logger.warning(f"Video too short after trimming (duration: {duration}s)")
+                end = min(start + 1.0, duration)
+            if end <= start:
+                raise ValueError(f"Trim start is past the end of {os.path.basename(clip.path)}")
+            video += [f"trim=start={_num(start)}:end={_num(end)}", "setpts=PTS-STARTPTS"]
+            audio += [f"atrim=start={_num(start)}:end={_num(end)}", "asetpts=PTS-STARTPTS"]
+            duration = end - start
+
+        # Crop
+        if settings.crop_enabled:
+            rect = _crop_rect(settings, width, height)
+            if rect:
+                x, y, width, height = rect
+                video.append(f"crop={width}:{height}:{x}:{y}")
+
+        # Zoom (scale up, crop back to the same size)
+        if settings.zoom_enabled and abs(settings.zoom_factor - 1.0) >= 0.01:
+            zoomed_w = int(width * settings.zoom_factor)
+            zoomed_h = int(height * settings.zoom_factor)
+            video.append(f"scale={zoomed_w}:{zoomed_h}")
+            video.append(f"crop={width}:{height}:{(zoomed_w - width) // 2}:{(zoomed_h - height) // 2}")
+
+        # Flip
+        if settings.flip_horizontal:
+            video.append("hflip")
+        if settings.flip_vertical:
+            video.append("vflip")
+
+        # Color enhancement
+        if settings.color_enhance_enabled:
+            color = _color_filter(settings)
+            if color:
+                video.append(color)
+
+        label = f"{i}:v"
+        if video:
+            statements.append(f"[{label}]{','.join(video)}[{prefix}v]")
+            label = f"{prefix}v"
+
+        # Side blur (needs its own split/overlay branch)
+        if settings.blur_sides_enabled:
+            label = _blur_sides(settings, label, prefix, width, height, statements)
+
+        # Speed
+        speed = _clip_speed(settings, i, duration)
+        tail: List[str] = []
+        if abs(speed - 1.0) > 0.01:
+            tail.append(f"setpts=PTS/{_num(speed)}")
+            audio += _atempo_chain(speed)
+            duration /= speed
+
+        statements.append(f"[{label}]{','.join(tail or ['null'])}[{prefix}s]")
+        segments.append([f"{prefix}s", None, duration, (width, height)])
+
+        # Audio (silence for clips without a track, so segments line up)
+        if settings.keep_audio:
+            if clip.has_audio:
+                audio_chain = audio + [AUDIO_FORMAT, "apad", f"atrim=end={_num(duration)}"]
+                statements.append(f"[{i}:a]{','.join(audio_chain)}[{prefix}a]")
+            else:
+                statements.append(
+                    f"anullsrc=r=44100:cl=stereo,atrim=end={_num(duration)},{AUDIO_FORMAT}[{prefix}a]"
+                )
+            segments[-1][1] = f"{prefix}a"
+
+    # Normalize size/fps/format (pad to the largest clip, no scaling)
+    target_w = max(seg[3][0] for seg in segments)
+    target_h = max(seg[3][1] for seg in segments)
+    fps = max(clip.fps for clip in clips)
+    for i, seg in enumerate(segments):
+        width, height = seg[3]
+        normalize = []
+        if (width, height) != (target_w, target_h):
+            left = max(0, (target_w - width) // 2)
+            top = max(0, (target_h - height) // 2)
+            normalize.append(f"pad={target_w}:{target_h}:{left}:{top}:black")
+        normalize += [f"fps={_num(fps)}", "format=yuv420p", "setsar=1"]
+        statements.append(f"[{seg[0]}]{','.join(normalize)}[n{i}]")
+        seg[0] = f"n{i}"
+
+    has_audio = bool(settings.keep_audio)
+
+    if transition == 'fade':
+        # Fade to black and back, no overlap (like the MoviePy fade)
+        for i in range(len(segments) - 1):
+            fade = min(overlap, segments[i][2], segments[i + 1][2])
+            statements.append(
+                f"[{segments[i][0]}]fade=t=out:st={_num(segments[i][2] - fade)}:d={_num(fade)}[fo{i}]"
+            )
+            segments[i][0] = f"fo{i}"
+            statements.append(f"[{segments[i + 1][0]}]fade=t=in:st=0:d={_num(fade)}[fi{i + 1}]")
+            segments[i + 1][0] = f"fi{i + 1}"
+        transition = 'none'
+
+    if transition == 'none':
+        inputs = "".join(f"[{seg[0]}]" + (f"[{seg[1]}]" if has_audio else "") for seg in segments)
+        outputs = "[vout][aout]" if has_audio else "[vout]"
+        statements.append(f"{inputs}concat=n={len(segments)}:v=1:a={1 if has_audio else 0}{outputs}")
+        total = sum(seg[2] for seg in segments)
+    else:
+        xfade = XFADE_TRANSITIONS[transition]
+        video_label, audio_label, total = segments[0][0], segments[0][1], segments[0][2]
+        for i, seg in enumerate(segments[1:], start=1):
+            step = min(overlap, total, seg[2])
+            last = i == len(segments) - 1
+            out_v = "vout" if last else f"x{i}"
+            statements.append(
+                f"[{video_label}][{seg[0]}]xfade=transition={xfade}:"
+                f"duration={_num(step)}:offset={_num(total - step)}[{out_v}]"
+            )
+            video_label = out_v
+            if has_audio:
+                out_a = "aout" if last else f"xa{i}"
+                statements.append(f"[{audio_label}][{seg[1]}]acrossfade=d={_num(step)}[{out_a}]")
+                audio_label = out_a
+            total += seg[2] - step
+
+    return FilterGraph(
+        filter_complex=";".join(statements),
+        video_label="vout",
+        audio_label="aout" if has_audio else None,
+        duration=total,
+        size=(target_w, target_h),
+    )
+
+
+def _parse_rate(value: Any) -> Optional[float]:
+    try:
+        num, _, den = str(value).partition('/')
+        rate = float(num) / float(den or 1)
+        return rate if rate > 0 else None
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def _parse_int(value: Any) -> Optional[int]:
+    try:
+        number = int(float(value))
+        return number if number > 0 else None
+    except (TypeError, ValueError):
+        return None
+
+
+def probe_clip(path: str, ffprobe_path: str = "ffprobe") -> ClipInfo:
+    """
+    Probe size, duration, fps, audio and bitrates of a video with ffprobe.
+
+    Raises:
+        FilterGraphUnsupported: the file could not be probed
+    """
+    cmd = [
+        ffprobe_path, "-v", "error",
+        "-show_entries",
+        "stream=codec_type,codec_name,profile,pix_fmt,time_base,width,height,avg_frame_rate,"
+        "r_frame_rate,sample_rate,channels,bit_rate,duration"
+        ":stream_tags=rotate:stream_side_data=rotation:format=duration,bit_rate",
+        "-of", "json", path,
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        data = json.loads(result.stdout or "{}")
+    except (OSError, subprocess.TimeoutExpired, ValueError) as e:
+        raise FilterGraphUnsupported(f"ffprobe failed for {path}: {e}")
+
+    streams = data.get("streams", [])
+    video = next((s for s in streams if s.get("codec_type") == "video"), None)
+    audio = next((s for s in streams if s.get("codec_type") == "audio"), None)
+    fmt = data.get("format", {})
+    if not video or not video.get("width"):
+        raise FilterGraphUnsupported(f"No video stream found by ffprobe: {path}")
+
+    # ffmpeg auto-rotates on decode, so a quarter turn swaps the frame size
+    width, height = int(video["width"]), int(video["height"])
+    rotation = (video.get("tags") or {}).get("rotate")
+    for side_data in video.get("side_data_list") or []:
+        rotation = side_data.get("rotation", rotation)
+    if _parse_int(abs(float(rotation or 0)) % 180) == 90:
+        width, height = height, width
+
+    duration = float(fmt.get("duration") or video.get("duration") or 0)
+    if duration <= 0:
+        raise FilterGraphUnsupported(f"Unknown duration: {path}")
+
+    video_bps = _parse_int(video.get("bit_rate"))
+    audio_bps = _parse_int(audio.get("bit_rate")) if audio else None
+    if video_bps is None:
+        total_bps = _parse_int(fmt.get("bit_rate"))
+        if total_bps and audio_bps and total_bps > audio_bps:
+            video_bps = total_bps - audio_bps
+        else:
+            video_bps = total_bps
+
+    return ClipInfo(
+        path=path,
+        width=width,
+        height=height,
+        duration=duration,
+        fps=_parse_rate(video.get("avg_frame_rate")) or _parse_rate(video.get("r_frame_rate")) or 30.0,
+        has_audio=audio is not None,
+        video_bitrate=video_bps,
+        audio_bitrate=audio_bps,
+        video_codec=video.get("codec_name"),
+        profile=video.get("profile"),
+        pix_fmt=video.get("pix_fmt"),
+        time_base=video.get("time_base"),
+        frame_rate=video.get("r_frame_rate"),
+        audio_codec=audio.get("codec_name") if audio else None,
+        sample_rate=_parse_int(audio.get("sample_rate")) if audio else None,
+        channels=_parse_int(audio.get("channels")) if audio else None,
+    )
+
+
+def probe_clips(paths: List[str], ffprobe_path: str = "ffprobe", max_workers: int = 4) -> List[ClipInfo]:
+    """
+    Probe all inputs in one concurrent pass (ffprobe takes one file per run).
+
+    Results are in input order; the first failure is raised.
+    """
+    if len(paths) <= 1:
+        return [probe_clip(path, ffprobe_path) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as pool:
+        return list(pool.map(lambda path: probe_clip(path, ffprobe_path), paths))
+
+
+def plan_stream_copy(settings: Any, clips: List[ClipInfo]) -> Optional[str]:
+    """
+    Decide whether a merge can skip decoding.
+
+    Returns PLAN_COPY if all inputs can be joined by packet copy,
+    PLAN_COPY_VIDEO if only the audio has to be re-encoded, None if the
+    merge needs the filtergraph (effects, transitions or mixed video).
+    """
+    if not clips:
+        return None
+
+    has_effects = (
+        settings.trim_start > 0 or settings.trim_end > 0
+        or (settings.crop_enabled and _crop_rect(settings, clips[0].width, clips[0].height))
+        or (settings.zoom_enabled and abs(settings.zoom_factor - 1.0) >= 0.01)
+        or settings.flip_horizontal or settings.flip_vertical
+        or (settings.color_enhance_enabled and _color_filter(settings))
+        or settings.blur_sides_enabled
+    )
+    if has_effects:
+        return None
+    if len(clips) > 1 and (settings.transition_type or 'none') != 'none' and settings.transition_duration > 0:
+        return None
+    if any(abs(_clip_speed(settings, i, clip.duration) - 1.0) > 0.01 for i, clip in enumerate(clips)):
+        return None
+
+    video_codecs, audio_codecs = COPY_CONTAINERS.get(str(settings.output_format).lower(), ({}, {}))
+    if len({clip.video_signature for clip in clips}) != 1:
+        return None
+    if video_codecs is not None and clips[0].video_codec not in video_codecs:
+        return None
+
+    if not settings.keep_audio:
+        return PLAN_COPY
+    if len({clip.audio_signature for clip in clips}) != 1 or not clips[0].has_audio:
+        return PLAN_COPY_VIDEO if any(clip.has_audio for clip in clips) else PLAN_COPY
+    if audio_codecs is not None and clips[0].audio_codec not in audio_codecs:
+        return PLAN_COPY_VIDEO
+    return PLAN_COPY
+
+
+def write_concat_list(clips: List[ClipInfo], list_path: str) -> None:
+    """Write a concat demuxer script listing the inputs."""
+    with open(list_path, "w", encoding="utf-8") as handle:
+        handle.write("ffconcat version 1.0\n")
+        for clip in clips:
+            escaped = os.path.abspath(clip.path).replace("'", "'\\''")
+            handle.write(f"file '{escaped}'\n")
+
+
+def build_concat_command(ffmpeg_path: str, clips: List[ClipInfo], list_path: str, output_path: str,
+                         plan: str, keep_audio: bool = True,
+                         audio_bitrate: Optional[str] = None) -> List[str]:
+    """
+    ffmpeg command joining the inputs with the concat demuxer.
+
+    PLAN_COPY copies every stream; PLAN_COPY_VIDEO copies the video and
+    rebuilds the audio from each input (silence where a clip has none).
+    """
+    cmd = [ffmpeg_path, "-hide_banner", "-nostdin", "-y", "-loglevel", "error",
+           "-f", "concat", "-safe", "0", "-i", list_path]
+
+    if plan == PLAN_COPY:
+        cmd += ["-map", "0:v:0"]
+        if keep_audio and clips[0].has_audio:
+            cmd += ["-map", "0:a:0"]
+        cmd += ["-c", "copy"]
+    else:
+        statements = []
+        input_index = 0  # input 0 is the concat list
+        for i, clip in enumerate(clips):
+            if clip.has_audio:
+                input_index += 1
+                cmd += ["-i", clip.path]
+                statements.append(
+                    f"[{input_index}:a:0]{AUDIO_FORMAT},apad,atrim=end={_num(clip.duration)}[a{i}]"
+                )
+            else:
+                statements.append(
+                    f"anullsrc=r=44100:cl=stereo,atrim=end={_num(clip.duration)},{AUDIO_FORMAT}[a{i}]"
+                )
+        statements.append("".join(f"[a{i}]" for i in range(len(clips))) + f"concat=n={len(clips)}:v=0:a=1[aout]")
+        cmd += ["-filter_complex", ";".join(statements), "-map", "0:v:0", "-map", "[aout]",
+                "-c:v", "copy", "-c:a", "aac"]
+        if audio_bitrate:
+            cmd += ["-b:a", audio_bitrate]
+
+    cmd += ["-movflags", "+faststart", "-progress", "pipe:1", "-nostats", output_path]
+    return cmd
+
+
+def build_command(ffmpeg_path: str, clips: List[ClipInfo], graph: FilterGraph, output_path: str,
+                  video_bitrate: str, audio_bitrate: Optional[str], threads: int = 0) -> List[str]:
+    """Full ffmpeg command rendering a compiled graph (progress on stdout)."""
+    cmd = [ffmpeg_path, "-hide_banner", "-nostdin", "-y", "-loglevel", "error"]
+    if threads and threads > 0:
+        cmd += ["-filter_complex_threads", str(int(threads))]
+    for clip in clips:
+        cmd += ["-i", clip.path]
+    cmd += ["-filter_complex", graph.filter_complex, "-map", f"[{graph.video_label}]"]
+    if graph.audio_label:
+        cmd += ["-map", f"[{graph.audio_label}]"]
+    cmd += ["-c:v", "libx264", "-preset", "medium", "-b:v", video_bitrate, "-pix_fmt", "yuv420p"]
+    if threads and threads > 0:
+        cmd += ["-threads", str(int(threads))]
+    if graph.audio_label:
+        cmd += ["-c:a", "aac"]
+        if audio_bitrate:
+            cmd += ["-b:a", audio_bitrate]
+    cmd += ["-movflags", "+faststart", "-progress", "pipe:1", "-nostats", output_path]
+    return cmd
+
+
+class FilterGraphRenderer:
+    """Runs an ffmpeg render with progress, pause (suspend) and cancel."""
+
+    def __init__(self, control_state: Optional[Callable[[], Tuple[bool, bool]]] = None,
+                 min_emit_interval: float = 0.2):
+        """
+        Args:
+            control_state: Returns (paused, cancelled)
+            min_emit_interval: Minimum seconds between progress callbacks
+        """
+        self.control_state = control_state
+        self.min_emit_interval = min_emit_interval
+        self.cancelled = False
+        self.error: Optional[str] = None
+
+    def _state(self) -> Tuple[bool, bool]:
+        if not self.control_state:
+            return False, False
+        return self.control_state()
+
+    def _suspend(self, process: subprocess.Popen, suspend: bool) -> None:
+        try:
+            if psutil is not None:
+                proc = psutil.Process(process.pid)
+                if suspend:
+                    proc.suspend()
+                else:
+                    proc.resume()
+            elif hasattr(signal, "SIGSTOP"):
+                os.kill(process.pid, signal.SIGSTOP if suspend else signal.SIGCONT)
+        except Exception as e:
+            logger.debug(f"Could not {'suspend' if suspend else 'resume'} ffmpeg: {e}")
+
+    def _hold_while_paused(self, process: subprocess.Popen) -> bool:
+        """Suspend ffmpeg while paused. Returns False if cancelled."""
+        paused, cancelled = self._state()
+        if cancelled:
+            return False
+        if not paused:
+            return True
+
+        self._suspend(process, True)
+        try:
+            while paused and not cancelled:
+                time.sleep(0.1)
+                paused, cancelled = self._state()
+        finally:
+            self._suspend(process, False)
+        return not cancelled
+
+    def run(self, cmd: List[str], duration: float, output_path: str,
+            progress_callback: Optional[Callable[[float], None]] = None) -> bool:
+        """
+        Run ffmpeg and report progress as a percentage.
+
+        Returns True on success; on cancel or error the partial output is
+        removed and False is returned (see `cancelled` / `error`).
+        """
+        self.cancelled = False
+        self.error = None
+        stderr_tail: deque = deque(maxlen=20)
+
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                   text=True, encoding="utf-8", errors="replace")
+
+        def read_stderr():
+            for line in process.stderr:
+                stderr_tail.append(line.rstrip())
+
+        reader = threading.Thread(target=read_stderr, daemon=True)
+        reader.start()
+
+        last_emit = 0.0
+        try:
+            for line in process.stdout:
+                if not self._hold_while_paused(process):
+                    self.cancelled = True
+                    process.kill()
+                    break
+
+                key, _, value = line.strip().partition("=")
+                if key != "out_time_us" or not progress_callback or duration <= 0:
+                    continue
+                try:
+                    percent = min(100.0, (int(value) / 1_000_000) / duration * 100.0)
+                except ValueError:
+                    continue
+                now = time.time()
+                if (now - last_emit) >= self.min_emit_interval:
+                    last_emit = now
+                    progress_callback(percent)
+        finally:
+            returncode = process.wait()
+            reader.join(timeout=2)
+
+        if self.cancelled or returncode != 0:
+            if not self.cancelled:
+                self.error = "\n".join(stderr_tail) or f"ffmpeg exited with code {returncode}"
+            try:
+                if os.path.exists(output_path):
+                    os.remove(output_path)
+            except OSError:
+                pass
+            return False
+
+        if progress_callback:
+            progress_callback(100.0)
+        return True
@@ -5,11 +5,26 @@ modules/video_editor/videos_merger/merge_engine.py
 Core video merging engine with trim, crop, zoom, flip, and transitions
 """
 
+import os
+import tempfile
 import time
 from typing import List, Dict, Any, Optional, Callable
 from pathlib import Path
 from modules.logging.logger import get_logger
 from modules.video_editor.transitions import TransitionManager
+from .effect_kernels import BlurSidesKernel, ColorKernel, kernels_available
+from .ffmpeg_filtergraph import (
+    ASPECT_PRESETS,
+    FilterGraphRenderer,
+    FilterGraphUnsupported,
+    PLAN_COPY,
+    build_command,
+    build_concat_command,
+    compile_filtergraph,
+    plan_stream_copy,
+    probe_clips,
+    write_concat_list,
+)
 
 logger = get_logger(__name__)
 
@@ -27,16 +42,6 @@ try:
 except ImportError:
     ProgressBarLogger = None
 
-try:
-    import numpy as np
-except ImportError:
-    np = None
-
-try:
-    from scipy.ndimage import gaussian_filter
-except ImportError:
-    gaussian_filter = None
-
 
 class MergeCancelled(Exception):
     """Raised when a merge operation is cancelled."""
@@ -159,6 +164,14 @@ class MergeSettings:
         # Deletion settings
         self.delete_source: bool = False
 
+        # Rendering backend: 'auto' (FFmpeg filtergraph, MoviePy fallback) or 'moviepy'
+        self.render_backend: str = 'auto'
+
+        # Concurrency: merges run at once in bulk mode (0 = from core count)
+        # and encoder threads per merge (0 = encoder default)
+        self.parallel_jobs: int = 0
+        self.encoder_threads: int = 0
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert settings to dictionary"""
         return {
@@ -186,7 +199,10 @@ class MergeSettings:
             'output_format': self.output_format,
             'keep_audio': self.keep_audio,
             'fade_audio': self.fade_audio,
-            'delete_source': self.delete_source
+            'delete_source': self.delete_source,
+            'render_backend': self.render_backend,
+            'parallel_jobs': self.parallel_jobs,
+            'encoder_threads': self.encoder_threads
         }
 
     @classmethod
@@ -202,15 +218,8 @@ class MergeSettings:
 class VideoMergeEngine:
     """Core engine for merging videos with various effects"""
 
-    # Aspect ratio presets
-    ASPECT_PRESETS = {
-        '9:16': (9, 16),  # TikTok, Reels vertical
-        '16:9': (16, 9),  # YouTube horizontal
-        '1:1': (1, 1),  # Instagram square
-        '4:3': (4, 3),  # Classic TV
-        '4:5': (4, 5),  # Instagram portrait
-        '21:9': (21, 9)  # Ultrawide
-    }
+    # Aspect ratio presets (shared with the filtergraph compiler)
+    ASPECT_PRESETS = ASPECT_PRESETS
 
     # Quality presets (bitrate in kbps)
     QUALITY_PRESETS = {
@@ -406,7 +415,7 @@ class VideoMergeEngine:
         """
         Apply basic color enhancement.
         """
-        if np is None:
+        if not kernels_available():
             logger.warning("NumPy unavailable; skipping color enhancement")
             return clip
 
@@ -425,31 +434,9 @@ class VideoMergeEngine:
             f"contrast={contrast:.2f}, saturation={saturation:.2f}"
         )
 
-        def color_transform(get_frame, t):
-            frame = get_frame(t)
-            arr = frame.astype(np.float32)
-
-            # Brightness
-            if abs(brightness - 1.0) > 0.01:
-                arr = arr * brightness
-
-            # Contrast
-            if abs(contrast - 1.0) > 0.01:
-                arr = (arr - 127.5) * contrast + 127.5
-
-            # Saturation
-            if abs(saturation - 1.0) > 0.01 and arr.ndim == 3 and arr.shape[2] >= 3:
-                gray = (
-                    arr[:, :, 0] * 0.299
-                    + arr[:, :, 1] * 0.587
-                    + arr[:, :, 2] * 0.114
-                )[:, :, None]
-                arr[:, :, :3] = gray + (arr[:, :, :3] - gray) * saturation
-
-            arr = np.clip(arr, 0, 255).astype(np.uint8)
-            return arr
-
-        return clip.transform(color_transform)
+        # LUT and saturation matrix are built once per clip, not per frame
+        kernel = ColorKernel(brightness, contrast, saturation)
+        return clip.transform(lambda get_frame, t: kernel(get_frame(t)))
 
     def apply_blur_sides(
         self,
@@ -461,8 +448,8 @@ class VideoMergeEngine:
         """
         Blur only left and right side bands.
         """
-        if np is None or gaussian_filter is None:
-            logger.warning("NumPy/SciPy unavailable; skipping blur sides effect")
+        if not kernels_available(blur=True):
+            logger.warning("NumPy/OpenCV/SciPy unavailable; skipping blur sides effect")
             return clip
 
         width_percent = max(1, min(45, int(width_percent)))
@@ -473,44 +460,9 @@ class VideoMergeEngine:
             f"feather={feather_percent}%"
         )
 
-        def blur_sides_transform(get_frame, t):
-            frame = get_frame(t)
-            if frame.ndim != 3 or frame.shape[1] < 10:
-                return frame
-
-            h, w = frame.shape[:2]
-            side_w = int((w * width_percent) / 100.0)
-            if side_w <= 0 or (side_w * 2) >= w:
-                return frame
-
-            arr = frame.astype(np.float32)
-            blurred = np.empty_like(arr)
-            channels = min(arr.shape[2], 3)
-            for c in range(channels):
-                blurred[:, :, c] = gaussian_filter(arr[:, :, c], sigma=strength)
-            if arr.shape[2] > 3:
-                blurred[:, :, 3:] = arr[:, :, 3:]
-
-            # Build smooth side blend mask so blur ends naturally.
-            feather_w = int(side_w * (feather_percent / 100.0))
-            edge_distance = np.minimum(np.arange(w), np.arange(w)[::-1]).astype(np.float32)
-
-            alpha_1d = np.zeros(w, dtype=np.float32)
-            if feather_w <= 0:
-                alpha_1d[edge_distance < side_w] = 1.0
-            else:
-                full_blur_limit = max(0, side_w - feather_w)
-                full_mask = edge_distance <= full_blur_limit
-                alpha_1d[full_mask] = 1.0
-
-                feather_mask = (edge_distance > full_blur_limit) & (edge_distance < side_w)
-                alpha_1d[feather_mask] = (side_w - edge_distance[feather_mask]) / max(feather_w, 1)
-
-            alpha = alpha_1d.reshape(1, w, 1)
-            result = (arr * (1.0 - alpha)) + (blurred * alpha)
-            return np.clip(result, 0, 255).astype(np.uint8)
-
-        return clip.transform(blur_sides_transform)
+        # Masks and buffers are built on the first frame and reused
+        kernel = BlurSidesKernel(strength, width_percent, feather_percent)
+        return clip.transform(lambda get_frame, t: kernel(get_frame(t)))
 
     def _parse_bitrate(self, value: Any) -> Optional[int]:
         """Normalize bitrate value to bits per second."""
@@ -731,6 +683,59 @@ class VideoMergeEngine:
             logger.error(f"Error merging clips: {e}")
             return None
 
+    @classmethod
+    def resolve_quality(cls, settings: MergeSettings,
+                        source_video_bps: Optional[int] = None,
+                        source_audio_bps: Optional[int] = None) -> tuple:
+        """
+        Pick output bitrates for the quality preset
+
+        Args:
+            settings: Merge settings
+            source_video_bps: Highest source video bitrate (bps) if known
+            source_audio_bps: Highest source audio bitrate (bps) if known
+
+        Returns:
+            (quality dict with video/audio bitrate, quality label)
+        """
+        quality = dict(cls.QUALITY_PRESETS.get(settings.output_quality, cls.QUALITY_PRESETS['high']))
+
+        # Try to preserve original quality if no transformations were applied
+        # Check if any transformations are enabled
+        has_transformations = (
+            settings.trim_start > 0 or settings.trim_end > 0 or
+            settings.crop_enabled or settings.zoom_enabled or
+            settings.flip_horizontal or settings.flip_vertical
+        )
+
+        if settings.output_quality == 'source':
+            if source_video_bps:
+                quality['video_bitrate'] = f"{max(source_video_bps // 1000, 250)}k"
+            else:
+                logger.warning("Could not detect source bitrate; using high preset.")
+                quality = dict(cls.QUALITY_PRESETS['high'])
+
+            if settings.keep_audio:
+                if source_audio_bps:
+                    quality['audio_bitrate'] = f"{max(source_audio_bps // 1000, 64)}k"
+            else:
+                quality['audio_bitrate'] = None
+
+            if source_video_bps:
+                logger.info(f"Using source bitrate: {quality['video_bitrate']}")
+        # If no transformations and we have original clips, try to get original bitrate
+        elif not has_transformations and source_video_bps:
+            preset_bitrate_num = int(quality['video_bitrate'].replace('k', '')) * 1000
+            if source_video_bps > preset_bitrate_num:
+                quality['video_bitrate'] = f"{source_video_bps // 1000}k"
+                logger.info(f"Using source bitrate: {quality['video_bitrate']}")
+
+        quality_label = settings.output_quality
+        if settings.output_quality == 'source' and not source_video_bps:
+            quality_label = 'high'
+
+        return quality, quality_label
+
     def export(self, merged_clip: VideoFileClip, output_path: str,
                settings: MergeSettings,
                progress_callback: Optional[Callable[[float], None]] = None,
@@ -749,46 +754,12 @@ class VideoMergeEngine:
             True if successful
         """
         try:
-            quality = dict(self.QUALITY_PRESETS.get(settings.output_quality, self.QUALITY_PRESETS['high']))
-
-            # Try to preserve original quality if no transformations were applied
-            # Check if any transformations are enabled
-            has_transformations = (
-                settings.trim_start > 0 or settings.trim_end > 0 or
-                settings.crop_enabled or settings.zoom_enabled or
-                settings.flip_horizontal or settings.flip_vertical
-            )
-
             source_video_bps = None
             source_audio_bps = None
             if self.clips:
                 source_video_bps, source_audio_bps = self._get_source_bitrates(settings)
 
-            if settings.output_quality == 'source':
-                if source_video_bps:
-                    quality['video_bitrate'] = f"{max(source_video_bps // 1000, 250)}k"
-                else:
-                    logger.warning("Could not detect source bitrate; using high preset.")
-                    quality = dict(self.QUALITY_PRESETS['high'])
-
-                if settings.keep_audio:
-                    if source_audio_bps:
-                        quality['audio_bitrate'] = f"{max(source_audio_bps // 1000, 64)}k"
-                else:
-                    quality['audio_bitrate'] = None
-
-                if source_video_bps:
-                    logger.info(f"Using source bitrate: {quality['video_bitrate']}")
-            # If no transformations and we have original clips, try to get original bitrate
-            elif not has_transformations and source_video_bps:
-                preset_bitrate_num = int(quality['video_bitrate'].replace('k', '')) * 1000
-                if source_video_bps > preset_bitrate_num:
-                    quality['video_bitrate'] = f"{source_video_bps // 1000}k"
-                    logger.info(f"Using source bitrate: {quality['video_bitrate']}")
-
-            quality_label = settings.output_quality
-            if settings.output_quality == 'source' and not source_video_bps:
-                quality_label = 'high'
+            quality, quality_label = self.resolve_quality(settings, source_video_bps, source_audio_bps)
 
             logger.info(f"Exporting to: {output_path}")
             logger.info(f"Quality: {quality_label} ({quality['video_bitrate']} video, {quality['audio_bitrate']} audio)")
@@ -804,7 +775,7 @@ class VideoMergeEngine:
                 bitrate=quality['video_bitrate'],
                 audio_bitrate=quality['audio_bitrate'],
                 preset='medium',
-                threads=4,
+                threads=settings.encoder_threads or 4,
                 logger=export_logger
             )
 
@@ -840,6 +811,134 @@ class VideoMergeEngine:
         logger.info("Cleanup complete")
 
 
+def merge_with_filtergraph(video_paths: List[str], output_path: str,
+                           settings: MergeSettings,
+                           progress_callback: Optional[Callable[[str, float], None]] = None,
+                           control_callback: Optional[Callable[[], Any]] = None) -> Optional[bool]:
+    """
+    Merge videos in a single FFmpeg run (no MoviePy)
+
+    Plain joins of stream-compatible inputs are copied with the concat
+    demuxer; everything else is rendered as one filter_complex.
+
+    Args:
+        video_paths: List of video file paths
+        output_path: Output file path
+        settings: Merge settings
+        progress_callback: Callback(status_msg, percentage)
+        control_callback: Callback returning (paused, cancelled)
+
+    Returns:
+        True if successful, False if cancelled, None if FFmpeg failed
+
+    Raises:
+        FilterGraphUnsupported: settings need the MoviePy fallback
+    """
+    from modules.video_editor.utils import get_ffmpeg_path, get_ffprobe_path
+
+    if progress_callback:
+        progress_callback("Probing videos...", 0)
+
+    clips = probe_clips(video_paths, get_ffprobe_path())
+    renderer = FilterGraphRenderer(lambda: _get_control_state(control_callback))
+
+    plan = plan_stream_copy(settings, clips)
+    if plan:
+        result = _merge_by_stream_copy(clips, output_path, settings, plan, renderer, progress_callback)
+        if result is not None:
+            return result
+
+    graph = compile_filtergraph(settings, clips)
+
+    source_video_bps = max((c.video_bitrate for c in clips if c.video_bitrate), default=None)
+    source_audio_bps = max((c.audio_bitrate for c in clips if c.audio_bitrate), default=None)
+    quality, quality_label = VideoMergeEngine.resolve_quality(settings, source_video_bps, source_audio_bps)
+
+    cmd = build_command(get_ffmpeg_path(), clips, graph, output_path,
+                        quality['video_bitrate'], quality['audio_bitrate'],
+                        threads=settings.encoder_threads)
+
+    logger.info(f"Rendering {len(clips)} clips with FFmpeg filtergraph to: {output_path}")
+    logger.info(f"Quality: {quality_label} ({quality['video_bitrate']} video, {quality['audio_bitrate']} audio)")
+    logger.debug(f"filter_complex: {graph.filter_complex}")
+
+    def render_progress(pct):
+        if progress_callback:
+            progress_callback(f"Rendering... {pct:.1f}%", 10 + (pct / 100) * 90)
+
+    if progress_callback:
+        progress_callback("Rendering with FFmpeg...", 10)
+
+    if renderer.run(cmd, graph.duration, output_path, render_progress):
+        logger.info(f"Export complete: {output_path}")
+        return True
+    if renderer.cancelled:
+        logger.info("Merge cancelled")
+        return False
+
+    logger.warning(f"FFmpeg filtergraph render failed: {renderer.error}")
+    return None
+
+
+def _merge_by_stream_copy(clips, output_path: str, settings: MergeSettings, plan: str,
+                          renderer: FilterGraphRenderer,
+                          progress_callback: Optional[Callable[[str, float], None]] = None) -> Optional[bool]:
+    """
+    Join inputs with the concat demuxer (no video re-encode)
+
+    Returns:
+        True if successful, False if cancelled, None if the copy failed
+    """
+    from modules.video_editor.utils import get_ffmpeg_path
+
+    audio_bps = max((c.audio_bitrate for c in clips if c.audio_bitrate), default=None)
+    audio_bitrate = f"{max(audio_bps // 1000, 64)}k" if audio_bps else None
+
+    handle, list_path = tempfile.mkstemp(prefix="merge_", suffix=".ffconcat")
+    os.close(handle)
+    try:
+        write_concat_list(clips, list_path)
+        cmd = build_concat_command(get_ffmpeg_path(), clips, list_path, output_path, plan,
+                                   settings.keep_audio, audio_bitrate)
+
+        mode = "stream copy" if plan == PLAN_COPY else "video copy, audio re-encode"
+        logger.info(f"Joining {len(clips)} compatible clips ({mode}) to: {output_path}")
+        if progress_callback:
+            progress_callback("Joining videos (no re-encode)...", 10)
+
+        def copy_progress(pct):
+            if progress_callback:
+                progress_callback(f"Joining... {pct:.1f}%", 10 + (pct / 100) * 90)
+
+        total = sum(c.duration for c in clips)
+        if renderer.run(cmd, total, output_path, copy_progress):
+            logger.info(f"Export complete: {output_path}")
+            return True
+        if renderer.cancelled:
+            logger.info("Merge cancelled")
+            return False
+
+        logger.warning(f"Stream copy failed, re-encoding instead: {renderer.error}")
+        return None
+    finally:
+        try:
+            os.remove(list_path)
+        except OSError:
+            pass
+
+
+def _delete_sources(video_paths: List[str],
+                    progress_callback: Optional[Callable[[str, float], None]] = None):
+    """Delete merged source files"""
+    if progress_callback:
+        progress_callback("Deleting source files...", 100)
+
+    from .utils import safe_delete_file
+    for path in video_paths:
+        safe_delete_file(path)
+        logger.info(f"Deleted source file: {path}")
+
+
 def merge_videos(video_paths: List[str], output_path: str,
                  settings: MergeSettings = None,
                  progress_callback: Optional[Callable[[str, float], None]] = None,
@@ -860,6 +959,23 @@ def merge_videos(video_paths: List[str], output_path: str,
     if settings is None:
         settings = MergeSettings()
 
+    if settings.render_backend != 'moviepy':
+        try:
+            result = merge_with_filtergraph(video_paths, output_path, settings,
+                                            progress_callback, control_callback)
+            if result is not None:
+                if result and settings.delete_source:
+                    _delete_sources(video_paths, progress_callback)
+                return result
+        except FilterGraphUnsupported as e:
+            logger.info(f"Using MoviePy: {e}")
+        except Exception as e:
+            logger.warning(f"FFmpeg filtergraph unavailable ({e}); using MoviePy")
+
+        if not MOVIEPY_AVAILABLE:
+            logger.error("MoviePy is not installed. Install with: pip install moviepy")
+            return False
+
     engine = VideoMergeEngine()
     merged = None
 
@@ -907,13 +1023,7 @@ def merge_videos(video_paths: List[str], output_path: str,
 
         # Delete source files if requested
         if success and settings.delete_source:
-            if progress_callback:
-                progress_callback("Deleting source files...", 100)
-
-            from .utils import safe_delete_file
-            for path in video_paths:
-                safe_delete_file(path)
-                logger.info(f"Deleted source file: {path}")
+            _delete_sources(video_paths, progress_callback)
 
         return success
 
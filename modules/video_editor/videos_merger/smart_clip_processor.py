@@ -12,6 +12,9 @@ from typing import Any, Dict, List, Optional
 from PyQt5.QtCore import QThread, pyqtSignal
 
 from modules.logging.logger import get_logger
+from .batch_pool import BatchPool, auto_workers, encoder_threads_for
+from .clip_extractor import cut_clip, keyframe_index, plan_cut
+from .ffmpeg_filtergraph import probe_clip
 from .merge_engine import MergeSettings, merge_videos
 from .utils import generate_batch_filename, generate_output_filename, safe_delete_file
 
@@ -23,6 +26,9 @@ try:
 except ImportError:
     MOVIEPY_AVAILABLE = False
 
+# Encoder threads one clip extraction needs
+EXTRACT_THREADS_PER_JOB = 2
+
 
 class SmartClipMergeProcessor(QThread):
     """Background processor for Smart Clip Merge."""
@@ -69,8 +75,10 @@ class SmartClipMergeProcessor(QThread):
         self._is_cancelled = False
         self._is_paused = False
 
-        if not MOVIEPY_AVAILABLE:
-            msg = "MoviePy is not available. Install with: pip install moviepy"
+        from modules.video_editor.utils import check_ffmpeg
+
+        if not MOVIEPY_AVAILABLE and not check_ffmpeg():
+            msg = "Neither FFmpeg nor MoviePy is available. Install with: pip install moviepy"
             self.error_occurred.emit(msg)
             self.merge_completed.emit(False, {"error": msg})
             self._is_running = False
@@ -113,34 +121,50 @@ class SmartClipMergeProcessor(QThread):
                     source_paths: List[str] = []
                     extraction_failed = False
 
-                    for item_index, item in enumerate(batch_items, start=1):
-                        if self._check_pause_cancel():
-                            extraction_failed = True
-                            break
-
-                        source_path = item["path"]
-                        clip_seconds = int(item.get("clip_seconds") or self.global_seconds)
-                        if clip_seconds <= 0:
-                            clip_seconds = self.global_seconds
+                    # Extract the batch's clips concurrently, results stay in item order
+                    workers = auto_workers(len(batch_items), EXTRACT_THREADS_PER_JOB,
+                                           int(self.merge_overrides.get("parallel_jobs") or 0))
+                    threads = encoder_threads_for(workers) if workers > 1 else EXTRACT_THREADS_PER_JOB
+
+                    def make_job(item_index: int, item: Dict[str, Any]):
+                        def job(report):
+                            clip_seconds = int(item.get("clip_seconds") or self.global_seconds)
+                            if clip_seconds <= 0:
+                                clip_seconds = self.global_seconds
+                            temp_path = str(Path(tmp_dir) / f"clip_{item_index:03d}.mp4")
+                            ok, err = self._extract_clip(item["path"], clip_seconds, temp_path, threads)
+                            return ok, err, temp_path
+                        return job
+
+                    done = []
+
+                    def extract_progress(index, item_pct, overall_pct):
+                        if item_pct >= 100.0:
+                            done.append(index)
+                        self.batch_progress_updated.emit(
+                            idx, total_batches, f"Extracting {len(done)}/{len(batch_items)}", overall_pct * 0.45
+                        )
 
-                        temp_name = f"clip_{item_index:03d}.mp4"
-                        temp_path = str(Path(tmp_dir) / temp_name)
+                    pool = BatchPool(workers, lambda: (self._is_paused, self._is_cancelled))
+                    outcomes = pool.run(
+                        [make_job(item_index, item) for item_index, item in enumerate(batch_items, start=1)],
+                        extract_progress,
+                    )
 
-                        ok, err = self._extract_clip(source_path, clip_seconds, temp_path)
+                    for item, outcome in zip(batch_items, outcomes):
+                        source_path = item["path"]
+                        ok, err, temp_path = outcome or (False, "cancelled" if pool.cancelled else "failed", None)
                         if not ok:
                             extraction_failed = True
-                            results["errors"].append(f"Batch {idx}: {Path(source_path).name} - {err}")
-                            self.log_message.emit(
-                                f"Batch {idx}: failed to extract clip from {Path(source_path).name} ({err})"
-                            )
+                            if not self._is_cancelled:
+                                results["errors"].append(f"Batch {idx}: {Path(source_path).name} - {err}")
+                                self.log_message.emit(
+                                    f"Batch {idx}: failed to extract clip from {Path(source_path).name} ({err})"
+                                )
                             break
 
                         extracted_paths.append(temp_path)
                         source_paths.append(source_path)
-                        pct = (item_index / len(batch_items)) * 45.0
-                        self.batch_progress_updated.emit(
-                            idx, total_batches, f"Extracting {item_index}/{len(batch_items)}", pct
-                        )
 
                     if self._is_cancelled:
                         results["cancelled"] = True
@@ -224,8 +248,51 @@ class SmartClipMergeProcessor(QThread):
             return max(0.5, duration / 2.0)
         return min(req, duration)
 
-    def _extract_clip(self, source_path: str, requested_seconds: int, output_path: str) -> tuple[bool, str]:
-        """Extract a smart clip from source video."""
+    def _pick_window(self, duration: float, requested_seconds: int) -> tuple[float, float]:
+        """Random or centered clip window (start, end) in seconds."""
+        effective_seconds = self._effective_seconds(duration, requested_seconds)
+        max_start = max(0.0, duration - effective_seconds)
+
+        if self.clip_mode == "random":
+            start_time = random.uniform(0.0, max_start) if max_start > 0 else 0.0
+        else:
+            start_time = max_start / 2.0
+
+        return start_time, min(duration, start_time + effective_seconds)
+
+    def _extract_clip(self, source_path: str, requested_seconds: int, output_path: str,
+                      threads: int = EXTRACT_THREADS_PER_JOB) -> tuple[bool, str]:
+        """Extract a smart clip: keyframe-snapped stream copy, MoviePy as fallback."""
+        try:
+            ok, err = self._extract_clip_ffmpeg(source_path, requested_seconds, output_path, threads)
+            if ok:
+                return True, ""
+        except Exception as e:
+            err = str(e)
+        logger.warning(f"Stream-copy extraction failed for {Path(source_path).name}: {err}")
+
+        if not MOVIEPY_AVAILABLE:
+            return False, err
+        return self._extract_clip_moviepy(source_path, requested_seconds, output_path, threads)
+
+    def _extract_clip_ffmpeg(self, source_path: str, requested_seconds: int, output_path: str,
+                             threads: int) -> tuple[bool, str]:
+        """Cut the window at keyframes; only a random window may move to the nearest one."""
+        from modules.video_editor.utils import get_ffmpeg_path, get_ffprobe_path
+
+        ffprobe_path = get_ffprobe_path()
+        info = probe_clip(source_path, ffprobe_path)
+        start_time, end_time = self._pick_window(info.duration, requested_seconds)
+        if end_time <= start_time:
+            return False, "failed to compute valid clip range"
+
+        keyframes = keyframe_index(source_path, start_time, end_time, ffprobe_path)
+        plan = plan_cut(keyframes, start_time, end_time, info.duration, exact=self.clip_mode != "random")
+        return cut_clip(info, plan, output_path, get_ffmpeg_path(), threads)
+
+    def _extract_clip_moviepy(self, source_path: str, requested_seconds: int, output_path: str,
+                              threads: int) -> tuple[bool, str]:
+        """Extract a smart clip by re-encoding it with MoviePy."""
         clip = None
         segment = None
         try:
@@ -234,15 +301,7 @@ class SmartClipMergeProcessor(QThread):
             if duration <= 0.0:
                 return False, "invalid video duration"
 
-            effective_seconds = self._effective_seconds(duration, requested_seconds)
-            max_start = max(0.0, duration - effective_seconds)
-
-            if self.clip_mode == "random":
-                start_time = random.uniform(0.0, max_start) if max_start > 0 else 0.0
-            else:
-                start_time = max_start / 2.0
-
-            end_time = min(duration, start_time + effective_seconds)
+            start_time, end_time = self._pick_window(duration, requested_seconds)
             if end_time <= start_time:
                 return False, "failed to compute valid clip range"
 
@@ -252,7 +311,7 @@ class SmartClipMergeProcessor(QThread):
                 codec="libx264",
                 audio_codec="aac",
                 preset="medium",
-                threads=2,
+                threads=threads,
                 logger=None,
             )
             return True, ""
@@ -0,0 +1,71 @@
+"""Tests for the offline detector benchmark (synthetic frames, no display)."""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+
+def _load(name, relative):
+    # Direct import: the browser package __init__ pulls in the whole GUI stack
+    spec = importlib.util.spec_from_file_location(name, Path(__file__).parent / relative)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+bench = _load("detector_benchmark", "modules/auto_uploader/browser/detector_benchmark.py")
+ScreenMatcher = _load("screen_matcher", "modules/auto_uploader/browser/screen_matcher.py").ScreenMatcher
+
+
+@pytest.fixture
+def templates(tmp_path):
+    rng = np.random.default_rng(7)
+    paths = {}
+    for name in ("publish_button", "search_input"):
+        tile = rng.integers(0, 255, size=(12, 30, 3), dtype=np.uint8)
+        cv2.imwrite(str(tmp_path / f"{name}.png"), cv2.resize(tile, (120, 48), interpolation=cv2.INTER_NEAREST))
+        paths[name] = tmp_path / f"{name}.png"
+    return paths
+
+
+def _never_grab():
+    raise AssertionError("benchmark must not capture the screen")
+
+
+def test_synthetic_renders_score_hits_and_false_positives(templates):
+    cases = bench.render_synthetic_cases(templates, resolutions=[(800, 600)], scales=[1.0, 1.5])
+    assert len(cases) == 8 and sum(case.truth is None for case in cases) == 4
+
+    detector = bench.TemplateDetector(templates, ScreenMatcher(grab=_never_grab))
+    rows = bench.run_benchmark(cases, [detector])
+
+    assert [row.element for row in rows] == ["publish_button", "search_input"]
+    for row in rows:
+        # found at 1.0, template matching does not survive a 150% DPI render
+        assert (row.positives, row.hits, row.negatives, row.false_positives) == (2, 1, 2, 0)
+        assert row.hit_rate == 0.5 and row.fp_rate == 0.0
+        assert row.percentile(50) <= row.percentile(99)
+    assert "publish_button" in bench.format_report(rows)
+
+
+def test_recorded_captures_use_annotations(tmp_path, templates):
+    captures = tmp_path / "captures"
+    captures.mkdir()
+    frame = np.full((600, 800, 3), 240, dtype=np.uint8)
+    frame[100:148, 200:320] = cv2.imread(str(templates["publish_button"]))
+    cv2.imwrite(str(captures / "shot.png"), frame)
+    (captures / "annotations.json").write_text(json.dumps({"shot.png": {"publish_button": [200, 100, 120, 48]}}))
+
+    cases = bench.load_recorded_cases([captures / "shot.png"], templates)
+    rows = bench.run_benchmark(cases, [bench.TemplateDetector(templates, ScreenMatcher(grab=_never_grab))])
+    stats = {row.element: row for row in rows}
+
+    assert stats["publish_button"].hits == 1
+    # not annotated: replayed for latency only
+    assert stats["search_input"].positives == stats["search_input"].negatives == 0
+    assert stats["search_input"].cases == 1 and stats["search_input"].hit_rate is None
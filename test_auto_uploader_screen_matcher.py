@@ -0,0 +1,64 @@
+"""Tests for the shared screen template matcher (synthetic frames, no display)."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+# Direct import: the browser package __init__ pulls in the whole GUI stack
+_spec = importlib.util.spec_from_file_location(
+    "screen_matcher",
+    Path(__file__).parent / "modules/auto_uploader/browser/screen_matcher.py",
+)
+_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+ScreenMatcher = _module.ScreenMatcher
+
+
+def _button(seed: int, size=(40, 120)):
+    rng = np.random.default_rng(seed)
+    tile = rng.integers(0, 255, size=(size[0] // 4, size[1] // 4), dtype=np.uint8)
+    return cv2.resize(tile, (size[1], size[0]), interpolation=cv2.INTER_NEAREST)
+
+
+@pytest.fixture
+def screen(tmp_path):
+    frame = np.full((720, 1280), 235, dtype=np.uint8)
+    publish, cancel = _button(1), _button(2)
+    frame[300:340, 600:720] = publish
+    frame[500:540, 100:220] = publish
+    cv2.imwrite(str(tmp_path / "publish.png"), publish)
+    cv2.imwrite(str(tmp_path / "cancel.png"), cancel)
+    grabs = []
+
+    def grab():
+        grabs.append(1)
+        return frame
+
+    return ScreenMatcher(tick_seconds=60, grab=grab), tmp_path, grabs
+
+
+def test_find_all_and_region(screen):
+    matcher, images, _ = screen
+
+    matches = matcher.find_all(images / "publish.png", confidence=0.9)
+    assert [(m.left, m.top) for m in matches] == [(600, 300), (100, 500)]
+    assert matches[0].center == (660, 320)
+
+    match = matcher.find(images / "publish.png", confidence=0.9, region=(0, 400, 640, 320))
+    assert (match.left, match.top, match.width, match.height) == (100, 500, 120, 40)
+
+
+def test_batch_lookup_shares_one_capture(screen):
+    matcher, images, grabs = screen
+
+    hit = matcher.find_any([images / "cancel.png", images / "missing.png", images / "publish.png"])
+    again = matcher.find(images / "publish.png")
+
+    assert hit[0].endswith("publish.png") and hit[1].confidence > 0.99
+    assert again is not None
+    assert matcher.find(images / "cancel.png") is None
+    assert len(grabs) == 1
@@ -0,0 +1,93 @@
+"""Tests for the segmented, batch-flushed upload tracker."""
+
+import builtins
+import json
+
+from modules.auto_uploader.tracking import upload_tracker
+from modules.auto_uploader.tracking.upload_tracker import UploadTracker
+
+
+def test_records_are_coalesced_into_day_segments(tmp_path):
+    path = tmp_path / "history.json"
+    tracker = UploadTracker(path, flush_window=60)
+
+    tracker.record_upload("alice", "a.mp4", "completed", account="acc", browser_type="ix")
+    tracker.record_upload("alice", "b.mp4", "failed", account="acc", browser_type="ix")
+    assert not path.exists()  # nothing written until the window closes
+
+    tracker.close()
+    summary = json.loads(path.read_text(encoding="utf-8"))
+    segment = tmp_path / "history_segments" / f"{summary['segments'][0]}.jsonl"
+    records = [json.loads(line) for line in segment.read_text().splitlines()]
+    assert [(r["video"], r["status"]) for r in records] == [("a.mp4", "completed"), ("b.mp4", "failed")]
+    assert "completed" not in summary  # completions are only appended to the segment
+    assert summary["browser_accounts"]["acc"]["uploads"] == 1
+    assert summary["browser_accounts"]["acc"]["failures"] == 1
+
+    reloaded = UploadTracker(path)
+    assert reloaded.was_uploaded("alice", "a.mp4") and not reloaded.was_uploaded("alice", "b.mp4")
+    assert len(reloaded.recent_history()) == 2
+
+
+def test_single_file_history_is_migrated(tmp_path):
+    path = tmp_path / "history.json"
+    old_entries = [
+        {"creator": "bob", "video": "x.mp4", "status": "completed", "timestamp": "2024-01-01T10:00:00+00:00"},
+        {"creator": "bob", "video": "y.mp4", "status": "completed", "timestamp": "2024-03-05T10:00:00+00:00"},
+    ]
+    path.write_text(json.dumps({"upload_history": old_entries, "failed_uploads": [],
+                                "browser_accounts": {}, "last_updated": None}), encoding="utf-8")
+
+    tracker = UploadTracker(path, recent_segments=1)
+
+    assert tracker.was_uploaded("bob", "x.mp4") and tracker.was_uploaded("bob", "y.mp4")
+    assert [entry["video"] for entry in tracker.recent_history()] == ["y.mp4"]
+    summary = json.loads(path.read_text(encoding="utf-8"))
+    assert summary["segments"] == ["2024-01-01", "2024-03-05"] and summary["totals"]["uploads"] == 2
+
+
+def test_completed_keys_survive_flushes_without_rewriting_the_summary(tmp_path):
+    path = tmp_path / "history.json"
+    tracker = UploadTracker(path, flush_window=60, recent_segments=0)
+
+    tracker.record_upload("carol", "one.mp4", "completed")
+    tracker.flush()
+    size_after_one = path.stat().st_size
+    for number in range(20):
+        tracker.record_upload("carol", f"more_{number}.mp4", "completed")
+    tracker.flush()
+
+    assert path.stat().st_size < size_after_one + 20
+    reloaded = UploadTracker(path, recent_segments=0)
+    assert reloaded.was_uploaded("carol", "one.mp4") and reloaded.was_uploaded("carol", "more_19.mp4")
+    assert reloaded.recent_history() == []
+
+
+def test_loading_reads_the_completed_index_and_recent_segments_only(tmp_path, monkeypatch):
+    path = tmp_path / "history.json"
+    tracker = UploadTracker(path, flush_window=60, recent_segments=1)
+    for day in ("2024-01-01", "2024-01-02", "2024-01-03"):
+        monkeypatch.setattr(upload_tracker, "_timestamp", lambda day=day: f"{day}T10:00:00+00:00")
+        tracker.record_upload("dave", f"{day}.mp4", "completed")
+    tracker.close()
+
+    opened = []
+    real_open = builtins.open
+
+    def recording_open(file, *args, **kwargs):
+        opened.append(str(file))
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", recording_open)
+    reloaded = UploadTracker(path, recent_segments=1)
+    monkeypatch.setattr(builtins, "open", real_open)
+
+    assert reloaded.was_uploaded("dave", "2024-01-01.mp4") and reloaded.was_uploaded("dave", "2024-01-03.mp4")
+    assert [entry["video"] for entry in reloaded.recent_history()] == ["2024-01-03.mp4"]
+    segments_read = [name for name in opened if "history_segments" in name]
+    assert segments_read and all(name.endswith("2024-01-03.jsonl") for name in segments_read)
+
+    # Histories written before the index existed get it rebuilt once from the segments
+    (tmp_path / "history_completed.jsonl").unlink()
+    assert UploadTracker(path, recent_segments=1).was_uploaded("dave", "2024-01-02.mp4")
+    assert len((tmp_path / "history_completed.jsonl").read_text().splitlines()) == 3
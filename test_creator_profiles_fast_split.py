@@ -0,0 +1,86 @@
+"""Tests for the keyframe stream-copy split inside the fused post-processing."""
+
+import types
+
+import pytest
+
+pytest.importorskip("yt_dlp")
+pytest.importorskip("PyQt5")
+
+from modules.creator_profiles import download_engine  # noqa: E402
+from modules.creator_profiles.postprocess_planner import STEP_BYPASS, PostProcessPlanner  # noqa: E402
+
+
+def _worker(tmp_path, events):
+    config = types.SimpleNamespace(
+        fast_split=True,
+        fast_split_tolerance=2.0,
+        split_duration=10,
+        parts_count=3,
+    )
+    return types.SimpleNamespace(
+        config=config,
+        creator_folder=tmp_path,
+        ffmpeg="ffmpeg",
+        progress=types.SimpleNamespace(emit=events.append),
+        _stop=False,
+    )
+
+
+def test_fused_split_with_bypass_only_uses_keyframe_copy(tmp_path, monkeypatch):
+    source = tmp_path / "clip.mp4"
+    source.write_bytes(b"x")
+    calls = []
+
+    monkeypatch.setattr(download_engine, "_probe_duration_seconds", lambda path, ffmpeg: 25.0)
+    monkeypatch.setattr(download_engine, "_probe_keyframe_times", lambda path, ffmpeg: [0.0, 9.6, 20.2])
+
+    def fake_segment(input_path, output_folder, spans, ffmpeg, progress_cb, graph, label, copy_cuts=None):
+        calls.append((graph, copy_cuts))
+        return []
+
+    monkeypatch.setattr(download_engine, "_segment_video", fake_segment)
+
+    events = []
+    planner = PostProcessPlanner("ffmpeg", tmp_path)
+    ok = download_engine.CreatorDownloadWorker._fused_split_clip(
+        _worker(tmp_path, events), planner, source, "split", keep_original=True
+    )
+
+    assert ok is False   # nothing written by the fake segmenter
+    graph, copy_cuts = calls[0]
+    assert graph.steps == [STEP_BYPASS]
+    assert copy_cuts == [9.6, 20.2]
+    # copy pass produced nothing: the bypass re-encode runs instead
+    assert calls[1] == (graph, None)
+    assert any("Fast split" in line for line in events)
+
+
+def test_copy_split_carries_only_bypass_metadata_args(tmp_path):
+    graph = PostProcessPlanner("ffmpeg", tmp_path).build([STEP_BYPASS])
+    cmd = download_engine._segment_copy_command(
+        "ffmpeg", tmp_path / "in.mp4", tmp_path / "in_part%03d.mp4", tmp_path / "list.csv",
+        [9.6], 25.0, graph.output_args,
+    )
+
+    assert cmd[cmd.index("-c") + 1] == "copy"
+    assert "-map_metadata" in cmd and "-filter_complex" not in cmd and "-vf" not in cmd
+
+
+def test_fused_split_without_any_fused_step_splits_plainly(tmp_path, monkeypatch):
+    source = tmp_path / "clip.mp4"
+    source.write_bytes(b"x")
+    seen = {}
+
+    def fake_split(fp, folder, seconds, ffmpeg, progress_cb, graph=None, **kwargs):
+        seen.update(graph=graph, **kwargs)
+        return []
+
+    monkeypatch.setattr(download_engine, "split_video", fake_split)
+    planner = PostProcessPlanner("ffmpeg", tmp_path, bypass=False)
+
+    ok = download_engine.CreatorDownloadWorker._fused_split_clip(
+        _worker(tmp_path, []), planner, source, "split", keep_original=True
+    )
+
+    assert ok is False and seen["graph"] is None and seen["fast_split"] is True
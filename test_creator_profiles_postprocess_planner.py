@@ -0,0 +1,45 @@
+"""Tests for fusing creator post-processing steps into one ffmpeg pass."""
+
+from modules.creator_profiles.postprocess_planner import (
+    STEP_BYPASS,
+    STEP_EDIT,
+    STEP_WATERMARK,
+    PostProcessPlanner,
+)
+from modules.creator_profiles.watermark_engine import WatermarkLayers
+
+
+def _layers(animated=False):
+    return WatermarkLayers(
+        input_args=["-i", "logo.png"],
+        filter_parts=["[vpre][1:v]overlay=10:10[vout]"],
+        output_label="[vout]",
+        animated=animated,
+    )
+
+
+def test_bypass_edit_and_watermark_share_one_graph(tmp_path):
+    planner = PostProcessPlanner("ffmpeg", tmp_path, edit_settings={"metadata_level": "high", "mirror_horizontal": True})
+    layers = _layers()
+    graph = planner.build(planner.split_steps(layers), layers)
+
+    assert graph.steps == [STEP_BYPASS, STEP_EDIT, STEP_WATERMARK]
+    assert graph.filter_complex.startswith("[0:v]scale=iw*1.011")
+    assert graph.filter_complex.endswith("[vout]")
+
+    cmd = graph.command("ffmpeg", tmp_path / "in.mp4", tmp_path / "out.mp4", trim_args=["-ss", "0.000"])
+    assert cmd.count("-filter_complex") == 1
+    assert cmd[cmd.index("-i", cmd.index("-i") + 1) + 1] == "logo.png"
+    assert cmd[cmd.index("-map") + 1] == "[vout]"
+    assert cmd.count("-map_metadata") == 1
+
+
+def test_demucs_edit_and_animated_watermark_stay_out_of_split_pass(tmp_path):
+    planner = PostProcessPlanner(
+        "ffmpeg",
+        tmp_path,
+        edit_settings={"remove_background_music": True},
+    )
+
+    assert planner.edit_fusable is False
+    assert planner.split_steps(_layers(animated=True)) == [STEP_BYPASS]
@@ -0,0 +1,74 @@
+"""Tests for the concurrency caps used by the creator queue."""
+
+import threading
+
+import pytest
+
+from modules.creator_profiles.scheduler import ResourceGate, SchedulerLimits, SlotCancelled
+
+
+def test_scheduler_limits_default_to_sequential_queue():
+    limits = SchedulerLimits()
+
+    assert limits.concurrent is False
+    assert limits.platform_limit("YouTube") == 4
+    assert limits.platform_limit("unknown-platform") == 2
+
+
+def test_resource_gate_caps_slots_per_resource():
+    gate = ResourceGate({"download": 2})
+    first = gate.slot("download")
+    second = gate.slot("download")
+    first.__enter__()
+    second.__enter__()
+
+    assert gate.in_use("download") == 2
+
+    cancel = threading.Event()
+    cancel.set()
+    waits = []
+    entered = []
+    with pytest.raises(SlotCancelled):
+        with gate.slot("download", cancel_event=cancel, on_wait=waits.append):
+            entered.append(True)
+    # Cancelled waiters never enter the stage
+    assert entered == []
+    assert gate.in_use("download") == 2
+    assert waits
+
+    second.__exit__(None, None, None)
+    first.__exit__(None, None, None)
+    assert gate.in_use("download") == 0
+
+
+def test_resource_gate_cancel_wakes_a_blocked_waiter():
+    gate = ResourceGate({"postprocess": 1})
+    holder = gate.slot("postprocess")
+    holder.__enter__()
+
+    cancel = threading.Event()
+    outcome = []
+
+    def _waiter():
+        try:
+            with gate.slot("postprocess", cancel_event=cancel):
+                outcome.append("entered")
+        except SlotCancelled:
+            outcome.append("cancelled")
+
+    thread = threading.Thread(target=_waiter)
+    thread.start()
+    cancel.set()
+    thread.join(timeout=5)
+
+    assert outcome == ["cancelled"]
+    assert gate.in_use("postprocess") == 1
+    holder.__exit__(None, None, None)
+    assert gate.in_use("postprocess") == 0
+
+
+def test_resource_gate_ignores_unknown_resource():
+    gate = ResourceGate()
+
+    with gate.slot("not-a-stage"):
+        pass
@@ -0,0 +1,99 @@
+"""Tests for the one-pass segment-muxer split (command + segment list parsing)."""
+
+import pytest
+
+pytest.importorskip("yt_dlp")
+pytest.importorskip("PyQt5")
+
+from modules.creator_profiles import download_engine  # noqa: E402
+from modules.creator_profiles.postprocess_planner import STEP_BYPASS, PostProcessPlanner  # noqa: E402
+
+SPANS = [(0.0, 10.0), (10.0, 10.0), (20.0, 4.5)]
+
+
+def _after(cmd, flag):
+    return cmd[cmd.index(flag) + 1]
+
+
+def test_segment_command_cuts_at_span_starts_without_graph(tmp_path):
+    pattern = tmp_path / "clip_part%03d.mov"
+    cmd = download_engine._segment_command(
+        "ffmpeg", tmp_path / "clip.mov", pattern, tmp_path / "list.csv", SPANS)
+
+    assert _after(cmd, "-f") == "segment"
+    assert _after(cmd, "-segment_times") == "10.000,20.000"
+    assert _after(cmd, "-force_key_frames") == "10.000,20.000"
+    assert _after(cmd, "-t") == "24.500"
+    assert _after(cmd, "-segment_format") == "mov"
+    assert _after(cmd, "-segment_list") == str(tmp_path / "list.csv")
+    assert _after(cmd, "-segment_list_type") == "csv"
+    assert _after(cmd, "-c:v") == "libx264" and "-filter_complex" not in cmd
+    assert cmd[-1] == str(pattern)
+
+
+def test_segment_command_runs_the_fused_graph(tmp_path):
+    graph = PostProcessPlanner("ffmpeg", tmp_path).build([STEP_BYPASS])
+    pattern = tmp_path / "clip_part%03d.mp4"
+    cmd = download_engine._segment_command(
+        "ffmpeg", tmp_path / "clip.mp4", pattern, tmp_path / "list.csv", SPANS, graph)
+
+    assert _after(cmd, "-filter_complex") == graph.filter_complex
+    assert _after(cmd, "-segment_times") == "10.000,20.000"
+    assert _after(cmd, "-segment_format") == "mp4"
+    assert _after(cmd, "-segment_format_options") == "movflags=+faststart"
+    assert "-movflags" not in cmd   # the segment muxer carries the mp4 options
+    assert cmd[-1] == str(pattern)
+
+
+def test_single_span_uses_one_long_segment(tmp_path):
+    cmd = download_engine._segment_command(
+        "ffmpeg", tmp_path / "clip.mp4", tmp_path / "clip_part%03d.mp4", tmp_path / "list.csv",
+        [(0.0, 8.0)])
+
+    assert "-segment_times" not in cmd and "-force_key_frames" not in cmd
+    assert _after(cmd, "-segment_time") == "9.000"
+
+
+def test_segment_list_is_parsed_into_parts_of_the_output_folder(tmp_path):
+    list_path = tmp_path / "list.csv"
+    list_path.write_text(
+        "clip_part001.mp4,0.000000,10.010000\n"
+        "sub/clip_part002.mp4,10.010000,20.000000\n"
+        "\"clip, part003.mp4\",20.000000,24.500000\n"
+        "broken_line\n"
+        "clip_part004.mp4,not-a-number,1.0\n",
+        encoding="utf-8",
+    )
+    out = tmp_path / "parts"
+
+    entries = download_engine._read_segment_list(list_path, out)
+
+    assert entries == [
+        (out / "clip_part001.mp4", 0.0, 10.01),
+        (out / "clip_part002.mp4", 10.01, 20.0),
+        (out / "clip, part003.mp4", 20.0, 24.5),
+    ]
+    assert download_engine._read_segment_list(tmp_path / "missing.csv", out) == []
+
+
+def test_segment_video_keeps_valid_parts_and_removes_the_rest(tmp_path, monkeypatch):
+    source = tmp_path / "clip.mp4"
+    source.write_bytes(b"x")
+
+    def fake_run(cmd):
+        list_path = _after(cmd, "-segment_list")
+        for n in (1, 2, 3):
+            (tmp_path / f"clip_part{n:03d}.mp4").write_bytes(b"part")
+        with open(list_path, "w", encoding="utf-8") as fh:
+            fh.write("clip_part001.mp4,0.0,10.0\n"
+                     "clip_part002.mp4,10.0,20.0\n"
+                     "clip_part003.mp4,20.0,20.2\n")   # tail shorter than a valid part
+        return 0, ""
+
+    monkeypatch.setattr(download_engine, "_run_ffmpeg_capture", fake_run)
+
+    parts = download_engine._segment_video(source, tmp_path, SPANS, "ffmpeg")
+
+    assert parts == [tmp_path / "clip_part001.mp4", tmp_path / "clip_part002.mp4"]
+    assert not (tmp_path / "clip_part003.mp4").exists()
+    assert not (tmp_path / "clip_segments.csv").exists()
@@ -0,0 +1,59 @@
+"""Tests for content-fingerprint dedupe of ixBrowser uploads."""
+
+import importlib.util
+import os
+from pathlib import Path
+
+
+def _load(name, relative):
+    # Direct import: the ixbrowser package __init__ pulls in the HTTP client
+    spec = importlib.util.spec_from_file_location(name, Path(__file__).parent / relative)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+CORE = "modules/auto_uploader/approaches/ixbrowser/core/"
+fingerprints = _load("ixbrowser_fingerprint_index", CORE + "fingerprint_index.py")
+StateManager = _load("ixbrowser_state_manager", CORE + "state_manager.py").StateManager
+FolderQueueManager = _load("ixbrowser_folder_queue", CORE + "folder_queue.py").FolderQueueManager
+
+
+def test_fingerprint_is_cached_by_size_and_mtime(tmp_path):
+    data = os.urandom(512 * 1024)
+    clip = tmp_path / "clip.mp4"
+    clip.write_bytes(data)
+    (tmp_path / "renamed title.mp4").write_bytes(data)
+
+    index = fingerprints.FingerprintIndex(cache_file=tmp_path / "cache.json")
+    first = index.fingerprint(str(clip))
+    assert first.startswith(f"{len(data)}:")
+    assert index.fingerprint(str(clip)) == first and (index.misses, index.hits) == (1, 1)
+    assert index.fingerprint(str(tmp_path / "renamed title.mp4")) == first
+
+    clip.write_bytes(data[:-1] + bytes([data[-1] ^ 1]))
+    os.utime(clip, ns=(1, 1))
+    assert index.fingerprint(str(clip)) != first  # changed file is hashed again
+
+    index.save()
+    reloaded = fingerprints.FingerprintIndex(cache_file=tmp_path / "cache.json")
+    reloaded.fingerprint(str(clip))
+    assert (reloaded.misses, reloaded.hits) == (0, 1)
+
+
+def test_folder_queue_skips_content_uploaded_under_another_name(tmp_path):
+    creator = tmp_path / "creators" / "alice"
+    creator.mkdir(parents=True)
+    original = creator / "first download.mp4"
+    original.write_bytes(os.urandom(200 * 1024))
+    (creator / "other.mp4").write_bytes(os.urandom(200 * 1024))
+
+    state = StateManager(data_dir=tmp_path / "data")
+    index = fingerprints.FingerprintIndex(cache_file=tmp_path / "data" / "fingerprints.json")
+    queue = FolderQueueManager(str(tmp_path / "creators"), state_manager=state, fingerprint_index=index)
+
+    state.mark_video_uploaded(str(original), bookmark="Page", fingerprint=index.fingerprint(str(original)))
+    # same clip comes back under a generated title
+    os.rename(original, creator / "Amazing Title.mp4")
+
+    assert queue.get_videos_in_folder(str(creator)) == [os.path.normpath(str(creator / "other.mp4"))]
@@ -0,0 +1,173 @@
+"""Tests for the parallel ixBrowser profile runner and the shared input lease."""
+
+import importlib.util
+import threading
+import time
+from pathlib import Path
+
+
+def _load(name, relative):
+    # Direct import: the ixbrowser package __init__ pulls in the HTTP client
+    spec = importlib.util.spec_from_file_location(name, Path(__file__).parent / relative)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+InputLease = _load("ixbrowser_input_lease",
+                   "modules/auto_uploader/approaches/ixbrowser/core/input_lease.py").InputLease
+runner_module = _load("ixbrowser_parallel_runner",
+                      "modules/auto_uploader/approaches/ixbrowser/core/parallel_runner.py")
+
+
+class FakeProfileManager:
+    def __init__(self, count):
+        self.profiles = [{"profile_id": i, "name": f"P{i}"} for i in range(count)]
+        self.next_index = 0
+        self.finished = []
+        self.lock = threading.Lock()
+
+    def claim_next_profile(self):
+        with self.lock:
+            if self.next_index >= len(self.profiles):
+                return None
+            self.next_index += 1
+            return self.next_index - 1, self.profiles[self.next_index - 1]
+
+    def finish_profile(self, index):
+        with self.lock:
+            self.finished.append(index)
+
+
+class FakeStateManager:
+    def __init__(self, uploaded):
+        self.uploaded = uploaded
+
+    def check_daily_limit(self, user_type="basic", limit=200):
+        return {"limit_reached": self.uploaded >= limit, "current_count": self.uploaded,
+                "remaining": max(0, limit - self.uploaded), "message": "basic"}
+
+    def increment_daily_bookmarks(self, count=1, bookmark_name=None):
+        self.uploaded += count
+
+
+def test_lease_is_reentrant_and_exclusive():
+    lease = InputLease()
+    focused = []
+    assert lease.acquire("click", focus=lambda: focused.append(1))
+    assert lease.acquire("nested", focus=lambda: focused.append(2))
+    assert focused == [1] and lease.held_by_me()
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(
+        (lease.try_acquire("idle"), lease.acquire("dialog", timeout=0.1))))
+    thread.start()
+    thread.join()
+    assert other == [(False, False)]
+
+    lease.release_all()
+    assert lease.holder is None and not lease.held_by_me()
+
+
+def test_runner_keeps_k_profiles_open_and_finishes_all():
+    manager = FakeProfileManager(5)
+    open_now, peak = [0], [0]
+    lock = threading.Lock()
+
+    def process(profile, index):
+        with lock:
+            open_now[0] += 1
+            peak[0] = max(peak[0], open_now[0])
+        time.sleep(0.05)
+        with lock:
+            open_now[0] -= 1
+        if index == 3:
+            raise RuntimeError("launch failed")
+        return index * 10
+
+    results = runner_module.ParallelProfileRunner(2, process).run(manager)
+
+    assert peak[0] == 2
+    assert [entry["index"] for entry in results] == [0, 1, 2, 3, 4]
+    assert [entry["result"] for entry in results] == [0, 10, 20, None, 40]
+    assert results[3]["error"] == "launch failed"
+    assert sorted(manager.finished) == [0, 1, 2, 3, 4]
+
+
+def test_scoped_daily_limit_counts_uploads_in_other_profiles():
+    runner = runner_module.ParallelProfileRunner(2, lambda profile, index: 0)
+    shared = FakeStateManager(uploaded=8)
+    first = runner.scoped_state(shared, "a")
+    second = runner.scoped_state(shared, "b")
+
+    assert not first.check_daily_limit(limit=10)["limit_reached"]
+    assert not second.check_daily_limit(limit=10)["limit_reached"]
+    # both slots are taken by in-flight uploads
+    assert runner.scoped_state(shared, "c").check_daily_limit(limit=10)["limit_reached"]
+
+    first.increment_daily_bookmarks(bookmark_name="Page")
+    first.update_queue_position(folder_index=3)
+    assert shared.uploaded == 9
+    assert second.check_daily_limit(limit=10)["remaining"] == 1
+
+
+class FakePositionState(FakeStateManager):
+    def __init__(self):
+        super().__init__(uploaded=0)
+        self.current_upload = {}
+
+    def get_current_position(self):
+        return {"folder_index": 0, "folder_path": None, "cycle": 1,
+                "current_upload": dict(self.current_upload)}
+
+    def update_current_upload(self, **fields):
+        self.current_upload.update(fields)
+
+
+def test_scoped_current_upload_is_per_profile():
+    runner = runner_module.ParallelProfileRunner(2, lambda profile, index: 0)
+    shared = FakePositionState()
+    first = runner.scoped_state(shared, "a")
+    second = runner.scoped_state(shared, "b")
+
+    first.update_current_upload(video_file="a.mp4", video_name="a", status="uploading", progress=40)
+    second.update_current_upload(video_file="b.mp4", video_name="b", progress=10)
+    first.update_current_upload(progress=70)
+
+    assert first.get_current_position()["current_upload"]["video_file"] == "a.mp4"
+    assert first.get_current_position()["current_upload"]["progress_last_seen"] == 70
+    assert first.get_current_position()["current_upload"]["started_at"]
+    assert second.get_current_position()["current_upload"]["video_file"] == "b.mp4"
+    assert shared.current_upload == {}
+
+    first.clear_current_upload()
+    assert not first.get_current_position()["current_upload"].get("video_file")
+    assert second.get_current_position()["current_upload"]["progress_last_seen"] == 10
+
+
+def test_launch_failure_streak_stops_claiming_profiles():
+    manager = FakeProfileManager(8)
+    streak = runner_module.LaunchFailureStreak(3)
+    runner = None
+
+    def process(profile, index):
+        time.sleep(0.02)
+        if streak.record(launched=False):
+            runner.stop()
+        return 0
+
+    runner = runner_module.ParallelProfileRunner(2, process)
+    results = runner.run(manager)
+
+    # The third failure stops the run; the profile still open in the other slot finishes
+    assert 3 <= len(results) <= 4
+    assert manager.next_index < 8
+
+
+def test_launch_failure_streak_resets_on_a_healthy_launch():
+    streak = runner_module.LaunchFailureStreak(2)
+
+    assert streak.record(False) is False
+    assert streak.record(True) is False
+    assert streak.record(False) is False
+    assert streak.record(False) is True
@@ -0,0 +1,85 @@
+"""Tests for the indexed upload history of the ixBrowser StateManager."""
+
+import importlib.util
+import json
+import os
+import sys
+import types
+from pathlib import Path
+
+# Direct import: the ixbrowser package __init__ pulls in the HTTP client.
+# The core directory is mounted as its own package so the lazy relative
+# imports inside state_manager (fingerprint_index) still resolve.
+_CORE = Path(__file__).parent / "modules/auto_uploader/approaches/ixbrowser/core"
+_package = types.ModuleType("ixbrowser_core")
+_package.__path__ = [str(_CORE)]
+sys.modules.setdefault("ixbrowser_core", _package)
+_spec = importlib.util.spec_from_file_location("ixbrowser_core.state_manager", _CORE / "state_manager.py")
+_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+StateManager = _module.StateManager
+
+
+def test_filter_unprocessed_uses_normalized_paths(tmp_path):
+    mgr = StateManager(data_dir=tmp_path)
+    a = str(tmp_path / "creator" / "a.mp4")
+    b = str(tmp_path / "creator" / "b.mp4")
+    c = str(tmp_path / "creator" / "c.mp4")
+
+    mgr.mark_video_uploaded(a, bookmark="Page 1")
+    mgr.mark_video_failed(b, bookmark="Page 1", reason="timeout")
+
+    unnormalized_a = os.path.join(str(tmp_path), "creator", ".", "a.mp4")
+    assert mgr.filter_unprocessed([c, unnormalized_a, b]) == [c]
+    assert mgr.is_video_uploaded(unnormalized_a)
+    assert mgr.is_video_uploaded_to(a, "Page 1") and not mgr.is_video_uploaded_to(a, "Page 2")
+
+
+def test_index_reloads_when_file_changes_on_disk(tmp_path):
+    mgr = StateManager(data_dir=tmp_path)
+    clip = str(tmp_path / "clip.mp4")
+    assert not mgr.is_video_uploaded(clip)
+
+    # Another process records an upload
+    other = StateManager(data_dir=tmp_path)
+    other.mark_video_uploaded(clip, bookmark="Page 1")
+    other.compact()
+    data = json.loads(mgr.uploaded_videos_file.read_text(encoding="utf-8"))
+    data["videos"][0]["fingerprint"] = "abc"
+    mgr.uploaded_videos_file.write_text(json.dumps(data, indent=4), encoding="utf-8")
+
+    assert mgr.is_video_uploaded(clip)
+    assert mgr.is_fingerprint_uploaded("abc")
+
+
+def test_journal_replays_after_restart_and_compaction(tmp_path):
+    mgr = StateManager(data_dir=tmp_path)
+    for i in range(3):
+        mgr.mark_video_uploaded(str(tmp_path / f"{i}.mp4"), bookmark="Page 1")
+    mgr.update_network_status("stable")
+    assert not mgr.uploaded_videos_file.exists()   # only journaled so far
+
+    restarted = StateManager(data_dir=tmp_path)
+    assert restarted.load_uploaded_videos()["total_uploads"] == 3
+    assert restarted.load_state()["network"]["status"] == "stable"
+
+    # Crash between writing the base and truncating the journal
+    journal_text = restarted.uploaded_videos_file.with_name("uploaded_videos.json.journal").read_text()
+    restarted.compact()
+    restarted.uploaded_videos_file.with_name("uploaded_videos.json.journal").write_text(journal_text + '{"op": "app')
+
+    data = StateManager(data_dir=tmp_path).load_uploaded_videos()
+    assert len(data["videos"]) == 3 and data["total_uploads"] == 3
+    assert json.loads(restarted.uploaded_videos_file.read_text())["total_uploads"] == 3
+
+
+def test_content_checks_see_uploads_from_the_same_manager(tmp_path):
+    mgr = StateManager(data_dir=tmp_path)
+    first = str(tmp_path / "creator_a" / "clip.mp4")
+    assert not mgr.is_fingerprint_uploaded("f00d")   # index built before the upload
+
+    mgr.mark_video_uploaded(first, bookmark="Page 1", fingerprint="f00d", phash="ffff0000ffff0000")
+
+    assert mgr.is_fingerprint_uploaded("f00d")
+    assert mgr.is_similar_uploaded("ffff0000ffff0001")
+    assert not mgr.is_similar_uploaded("0000ffff0000ffff")
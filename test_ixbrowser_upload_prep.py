@@ -0,0 +1,61 @@
+"""Tests for the look-ahead upload preparation pipeline (temp folders, no browser)."""
+
+import importlib.util
+import os
+import time
+from pathlib import Path
+
+# Direct import: the ixbrowser package __init__ pulls in the HTTP client
+_spec = importlib.util.spec_from_file_location(
+    "ixbrowser_upload_prep",
+    Path(__file__).parent / "modules/auto_uploader/approaches/ixbrowser/core/upload_prep.py",
+)
+prep = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(prep)
+
+
+def _pipeline(folder, prepared, lookahead=2):
+    def list_files(path):
+        return [str(p) for p in Path(path).glob("*.mp4")]
+
+    def prepare(file_path, folder_path, folder_data):
+        prepared.append(Path(file_path).stem)
+        if os.path.getsize(file_path) == 0:
+            raise ValueError("empty video file")
+        return prep.PreparedUpload(file_path=file_path, folder_path=folder_path,
+                                   title=Path(file_path).stem, size=os.path.getsize(file_path))
+
+    return prep.UploadPrepPipeline(list_files, prepare, lookahead=lookahead)
+
+
+def test_jobs_are_prepared_ahead_and_repeated_until_handled(tmp_path):
+    for name in ("a", "b", "c", "d", "e"):
+        (tmp_path / f"{name}.mp4").write_bytes(name.encode() * 1000)
+    prepared = []
+    pipeline = _pipeline(tmp_path, prepared)
+
+    job = pipeline.next_job(str(tmp_path))
+    assert job.title == "a" and job.size == 1000
+    time.sleep(0.2)
+    # a handed out, b+c waiting in the bounded queue, d blocked on put
+    assert prepared == ["a", "b", "c", "d"]
+
+    # retry: file still pending -> same job
+    assert pipeline.next_job(str(tmp_path)) is job
+
+    os.remove(job.file_path)  # uploaded and moved away
+    assert pipeline.next_job(str(tmp_path)).title == "b"
+    pipeline.close()
+
+
+def test_invalid_files_are_skipped_and_folder_runs_dry(tmp_path):
+    (tmp_path / "a.mp4").write_bytes(b"")
+    (tmp_path / "b.mp4").write_bytes(b"x" * 10)
+    pipeline = _pipeline(tmp_path, [])
+
+    job = pipeline.next_job(str(tmp_path))
+    assert job.title == "b" and str(tmp_path / "a.mp4") in pipeline.skipped
+
+    os.remove(job.file_path)
+    assert pipeline.next_job(str(tmp_path)) is None
+
@@ -0,0 +1,119 @@
+"""Tests for the event-driven ixBrowser upload progress monitor (scripted driver)."""
+
+import importlib.util
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+# Direct import: the ixbrowser package __init__ pulls in the HTTP client
+_spec = importlib.util.spec_from_file_location(
+    "ixbrowser_upload_progress_monitor",
+    Path(__file__).parent / "modules/auto_uploader/approaches/ixbrowser/core/upload_progress_monitor.py",
+)
+_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+UploadProgressMonitor = _module.UploadProgressMonitor
+
+# Minimal browser globals for running MONITOR_SCRIPT under node
+PAGE_SHIM = r"""
+var window = globalThis;
+var document = { documentElement: null, addEventListener: function () {} };
+function XMLHttpRequest() { this.listeners = {}; this.upload = { addEventListener: function () {} }; }
+XMLHttpRequest.prototype.open = function () {};
+XMLHttpRequest.prototype.send = function () {};
+XMLHttpRequest.prototype.addEventListener = function (name, fn) { this.listeners[name] = fn; };
+function post(url, body) {
+  var xhr = new XMLHttpRequest();
+  xhr.open('POST', url);
+  xhr.send(body);
+  xhr.status = 200;
+  if (xhr.listeners.loadend) { xhr.listeners.loadend(); }
+}
+"""
+
+
+class ScriptedDriver:
+    """Answers each execute_async_script call with the next page state."""
+
+    def __init__(self, states):
+        self.states = list(states)
+        self.waits = []
+        self.cdp = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append(cmd)
+
+    def execute_script(self, script, *args):
+        return True
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def execute_async_script(self, script, last_seq, slice_ms, expected):
+        self.waits.append((last_seq, expected))
+        state = self.states.pop(0)
+        if isinstance(state, Exception):
+            raise state
+        return state
+
+
+def test_returns_on_completion_event_and_reports_progress():
+    driver = ScriptedDriver([
+        {"seq": 1, "progress": 10, "done": False},
+        {"seq": 1, "progress": 10, "done": False},   # quiet slice
+        {"seq": 4, "progress": 100, "done": True, "reason": "network"},
+    ])
+    monitor = UploadProgressMonitor(driver)
+    assert monitor.arm(expected_bytes=5_000_000)
+
+    seen, quiet = [], []
+    completed = monitor.wait_until_complete(
+        60, on_progress=lambda pct, state: seen.append(pct), on_quiet=quiet.append)
+
+    assert completed is True
+    assert seen == [10, 100] and len(quiet) == 1
+    assert driver.waits == [(-1, 5_000_000), (1, 5_000_000), (1, 5_000_000)]
+    assert driver.cdp == ["Page.addScriptToEvaluateOnNewDocument"]
+
+
+def test_unavailable_page_script_asks_for_dom_polling():
+    monitor = UploadProgressMonitor(ScriptedDriver([RuntimeError("javascript error")]))
+    assert monitor.wait_until_complete(60) is None
+
+
+def test_no_upload_activity_falls_back_to_dom_polling():
+    idle = {"seq": 1, "progress": 0, "bar": -1, "requests": 0, "done": False}
+    driver = ScriptedDriver([dict(idle), dict(idle)])
+    monitor = UploadProgressMonitor(driver)
+    monitor.arm(expected_bytes=5_000_000)
+
+    assert monitor.wait_until_complete(60, quiet_fallback=0) is None
+    assert len(driver.waits) == 1
+
+    # Upload requests seen: keep waiting on page events
+    busy = {"seq": 1, "progress": 5, "bar": -1, "requests": 1, "done": False}
+    driver = ScriptedDriver([busy, {"seq": 2, "progress": 100, "done": True}])
+    assert UploadProgressMonitor(driver).wait_until_complete(60, quiet_fallback=0) is True
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+def test_only_video_upload_posts_count_towards_sent():
+    page = PAGE_SHIM + _module.MONITOR_SCRIPT + r"""
+var m = window.__ixUploadMonitor;
+m.expected = 300000;
+post('https://upload.facebook.com/ajax/photo/upload', new Blob([new Uint8Array(200000)], {type: 'image/jpeg'}));
+post('https://vupload-edge.facebook.com/ajax/video/upload/requests/receive/', new Blob([new Uint8Array(150000)]));
+var after = m.snapshot();
+post('https://www.facebook.com/graphql', new Blob([new Uint8Array(150000)], {type: 'video/mp4'}));
+console.log(JSON.stringify([after, m.snapshot()]));
+"""
+    output = subprocess.run(["node", "-e", page], capture_output=True, text=True, check=True).stdout
+    after_chunk, after_video = json.loads(output)
+
+    assert after_chunk["requests"] == 1 and after_chunk["sent"] == 150000
+    assert not after_chunk["done"]
+    assert after_video["sent"] == 300000 and after_video["done"]
+    assert after_video["reason"] == "network"
@@ -0,0 +1,82 @@
+"""Tests for the incremental per-creator extraction cursor."""
+
+from modules.link_grabber.cursor import (
+    DeltaScan,
+    ExtractionCursor,
+    ExtractionCursorStore,
+    archive_id_for_url,
+)
+
+
+def test_delta_run_keeps_known_links_and_moves_stop_window(tmp_path):
+    store = ExtractionCursorStore(tmp_path)
+    cursor = store.load("@Creator", "tiktok", scope="https://www.tiktok.com/@creator")
+    assert cursor.needs_full_sync(168)
+
+    cursor.record([
+        {"url": "https://www.tiktok.com/@creator/video/2", "date": "20260102"},
+        {"url": "https://www.tiktok.com/@creator/video/1", "date": "20260101"},
+    ], full_sync=True)
+    store.save(cursor)
+
+    cursor = store.load("@Creator", "tiktok", scope="https://www.tiktok.com/@creator")
+    assert not cursor.needs_full_sync(168)
+    assert cursor.stop_ids(1) == ["tiktok 2"]
+
+    cursor.record([{"url": "https://www.tiktok.com/@creator/video/3", "date": "20260103"}], full_sync=False)
+    assert [e["url"][-1] for e in cursor.entries] == ["3", "2", "1"]
+    assert cursor.newest_id == "tiktok 3"
+    assert cursor.newest_date == "20260103"
+
+
+def test_delta_scan_stops_on_known_links_and_ytdlp_break():
+    assert archive_id_for_url("https://www.youtube.com/shorts/abcdefghijk", "youtube") == "youtube abcdefghijk"
+    scan = DeltaScan("youtube", ["youtube abcdefghijk"])
+
+    assert not scan.reached("https://www.youtube.com/watch?v=zzzzzzzzzzz")
+    assert scan.reached_any(["/watch?v=abcdefghijk&t=1"])
+    assert scan.caught_up
+
+    other = DeltaScan("youtube", ["youtube abcdefghijk"])
+    args = other.ytdlp_args()
+    with open(args[1], encoding="utf-8") as fh:
+        assert fh.read() == "youtube abcdefghijk\n"
+    other.note_ytdlp_exit(0)
+    assert not other.caught_up
+    other.note_ytdlp_exit(101)
+    assert other.caught_up
+    other.cleanup()
+
+
+def test_limited_full_sync_does_not_cover_unlimited_runs():
+    cursor = ExtractionCursor(creator="c", platform="youtube")
+    cursor.record([{"url": "https://youtu.be/abcdefghijk"}], full_sync=True, max_videos=10)
+
+    assert not cursor.needs_full_sync(168, max_videos=5)
+    assert cursor.needs_full_sync(168, max_videos=0)
+
+
+def test_pinned_posts_do_not_end_the_delta_scan():
+    cursor = ExtractionCursor(creator="c", platform="tiktok")
+    # feed order: two pinned old posts, then the newest uploads
+    cursor.record([
+        {"url": "https://www.tiktok.com/@c/video/100"},
+        {"url": "https://www.tiktok.com/@c/video/120"},
+        {"url": "https://www.tiktok.com/@c/video/500"},
+        {"url": "https://www.tiktok.com/@c/video/400"},
+        {"url": "https://www.tiktok.com/@c/video/300"},
+    ], full_sync=True)
+
+    assert cursor.pinned_count() == 2
+    assert cursor.stop_ids(2) == ["tiktok 500", "tiktok 400"]
+    assert cursor.newest_id == "tiktok 500"
+
+    scan = DeltaScan("tiktok", cursor.stop_ids(2))
+    feed = ["/@c/video/100", "/@c/video/120", "/@c/video/600", "/@c/video/500"]
+    assert not scan.reached_any(feed) and not scan.caught_up
+    assert scan.reached_any(feed + ["/@c/video/400"])
+
+    # a post pinned since the last full sync is known but not followed by another
+    late_pin = DeltaScan("tiktok", ["tiktok 500", "tiktok 400"])
+    assert not any(late_pin.reached(u) for u in ["/@c/video/400", "/@c/video/600", "/@c/video/500"])
+    assert late_pin.reached("/@c/video/400")
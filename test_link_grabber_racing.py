@@ -0,0 +1,127 @@
+"""Tests for racing cheap link-grab methods in parallel."""
+
+import subprocess
+import sys
+import threading
+import time
+
+from modules.link_grabber.racing import pick_racers, race_cancelled, race_methods, run_cancellable
+
+
+def _noop():
+    return []
+
+
+def test_pick_racers_skips_browser_methods_and_prefers_learned_winners():
+    methods = [
+        ("A", _noop, "ytdlp_primary"),
+        ("D", _noop, "selenium_cdp_attach"),
+        ("2", _noop, "ytdlp_get_url"),
+        ("6", _noop, "gallery_dl"),
+    ]
+
+    racers = pick_racers(methods, ["gallery_dl"], top_k=2)
+
+    assert [mid for _, _, mid in racers] == ["gallery_dl", "ytdlp_primary"]
+
+
+def test_race_settles_on_first_sufficient_result_and_reports_late_losers():
+    release = threading.Event()
+    late = []
+
+    def slow():
+        release.wait(5)
+        return [{"url": "https://example.com/slow"}]
+
+    methods = [
+        ("slow", slow, "ytdlp_primary"),
+        ("fast", lambda: [{"url": "https://example.com/fast"}], "ytdlp_get_url"),
+    ]
+
+    results = race_methods(methods, lambda got: any(r.entries for r in got), on_late_result=late.append)
+    release.set()
+    for _ in range(50):
+        if late:
+            break
+        time.sleep(0.05)
+
+    assert [r.method_id for r in results] == ["ytdlp_get_url"]
+    assert [r.method_id for r in late] == ["ytdlp_primary"]
+
+
+def _wait_for(items, count=1):
+    for _ in range(100):
+        if len(items) >= count:
+            break
+        time.sleep(0.05)
+
+
+def test_losers_observe_cancellation_once_the_race_settles():
+    late = []
+    saw_cancel = threading.Event()
+
+    def paging_loser():
+        for _ in range(100):
+            if race_cancelled():
+                saw_cancel.set()
+                break
+            time.sleep(0.05)
+        return [{"url": "https://example.com/partial"}]
+
+    methods = [
+        ("paging", paging_loser, "instagram_graphql"),
+        ("fast", lambda: [{"url": "https://example.com/fast"}], "ytdlp_get_url"),
+    ]
+
+    results = race_methods(methods, lambda got: any(r.entries for r in got), on_late_result=late.append)
+    _wait_for(late)
+
+    assert [r.method_id for r in results] == ["ytdlp_get_url"]
+    assert saw_cancel.is_set()
+    assert [r.method_id for r in late] == ["instagram_graphql"]
+    assert late[0].cancelled is True
+    assert results[0].cancelled is False
+
+
+def test_subprocess_losers_are_killed():
+    late = []
+    outcome = {}
+
+    def subprocess_loser():
+        started = time.time()
+        try:
+            run_cancellable(
+                [sys.executable, "-c", "import time; time.sleep(30)"],
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+        finally:
+            outcome["elapsed"] = time.time() - started
+        return []
+
+    methods = [
+        ("slow-binary", subprocess_loser, "gallery_dl"),
+        ("fast", lambda: [{"url": "https://example.com/fast"}], "ytdlp_primary"),
+    ]
+
+    race_methods(methods, lambda got: any(r.entries for r in got), on_late_result=late.append)
+    _wait_for(late)
+
+    assert [r.method_id for r in late] == ["gallery_dl"]
+    assert late[0].cancelled is True
+    assert "cancelled" in late[0].error
+    assert outcome["elapsed"] < 10
+
+
+def test_run_cancellable_outside_a_race_is_plain_subprocess_run():
+    result = run_cancellable(
+        [sys.executable, "-c", "print('ok')"],
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+
+    assert isinstance(result, subprocess.CompletedProcess)
+    assert result.returncode == 0
+    assert result.stdout.strip() == "ok"
@@ -0,0 +1,44 @@
+"""Tests for the per-platform token buckets used by link grabbing."""
+
+from modules.link_grabber.throttle import PlatformRateLimiter, TokenBucket
+
+
+def test_bucket_allows_burst_then_spaces_callers_in_order():
+    bucket = TokenBucket(rate=2.0, capacity=2)
+
+    waits = [bucket.reserve() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert 0.4 < waits[2] <= 0.5
+    assert 0.9 < waits[3] <= 1.0
+
+
+def test_platforms_have_independent_budgets():
+    limiter = PlatformRateLimiter({
+        "tiktok": {"rate": 0.25, "burst": 1},
+        "default": {"rate": 1.0, "burst": 1},
+    })
+
+    assert limiter.bucket("tiktok").reserve() == 0.0
+    assert limiter.bucket("youtube").reserve() == 0.0
+    assert limiter.bucket("tiktok").reserve() > 3.5
+    assert limiter.bucket("TikTok") is limiter.bucket("tiktok")
+
+
+def test_acquire_adds_a_bounded_random_wait_after_the_token():
+    bucket = TokenBucket(rate=100.0, capacity=5, jitter=0.05)
+
+    waits = [bucket.acquire() for _ in range(3)]
+
+    assert all(0.0 <= wait <= 0.05 for wait in waits)
+    assert TokenBucket(rate=100.0, capacity=5).acquire() == 0.0
+
+
+def test_bucket_limits_follow_the_delay_config():
+    from modules.link_grabber.config import DELAY_CONFIG, TOKEN_BUCKET_LIMITS
+
+    low, high = DELAY_CONFIG["platform_delays"]["tiktok"]
+    assert TOKEN_BUCKET_LIMITS["tiktok"]["rate"] == 2.0 / (low + high)
+    assert 0 < TOKEN_BUCKET_LIMITS["tiktok"]["jitter"] < high - low
+    assert TOKEN_BUCKET_LIMITS["youtube"]["burst"] == 2
+    assert set(TOKEN_BUCKET_LIMITS) == set(DELAY_CONFIG["platform_delays"]) | {"default"}
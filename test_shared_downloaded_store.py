@@ -0,0 +1,84 @@
+"""Tests for the shared SQLite "already downloaded" store."""
+
+from modules.creator_profiles import config_manager
+from modules.creator_profiles.selection_policy import select_videos
+from modules.shared.downloaded_store import DownloadedStore
+
+
+def test_membership_by_id_and_canonical_url(tmp_path):
+    store = DownloadedStore(tmp_path / "downloaded.sqlite3")
+    scope = store.scope(tmp_path / "creator_a")
+
+    scope.add(url="https://youtu.be/abcdefghijk", video_id="abcdefghijk", platform="youtube")
+
+    assert "abcdefghijk" in scope
+    assert "https://www.youtube.com/watch?v=abcdefghijk&t=3" in scope
+    assert scope.known(["abcdefghijk", "zzz", "https://youtu.be/other000000"]) == {"abcdefghijk"}
+    assert "abcdefghijk" not in store.scope(tmp_path / "creator_b")
+
+
+def test_legacy_text_file_is_migrated_once(tmp_path):
+    store = DownloadedStore(tmp_path / "downloaded.sqlite3")
+    scope = store.scope(tmp_path)
+    legacy = tmp_path / ".downloaded_links.txt"
+    legacy.write_text("https://www.tiktok.com/@a/video/1\nhttps://www.tiktok.com/@a/video/2\n", encoding="utf-8")
+
+    assert store.migrate_text_file(scope.scope, legacy) == 2
+    legacy.write_text("https://www.tiktok.com/@a/video/3\n", encoding="utf-8")
+    assert store.migrate_text_file(scope.scope, legacy) == 0
+    assert len(scope) == 2
+
+
+def test_select_videos_skips_known_entries_in_bulk(tmp_path):
+    store = DownloadedStore(tmp_path / "downloaded.sqlite3")
+    scope = store.scope(tmp_path)
+    scope.add(url="https://www.tiktok.com/@a/video/1")
+    entries = [
+        {"url": "https://www.tiktok.com/@a/video/1", "date": "20240102"},
+        {"url": "https://www.tiktok.com/@a/video/2", "date": "20240101"},
+    ]
+
+    selected, _ = select_videos(
+        entries, n_videos=2, skip_downloaded=True, popular_enabled=False,
+        random_enabled=False, already_downloaded=scope, platform="tiktok",
+    )
+
+    assert [e["url"] for e in selected] == ["https://www.tiktok.com/@a/video/2"]
+
+
+def test_creator_history_survives_folder_rename(tmp_path, monkeypatch):
+    store = DownloadedStore(tmp_path / "downloaded.sqlite3")
+    monkeypatch.setattr(config_manager, "get_downloaded_store", lambda: store)
+    folder = tmp_path / "creators" / "old_name"
+    folder.mkdir(parents=True)
+    # History recorded under the folder-path scope before creators had an id
+    store.scope(folder).add(url="https://www.tiktok.com/@a/video/1")
+
+    config = config_manager.CreatorConfig(folder)
+    config.data["downloaded_ids"] = ["legacy-id"]
+    config.add_url_to_history("https://www.tiktok.com/@a/video/2")
+    assert config.is_downloaded("https://www.tiktok.com/@a/video/1")
+
+    renamed = folder.rename(tmp_path / "new_name")
+    moved = config_manager.CreatorConfig(renamed)
+
+    assert moved.data["downloaded_scope_id"] == config.data["downloaded_scope_id"]
+    assert moved.is_downloaded("https://www.tiktok.com/@a/video/1")
+    assert moved.is_downloaded("https://www.tiktok.com/@a/video/2")
+    assert moved.is_downloaded("legacy-id")
+    assert len(store.scope(folder)) == 0
+
+
+def test_moved_plain_folder_reimports_its_links_file(tmp_path):
+    store = DownloadedStore(tmp_path / "downloaded.sqlite3")
+    folder = tmp_path / "bulk"
+    folder.mkdir()
+    legacy = folder / ".downloaded_links.txt"
+    legacy.write_text("https://www.tiktok.com/@a/video/1\n", encoding="utf-8")
+    store.migrate_text_file(store.scope(folder).scope, legacy)
+
+    moved = folder.rename(tmp_path / "bulk_moved")
+    scope = store.scope(moved)
+    store.migrate_text_file(scope.scope, moved / ".downloaded_links.txt")
+
+    assert "https://www.tiktok.com/@a/video/1" in scope
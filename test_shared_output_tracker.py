@@ -0,0 +1,47 @@
+"""Tests for the per-attempt download output tracker."""
+
+import os
+
+from modules.shared.output_tracker import OutputTracker
+
+VIDEO = {".mp4", ".mkv"}
+
+
+def test_reported_path_wins_over_folder_scan(tmp_path):
+    tracker = OutputTracker(tmp_path)
+    (tmp_path / "f137.mp4").write_bytes(b"x" * 50)
+    merged = tmp_path / "clip.mkv"
+    merged.write_bytes(b"x" * 100)
+
+    tracker.progress_hook({"status": "finished", "filename": str(tmp_path / "f137.mp4")})
+    tracker.postprocessor_hook({"status": "finished", "info_dict": {"filepath": str(merged)}})
+
+    assert tracker.new_files(VIDEO) == [str(merged), str(tmp_path / "f137.mp4")]
+    assert tracker.new_files(VIDEO, min_size=80) == [str(merged)]
+
+
+def test_fallback_scan_ignores_files_from_before_the_attempt(tmp_path):
+    old = tmp_path / "old.mp4"
+    old.write_bytes(b"x" * 100)
+    os.utime(old, ns=(0, 0))
+    tracker = OutputTracker(tmp_path)
+    tracker.started_ns = max(old.stat().st_ctime_ns, old.stat().st_mtime_ns) + 1
+
+    nested = tmp_path / "owner"
+    nested.mkdir()
+    (nested / "new.mp4").write_bytes(b"x" * 100)
+    (tmp_path / "new.mp4.part").write_bytes(b"x" * 100)
+    assert tracker.new_files(VIDEO, skip_extensions={".part"}) == []
+
+    tracker.add_search_dir(nested)
+    assert tracker.new_files(VIDEO) == [str(nested / "new.mp4")]
+
+
+def test_paths_printed_by_a_cli_are_picked_up(tmp_path):
+    tracker = OutputTracker(tmp_path)
+    out = tmp_path / "video.mp4"
+    out.write_bytes(b"x" * 100)
+
+    tracker.note_output(f"[download] 100%\n# {out}\nrelative.mp4\n")
+
+    assert tracker.new_files(VIDEO) == [str(out)]
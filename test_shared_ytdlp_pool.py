@@ -0,0 +1,190 @@
+"""Tests for the shared yt-dlp worker pool (options and worker protocol)."""
+
+import queue
+import sys
+import threading
+import types
+
+import pytest
+
+from modules.shared import ytdlp_pool
+from modules.shared.ytdlp_pool import YtdlpPoolUnavailable, instance_key, split_options
+
+
+def test_hooks_and_logger_are_relayed_not_sent():
+    hook = lambda d: None
+    pp_hook = lambda d: None
+    logger = object()
+
+    remote, hooks, pp_hooks, relayed_logger = split_options({
+        "format": "best",
+        "progress_hooks": [hook],
+        "postprocessor_hooks": [pp_hook],
+        "logger": logger,
+    })
+
+    assert remote == {"format": "best"}
+    assert hooks == [hook]
+    assert pp_hooks == [pp_hook]
+    assert relayed_logger is logger
+
+    with pytest.raises(YtdlpPoolUnavailable):
+        split_options({"match_filter": lambda info, *a, **k: None})
+
+
+def test_instances_are_shared_per_account_and_options():
+    base = {"format": "best", "cookiefile": "a.txt", "proxy": "http://p:1"}
+
+    assert instance_key(dict(base)) == instance_key(dict(reversed(list(base.items()))))
+    assert instance_key(base) != instance_key({**base, "cookiefile": "b.txt"})
+    assert instance_key(base) != instance_key({**base, "format": "worst"})
+    assert instance_key(base)[:3] == ("a.txt", "http://p:1", "")
+
+
+class _Conn:
+    """In-process stand-in for one end of a multiprocessing pipe."""
+
+    def __init__(self):
+        self.queue = queue.Queue()
+
+    def send(self, message):
+        self.queue.put(message)
+
+    def recv(self):
+        message = self.queue.get(timeout=5)
+        if message is None:
+            raise EOFError
+        return message
+
+
+class DownloadCancelled(Exception):
+    pass
+
+
+class _StubYoutubeDL:
+    """Drives the hooks the worker installs, the way YoutubeDL would."""
+
+    created = []
+
+    def __init__(self, params):
+        self.params = params
+        self._download_retcode = 0
+        self.closed = False
+        _StubYoutubeDL.created.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def download(self, urls):
+        url = urls[0]
+        hook = self.params["progress_hooks"][0]
+        hook({"status": "downloading", "downloaded_bytes": 10, "info_dict": {"not": "sent"}})
+        if url == "slow":
+            while True:   # until the worker's hook sees the cancel
+                hook({"status": "downloading", "downloaded_bytes": 20})
+        self.params["logger"].warning(f"fetched {url}")
+        hook({"status": "finished", "filename": f"{url}.mp4"})
+        if url == "bad":
+            self._download_retcode = 1
+        return self._download_retcode
+
+    def extract_info(self, url, download=False):
+        if url == "broken":
+            raise RuntimeError("Unsupported URL: broken")
+        return {"id": url, "title": "Listing", "entries": [{"id": "a", "url": "u/a", "formats": [1]}]}
+
+    def save_cookies(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    stub = types.ModuleType("yt_dlp")
+    stub.YoutubeDL = _StubYoutubeDL
+    stub.utils = types.SimpleNamespace(DownloadCancelled=DownloadCancelled)
+    monkeypatch.setitem(sys.modules, "yt_dlp", stub)
+    monkeypatch.setattr(ytdlp_pool, "_PROGRESS_INTERVAL", 0.0)
+    _StubYoutubeDL.created = []
+
+    jobs, events = _Conn(), _Conn()
+    thread = threading.Thread(target=ytdlp_pool._worker_main, args=(jobs, events), daemon=True)
+    thread.start()
+
+    def run(job_id, kind, url, opts=None, forward_log=False):
+        jobs.send(("job", job_id, kind, url, dict(opts or {"format": "best"}), forward_log))
+        messages = []
+        while not messages or messages[-1][0] not in ("done", "error"):
+            messages.append(events.recv())
+        return messages
+
+    run.jobs = jobs
+    run.events = events
+    yield run
+    jobs.send(("stop",))
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_worker_relays_progress_logs_and_results(worker):
+    messages = worker(1, "download", "clip", forward_log=True)
+
+    assert messages == [
+        ("progress", 1, {"status": "downloading", "downloaded_bytes": 10}),
+        ("log", 1, "warning", "fetched clip"),
+        ("progress", 1, {"status": "finished", "filename": "clip.mp4"}),
+        ("done", 1, 0),
+    ]
+    assert worker(2, "extract", "channel") == [
+        ("done", 2, {"id": "channel", "title": "Listing", "entries": [{"id": "a", "url": "u/a"}]}),
+    ]
+    error = worker(3, "extract", "broken")[-1]
+    assert error == ("error", 3, {"type": "RuntimeError", "message": "Unsupported URL: broken", "partial": []})
+
+
+def test_reused_instance_starts_each_job_with_a_clean_return_code(worker):
+    assert worker(1, "download", "bad")[-1] == ("done", 1, 1)
+    assert worker(2, "download", "good")[-1] == ("done", 2, 0)
+    assert len(_StubYoutubeDL.created) == 1
+
+    worker(3, "download", "good", opts={"format": "best", "cookiefile": "b.txt"})
+    assert len(_StubYoutubeDL.created) == 2
+
+
+def test_cancel_stops_the_running_download(worker):
+    worker.jobs.send(("job", 7, "download", "slow", {"format": "best"}, False))
+    assert worker.events.recv()[0] == "progress"
+    worker.jobs.send(("cancel", 7))
+
+    while True:
+        message = worker.events.recv()
+        if message[0] != "progress":
+            break
+    assert message[:2] == ("error", 7) and message[2]["type"] == "DownloadCancelled"
+    # The worker is free again afterwards
+    assert worker(8, "download", "clip")[-1] == ("done", 8, 0)
+
+
+def test_link_grabber_runs_in_process_when_the_pool_refuses(monkeypatch):
+    pytest.importorskip("PyQt5")
+    from modules.link_grabber import core
+
+    class _BusyPool:
+        def extract_info(self, url, opts, should_cancel=None):
+            raise YtdlpPoolUnavailable("all yt-dlp workers are busy")
+
+    stub = types.ModuleType("yt_dlp")
+    stub.YoutubeDL = _StubYoutubeDL
+    monkeypatch.setitem(sys.modules, "yt_dlp", stub)
+    monkeypatch.setattr(core, "get_ytdlp_pool", lambda: _BusyPool())
+    _StubYoutubeDL.created = []
+
+    entries = core._execute_ytdlp_dual("https://www.youtube.com/@someone/videos", {"extract_flat": True})
+
+    assert [entry["url"] for entry in entries] == ["u/a"]
+    assert len(_StubYoutubeDL.created) == 1
@@ -0,0 +1,58 @@
+"""Tests for the concurrent merge batch pool."""
+
+import importlib.util
+import threading
+import time
+from pathlib import Path
+
+# Direct import: the videos_merger package __init__ pulls in the Qt window
+_spec = importlib.util.spec_from_file_location(
+    "merge_batch_pool",
+    Path(__file__).parent / "modules/video_editor/videos_merger/batch_pool.py",
+)
+batch_pool = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(batch_pool)
+
+
+def test_jobs_run_concurrently_and_keep_their_order():
+    running, peak = [0], [0]
+    lock = threading.Lock()
+    progress = []
+
+    def make_job(number, delay):
+        def job(report):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            report(50.0)
+            time.sleep(delay)
+            with lock:
+                running[0] -= 1
+            return f"batch_{number:03d}.mp4"
+        return job
+
+    pool = batch_pool.BatchPool(workers=3)
+    results = pool.run([make_job(1, 0.3), make_job(2, 0.1), make_job(3, 0.2)],
+                       lambda index, job_pct, overall: progress.append(overall))
+
+    assert results == ["batch_001.mp4", "batch_002.mp4", "batch_003.mp4"]
+    assert peak[0] == 3
+    assert max(progress) == 100.0
+
+
+def test_pause_holds_and_cancel_skips_pending_jobs():
+    state = {"paused": True, "cancelled": False}
+    started = []
+
+    def job(report):
+        started.append(time.monotonic())
+        state["cancelled"] = True  # cancel arrives while the first job runs
+        return True
+
+    threading.Timer(0.3, lambda: state.update(paused=False)).start()
+    begin = time.monotonic()
+    pool = batch_pool.BatchPool(workers=1, control_state=lambda: (state["paused"], state["cancelled"]))
+    results = pool.run([job, job, job])
+
+    assert started[0] - begin >= 0.25  # waited for resume
+    assert results == [True, None, None] and pool.cancelled
@@ -0,0 +1,134 @@
+"""Tests for the editor batch worker's parallel mode."""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from modules.video_editor import editor_batch_processor as ebp
+from modules.video_editor.editor_folder_manager import EditorMappingSettings
+
+
+class _Signal:
+    """Records emits in place of a Qt signal (the worker runs on pool threads)."""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def emit(self, *args):
+        with self._lock:
+            self.calls.append(args)
+
+
+def _worker(count, parallel=3, preset_id=None):
+    videos = [
+        {"source": f"/in/video_{n}.mp4", "destination": f"/out/video_{n}.mp4"}
+        for n in range(count)
+    ]
+    worker = ebp.EditorBatchWorker({
+        "videos": videos,
+        "settings": EditorMappingSettings(preset_id=preset_id, parallel_videos=parallel),
+    })
+    for name in ("progress", "video_started", "video_completed", "log_message", "processing_finished"):
+        setattr(worker, name, _Signal())
+    return worker
+
+
+def _result(source, dest, status=ebp.ProcessingStatus.SUCCESS):
+    return ebp.VideoProcessResult(source_path=source, destination_path=dest, status=status)
+
+
+def _emitted(worker):
+    return [(call[0]["source"], call[0]["status"]) for call in worker.video_completed.calls]
+
+
+def test_parallel_results_are_emitted_in_batch_order():
+    worker = _worker(5)
+    delays = {0: 0.3, 1: 0.05, 2: 0.2, 3: 0.0, 4: 0.1}
+    running, peak = [0], [0]
+    lock = threading.Lock()
+
+    def process(source, dest, preset=None, operations=None):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(delays[int(source[-5])])
+        with lock:
+            running[0] -= 1
+        return _result(source, dest)
+
+    worker._process_single_video = process
+    worker.run()
+
+    order = [f"/in/video_{n}.mp4" for n in range(5)]
+    assert peak[0] > 1
+    assert [r.source_path for r in worker.results] == order
+    assert _emitted(worker) == [(src, "success") for src in order]
+
+
+def test_preset_is_compiled_once_for_the_batch():
+    worker = _worker(4, preset_id="demo")
+    compiled = [("trim", {"start": 1.0})]
+    compile_calls = []
+    seen = []
+
+    worker._load_preset = lambda preset_id: object()
+    worker._compile_preset = lambda preset: compile_calls.append(preset) or compiled
+
+    def process(source, dest, preset=None, operations=None):
+        seen.append(operations)
+        return _result(source, dest)
+
+    worker._process_single_video = process
+    worker.run()
+
+    assert len(compile_calls) == 1
+    assert len(seen) == 4 and all(ops is compiled for ops in seen)
+
+
+def test_raising_video_is_failed_and_later_videos_still_emit():
+    worker = _worker(4)
+
+    def process(source, dest, preset=None, operations=None):
+        if source.endswith("_1.mp4"):
+            raise RuntimeError("probe crashed")
+        time.sleep(0.05)
+        return _result(source, dest)
+
+    worker._process_single_video = process
+    worker.run()
+
+    assert _emitted(worker) == [
+        ("/in/video_0.mp4", "success"),
+        ("/in/video_1.mp4", "failed"),
+        ("/in/video_2.mp4", "success"),
+        ("/in/video_3.mp4", "success"),
+    ]
+    assert "probe crashed" in worker.results[1].error_message
+
+
+def test_cancel_during_run_only_cancels_videos_that_never_started():
+    worker = _worker(6, parallel=2)
+    started = []
+
+    def process(source, dest, preset=None, operations=None):
+        started.append(source)
+        if source.endswith("_1.mp4"):
+            worker.cancel()
+        time.sleep(0.1)
+        return _result(source, dest)
+
+    worker._process_single_video = process
+    worker.run()
+
+    statuses = [r.status for r in worker.results]
+    assert len(statuses) == 6
+    finished = {r.source_path for r in worker.results if r.status == ebp.ProcessingStatus.SUCCESS}
+    assert finished == set(started)
+    assert statuses[len(started):] == [ebp.ProcessingStatus.CANCELLED] * (6 - len(started))
+    # Finished videos are emitted in order, never-started ones are not
+    assert _emitted(worker) == [(src, "success") for src in sorted(started)]
+    assert worker.processing_finished.calls
@@ -0,0 +1,56 @@
+"""Tests for the precomputed merge effect kernels."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# Direct import: the videos_merger package __init__ pulls in the Qt window
+_spec = importlib.util.spec_from_file_location(
+    "merge_effect_kernels",
+    Path(__file__).parent / "modules/video_editor/videos_merger/effect_kernels.py",
+)
+effect_kernels = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(effect_kernels)
+
+
+def test_color_kernel_matches_float_reference_and_reuses_buffers():
+    rng = np.random.default_rng(7)
+    frame = rng.integers(0, 256, size=(36, 64, 3), dtype=np.uint8)
+    kernel = effect_kernels.ColorKernel(brightness=1.1, contrast=1.15, saturation=1.2)
+
+    arr = frame.astype(np.float32) * 1.1
+    arr = (arr - 127.5) * 1.15 + 127.5
+    arr = np.clip(arr, 0, 255)  # the LUT clips before saturation
+    gray = (arr @ np.array(effect_kernels.LUMA_WEIGHTS, dtype=np.float32))[:, :, None]
+    expected = np.clip(gray + (arr - gray) * 1.2, 0, 255).astype(np.uint8)
+
+    result = kernel(frame)
+    mapped, work = kernel._mapped, kernel._work
+    assert result.dtype == np.uint8
+    assert np.abs(result.astype(int) - expected.astype(int)).max() <= 2
+
+    kernel(frame)
+    assert kernel._mapped is mapped and kernel._work is work
+
+
+def test_blur_sides_kernel_only_touches_the_bands():
+    if not effect_kernels.kernels_available(blur=True):
+        pytest.skip("needs OpenCV or SciPy")
+    rng = np.random.default_rng(3)
+    frame = rng.integers(0, 256, size=(72, 128, 3), dtype=np.uint8)
+    kernel = effect_kernels.BlurSidesKernel(strength=6.0, width_percent=20, feather_percent=0)
+
+    result = kernel(frame)
+    side_w = kernel.side_w
+    assert side_w == 25
+    assert np.array_equal(result[:, side_w:-side_w], frame[:, side_w:-side_w])
+    # noise in the bands is smoothed out
+    assert result[:, :side_w].astype(float).std() < frame[:, :side_w].astype(float).std() / 2
+    assert result[:, -side_w:].astype(float).std() < frame[:, -side_w:].astype(float).std() / 2
+
+    region = kernel._region
+    kernel(frame)
+    assert kernel._region is region
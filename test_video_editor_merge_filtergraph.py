@@ -0,0 +1,72 @@
+"""Tests for compiling merge settings into one ffmpeg filter_complex."""
+
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Direct import: the videos_merger package __init__ pulls in the Qt window
+_spec = importlib.util.spec_from_file_location(
+    "merge_filtergraph",
+    Path(__file__).parent / "modules/video_editor/videos_merger/ffmpeg_filtergraph.py",
+)
+filtergraph = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(filtergraph)
+
+
+def _settings(**overrides):
+    settings = SimpleNamespace(
+        trim_start=0.0, trim_end=0.0,
+        crop_enabled=False, crop_preset=None, crop_coords=None,
+        zoom_enabled=False, zoom_factor=1.0,
+        flip_horizontal=False, flip_vertical=False,
+        color_enhance_enabled=False, brightness=1.0, contrast=1.0, saturation=1.0,
+        blur_sides_enabled=False, blur_sides_strength=6.0,
+        blur_sides_width_percent=18, blur_sides_feather_percent=60,
+        transition_type='crossfade', transition_duration=1.0,
+        clip_speeds=None, keep_audio=True,
+    )
+    settings.__dict__.update(overrides)
+    return settings
+
+
+def test_effects_and_crossfade_compile_to_one_graph():
+    clips = [
+        filtergraph.ClipInfo("a.mp4", 1920, 1080, 10.0, fps=30.0),
+        filtergraph.ClipInfo("b.mp4", 1280, 720, 8.0, fps=25.0, has_audio=False),
+    ]
+    settings = _settings(trim_start=1.0, crop_enabled=True, crop_preset='1:1',
+                         flip_horizontal=True, clip_speeds=[2.0, 1.0])
+
+    graph = filtergraph.compile_filtergraph(settings, clips)
+    statements = graph.filter_complex.split(";")
+
+    assert statements[0] == "[0:v]trim=start=1:end=10,setpts=PTS-STARTPTS,crop=1080:1080:420:0,hflip[c0v]"
+    assert "[c0v]setpts=PTS/2[c0s]" in statements
+    assert any(s.startswith("[0:a]atrim=start=1:end=10,asetpts=PTS-STARTPTS,atempo=2,") for s in statements)
+    assert any(s.startswith("anullsrc=r=44100:cl=stereo,atrim=end=7,") for s in statements)
+    # smaller clip is padded to the largest size, both share one fps
+    assert "[c1s]pad=1080:1080:180:180:black,fps=30,format=yuv420p,setsar=1[n1]" in statements
+    assert "[n0][n1]xfade=transition=fade:duration=1:offset=3.5[vout]" in statements
+    assert "[c0a][c1a]acrossfade=d=1[aout]" in statements
+    assert graph.duration == pytest.approx(4.5 + 7.0 - 1.0)
+    assert graph.size == (1080, 1080)
+
+
+def test_blur_sides_only_blurs_the_bands():
+    clips = [filtergraph.ClipInfo("a.mp4", 1000, 500, 5.0)]
+    graph = filtergraph.compile_filtergraph(
+        _settings(blur_sides_enabled=True, keep_audio=False, transition_type='none'), clips)
+
+    assert "[0:v]split=3[c0m][c0l][c0r]" in graph.filter_complex
+    assert "[c0l]crop=194:500:0:0,boxblur=luma_radius=7:luma_power=2,crop=180:500:0:0," in graph.filter_complex
+    assert "[c0ol][c0rb]overlay=820:0[c0bs]" in graph.filter_complex
+    assert graph.filter_complex.endswith("[n0]concat=n=1:v=1:a=0[vout]")
+    assert graph.audio_label is None
+
+
+def test_transitions_without_xfade_equivalent_need_moviepy():
+    clips = [filtergraph.ClipInfo("a.mp4", 640, 360, 5.0), filtergraph.ClipInfo("b.mp4", 640, 360, 5.0)]
+    with pytest.raises(filtergraph.FilterGraphUnsupported):
+        filtergraph.compile_filtergraph(_settings(transition_type='rotate'), clips)
@@ -0,0 +1,64 @@
+"""Tests for the stream-copy (concat demuxer) merge planner."""
+
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+# Direct import: the videos_merger package __init__ pulls in the Qt window
+_spec = importlib.util.spec_from_file_location(
+    "merge_stream_copy",
+    Path(__file__).parent / "modules/video_editor/videos_merger/ffmpeg_filtergraph.py",
+)
+filtergraph = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(filtergraph)
+
+
+def _settings(**overrides):
+    settings = SimpleNamespace(
+        trim_start=0.0, trim_end=0.0,
+        crop_enabled=False, crop_preset=None, crop_coords=None,
+        zoom_enabled=False, zoom_factor=1.0,
+        flip_horizontal=False, flip_vertical=False,
+        color_enhance_enabled=False, brightness=1.0, contrast=1.0, saturation=1.0,
+        blur_sides_enabled=False, transition_type='none', transition_duration=1.0,
+        clip_speeds=None, keep_audio=True, output_format='mp4',
+    )
+    settings.__dict__.update(overrides)
+    return settings
+
+
+def _clip(path, **overrides):
+    fields = dict(path=path, width=1080, height=1920, duration=20.0, video_codec='h264', profile='High',
+                  pix_fmt='yuv420p', time_base='1/15360', frame_rate='30/1',
+                  audio_codec='aac', sample_rate=44100, channels=2)
+    fields.update(overrides)
+    return filtergraph.ClipInfo(**fields)
+
+
+def test_plain_join_of_matching_inputs_is_copied():
+    clips = [_clip("a.mp4"), _clip("b.mp4")]
+
+    assert filtergraph.plan_stream_copy(_settings(), clips) == filtergraph.PLAN_COPY
+    # effects, transitions, auto speed-up and mixed video all need a render
+    assert filtergraph.plan_stream_copy(_settings(flip_horizontal=True), clips) is None
+    assert filtergraph.plan_stream_copy(_settings(transition_type='crossfade'), clips) is None
+    assert filtergraph.plan_stream_copy(_settings(), [_clip("a.mp4"), _clip("b.mp4", duration=120.0)]) is None
+    assert filtergraph.plan_stream_copy(_settings(), [_clip("a.mp4"), _clip("b.mp4", width=720)]) is None
+    assert filtergraph.plan_stream_copy(_settings(output_format='avi'), clips) is None
+
+
+def test_only_audio_is_reencoded_when_it_differs(tmp_path):
+    clips = [_clip("a.mp4"), _clip("b.mp4", sample_rate=48000), _clip("c.mp4", has_audio=False, audio_codec=None)]
+    assert filtergraph.plan_stream_copy(_settings(), clips) == filtergraph.PLAN_COPY_VIDEO
+
+    list_path = tmp_path / "list.ffconcat"
+    filtergraph.write_concat_list(clips, str(list_path))
+    assert list_path.read_text(encoding="utf-8").splitlines()[1].endswith("a.mp4'")
+
+    cmd = filtergraph.build_concat_command("ffmpeg", clips, str(list_path), "out.mp4",
+                                           filtergraph.PLAN_COPY_VIDEO, audio_bitrate="128k")
+    graph = cmd[cmd.index("-filter_complex") + 1]
+    assert cmd[cmd.index("-c:v") + 1] == "copy" and cmd.count("-i") == 3
+    assert graph.startswith("[1:a:0]aresample=44100") and "[2:a:0]" in graph
+    assert "anullsrc=r=44100:cl=stereo,atrim=end=20," in graph
+    assert graph.endswith("[a0][a1][a2]concat=n=3:v=0:a=1[aout]")
@@ -0,0 +1,98 @@
+"""Tests for keyframe-snapped smart clip cutting."""
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+# Direct import: the videos_merger package __init__ pulls in the Qt window.
+# The directory is mounted as its own package so cut_clip's lazy relative
+# import of ffmpeg_filtergraph resolves.
+_MERGER = Path(__file__).parent / "modules/video_editor/videos_merger"
+_package = types.ModuleType("videos_merger_modules")
+_package.__path__ = [str(_MERGER)]
+sys.modules.setdefault("videos_merger_modules", _package)
+_spec = importlib.util.spec_from_file_location("videos_merger_modules.clip_extractor",
+                                               _MERGER / "clip_extractor.py")
+clip_extractor = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(clip_extractor)
+
+KEYFRAMES = [40.0, 42.0, 44.0, 46.0, 48.0, 50.0]
+
+
+def test_random_window_snaps_to_nearest_keyframe():
+    plan = clip_extractor.plan_cut(KEYFRAMES, 42.7, 47.7, duration=120.0, exact=False)
+    assert (plan.start, plan.end, plan.is_copy) == (42.0, 47.0, True)
+
+    # near the end the window can only move back, keeping its length
+    plan = clip_extractor.plan_cut(KEYFRAMES, 45.8, 50.8, duration=50.9, exact=False)
+    assert (plan.start, plan.end, plan.is_copy) == (44.0, 49.0, True)
+
+
+def test_exact_start_reencodes_only_the_head_gop():
+    near = clip_extractor.plan_cut(KEYFRAMES, 44.3, 49.3, duration=120.0, exact=True)
+    assert (near.start, near.is_copy) == (44.0, True)
+
+    far = clip_extractor.plan_cut(KEYFRAMES, 43.0, 48.0, duration=120.0, exact=True)
+    assert (far.start, far.end, far.copy_from) == (43.0, 48.0, 44.0)
+    assert far.head_seconds == pytest.approx(1.0)
+
+    # no keyframe inside the window: everything is re-encoded
+    sparse = clip_extractor.plan_cut([0.0, 60.0], 30.0, 35.0, duration=120.0, exact=True)
+    assert sparse.copy_from >= sparse.end and sparse.head_seconds == pytest.approx(5.0)
+
+
+def _smart_cut_commands(tmp_path, monkeypatch, fail_join=False, plan=None):
+    commands = []
+
+    def fake_run(cmd):
+        commands.append(cmd)
+        if fail_join and "concat" in cmd:
+            return False, "non-monotonic DTS"
+        return True, ""
+
+    monkeypatch.setattr(clip_extractor, "_run", fake_run)
+    info = types.SimpleNamespace(
+        path=str(tmp_path / "source.mp4"), video_codec="h264", audio_codec="aac", has_audio=True,
+        time_base="1/15360", profile="High", pix_fmt="yuv420p", fps=30.0,
+    )
+    plan = plan or clip_extractor.CutPlan(start=43.0, end=48.0, copy_from=44.0)
+    ok, _ = clip_extractor.cut_clip(info, plan, str(tmp_path / "clip.mp4"))
+    return ok, commands
+
+
+def test_smart_cut_joins_annexb_parts_with_in_band_parameter_sets(tmp_path, monkeypatch):
+    ok, (head, tail, join) = _smart_cut_commands(tmp_path, monkeypatch)
+
+    assert ok
+    assert head[-1].endswith("head.ts") and head[head.index("-f") + 1] == "mpegts"
+    assert tail[tail.index("-c:v") + 1] == "copy"
+    assert tail[tail.index("-bsf:v") + 1] == "h264_mp4toannexb" and tail[-1].endswith("tail.ts")
+    assert join[join.index("-c") + 1] == "copy" and join[-1].endswith("clip.mp4")
+
+
+def test_failed_smart_cut_falls_back_to_one_encode(tmp_path, monkeypatch):
+    ok, commands = _smart_cut_commands(tmp_path, monkeypatch, fail_join=True)
+
+    assert ok and len(commands) == 4
+    fallback = commands[-1]
+    assert fallback[fallback.index("-c:v") + 1] == "libx264"
+    assert fallback[fallback.index("-t") + 1] == "5.000" and fallback[-1].endswith("clip.mp4")
+
+
+def test_copy_seek_keeps_sub_millisecond_keyframes(tmp_path, monkeypatch):
+    keyframe = 1321 / 30  # 44.033333..., not a whole millisecond
+
+    copy_plan = clip_extractor.CutPlan(start=keyframe, end=keyframe + 5.0, copy_from=keyframe)
+    ok, (copy,) = _smart_cut_commands(tmp_path, monkeypatch, plan=copy_plan)
+    seek = float(copy[copy.index("-ss") + 1])
+    # past the keyframe (never rounded down before it), but short of the next frame
+    assert ok and keyframe < seek < keyframe + 1 / 30.0
+    assert seek + float(copy[copy.index("-t") + 1]) == pytest.approx(keyframe + 5.0, abs=1e-5)
+
+    smart_plan = clip_extractor.CutPlan(start=43.0, end=48.0, copy_from=keyframe)
+    ok, (head, tail, _) = _smart_cut_commands(tmp_path, monkeypatch, plan=smart_plan)
+    tail_seek = float(tail[tail.index("-ss") + 1])
+    assert ok and keyframe < tail_seek < keyframe + 1 / 30.0